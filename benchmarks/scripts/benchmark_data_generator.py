@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Data generator throughput benchmark: dict API vs columnar mode.
+
+For each entity it times generation alone and generation plus rendering the loader payload
+(the dict API's prepared execute_batch records vs the columnar batch's COPY text), and
+reports rows/s for both modes. No database is needed.
+
+Usage:
+  python benchmarks/scripts/benchmark_data_generator.py
+  python benchmarks/scripts/benchmark_data_generator.py --rows 50000 --output benchmarks/results/data_generator.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+generator_dir = Path(__file__).resolve().parents[2] / "data-generator"
+if str(generator_dir) not in sys.path:
+    sys.path.insert(0, str(generator_dir))
+
+from config import DataGeneratorConfig  # noqa: E402
+from generators import (  # noqa: E402
+    ClickstreamGenerator,
+    CustomerGenerator,
+    OrderGenerator,
+    ProductGenerator,
+    SessionGenerator,
+)
+from loaders.batch_loader import COLUMNAR_TABLES, dumps_jsonb  # noqa: E402
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _dict_payload(records):
+    # What the load_* methods build per row before execute_batch, raw_data encoded as when quoted
+    return [dict(r, raw_data=dumps_jsonb(r.get('raw_data') or {})) for r in records]
+
+
+def run(rows: int, seed: int = 42):
+    config = DataGeneratorConfig(random_seed=seed)
+    customers_n = rows
+    products_n = max(1, rows // 2)
+    end = datetime.now()
+    start = end - timedelta(days=config.days_of_data)
+    sessions_n = max(1, rows // 10)
+
+    # Inputs shared by the dependent generators, built once per mode
+    dict_customers = CustomerGenerator(config, seed=seed).generate(min(customers_n, 2000))
+    dict_products = ProductGenerator(config, seed=seed).generate(min(products_n, 2000))
+    dict_sessions = SessionGenerator(config, dict_customers, seed=seed).generate(sessions_n)
+    col_customers = CustomerGenerator(config, seed=seed).generate_columns(min(customers_n, 2000))
+    col_products = ProductGenerator(config, seed=seed).generate_columns(min(products_n, 2000))
+    col_sessions = SessionGenerator(config, col_customers, seed=seed).generate_columns(sessions_n)
+
+    cases = {
+        'customers': (
+            lambda: CustomerGenerator(config, seed=seed).generate(customers_n),
+            lambda: CustomerGenerator(config, seed=seed).generate_columns(customers_n),
+        ),
+        'products': (
+            lambda: ProductGenerator(config, seed=seed).generate(products_n),
+            lambda: ProductGenerator(config, seed=seed).generate_columns(products_n),
+        ),
+        'orders': (
+            lambda: OrderGenerator(config, dict_customers, dict_products, seed=seed).generate(rows, start, end)[0],
+            lambda: OrderGenerator(config, col_customers, col_products, seed=seed).generate_columns(rows, start, end)[0],
+        ),
+        'sessions': (
+            lambda: SessionGenerator(config, dict_customers, seed=seed).generate(sessions_n),
+            lambda: SessionGenerator(config, col_customers, seed=seed).generate_columns(sessions_n),
+        ),
+        'clickstream': (
+            lambda: ClickstreamGenerator(config, dict_sessions, dict_products, seed=seed).generate(),
+            lambda: ClickstreamGenerator(config, col_sessions, col_products, seed=seed).generate_columns(),
+        ),
+    }
+
+    results = []
+    for entity, (dict_fn, columnar_fn) in cases.items():
+        records, dict_gen = _timed(dict_fn)
+        _, dict_render = _timed(lambda: _dict_payload(records))
+        batch, col_gen = _timed(columnar_fn)
+        _, col_render = _timed(lambda: batch.to_copy_text(COLUMNAR_TABLES[entity][1]))
+        n_dict, n_col = len(records), len(batch)
+        results.append({
+            'entity': entity,
+            'dict_rows': n_dict,
+            'columnar_rows': n_col,
+            'dict_generate_rows_per_s': round(n_dict / dict_gen),
+            'columnar_generate_rows_per_s': round(n_col / col_gen),
+            'dict_end_to_end_rows_per_s': round(n_dict / (dict_gen + dict_render)),
+            'columnar_end_to_end_rows_per_s': round(n_col / (col_gen + col_render)),
+        })
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000, help='Customers / orders per case (default 20000)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', type=Path, help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.rows, args.seed)
+    header = f"{'entity':<12} {'mode':<9} {'rows':>9} {'gen rows/s':>12} {'+payload rows/s':>16}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        for mode in ('dict', 'columnar'):
+            print(f"{r['entity']:<12} {mode:<9} {r[mode + '_rows']:>9,} "
+                  f"{r[mode + '_generate_rows_per_s']:>12,} {r[mode + '_end_to_end_rows_per_s']:>16,}")
+        speedup = r['columnar_end_to_end_rows_per_s'] / max(1, r['dict_end_to_end_rows_per_s'])
+        print(f"{'':<12} speedup x{speedup:.1f}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            'benchmark': 'data_generator',
+            'rows': args.rows,
+            'timestamp': datetime.now().isoformat(),
+            'results': results,
+        }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
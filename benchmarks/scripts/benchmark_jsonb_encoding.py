@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+JSONB encoding micro-benchmark for BatchLoader's dict path.
+
+Times the JSON work done per row for the JSONB columns of the load_* methods:
+  - round_trip: the previous path, Json(prepare_jsonb_data(raw_data)) with json.dumps and
+    json.loads before psycopg2 serializes the dict again when quoting it
+  - single_pass_json: JsonbAdapter with the json module (orjson not installed)
+  - single_pass_orjson: JsonbAdapter with orjson, when it is installed
+and reports rows/s per entity. Only the encoding is timed; no database is needed.
+
+Usage:
+  python benchmarks/scripts/benchmark_jsonb_encoding.py
+  python benchmarks/scripts/benchmark_jsonb_encoding.py --rows 50000 --output benchmarks/results/jsonb_encoding.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from psycopg2.extras import Json
+
+generator_dir = Path(__file__).resolve().parents[2] / "data-generator"
+if str(generator_dir) not in sys.path:
+    sys.path.insert(0, str(generator_dir))
+
+from config import DataGeneratorConfig  # noqa: E402
+from generators import (  # noqa: E402
+    ClickstreamGenerator,
+    CustomerGenerator,
+    OrderGenerator,
+    ProductGenerator,
+    SessionGenerator,
+)
+from loaders import batch_loader  # noqa: E402
+from loaders.batch_loader import JsonbAdapter, serialize_datetime  # noqa: E402
+
+# JSONB columns besides raw_data written by each load_* method
+JSON_COLUMNS = {
+    'customers': ['address'],
+    'orders': ['shipping_address'],
+    'clickstream': ['device_info'],
+}
+
+
+def _round_trip(records, columns):
+    # Json.getquoted() calls dumps(adapted); that is the serialization timed here
+    out = []
+    for r in records:
+        raw = r.get('raw_data', {})
+        raw = json.loads(json.dumps(raw, default=serialize_datetime)) if raw else {}
+        adapters = [Json(r.get(c, {})) for c in columns] + [Json(raw)]
+        out.append([a.dumps(a.adapted) for a in adapters])
+    return out
+
+
+def _single_pass(records, columns):
+    out = []
+    for r in records:
+        adapters = [JsonbAdapter(r.get(c, {})) for c in columns] + [JsonbAdapter(r.get('raw_data') or {})]
+        out.append([a.dumps(a.adapted) for a in adapters])
+    return out
+
+
+def _rows_per_s(fn, records, columns, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(records, columns)
+        best = min(best, time.perf_counter() - start)
+    return round(len(records) / best)
+
+
+def run(rows: int, seed: int = 42, repeat: int = 3):
+    config = DataGeneratorConfig(random_seed=seed)
+    customers = CustomerGenerator(config, seed=seed).generate(rows)
+    products = ProductGenerator(config, seed=seed).generate(min(rows, 2000))
+    end = datetime.now()
+    orders, _ = OrderGenerator(config, customers[:2000], products, seed=seed).generate(
+        rows, end - timedelta(days=config.days_of_data), end
+    )
+    sessions = SessionGenerator(config, customers[:2000], seed=seed).generate(max(1, rows // 10))
+    events = ClickstreamGenerator(config, sessions, products, seed=seed).generate()[:rows]
+    datasets = {'customers': customers, 'orders': orders, 'clickstream': events}
+
+    results = []
+    orjson = batch_loader.orjson
+    for entity, records in datasets.items():
+        columns = JSON_COLUMNS[entity]
+        result = {
+            'entity': entity,
+            'rows': len(records),
+            'round_trip_rows_per_s': _rows_per_s(_round_trip, records, columns, repeat),
+        }
+        batch_loader.orjson = None
+        try:
+            result['single_pass_json_rows_per_s'] = _rows_per_s(_single_pass, records, columns, repeat)
+        finally:
+            batch_loader.orjson = orjson
+        if orjson is not None:
+            result['single_pass_orjson_rows_per_s'] = _rows_per_s(_single_pass, records, columns, repeat)
+        results.append(result)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20000, help='Records per entity (default 20000)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='Best of N timings (default 3)')
+    parser.add_argument('--output', type=Path, help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.rows, args.seed, args.repeat)
+    modes = [m for m in ('round_trip', 'single_pass_json', 'single_pass_orjson')
+             if f'{m}_rows_per_s' in results[0]]
+    header = f"{'entity':<12} {'rows':>8} " + " ".join(f"{m + ' rows/s':>26}" for m in modes)
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['entity']:<12} {r['rows']:>8,} "
+              + " ".join(f"{r[m + '_rows_per_s']:>26,}" for m in modes))
+        best = r[modes[-1] + '_rows_per_s'] / max(1, r['round_trip_rows_per_s'])
+        print(f"{'':<12} speedup x{best:.1f} ({modes[-1]} vs round_trip)")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            'benchmark': 'jsonb_encoding',
+            'rows': args.rows,
+            'timestamp': datetime.now().isoformat(),
+            'results': results,
+        }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Model inference latency benchmark: sklearn / XGBoost vs the NumPy-only compiled models.
+
+Fits the serving models on synthetic data with the model_config defaults
+  - predictor: XGBRegressor (100 trees, depth 6) on the 13 query features
+  - anomaly: IsolationForest (100 trees, 256 samples) on the 5 metrics columns
+  - cache: RandomForestClassifier (50 trees, depth 10) on the 6 aggregate features
+then times a single-row call (median of --calls) and one --batch row call through each path,
+with the StandardScaler in front of the model as the API uses it. Run it at a few --batch
+sizes to re-derive the per-kind row limits in fast_inference.COMPILED_MAX_ROWS.
+
+Usage:
+  python benchmarks/scripts/benchmark_model_inference.py
+  python benchmarks/scripts/benchmark_model_inference.py --batch 100000 --output benchmarks/results/model_inference.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from sklearn.ensemble import IsolationForest, RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+ml_dir = Path(__file__).resolve().parents[2] / "ml-optimization"
+if str(ml_dir) not in sys.path:
+    sys.path.insert(0, str(ml_dir))
+
+from models.fast_inference import compile_model  # noqa: E402
+
+
+def _fit(name, rng, rows):
+    if name == 'predictor':
+        import xgboost as xgb
+        X = rng.gamma(2.0, 3.0, size=(rows, 13)).astype(np.float32)
+        y = X[:, 0] * 10 + X[:, 1] ** 2 + rng.normal(0, 1, rows)
+        model = xgb.XGBRegressor(n_estimators=100, max_depth=6, learning_rate=0.1, random_state=42, n_jobs=1)
+        scaler = None
+    elif name == 'anomaly':
+        X = rng.lognormal(2.0, 1.0, size=(rows, 5))
+        y = None
+        model = IsolationForest(contamination=0.1, n_estimators=100, max_samples=256, random_state=42, n_jobs=1)
+        scaler = StandardScaler()
+    else:
+        X = rng.lognormal(1.0, 1.0, size=(rows, 6))
+        y = (X[:, 0] > np.median(X[:, 0])).astype(int)
+        model = RandomForestClassifier(n_estimators=50, max_depth=10, min_samples_split=5, random_state=42, n_jobs=1)
+        scaler = StandardScaler()
+    Xs = scaler.fit_transform(X) if scaler is not None else X
+    model.fit(Xs, y) if y is not None else model.fit(Xs)
+    return model, scaler, X
+
+
+def _reference(name, model, scaler):
+    transform = scaler.transform if scaler is not None else (lambda X: X)
+    if name == 'anomaly':
+        return lambda X: model.score_samples(transform(X))
+    if name == 'cache':
+        return lambda X: model.predict_proba(transform(X))
+    return lambda X: model.predict(transform(X))
+
+
+def _compiled(name, compiled):
+    if name == 'anomaly':
+        return compiled.score_samples
+    if name == 'cache':
+        return compiled.predict_proba
+    return compiled.predict
+
+
+def _single_ms(fn, X, calls):
+    times = []
+    for i in range(calls):
+        row = X[i % len(X)][None, :]
+        start = time.perf_counter()
+        fn(row)
+        times.append(time.perf_counter() - start)
+    return round(statistics.median(times) * 1000, 3)
+
+
+def _batch_ms(fn, X, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(X)
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 1)
+
+
+def run(batch: int = 10000, calls: int = 200, seed: int = 42, repeat: int = 3, train_rows: int = 5000):
+    rng = np.random.default_rng(seed)
+    results = []
+    for name in ('predictor', 'anomaly', 'cache'):
+        model, scaler, X_train = _fit(name, rng, train_rows)
+        compiled = compile_model(model, scaler)
+        X = X_train[rng.integers(0, len(X_train), size=batch)]
+        reference, fast = _reference(name, model, scaler), _compiled(name, compiled)
+        max_diff = float(np.max(np.abs(np.asarray(reference(X[:1000])) - fast(X[:1000]))))
+        results.append({
+            'model': name,
+            'estimator': type(model).__name__,
+            'trees': compiled.trees.n_trees,
+            'max_depth': compiled.trees.max_depth,
+            'single_reference_ms': _single_ms(reference, X, calls),
+            'single_compiled_ms': _single_ms(fast, X, calls),
+            'batch_rows': batch,
+            'batch_reference_ms': _batch_ms(reference, X, repeat),
+            'batch_compiled_ms': _batch_ms(fast, X, repeat),
+            'max_abs_diff': max_diff,
+        })
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batch', type=int, default=10000, help='Rows in the batch call (default 10000)')
+    parser.add_argument('--calls', type=int, default=200, help='Single-row calls timed (default 200)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='Best of N batch timings (default 3)')
+    parser.add_argument('--output', type=Path, help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.batch, args.calls, args.seed, args.repeat)
+    header = (f"{'model':<10} {'estimator':<24} {'1 row ref ms':>12} {'1 row fast ms':>13} "
+              f"{'batch ref ms':>12} {'batch fast ms':>13} {'max diff':>9}")
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['model']:<10} {r['estimator']:<24} {r['single_reference_ms']:>12} {r['single_compiled_ms']:>13} "
+              f"{r['batch_reference_ms']:>12} {r['batch_compiled_ms']:>13} {r['max_abs_diff']:>9.1e}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            'benchmark': 'model_inference',
+            'batch_rows': args.batch,
+            'timestamp': datetime.now().isoformat(),
+            'results': results,
+        }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ from .inventory_generator import InventoryGenerator
 from .review_generator import ReviewGenerator
 from .session_generator import SessionGenerator
 from .clickstream_generator import ClickstreamGenerator
+from .columnar import ColumnBatch
 
 __all__ = [
     'BaseGenerator',
@@ -20,4 +21,5 @@ __all__ = [
     'ReviewGenerator',
     'SessionGenerator',
     'ClickstreamGenerator',
+    'ColumnBatch',
 ]
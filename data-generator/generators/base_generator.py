@@ -4,9 +4,11 @@ Base class for all data generators.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 import random
+import numpy as np
 from faker import Faker
+from .columnar import POOL_SIZE, build_pool, format_ids
 
 
 class BaseGenerator(ABC):
@@ -19,6 +21,10 @@ class BaseGenerator(ABC):
         if seed:
             random.seed(seed)
             Faker.seed(seed)
+        # Columnar mode draws from its own generator, seeded like the dict API
+        self.rng = np.random.default_rng(seed)
+        self._pools: Dict[str, np.ndarray] = {}
+        self._columnar_rows = 0
     
     @abstractmethod
     def generate(self, count: int) -> List[Dict[str, Any]]:
@@ -41,3 +47,31 @@ class BaseGenerator(ABC):
     def get_source_system(self) -> str:
         """Get source system identifier."""
         return self.config.source_system
+    
+    def pool(self, name: str, factory: Callable[[], Any], size: int = POOL_SIZE) -> np.ndarray:
+        """Faker values for a columnar field, generated once and reused by index."""
+        if name not in self._pools:
+            self._pools[name] = build_pool(factory, size)
+        return self._pools[name]
+    
+    def pick(self, name: str, factory: Callable[[], Any], count: int) -> np.ndarray:
+        """Draw ``count`` values from a field's pool."""
+        values = self.pool(name, factory)
+        return values[self.rng.integers(0, len(values), size=count)]
+    
+    def next_numbers(self, count: int) -> np.ndarray:
+        """Sequential record numbers for columnar batches, continuing across calls.
+        
+        The columnar and dict APIs number their records independently; use one of them per instance.
+        """
+        numbers = np.arange(self._columnar_rows + 1, self._columnar_rows + count + 1)
+        self._columnar_rows += count
+        return numbers
+    
+    def continue_after(self, number: int) -> None:
+        """Number the next columnar records from ``number + 1`` (e.g. the highest id already loaded)."""
+        self._columnar_rows = max(self._columnar_rows, int(number))
+    
+    def next_ids(self, prefix: str, count: int, width: int) -> np.ndarray:
+        """Sequential ids like the dict API's (``CUST00000001``) for columnar batches."""
+        return format_ids(prefix, self.next_numbers(count), width)
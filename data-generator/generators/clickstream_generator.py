@@ -6,7 +6,9 @@ Generates realistic clickstream/event data.
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 import random
+import numpy as np
 from .base_generator import BaseGenerator
+from .columnar import ColumnBatch, choice, column_of, nullify
 
 
 class ClickstreamGenerator(BaseGenerator):
@@ -14,6 +16,14 @@ class ClickstreamGenerator(BaseGenerator):
     
     EVENT_TYPES = ['page_view', 'click', 'add_to_cart', 'remove_from_cart', 'checkout_start', 'purchase', 'search']
     PAGE_CATEGORIES = ['home', 'product', 'category', 'cart', 'checkout', 'search', 'account', 'help']
+    URL_CATEGORIES = ['Electronics', 'Clothing', 'Home', 'Sports']
+    REFERRERS = [
+        'https://www.google.com',
+        'https://www.bing.com',
+        'https://www.facebook.com',
+        'https://www.twitter.com',
+        'direct'
+    ]
     
     def __init__(self, config, sessions: List[Dict], products: List[Dict], customers: List[Dict] = None, seed: int = None):
         """Initialize clickstream generator."""
@@ -57,7 +67,7 @@ class ClickstreamGenerator(BaseGenerator):
                     product = random.choice(self.products)
                     page_url = f"/products/{product['product_id']}"
                 elif page_category == 'category':
-                    category = random.choice(['Electronics', 'Clothing', 'Home', 'Sports'])
+                    category = random.choice(self.URL_CATEGORIES)
                     page_url = f"/categories/{category.lower()}"
                 else:
                     page_url = f"/{page_category}"
@@ -65,13 +75,7 @@ class ClickstreamGenerator(BaseGenerator):
                 # Referrer (50% chance)
                 referrer = None
                 if random.random() > 0.5:
-                    referrer = random.choice([
-                        'https://www.google.com',
-                        'https://www.bing.com',
-                        'https://www.facebook.com',
-                        'https://www.twitter.com',
-                        'direct'
-                    ])
+                    referrer = random.choice(self.REFERRERS)
                 
                 event = {
                     'event_id': event_id,
@@ -97,3 +101,60 @@ class ClickstreamGenerator(BaseGenerator):
                 events.append(event)
         
         return events
+    
+    def generate_columns(self) -> ColumnBatch:
+        """Generate clickstream events as a column batch (columnar mode)."""
+        rng = self.rng
+        n_sessions = len(self.sessions)
+        low, high = self.config.events_per_session_range
+        events_per_session = rng.integers(low, high + 1, size=n_sessions)
+        session_idx = np.repeat(np.arange(n_sessions), events_per_session)
+        count = len(session_idx)
+        
+        # Events spread uniformly over their session
+        start = column_of(self.sessions, 'start_time').astype('datetime64[us]')
+        end = column_of(self.sessions, 'end_time').astype('datetime64[us]')
+        duration_us = np.maximum((end - start).astype(np.int64), 0)[session_idx]
+        event_timestamp = start[session_idx] + (rng.random(count) * duration_us).astype('timedelta64[us]')
+        
+        page_category = choice(rng, self.PAGE_CATEGORIES, count)
+        # Built as an object array so longer URLs are not cut to the width of '/checkout'
+        page_url = np.char.add('/', page_category).astype(object)
+        category_pages = page_category == 'category'
+        page_url[category_pages] = np.char.add(
+            '/categories/', np.char.lower(choice(rng, self.URL_CATEGORIES, int(category_pages.sum())))
+        )
+        product_pages = page_category == 'product'
+        if len(self.products):
+            product_ids = column_of(self.products, 'product_id')
+            page_url[product_pages] = np.char.add(
+                '/products/', product_ids[rng.integers(0, len(product_ids), size=int(product_pages.sum()))]
+            )
+        
+        device_type = column_of(self.sessions, 'device_type')[session_idx]
+        is_mobile = column_of(self.sessions, 'is_mobile')[session_idx].astype(bool)
+        resolution = np.char.add(np.char.add(choice(rng, ['1920', '1366', '1440'], count), 'x'),
+                                 choice(rng, ['1080', '768', '900'], count))
+        
+        return ColumnBatch(
+            {
+                'event_id': self.next_numbers(count),
+                'session_id': column_of(self.sessions, 'session_id')[session_idx],
+                'user_id': column_of(self.sessions, 'user_id').astype(object)[session_idx],
+                'event_type': choice(rng, self.EVENT_TYPES, count),
+                'page_url': page_url.astype(str),
+                'referrer': nullify(rng, choice(rng, self.REFERRERS, count), 0.5),
+                'event_timestamp': event_timestamp,
+                'source_system': np.full(count, self.get_source_system()),
+                'ingestion_timestamp': np.full(count, np.datetime64(datetime.now(), 'us')),
+            },
+            {
+                'device_info': {
+                    'device_type': device_type,
+                    'browser': column_of(self.sessions, 'browser')[session_idx],
+                    'operating_system': column_of(self.sessions, 'operating_system')[session_idx],
+                    'is_mobile': is_mobile,
+                    'screen_resolution': resolution,
+                }
+            },
+        )
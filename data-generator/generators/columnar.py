@@ -0,0 +1,269 @@
+"""
+Columnar Generation
+Column batches and vectorized draws behind the generators' columnar mode.
+
+The dict API builds one dict per row with a Faker / random call per field. Columnar mode
+draws each column at once with NumPy (ids from a range, dates and amounts from vectorized
+distributions, categorical values by index into a small value array) and keeps the result
+as a ColumnBatch. Text that only Faker can produce (names, streets, words) comes from a
+pool filled once per generator and is picked by index, so Faker is called a few thousand
+times per run instead of several times per row.
+
+A ColumnBatch renders straight to COPY text for BatchLoader.load_columns(), and
+to_records() turns it back into the dicts the dict API returns.
+"""
+
+import json
+from json.encoder import encode_basestring_ascii
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Distinct values drawn from Faker per pooled field
+POOL_SIZE = 2000
+
+Column = np.ndarray
+JsonColumn = Dict[str, Union[np.ndarray, "JsonColumn"]]
+
+
+class ColumnBatch:
+    """Generated rows held column-wise; every column has one entry per row.
+
+    ``columns`` holds scalar columns. ``json_columns`` holds JSONB columns as nested dicts
+    of sub-columns (``{'address': {'city': array, ...}}``), or as an object array of ready
+    dicts when the values come from dict records. Object arrays carry None for NULL.
+    """
+
+    def __init__(self, columns: Dict[str, Column], json_columns: Optional[Dict[str, JsonColumn]] = None):
+        self.columns = columns
+        self.json_columns = json_columns or {}
+        lengths = {len(c) for c in _leaves(columns)} | {len(c) for c in _leaves(self.json_columns)}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @classmethod
+    def concat(cls, batches: Sequence["ColumnBatch"]) -> "ColumnBatch":
+        """Stack batches with the same scalar columns (JSON columns are not concatenated)."""
+        names = list(batches[0].columns)
+        return cls({name: np.concatenate([b.columns[name] for b in batches]) for name in names})
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def names(self) -> List[str]:
+        return list(self.columns) + list(self.json_columns)
+
+    def take(self, index: Union[slice, np.ndarray]) -> "ColumnBatch":
+        """Rows selected by a slice or an index array."""
+        return ColumnBatch(
+            {name: col[index] for name, col in self.columns.items()},
+            {name: _take_json(col, index) for name, col in self.json_columns.items()},
+        )
+
+    def chunks(self, size: int):
+        for start in range(0, len(self), size):
+            yield self.take(slice(start, start + size))
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Rows as dicts, shaped like the dict API's records (raw_data only for orders)."""
+        names = list(self.columns) + list(self.json_columns)
+        values = [_python_values(col) for col in self.columns.values()]
+        values += [_json_records(col, len(self)) for col in self.json_columns.values()]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def to_copy_text(self, names: Sequence[str]) -> str:
+        """Rows of the named columns in PostgreSQL COPY text format."""
+        if not len(self):
+            return ""
+        fields = []
+        for name in names:
+            if name in self.json_columns:
+                fields.append(_copy_escape(_json_text(self.json_columns[name], len(self))))
+            else:
+                fields.append(_copy_text(self.columns[name]))
+        return "\n".join(map("\t".join, zip(*fields))) + "\n"
+
+
+class JsonFragments(np.ndarray):
+    """Object array of already-encoded JSON values, written into a JSON column as they are.
+
+    For values with no fixed shape (a list of line items per order), which are rendered to
+    text once per batch instead of being held as one Python object per row.
+    """
+
+    @classmethod
+    def of(cls, values: Sequence[str]) -> "JsonFragments":
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array.view(cls)
+
+
+def json_arrays(columns: JsonColumn, counts: np.ndarray) -> JsonFragments:
+    """Rows of ``columns`` as JSON objects, each consecutive run of ``counts[i]`` rows as one array."""
+    if not len(counts):
+        return JsonFragments.of([])
+    rows = np.array(_json_text(columns, int(counts.sum())), dtype=object)
+    return JsonFragments.of(['[' + ', '.join(part) + ']' for part in np.split(rows, np.cumsum(counts)[:-1])])
+
+
+# -- vectorized draws ----------------------------------------------------------------------
+
+def format_ids(prefix: str, numbers: np.ndarray, width: int) -> np.ndarray:
+    """``prefix`` + each number zero-padded to ``width`` digits."""
+    return np.char.add(prefix, np.char.zfill(numbers.astype(str), width))
+
+
+def choice(rng: np.random.Generator, values: Sequence[Any], count: int,
+           weights: Optional[Sequence[float]] = None) -> np.ndarray:
+    """Draw ``count`` values by index; None among the values gives an object array."""
+    dtype = object if any(v is None for v in values) else None
+    array = np.array(values, dtype=dtype)
+    p = None
+    if weights is not None:
+        p = np.asarray(weights, dtype=float)
+        p = p / p.sum()
+    return array[rng.choice(len(array), size=count, p=p)]
+
+
+def random_datetimes(rng: np.random.Generator, start: datetime, end: datetime, count: int) -> np.ndarray:
+    """Uniform timestamps in [start, end) as datetime64[us]."""
+    start64 = np.datetime64(start, "us")
+    span = max(1, int((np.datetime64(end, "us") - start64) / np.timedelta64(1, "us")))
+    return start64 + rng.integers(0, span, size=count).astype("timedelta64[us]")
+
+
+def nullify(rng: np.random.Generator, values: np.ndarray, probability: float) -> np.ndarray:
+    """Replace each value with None with the given probability."""
+    out = values.astype(object)
+    out[rng.random(len(values)) < probability] = None
+    return out
+
+
+def build_pool(factory: Callable[[], Any], size: int = POOL_SIZE) -> np.ndarray:
+    return np.array([factory() for _ in range(size)])
+
+
+def column_of(rows, name: str) -> np.ndarray:
+    """One column from a ColumnBatch or from a list of dict records."""
+    if isinstance(rows, ColumnBatch):
+        return rows[name]
+    values = [row.get(name) for row in rows]
+    if values and isinstance(values[0], datetime):
+        return np.array(values, dtype="datetime64[us]")
+    return np.array(values, dtype=object if any(v is None for v in values) else None)
+
+
+# -- rendering -----------------------------------------------------------------------------
+
+def _leaves(columns):
+    if isinstance(columns, np.ndarray):
+        yield columns
+        return
+    for value in columns.values():
+        if isinstance(value, dict):
+            yield from _leaves(value)
+        else:
+            yield value
+
+
+def _take_json(column: JsonColumn, index) -> JsonColumn:
+    if isinstance(column, np.ndarray):
+        return column[index]
+    return {k: _take_json(v, index) if isinstance(v, dict) else v[index] for k, v in column.items()}
+
+
+def _python_values(column: np.ndarray) -> List[Any]:
+    if isinstance(column, JsonFragments):
+        return [json.loads(v) for v in column]
+    if column.dtype.kind == "M" and np.datetime_data(column.dtype)[0] == "D":
+        return column.astype(date).tolist()
+    return column.tolist()
+
+
+def _json_records(column: JsonColumn, length: int) -> List[Dict[str, Any]]:
+    if isinstance(column, np.ndarray):
+        return _python_values(column) if isinstance(column, JsonFragments) else column.tolist()
+    keys = list(column)
+    values = [
+        _json_records(v, length) if isinstance(v, dict) else _python_values(v) for v in column.values()
+    ]
+    return [dict(zip(keys, row)) for row in zip(*values)] if keys else [{} for _ in range(length)]
+
+
+_COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+_SEPARATOR = "\x1f"
+
+
+def _copy_escape(values: List[str]) -> List[str]:
+    """Escape COPY text fields, as one str.replace pass per character over the joined column."""
+    text = _SEPARATOR.join(values)
+    if not any(ch in text for ch, _ in _COPY_ESCAPES):
+        return values
+    if text.count(_SEPARATOR) != len(values) - 1:
+        escaped = []
+        for value in values:
+            for old, new in _COPY_ESCAPES:
+                value = value.replace(old, new)
+            escaped.append(value)
+        return escaped
+    for old, new in _COPY_ESCAPES:
+        text = text.replace(old, new)
+    return text.split(_SEPARATOR)
+
+
+def _copy_text(column: np.ndarray) -> List[str]:
+    kind = column.dtype.kind
+    if kind == "O":
+        mask = np.equal(column, None)
+        text = np.array(_copy_escape(np.where(mask, "", column).astype(str).tolist()), dtype=object)
+        text[mask] = "\\N"
+        return text.tolist()
+    if kind == "M":
+        return np.datetime_as_string(column).tolist()
+    if kind == "b":
+        return np.where(column, "t", "f").tolist()
+    if kind == "U":
+        return _copy_escape(column.tolist())
+    return column.astype(str).tolist()
+
+
+def _json_scalars(column: np.ndarray) -> List[str]:
+    """JSON literals for a sub-column."""
+    if isinstance(column, JsonFragments):
+        return column.tolist()
+    kind = column.dtype.kind
+    if kind == "b":
+        return np.where(column, "true", "false").tolist()
+    if kind in "iuf":
+        return column.astype(str).tolist()
+    if kind == "M":
+        return list(map(encode_basestring_ascii, np.datetime_as_string(column).tolist()))
+    if kind == "O":
+        mask = np.equal(column, None)
+        out = np.full(len(column), "null", dtype=object)
+        if (~mask).any():
+            present = column[~mask]
+            if isinstance(present[0], str):
+                out[~mask] = _json_scalars(present.astype(str))
+            else:
+                out[~mask] = [json.dumps(v, default=str) for v in present]
+        return out.tolist()
+    return list(map(encode_basestring_ascii, column.tolist()))
+
+
+def _json_text(column: JsonColumn, length: int) -> List[str]:
+    if isinstance(column, np.ndarray):
+        return _json_scalars(column)
+    keys = list(column)
+    if not keys:
+        return ["{}"] * length
+    parts = [
+        _json_text(v, length) if isinstance(v, dict) else _json_scalars(v) for v in column.values()
+    ]
+    template = "{" + ", ".join(json.dumps(k) + ": %s" for k in keys) + "}"
+    return [template % row for row in zip(*parts)]
@@ -6,7 +6,10 @@ Generates realistic inventory movement data.
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 import random
+import string
+import numpy as np
 from .base_generator import BaseGenerator
+from .columnar import ColumnBatch, choice, column_of, random_datetimes
 
 
 class InventoryGenerator(BaseGenerator):
@@ -124,3 +127,69 @@ class InventoryGenerator(BaseGenerator):
             movements.append(movement)
         
         return movements
+    
+    def generate_initial_inventory_columns(self) -> ColumnBatch:
+        """Columnar generate_initial_inventory: one IN movement per product and warehouse."""
+        product_ids = column_of(self.products, 'product_id').astype(str)
+        warehouses = np.array(self.warehouses)
+        product_id = np.repeat(product_ids, len(warehouses))
+        warehouse_id = np.tile(warehouses, len(product_ids))
+        count = len(product_id)
+        start_date = datetime.now() - timedelta(days=self.config.days_of_data)
+        reference = np.char.add(np.char.add(np.char.add('INIT-', warehouse_id), '-'), product_id)
+        return self._movement_columns(
+            product_id, warehouse_id, np.full(count, self.config.initial_inventory_per_product), 'IN',
+            random_datetimes(self.rng, start_date, start_date + timedelta(days=7), count), reference,
+        )
+    
+    def generate_movement_columns_from_orders(self, order_items: ColumnBatch) -> ColumnBatch:
+        """Columnar generate_movements_from_orders, from an order items batch of OrderGenerator.
+        
+        Every order ships from one randomly chosen warehouse.
+        """
+        order_id = order_items['order_id']
+        _, order_idx = np.unique(order_id, return_inverse=True)
+        warehouse = choice(self.rng, self.warehouses, int(order_idx.max()) + 1 if len(order_idx) else 0)
+        return self._movement_columns(
+            order_items['product_id'], warehouse[order_idx], -order_items['quantity'], 'OUT',
+            order_items['order_date'], order_id,
+        )
+    
+    def generate_adjustment_columns(self, count: int = 100) -> ColumnBatch:
+        """Columnar generate_adjustments: small +/- corrections, never zero."""
+        rng = self.rng
+        quantity = rng.integers(-10, 11, size=count)
+        zero = quantity == 0
+        quantity[zero] = choice(rng, [-1, 1], int(zero.sum()))
+        
+        digits = rng.integers(0, 10, size=(count, 4)).astype(str)
+        letters = np.array(list(string.ascii_uppercase))[rng.integers(0, 26, size=(count, 3))]
+        reference = np.full(count, 'ADJ-')
+        for column in digits.T:
+            reference = np.char.add(reference, column)
+        reference = np.char.add(reference, '-')
+        for column in letters.T:
+            reference = np.char.add(reference, column)
+        
+        now = datetime.now()
+        return self._movement_columns(
+            choice(rng, column_of(self.products, 'product_id'), count),
+            choice(rng, self.warehouses, count),
+            quantity, 'ADJUSTMENT',
+            random_datetimes(rng, now - timedelta(days=self.config.days_of_data), now, count),
+            reference,
+        )
+    
+    def _movement_columns(self, product_id, warehouse_id, quantity, movement_type: str,
+                          movement_date, reference_number) -> ColumnBatch:
+        count = len(product_id)
+        return ColumnBatch({
+            'product_id': product_id,
+            'warehouse_id': warehouse_id,
+            'quantity': quantity,
+            'movement_type': np.full(count, movement_type),
+            'movement_date': movement_date,
+            'reference_number': reference_number,
+            'source_system': np.full(count, self.get_source_system()),
+            'ingestion_timestamp': np.full(count, np.datetime64(datetime.now(), 'us')),
+        })
@@ -6,7 +6,9 @@ Generates realistic order data with order items.
 from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import random
+import numpy as np
 from .base_generator import BaseGenerator
+from .columnar import ColumnBatch, choice, column_of, json_arrays, random_datetimes
 
 
 class OrderGenerator(BaseGenerator):
@@ -16,6 +18,9 @@ class OrderGenerator(BaseGenerator):
     PAYMENT_METHODS = ['credit_card', 'debit_card', 'paypal', 'apple_pay', 'google_pay']
     PAYMENT_STATUSES = ['pending', 'completed', 'failed', 'refunded']
     
+    DISCOUNT_RATES = [0, 0.1, 0.15, 0.2, 0.25]
+    DISCOUNT_WEIGHTS = [70, 15, 8, 5, 2]
+    
     def __init__(self, config, customers: List[Dict], products: List[Dict], seed: int = None):
         """Initialize order generator."""
         super().__init__(config, seed)
@@ -67,7 +72,7 @@ class OrderGenerator(BaseGenerator):
                 unit_price = float(product['price'])
                 
                 # Apply random discount occasionally
-                discount_pct = random.choices([0, 0.1, 0.15, 0.2, 0.25], weights=[70, 15, 8, 5, 2])[0]
+                discount_pct = random.choices(self.DISCOUNT_RATES, weights=self.DISCOUNT_WEIGHTS)[0]
                 item_discount = unit_price * quantity * discount_pct
                 item_total = (unit_price * quantity) - item_discount
                 
@@ -156,3 +161,101 @@ class OrderGenerator(BaseGenerator):
             current_date += timedelta(days=1)
         
         return all_orders, all_items
+    
+    def generate_columns(self, count: int, start_date: datetime = None,
+                         end_date: datetime = None) -> Tuple[ColumnBatch, ColumnBatch]:
+        """
+        Generate orders and order items as column batches (columnar mode).
+        
+        Customers and products may be column batches or dict records.
+        
+        Returns:
+            Tuple of (orders batch, order_items batch)
+        """
+        if start_date is None:
+            start_date = datetime.now() - timedelta(days=self.config.days_of_data)
+        if end_date is None:
+            end_date = datetime.now()
+        return self._order_columns(random_datetimes(self.rng, start_date, end_date, count))
+    
+    def generate_columns_for_date_range(self, start_date: datetime,
+                                        end_date: datetime) -> Tuple[ColumnBatch, ColumnBatch]:
+        """Columnar generate_for_date_range: a random number of orders per day."""
+        first_day = np.datetime64(start_date.date(), 'D')
+        days = (np.datetime64(end_date.date(), 'D') - first_day).astype(int) + 1
+        low, high = self.config.orders_per_day_range
+        per_day = self.rng.integers(low, high + 1, size=max(0, days))
+        day = np.repeat(first_day + np.arange(len(per_day)), per_day)
+        seconds = self.rng.integers(0, 86_400_000_000, size=len(day)).astype('timedelta64[us]')
+        return self._order_columns(day.astype('datetime64[us]') + seconds)
+    
+    def _order_columns(self, order_date: np.ndarray) -> Tuple[ColumnBatch, ColumnBatch]:
+        if not len(self.customers) or not len(self.products):
+            raise ValueError("Customers and products must be provided")
+        rng = self.rng
+        count = len(order_date)
+        order_ids = self.next_ids('ORD', count, 10)
+        customer_idx = rng.integers(0, len(self.customers), size=count)
+        
+        # Line items: each order's items are contiguous, order_idx maps an item to its order
+        low, high = self.config.items_per_order_range
+        items_per_order = rng.integers(low, high + 1, size=count)
+        order_idx = np.repeat(np.arange(count), items_per_order)
+        n_items = len(order_idx)
+        product_idx = rng.integers(0, len(self.products), size=n_items)
+        unit_price = column_of(self.products, 'price').astype(float)[product_idx]
+        quantity = rng.integers(1, 6, size=n_items)
+        discount_pct = choice(rng, self.DISCOUNT_RATES, n_items, weights=self.DISCOUNT_WEIGHTS)
+        item_discount = unit_price * quantity * discount_pct
+        item_total = unit_price * quantity - item_discount
+        
+        # Shipping and 5-12% tax, with the configured minimum order amount
+        total_amount = np.bincount(order_idx, weights=item_total, minlength=count)
+        shipping_cost = rng.uniform(0, 25.0, size=count)
+        tax_amount = total_amount * rng.uniform(0.05, 0.12, size=count)
+        final_total = np.maximum(total_amount + shipping_cost + tax_amount, self.config.min_order_amount)
+        
+        if isinstance(self.customers, ColumnBatch) and 'address' in self.customers.json_columns:
+            shipping_address = self.customers.take(customer_idx).json_columns['address']
+        else:
+            addresses = np.empty(len(self.customers), dtype=object)
+            addresses[:] = [c.get('address', {}) for c in self.customers]
+            shipping_address = addresses[customer_idx]
+        
+        columns = {
+            'order_id': order_ids,
+            'customer_id': column_of(self.customers, 'customer_id')[customer_idx],
+            'order_date': order_date,
+            'status': choice(rng, self.ORDER_STATUSES, count),
+            'total_amount': final_total.round(2),
+            'source_system': np.full(count, self.get_source_system()),
+            'ingestion_timestamp': np.full(count, np.datetime64(datetime.now(), 'us')),
+        }
+        item_columns = {
+            'product_id': column_of(self.products, 'product_id')[product_idx],
+            'quantity': quantity,
+            'unit_price': unit_price.round(2),
+            'discount_amount': item_discount.round(2),
+            'total_amount': item_total.round(2),
+        }
+        
+        # raw_data as in the dict API: the order plus its line items and payment fields, which
+        # have no column in bronze.raw_orders
+        raw_data = {
+            **columns,
+            'shipping_address': shipping_address,
+            'items': json_arrays(item_columns, items_per_order),
+            'shipping_cost': shipping_cost.round(2),
+            'tax_amount': tax_amount.round(2),
+            'discount_amount': np.bincount(order_idx, weights=item_discount, minlength=count).round(2),
+            'payment_method': choice(rng, self.PAYMENT_METHODS, count),
+            'payment_status': choice(rng, self.PAYMENT_STATUSES, count),
+        }
+        
+        orders = ColumnBatch(columns, {'shipping_address': shipping_address, 'raw_data': raw_data})
+        order_items = ColumnBatch({
+            'order_id': order_ids[order_idx],
+            **item_columns,
+            'order_date': order_date[order_idx],
+        })
+        return orders, order_items
@@ -4,8 +4,11 @@ Generates realistic product catalog data.
 """
 
 from typing import List, Dict, Any
+from datetime import datetime, timedelta
 import random
+import numpy as np
 from .base_generator import BaseGenerator
+from .columnar import ColumnBatch, choice, nullify, random_datetimes
 
 
 class ProductGenerator(BaseGenerator):
@@ -95,3 +98,63 @@ class ProductGenerator(BaseGenerator):
             products.append(product)
         
         return products
+    
+    def generate_columns(self, count: int) -> ColumnBatch:
+        """Generate product records as a column batch (columnar mode)."""
+        rng = self.rng
+        now = datetime.now()
+        categories = list(self.CATEGORIES.keys())
+        category_idx = rng.integers(0, len(categories), size=count)
+        category = np.array(categories)[category_idx]
+        
+        # Subcategories and brands per category, flattened so one index draw picks within a category
+        subcategory = self._pick_within(category_idx, [self.CATEGORIES[c] for c in categories])
+        brand = self._pick_within(category_idx, [self.BRANDS[c] for c in categories])
+        
+        base_price = rng.uniform(10.0, 1000.0, size=count)
+        cost = base_price * rng.uniform(0.3, 0.7, size=count)
+        
+        product_name = np.char.add(np.char.add(brand, ' '), self.pick('word', lambda: self.fake.word().title(), count))
+        product_name = np.char.add(np.char.add(product_name, ' '), subcategory)
+        
+        size = choice(rng, ['S', 'M', 'L', 'XL', None], count)
+        size[category != 'Clothing'] = None
+        
+        return ColumnBatch(
+            {
+                'product_id': self.next_ids('PROD', count, 8),
+                'product_name': product_name,
+                'description': self.pick('description', lambda: self.fake.text(max_nb_chars=500), count),
+                'category': category,
+                'subcategory': subcategory,
+                'price': base_price.round(2),
+                'cost': cost.round(2),
+                'currency': np.full(count, 'USD'),
+                'supplier_id': choice(rng, self.supplier_ids, count),
+                'brand': brand,
+                'sku': np.char.add('SKU-', self.pick('sku', lambda: self.fake.bothify(text='???-####').upper(), count)),
+                'source_system': np.full(count, self.get_source_system()),
+                'ingestion_timestamp': random_datetimes(rng, now - timedelta(days=365), now, count),
+            },
+            {
+                'attributes': {
+                    'brand': brand,
+                    'color': nullify(rng, self.pick('color', self.fake.color_name, count), 0.5),
+                    'size': size,
+                    'weight': rng.uniform(0.1, 50.0, size=count).round(2),
+                    'dimensions': {
+                        'length': rng.uniform(5, 200, size=count).round(1),
+                        'width': rng.uniform(5, 200, size=count).round(1),
+                        'height': rng.uniform(5, 200, size=count).round(1),
+                    },
+                }
+            },
+        )
+    
+    def _pick_within(self, group_idx: np.ndarray, groups: List[List[str]]) -> np.ndarray:
+        """One uniformly drawn value per row from that row's group."""
+        sizes = np.array([len(g) for g in groups])
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        flat = np.array([v for g in groups for v in g])
+        within = (self.rng.random(len(group_idx)) * sizes[group_idx]).astype(int)
+        return flat[offsets[group_idx] + within]
@@ -6,7 +6,9 @@ Generates realistic user session data.
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 import random
+import numpy as np
 from .base_generator import BaseGenerator
+from .columnar import ColumnBatch, choice, column_of, random_datetimes
 
 
 class SessionGenerator(BaseGenerator):
@@ -80,3 +82,50 @@ class SessionGenerator(BaseGenerator):
             sessions.append(session)
         
         return sessions
+    
+    def generate_columns(self, count: int = None) -> ColumnBatch:
+        """Generate session records as a column batch (columnar mode)."""
+        if count is None:
+            count = self.config.sessions_per_day * self.config.days_of_data
+        rng = self.rng
+        now = datetime.now()
+        
+        # 60% of sessions have logged-in users
+        user_id = np.full(count, None, dtype=object)
+        if len(self.customers):
+            logged_in = rng.random(count) < 0.6
+            customer_ids = column_of(self.customers, 'customer_id')
+            user_id[logged_in] = customer_ids[rng.integers(0, len(customer_ids), size=int(logged_in.sum()))]
+        
+        start_time = random_datetimes(rng, now - timedelta(days=self.config.days_of_data), now, count)
+        duration_seconds = rng.integers(30, 7201, size=count)
+        device_type = choice(rng, self.DEVICE_TYPES, count)
+        octets = rng.integers(1, 255, size=(4, count)).astype(str)
+        ip_address = octets[0]
+        for octet in octets[1:]:
+            ip_address = np.char.add(np.char.add(ip_address, '.'), octet)
+        
+        return ColumnBatch(
+            {
+                'session_id': self.next_ids('SESS', count, 12),
+                'user_id': user_id,
+                'start_time': start_time,
+                'end_time': start_time + duration_seconds.astype('timedelta64[s]'),
+                'duration_seconds': duration_seconds,
+                'device_type': device_type,
+                'browser': choice(rng, self.BROWSERS, count),
+                'operating_system': choice(rng, self.OPERATING_SYSTEMS, count),
+                'ip_address': ip_address,
+                'is_mobile': device_type != 'desktop',
+                'source_system': np.full(count, self.get_source_system()),
+                'ingestion_timestamp': np.full(count, np.datetime64(now, 'us')),
+            },
+            {
+                'location': {
+                    'country': self.pick('country', self.fake.country, count),
+                    'city': self.pick('city', self.fake.city, count),
+                    'latitude': rng.uniform(-90, 90, size=count).round(6),
+                    'longitude': rng.uniform(-180, 180, size=count).round(6),
+                }
+            },
+        )
@@ -3,5 +3,6 @@ Data Loaders Package
 """
 
 from .batch_loader import BatchLoader
+from .stream_loader import StreamLoader, StreamStats, continuous_source
 
-__all__ = ['BatchLoader']
+__all__ = ['BatchLoader', 'StreamLoader', 'StreamStats', 'continuous_source']
@@ -6,10 +6,16 @@ Loads generated data into Bronze layer tables in batches.
 import psycopg2
 from psycopg2.extras import execute_batch, Json
 from typing import List, Dict, Any
+import io
 import logging
 from datetime import datetime, date
 import json
 
+try:
+    import orjson
+except ImportError:  # required (requirements.txt); json keeps partial installs working
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,14 +26,113 @@ def serialize_datetime(obj):
     raise TypeError(f"Type {type(obj)} not serializable")
 
 
+def dumps_jsonb(data: Any) -> str:
+    """Serialize a value for a JSON/JSONB column, datetimes as ISO strings, in a single pass."""
+    if orjson is not None:
+        return orjson.dumps(data, default=serialize_datetime, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=serialize_datetime)
+
+
+class JsonbAdapter(Json):
+    """
+    psycopg2 Json wrapper that serializes with dumps_jsonb().
+    
+    The value is encoded once, when psycopg2 quotes it into the statement, so records
+    with datetimes need no json.dumps / json.loads round trip beforehand.
+    """
+    
+    def dumps(self, obj):
+        return dumps_jsonb(obj)
+
+
 def prepare_jsonb_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Prepare data for JSONB storage by serializing datetime objects."""
+    """Prepare data for JSONB storage by serializing datetime objects.
+    
+    The load_* methods wrap records in JsonbAdapter instead; this is for callers that
+    need the JSON-compatible dict itself.
+    """
     if not data:
         return {}
     
-    # Convert to JSON string and back to ensure datetime serialization
-    json_str = json.dumps(data, default=serialize_datetime)
-    return json.loads(json_str)
+    return json.loads(dumps_jsonb(data))
+
+
+# Bronze tables written by load_columns(): entity -> (table, columns copied from the batch)
+COLUMNAR_TABLES = {
+    'customers': ('bronze.raw_customers', (
+        'customer_id', 'email', 'customer_name', 'first_name', 'last_name', 'phone', 'address',
+        'registration_date', 'date_of_birth', 'gender', 'source_system', 'ingestion_timestamp',
+    )),
+    'products': ('bronze.raw_products', (
+        'product_id', 'product_name', 'description', 'category', 'subcategory', 'price', 'cost',
+        'currency', 'attributes', 'supplier_id', 'brand', 'sku', 'source_system', 'ingestion_timestamp',
+    )),
+    'orders': ('bronze.raw_orders', (
+        'order_id', 'customer_id', 'order_date', 'status', 'shipping_address', 'total_amount',
+        'source_system', 'ingestion_timestamp', 'raw_data',
+    )),
+    'inventory': ('bronze.raw_inventory', (
+        'product_id', 'warehouse_id', 'quantity', 'movement_type', 'movement_date',
+        'reference_number', 'source_system', 'ingestion_timestamp',
+    )),
+    'sessions': ('bronze.raw_sessions', (
+        'session_id', 'user_id', 'start_time', 'end_time', 'duration_seconds', 'device_type',
+        'browser', 'operating_system', 'location', 'ip_address', 'is_mobile', 'source_system',
+        'ingestion_timestamp',
+    )),
+    'clickstream': ('bronze.raw_clickstream', (
+        'session_id', 'user_id', 'event_type', 'page_url', 'referrer', 'device_info',
+        'event_timestamp', 'source_system', 'ingestion_timestamp',
+    )),
+}
+
+# Conflict targets of the load_* methods; copy_batch() skips rows that already exist on them
+CONFLICT_KEYS = {
+    'customers': ('customer_id',),
+    'products': ('product_id',),
+    'orders': ('order_id', 'order_date'),
+    'sessions': ('session_id',),
+}
+
+# Rows rendered per COPY call by load_columns()
+COPY_CHUNK_ROWS = 50000
+
+
+def copy_batch(cursor, entity: str, batch) -> int:
+    """
+    COPY a ColumnBatch into its Bronze table, a chunk at a time.
+    
+    Tables with a key in CONFLICT_KEYS are copied into a temporary staging table first and
+    moved over with INSERT ... ON CONFLICT DO NOTHING, like the load_* methods, so loading
+    the same customers or products again skips them instead of failing on the primary key.
+    The caller commits; the staging table is dropped with the transaction.
+    
+    Returns:
+        Number of rows inserted
+    """
+    table, columns = COLUMNAR_TABLES[entity]
+    column_list = ', '.join(columns)
+    keys = CONFLICT_KEYS.get(entity)
+    target = table
+    if keys:
+        target = f"stage_{table.split('.')[-1]}"
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {target} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table} WITH NO DATA"
+        )
+    inserted = 0
+    for chunk in batch.chunks(COPY_CHUNK_ROWS):
+        cursor.copy_expert(f"COPY {target} ({column_list}) FROM STDIN", io.StringIO(chunk.to_copy_text(columns)))
+        if not keys:
+            inserted += len(chunk)
+            continue
+        cursor.execute(
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {target} "
+            f"ON CONFLICT ({', '.join(keys)}) DO NOTHING"
+        )
+        inserted += cursor.rowcount
+        cursor.execute(f"TRUNCATE {target}")
+    return inserted
 
 
 class BatchLoader:
@@ -89,13 +194,13 @@ class BatchLoader:
                 'first_name': customer['first_name'],
                 'last_name': customer['last_name'],
                 'phone': customer.get('phone'),
-                'address': Json(customer.get('address', {})),
+                'address': JsonbAdapter(customer.get('address', {})),
                 'registration_date': customer.get('registration_date'),
                 'date_of_birth': customer.get('date_of_birth'),
                 'gender': customer.get('gender'),
                 'source_system': customer['source_system'],
                 'ingestion_timestamp': customer['ingestion_timestamp'],
-                'raw_data': Json(prepare_jsonb_data(customer.get('raw_data', {})))
+                'raw_data': JsonbAdapter(customer.get('raw_data') or {})
             })
         
         execute_batch(self.cursor, insert_query, records, page_size=self.config.batch_size)
@@ -131,13 +236,13 @@ class BatchLoader:
                 'price': product.get('price'),
                 'cost': product.get('cost'),
                 'currency': product.get('currency', 'USD'),
-                'attributes': Json(product.get('attributes', {})),
+                'attributes': JsonbAdapter(product.get('attributes', {})),
                 'supplier_id': product.get('supplier_id'),
                 'brand': product.get('brand'),
                 'sku': product.get('sku'),
                 'source_system': product['source_system'],
                 'ingestion_timestamp': product['ingestion_timestamp'],
-                'raw_data': Json(prepare_jsonb_data(product.get('raw_data', {})))
+                'raw_data': JsonbAdapter(product.get('raw_data') or {})
             })
         
         execute_batch(self.cursor, insert_query, records, page_size=self.config.batch_size)
@@ -167,11 +272,11 @@ class BatchLoader:
                 'customer_id': order['customer_id'],
                 'order_date': order['order_date'],
                 'status': order['status'],
-                'shipping_address': Json(order.get('shipping_address', {})),
+                'shipping_address': JsonbAdapter(order.get('shipping_address', {})),
                 'total_amount': order['total_amount'],
                 'source_system': order['source_system'],
                 'ingestion_timestamp': order['ingestion_timestamp'],
-                'raw_data': Json(prepare_jsonb_data(order.get('raw_data', {})))
+                'raw_data': JsonbAdapter(order.get('raw_data') or {})
             })
         
         execute_batch(self.cursor, insert_query, records, page_size=self.config.batch_size)
@@ -204,7 +309,7 @@ class BatchLoader:
                 'reference_number': movement.get('reference_number'),
                 'source_system': movement['source_system'],
                 'ingestion_timestamp': movement['ingestion_timestamp'],
-                'raw_data': Json(prepare_jsonb_data(movement.get('raw_data', {})))
+                'raw_data': JsonbAdapter(movement.get('raw_data') or {})
             })
         
         execute_batch(self.cursor, insert_query, records, page_size=self.config.batch_size)
@@ -243,7 +348,7 @@ class BatchLoader:
                 'verified_purchase': review.get('verified_purchase', False),
                 'source_system': review['source_system'],
                 'ingestion_timestamp': review['ingestion_timestamp'],
-                'raw_data': Json(prepare_jsonb_data(review.get('raw_data', {})))
+                'raw_data': JsonbAdapter(review.get('raw_data') or {})
             })
         
         execute_batch(self.cursor, insert_query, records, page_size=self.config.batch_size)
@@ -279,12 +384,12 @@ class BatchLoader:
                 'device_type': session.get('device_type'),
                 'browser': session.get('browser'),
                 'operating_system': session.get('operating_system'),
-                'location': Json(session.get('location', {})),
+                'location': JsonbAdapter(session.get('location', {})),
                 'ip_address': session.get('ip_address'),
                 'is_mobile': session.get('is_mobile', False),
                 'source_system': session['source_system'],
                 'ingestion_timestamp': session['ingestion_timestamp'],
-                'raw_data': Json(prepare_jsonb_data(session.get('raw_data', {})))
+                'raw_data': JsonbAdapter(session.get('raw_data') or {})
             })
         
         execute_batch(self.cursor, insert_query, records, page_size=self.config.batch_size)
@@ -314,13 +419,48 @@ class BatchLoader:
                 'event_type': event['event_type'],
                 'page_url': event.get('page_url'),
                 'referrer': event.get('referrer'),
-                'device_info': Json(event.get('device_info', {})),
+                'device_info': JsonbAdapter(event.get('device_info', {})),
                 'event_timestamp': event['event_timestamp'],
                 'source_system': event['source_system'],
                 'ingestion_timestamp': event['ingestion_timestamp'],
-                'raw_data': Json(prepare_jsonb_data(event.get('raw_data', {})))
+                'raw_data': JsonbAdapter(event.get('raw_data') or {})
             })
         
         execute_batch(self.cursor, insert_query, records, page_size=self.config.batch_size)
         self.connection.commit()
         logger.info(f"Successfully loaded {len(events)} clickstream events")
+    
+    def load_columns(self, entity: str, batch) -> int:
+        """
+        Load a ColumnBatch from a generator's columnar mode with COPY (see copy_batch).
+        
+        The batch is rendered to COPY text a chunk at a time, without building per-row dicts.
+        As with the load_* methods, rows whose key already exists are skipped.
+        
+        Args:
+            entity: Key of COLUMNAR_TABLES ('customers', 'orders', 'clickstream', ...)
+            batch: ColumnBatch with at least the table's columns
+            
+        Returns:
+            Number of rows inserted
+        """
+        logger.info(f"Loading {len(batch)} {entity} (columnar)...")
+        try:
+            inserted = copy_batch(self.cursor, entity, batch)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        logger.info(f"Successfully loaded {inserted} {entity} ({len(batch) - inserted} already present)")
+        return inserted
+    
+    def last_id_number(self, entity: str, column: str, prefix: str) -> int:
+        """Highest number among ids like ``<prefix>000123`` in an entity's table, 0 if none."""
+        table, _ = COLUMNAR_TABLES[entity]
+        self.cursor.execute(
+            f"SELECT COALESCE(MAX(substring({column} FROM %s)::bigint), 0) FROM {table}",
+            (f'^{prefix}([0-9]+)$',),
+        )
+        number = self.cursor.fetchone()[0]
+        self.connection.commit()
+        return int(number)
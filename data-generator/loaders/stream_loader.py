@@ -1,2 +1,202 @@
-# Stream loader
+"""
+Stream Loader
+Continuously loads generator output into Bronze layer tables at a target rate.
 
+A producer pulls column batches from a source (any iterator of ``(entity, ColumnBatch)``,
+see continuous_source) and puts them on a bounded asyncio queue; ``connections`` consumers
+take batches off the queue and COPY them, each on its own connection, so one batch is
+rendered and copied while the next ones are generated. A full queue blocks the producer
+(backpressure) instead of letting batches pile up in memory when the database falls behind.
+
+Generation, rendering and COPY are blocking calls and run in worker threads; the event loop
+only schedules them and paces the producer. With ``target_rate`` the producer releases rows
+no faster than that many per second; without it, it runs as fast as the consumers drain.
+
+Each batch is stamped when it is produced; its end-to-end lag is the time until its COPY is
+committed. run() returns the achieved throughput and the lag distribution as StreamStats.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import psycopg2
+
+from .batch_loader import copy_batch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamStats:
+    """Outcome of a streaming run."""
+    rows: int = 0
+    batches: int = 0
+    elapsed_s: float = 0.0
+    target_rate: Optional[float] = None
+    rows_by_entity: Dict[str, int] = field(default_factory=dict)
+    # Time the producer spent waiting on a full queue
+    backpressure_s: float = 0.0
+    lags_s: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s else 0.0
+
+    def lag_ms(self, quantile: float) -> Optional[float]:
+        if not self.lags_s:
+            return None
+        ordered = sorted(self.lags_s)
+        return round(ordered[min(len(ordered) - 1, int(quantile * len(ordered)))] * 1000, 1)
+
+    def summary(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop('lags_s')
+        data.update(
+            elapsed_s=round(self.elapsed_s, 3),
+            backpressure_s=round(self.backpressure_s, 3),
+            rows_per_s=round(self.rows_per_s, 1),
+            lag_p50_ms=self.lag_ms(0.50),
+            lag_p95_ms=self.lag_ms(0.95),
+            lag_max_ms=self.lag_ms(1.0),
+        )
+        return data
+
+
+class StreamLoader:
+    """Asyncio producer / consumer pipeline writing column batches with COPY."""
+
+    def __init__(self, config, connections: int = 2, queue_size: int = 4,
+                 target_rate: Optional[float] = None):
+        """
+        Args:
+            config: DataGeneratorConfig (database settings).
+            connections: Consumers, each with its own connection.
+            queue_size: Batches buffered between producer and consumers.
+            target_rate: Rows per second to release; None for as fast as possible.
+        """
+        self.config = config
+        self.connections = max(1, connections)
+        self.queue_size = max(1, queue_size)
+        self.target_rate = target_rate
+
+    def _connect(self):
+        return psycopg2.connect(
+            host=self.config.db_host,
+            port=self.config.db_port,
+            database=self.config.db_name,
+            user=self.config.db_user,
+            password=self.config.db_password
+        )
+
+    @staticmethod
+    def _copy(connection, entity: str, batch) -> None:
+        cursor = connection.cursor()
+        try:
+            copy_batch(cursor, entity, batch)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    async def run(self, source: Iterator[Tuple[str, Any]], duration: Optional[float] = None,
+                  max_rows: Optional[int] = None) -> StreamStats:
+        """
+        Stream batches from ``source`` until it is exhausted, ``duration`` seconds have passed
+        or ``max_rows`` rows were produced, whichever comes first.
+        """
+        stats = StreamStats(target_rate=self.target_rate)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        connections = [await asyncio.to_thread(self._connect) for _ in range(self.connections)]
+        started = time.monotonic()
+        consumers = [asyncio.create_task(self._consume(queue, conn, stats)) for conn in connections]
+        producer = asyncio.create_task(self._produce(queue, source, stats, started, duration, max_rows))
+        tasks = [producer, *consumers]
+        try:
+            # Fail fast: a failing consumer must stop the producer, which would otherwise block
+            # on a full queue, and the other consumers
+            pending = set(tasks)
+            while not all(consumer.done() for consumer in consumers):
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        raise task.exception()
+                if producer in done:
+                    # One end marker per consumer, queued behind the remaining batches
+                    closer = asyncio.create_task(self._close(queue, len(consumers)))
+                    tasks.append(closer)
+                    pending.add(closer)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for conn in connections:
+                conn.close()
+            stats.elapsed_s = time.monotonic() - started
+        logger.info("Stream load finished: %s", stats.summary())
+        return stats
+
+    async def _produce(self, queue: asyncio.Queue, source: Iterator[Tuple[str, Any]], stats: StreamStats,
+                       started: float, duration: Optional[float], max_rows: Optional[int]) -> None:
+        produced = 0
+        while True:
+            if duration is not None and time.monotonic() - started >= duration:
+                return
+            if max_rows is not None and produced >= max_rows:
+                return
+            item = await asyncio.to_thread(next, source, None)
+            if item is None:
+                return
+            entity, batch = item
+            waited = time.monotonic()
+            await queue.put((entity, batch, time.monotonic()))
+            stats.backpressure_s += time.monotonic() - waited
+            produced += len(batch)
+            if self.target_rate:
+                # Pace on the cumulative schedule so short stalls are caught up, not lost
+                delay = started + produced / self.target_rate - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+    @staticmethod
+    async def _close(queue: asyncio.Queue, consumers: int) -> None:
+        for _ in range(consumers):
+            await queue.put(None)
+
+    async def _consume(self, queue: asyncio.Queue, connection, stats: StreamStats) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            entity, batch, produced_at = item
+            await asyncio.to_thread(self._copy, connection, entity, batch)
+            stats.lags_s.append(time.monotonic() - produced_at)
+            stats.rows += len(batch)
+            stats.batches += 1
+            stats.rows_by_entity[entity] = stats.rows_by_entity.get(entity, 0) + len(batch)
+
+
+def continuous_source(config, customers, products, sessions_per_batch: int = 200,
+                      seed: Optional[int] = None, last_session: int = 0) -> Iterator[Tuple[str, Any]]:
+    """
+    Endless sessions and their clickstream events, as (entity, ColumnBatch) pairs.
+
+    Session ids are numbered after ``last_session`` (see BatchLoader.last_id_number), so a
+    new stream does not reuse the ids of sessions loaded by an earlier one.
+    """
+    from generators.clickstream_generator import ClickstreamGenerator
+    from generators.session_generator import SessionGenerator
+
+    session_gen = SessionGenerator(config, customers, seed=seed)
+    session_gen.continue_after(last_session)
+    # One event generator for the whole stream so event ids keep counting across batches
+    event_gen = ClickstreamGenerator(config, [], products, seed=seed)
+    while True:
+        sessions = session_gen.generate_columns(sessions_per_batch)
+        yield 'sessions', sessions
+        event_gen.sessions = sessions
+        yield 'clickstream', event_gen.generate_columns()
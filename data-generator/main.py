@@ -4,6 +4,7 @@ Generates and loads realistic e-commerce data into Bronze layer.
 """
 
 import sys
+import asyncio
 import logging
 import argparse
 from datetime import datetime
@@ -20,7 +21,9 @@ from generators.inventory_generator import InventoryGenerator
 from generators.review_generator import ReviewGenerator
 from generators.session_generator import SessionGenerator
 from generators.clickstream_generator import ClickstreamGenerator
+from generators.columnar import ColumnBatch
 from loaders.batch_loader import BatchLoader
+from loaders.stream_loader import StreamLoader, continuous_source
 
 # Configure logging
 logging.basicConfig(
@@ -174,6 +177,97 @@ def generate_data(config: DataGeneratorConfig, load: bool = False):
             loader.disconnect()
 
 
+def generate_data_columnar(config: DataGeneratorConfig, load: bool = False):
+    """Generate (and optionally load) the same data set with the generators' columnar mode."""
+    from datetime import timedelta
+    
+    logger.info("=" * 60)
+    logger.info("Starting Data Generation (columnar)")
+    logger.info("=" * 60)
+    
+    loader = None
+    if load:
+        loader = BatchLoader(config)
+        loader.connect()
+    
+    try:
+        seed = config.random_seed
+        customers = CustomerGenerator(config, seed=seed).generate_columns(config.num_customers)
+        logger.info(f"[1/7] Generated: {len(customers)} customers")
+        products = ProductGenerator(config, seed=seed).generate_columns(config.num_products)
+        logger.info(f"[2/7] Generated: {len(products)} products")
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=config.days_of_data)
+        orders, order_items = OrderGenerator(config, customers, products, seed=seed) \
+            .generate_columns_for_date_range(start_date, end_date)
+        logger.info(f"[3/7] Generated: {len(orders)} orders with {len(order_items)} order items")
+        
+        inventory_gen = InventoryGenerator(config, products, seed=seed)
+        inventory = ColumnBatch.concat([
+            inventory_gen.generate_initial_inventory_columns(),
+            inventory_gen.generate_movement_columns_from_orders(order_items),
+            inventory_gen.generate_adjustment_columns(count=500),
+        ])
+        logger.info(f"[4/7] Generated: {len(inventory)} inventory movements")
+        
+        # Reviews have no columnar mode; they use the dict records of the batches
+        reviews = ReviewGenerator(
+            config, customers.to_records(), products.to_records(), orders.to_records(), seed=seed
+        ).generate()
+        logger.info(f"[5/7] Generated: {len(reviews)} reviews")
+        
+        sessions = SessionGenerator(config, customers, seed=seed).generate_columns()
+        logger.info(f"[6/7] Generated: {len(sessions)} sessions")
+        events = ClickstreamGenerator(config, sessions, products, customers, seed=seed).generate_columns()
+        logger.info(f"[7/7] Generated: {len(events)} clickstream events")
+        
+        if load:
+            loader.load_columns('customers', customers)
+            loader.load_columns('products', products)
+            loader.load_columns('orders', orders)
+            loader.load_columns('inventory', inventory)
+            loader.load_reviews(reviews)
+            loader.load_columns('sessions', sessions)
+            loader.load_columns('clickstream', events)
+    except Exception as e:
+        logger.error(f"Error during data generation: {e}", exc_info=True)
+        raise
+    finally:
+        if loader:
+            loader.disconnect()
+
+
+def stream_data(config: DataGeneratorConfig, rate: float = None, duration: float = 60.0,
+                connections: int = 2):
+    """Stream sessions and clickstream events into Bronze layer at a steady rate."""
+    
+    logger.info("=" * 60)
+    logger.info(f"Starting Stream Load ({rate or 'unthrottled'} rows/s for {duration}s)")
+    logger.info("=" * 60)
+    
+    seed = config.random_seed
+    customers = CustomerGenerator(config, seed=seed).generate_columns(config.num_customers)
+    products = ProductGenerator(config, seed=seed).generate_columns(config.num_products)
+    loader = BatchLoader(config)
+    try:
+        loader.connect()
+        # Same seed, same customers and products: already loaded ones are skipped
+        loader.load_columns('customers', customers)
+        loader.load_columns('products', products)
+        last_session = loader.last_id_number('sessions', 'session_id', 'SESS')
+    finally:
+        loader.disconnect()
+    
+    stream = StreamLoader(config, connections=connections, target_rate=rate)
+    source = continuous_source(config, customers, products, seed=seed, last_session=last_session)
+    stats = asyncio.run(stream.run(source, duration=duration))
+    summary = stats.summary()
+    logger.info(f"Streamed {summary['rows']} rows in {summary['elapsed_s']}s: {summary['rows_per_s']} rows/s, "
+                f"lag p50 {summary['lag_p50_ms']} ms, p95 {summary['lag_p95_ms']} ms, max {summary['lag_max_ms']} ms")
+    return stats
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description='Generate realistic e-commerce data')
@@ -181,6 +275,13 @@ def main():
     parser.add_argument('--customers', type=int, help='Number of customers to generate')
     parser.add_argument('--products', type=int, help='Number of products to generate')
     parser.add_argument('--days', type=int, help='Number of days of historical data')
+    parser.add_argument('--columnar', action='store_true',
+                        help='Generate column batches with NumPy and load them with COPY')
+    parser.add_argument('--stream', action='store_true',
+                        help='Continuously stream sessions and clickstream events into Bronze layer')
+    parser.add_argument('--rate', type=float, help='Target rows per second for --stream (default: unthrottled)')
+    parser.add_argument('--duration', type=float, default=60.0, help='Seconds to stream for (default 60)')
+    parser.add_argument('--connections', type=int, default=2, help='Database connections for --stream (default 2)')
     
     args = parser.parse_args()
     
@@ -196,7 +297,12 @@ def main():
         config.days_of_data = args.days
     
     # Generate and optionally load data
-    generate_data(config, load=args.load)
+    if args.stream:
+        stream_data(config, rate=args.rate, duration=args.duration, connections=args.connections)
+    elif args.columnar:
+        generate_data_columnar(config, load=args.load)
+    else:
+        generate_data(config, load=args.load)
 
 
 if __name__ == "__main__":
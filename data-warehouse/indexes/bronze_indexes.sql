@@ -1,2 +1,24 @@
 -- Bronze layer indexes
 
+-- _load_timestamp: MAX() for step high-water marks and range scans for watermark-based
+-- incremental extraction (etl/transformers/watermarks.py)
+CREATE INDEX IF NOT EXISTS idx_bronze_country_load_ts ON bronze.country(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_location_load_ts ON bronze.location(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_warehouse_load_ts ON bronze.warehouse(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_product_load_ts ON bronze.product(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_inventory_load_ts ON bronze.inventory(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_person_load_ts ON bronze.person(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_restricted_info_load_ts ON bronze.restricted_info(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_person_location_load_ts ON bronze.person_location(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_phone_number_load_ts ON bronze.phone_number(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_customer_company_load_ts ON bronze.customer_company(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_customer_employee_load_ts ON bronze.customer_employee(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_customer_load_ts ON bronze.customer(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_employment_jobs_load_ts ON bronze.employment_jobs(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_employment_load_ts ON bronze.employment(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_orders_load_ts ON bronze.orders(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_order_item_load_ts ON bronze.order_item(_load_timestamp);
+
+-- Natural key + recency: keyset-range backfill (etl/transformers/backfill.py) scans
+-- order_item_id BETWEEN a AND b and takes the latest row per id
+CREATE INDEX IF NOT EXISTS idx_bronze_order_item_id_load_ts ON bronze.order_item(order_item_id, _load_timestamp DESC);
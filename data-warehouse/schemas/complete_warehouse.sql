@@ -314,6 +314,28 @@ CREATE TABLE bronze.order_item (
         REFERENCES bronze.product (product_id)
 );
 
+-- Create indexes for Bronze Layer (watermark extraction on _load_timestamp)
+CREATE INDEX IF NOT EXISTS idx_bronze_country_load_ts ON bronze.country(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_location_load_ts ON bronze.location(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_warehouse_load_ts ON bronze.warehouse(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_product_load_ts ON bronze.product(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_inventory_load_ts ON bronze.inventory(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_person_load_ts ON bronze.person(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_restricted_info_load_ts ON bronze.restricted_info(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_person_location_load_ts ON bronze.person_location(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_phone_number_load_ts ON bronze.phone_number(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_customer_company_load_ts ON bronze.customer_company(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_customer_employee_load_ts ON bronze.customer_employee(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_customer_load_ts ON bronze.customer(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_employment_jobs_load_ts ON bronze.employment_jobs(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_employment_load_ts ON bronze.employment(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_orders_load_ts ON bronze.orders(_load_timestamp);
+CREATE INDEX IF NOT EXISTS idx_bronze_order_item_load_ts ON bronze.order_item(_load_timestamp);
+
+-- Natural key + recency: keyset-range backfill (etl/transformers/backfill.py) scans
+-- order_item_id BETWEEN a AND b and takes the latest row per id
+CREATE INDEX IF NOT EXISTS idx_bronze_order_item_id_load_ts ON bronze.order_item(order_item_id, _load_timestamp DESC);
+
 -- ============================================================================
 -- ============================================================================
 -- SILVER LAYER - Cleaned & Standardized Data
@@ -667,6 +689,12 @@ CREATE INDEX idx_silver_orders_customer ON silver.orders(customer_key);
 CREATE INDEX idx_silver_orders_date ON silver.orders(order_date);
 CREATE INDEX idx_silver_orderitem_order ON silver.order_item(order_key);
 CREATE INDEX idx_silver_orderitem_product ON silver.order_item(product_key);
+-- Delta maintenance of gold aggregates reads silver rows newer than a watermark
+CREATE INDEX idx_silver_customer_etl_ts ON silver.customer(_etl_timestamp);
+CREATE INDEX idx_silver_orders_etl_ts ON silver.orders(_etl_timestamp);
+CREATE INDEX idx_silver_orderitem_etl_ts ON silver.order_item(_etl_timestamp);
+CREATE INDEX idx_silver_inventory_etl_ts ON silver.inventory(_etl_timestamp);
+CREATE INDEX idx_silver_product_etl_ts ON silver.product(_etl_timestamp);
 
 
 -- ============================================================================
@@ -874,9 +902,13 @@ CREATE TABLE gold.dim_promotion (
 -- FACT TABLES
 -- ----------------------------------------------------------------------------
 
+-- Fact tables are range-partitioned by month on their YYYYMMDD date key. The ETL
+-- (etl/aggregators/partitions.py) creates <table>_pYYYYMM partitions ahead of each load;
+-- the DEFAULT partitions only catch keys no month partition covers yet.
+
 -- Sales Fact Table (Transaction grain - one row per order line item)
 CREATE TABLE gold.fact_sales (
-    sales_key BIGSERIAL PRIMARY KEY,
+    sales_key BIGSERIAL,
     -- Dimension keys
     order_date_key INT NOT NULL,
     customer_key BIGINT NOT NULL,
@@ -904,12 +936,15 @@ CREATE TABLE gold.fact_sales (
     CONSTRAINT fk_fact_sales_customer FOREIGN KEY (customer_key) REFERENCES gold.dim_customer(customer_key),
     CONSTRAINT fk_fact_sales_product FOREIGN KEY (product_key) REFERENCES gold.dim_product(product_key),
     CONSTRAINT fk_fact_sales_employee FOREIGN KEY (employee_key) REFERENCES gold.dim_employee(employee_key),
-    CONSTRAINT fk_fact_sales_promotion FOREIGN KEY (promotion_key) REFERENCES gold.dim_promotion(promotion_key)
-);
+    CONSTRAINT fk_fact_sales_promotion FOREIGN KEY (promotion_key) REFERENCES gold.dim_promotion(promotion_key),
+    PRIMARY KEY (sales_key, order_date_key)
+) PARTITION BY RANGE (order_date_key);
+
+CREATE TABLE gold.fact_sales_default PARTITION OF gold.fact_sales DEFAULT;
 
 -- Inventory Snapshot Fact Table (Periodic snapshot - daily inventory levels)
 CREATE TABLE gold.fact_inventory_snapshot (
-    inventory_snapshot_key BIGSERIAL PRIMARY KEY,
+    inventory_snapshot_key BIGSERIAL,
     -- Dimension keys
     snapshot_date_key INT NOT NULL,
     product_key BIGINT NOT NULL,
@@ -925,19 +960,22 @@ CREATE TABLE gold.fact_inventory_snapshot (
     -- Foreign keys
     CONSTRAINT fk_fact_inv_date FOREIGN KEY (snapshot_date_key) REFERENCES gold.dim_date(date_key),
     CONSTRAINT fk_fact_inv_product FOREIGN KEY (product_key) REFERENCES gold.dim_product(product_key),
-    CONSTRAINT fk_fact_inv_warehouse FOREIGN KEY (warehouse_key) REFERENCES gold.dim_warehouse(warehouse_key)
-);
+    CONSTRAINT fk_fact_inv_warehouse FOREIGN KEY (warehouse_key) REFERENCES gold.dim_warehouse(warehouse_key),
+    PRIMARY KEY (inventory_snapshot_key, snapshot_date_key)
+) PARTITION BY RANGE (snapshot_date_key);
+
+CREATE TABLE gold.fact_inventory_snapshot_default PARTITION OF gold.fact_inventory_snapshot DEFAULT;
 
 -- Order Fact Table (Order grain - one row per order header)
 CREATE TABLE gold.fact_orders (
-    order_fact_key BIGSERIAL PRIMARY KEY,
+    order_fact_key BIGSERIAL,
     -- Dimension keys
     order_date_key INT NOT NULL,
     customer_key BIGINT NOT NULL,
     employee_key BIGINT,  -- Sales rep
     promotion_key BIGINT,
     -- Degenerate dimension
-    order_id INT NOT NULL UNIQUE,
+    order_id INT NOT NULL,
     order_code VARCHAR(20),
     -- Measures
     total_quantity DECIMAL(12,2),
@@ -957,8 +995,13 @@ CREATE TABLE gold.fact_orders (
     CONSTRAINT fk_fact_orders_date FOREIGN KEY (order_date_key) REFERENCES gold.dim_date(date_key),
     CONSTRAINT fk_fact_orders_customer FOREIGN KEY (customer_key) REFERENCES gold.dim_customer(customer_key),
     CONSTRAINT fk_fact_orders_employee FOREIGN KEY (employee_key) REFERENCES gold.dim_employee(employee_key),
-    CONSTRAINT fk_fact_orders_promotion FOREIGN KEY (promotion_key) REFERENCES gold.dim_promotion(promotion_key)
-);
+    CONSTRAINT fk_fact_orders_promotion FOREIGN KEY (promotion_key) REFERENCES gold.dim_promotion(promotion_key),
+    PRIMARY KEY (order_fact_key, order_date_key),
+    -- Unique keys of a partitioned table must include the partition key
+    CONSTRAINT uk_fact_orders_order UNIQUE (order_id, order_date_key)
+) PARTITION BY RANGE (order_date_key);
+
+CREATE TABLE gold.fact_orders_default PARTITION OF gold.fact_orders DEFAULT;
 
 -- ----------------------------------------------------------------------------
 -- AGGREGATE TABLES (For faster querying)
@@ -1049,6 +1092,7 @@ CREATE INDEX idx_fact_sales_date ON gold.fact_sales(order_date_key);
 CREATE INDEX idx_fact_sales_customer ON gold.fact_sales(customer_key);
 CREATE INDEX idx_fact_sales_product ON gold.fact_sales(product_key);
 CREATE INDEX idx_fact_sales_employee ON gold.fact_sales(employee_key);
+CREATE INDEX idx_fact_sales_order ON gold.fact_sales(order_id, order_item_id);
 CREATE INDEX idx_fact_inv_date ON gold.fact_inventory_snapshot(snapshot_date_key);
 CREATE INDEX idx_fact_inv_product ON gold.fact_inventory_snapshot(product_key);
 CREATE INDEX idx_fact_orders_date ON gold.fact_orders(order_date_key);
@@ -0,0 +1,237 @@
+"""
+Calendar engine for gold.dim_date.
+
+Any missing date range is filled with one ``INSERT ... SELECT`` over ``generate_series``: day
+and month names, ISO week, quarter and fiscal columns are derived in SQL, holidays are passed
+in as a (date, name) array computed from the configured rules. DateDimension also keeps the
+set of date_keys known to exist in gold.dim_date, loaded once per process and extended by
+every insert, so repeated fact loads skip the existence checks entirely.
+
+Fiscal calendar and holidays come from CalendarConfig (``CalendarConfig.from_env()`` reads
+DIM_DATE_FISCAL_START_MONTH, DIM_DATE_FISCAL_YEAR_BY_END and DIM_DATE_HOLIDAYS).
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HolidayRule:
+    """A yearly holiday: a fixed ``month``/``day``, or the ``nth`` ``weekday`` of ``month``.
+
+    ``weekday`` is 0 = Monday as in ``date.weekday()``; ``nth=-1`` means the last one.
+    """
+
+    name: str
+    month: int
+    day: Optional[int] = None
+    weekday: Optional[int] = None
+    nth: int = 1
+
+    def on(self, year: int) -> date:
+        if self.day is not None:
+            return date(year, self.month, self.day)
+        if self.nth > 0:
+            first = date(year, self.month, 1)
+            offset = (self.weekday - first.weekday()) % 7
+            return first + timedelta(days=offset + 7 * (self.nth - 1))
+        next_month = date(year + self.month // 12, self.month % 12 + 1, 1)
+        last = next_month - timedelta(days=1)
+        return last - timedelta(days=(last.weekday() - self.weekday) % 7)
+
+
+US_FEDERAL_HOLIDAYS: Tuple[HolidayRule, ...] = (
+    HolidayRule("New Year's Day", 1, day=1),
+    HolidayRule("Martin Luther King Jr. Day", 1, weekday=0, nth=3),
+    HolidayRule("Presidents' Day", 2, weekday=0, nth=3),
+    HolidayRule("Memorial Day", 5, weekday=0, nth=-1),
+    HolidayRule("Juneteenth", 6, day=19),
+    HolidayRule("Independence Day", 7, day=4),
+    HolidayRule("Labor Day", 9, weekday=0, nth=1),
+    HolidayRule("Columbus Day", 10, weekday=0, nth=2),
+    HolidayRule("Veterans Day", 11, day=11),
+    HolidayRule("Thanksgiving Day", 11, weekday=3, nth=4),
+    HolidayRule("Christmas Day", 12, day=25),
+)
+
+HOLIDAY_CALENDARS = {
+    'none': (),
+    'us': US_FEDERAL_HOLIDAYS,
+}
+
+
+@dataclass(frozen=True)
+class CalendarConfig:
+    """Fiscal calendar and holiday rules used when generating dim_date rows.
+
+    ``fiscal_year_start_month`` is the first month of the fiscal year; with
+    ``fiscal_year_by_end`` the fiscal year is named after the calendar year it ends in
+    (FY starting July 2025 is FY2026), otherwise after the year it starts in.
+    """
+
+    fiscal_year_start_month: int = 1
+    fiscal_year_by_end: bool = True
+    holidays: Tuple[HolidayRule, ...] = field(default_factory=tuple)
+
+    def __post_init__(self):
+        if not 1 <= self.fiscal_year_start_month <= 12:
+            raise ValueError("fiscal_year_start_month must be 1..12")
+
+    @classmethod
+    def from_env(cls) -> "CalendarConfig":
+        holidays = os.getenv("DIM_DATE_HOLIDAYS", "none").strip().lower()
+        if holidays not in HOLIDAY_CALENDARS:
+            raise ValueError(
+                f"DIM_DATE_HOLIDAYS must be one of {sorted(HOLIDAY_CALENDARS)}, got {holidays!r}"
+            )
+        return cls(
+            fiscal_year_start_month=int(os.getenv("DIM_DATE_FISCAL_START_MONTH", "1")),
+            fiscal_year_by_end=os.getenv("DIM_DATE_FISCAL_YEAR_BY_END", "true").lower() in ("1", "true", "yes"),
+            holidays=HOLIDAY_CALENDARS[holidays],
+        )
+
+    def holidays_between(self, start: date, end: date) -> List[Tuple[date, str]]:
+        """(date, name) of every configured holiday in [start, end]."""
+        out = []
+        for year in range(start.year, end.year + 1):
+            for rule in self.holidays:
+                day = rule.on(year)
+                if start <= day <= end:
+                    out.append((day, rule.name))
+        return out
+
+    @property
+    def fiscal_month_shift(self) -> int:
+        """Months to subtract from a date to land in its fiscal month / quarter."""
+        return self.fiscal_year_start_month - 1
+
+    @property
+    def fiscal_year_shift(self) -> int:
+        """Months to add to a date so its calendar year is the fiscal year."""
+        if self.fiscal_year_by_end:
+            return (13 - self.fiscal_year_start_month) % 12
+        return -self.fiscal_month_shift
+
+
+# English names regardless of lc_time: FM strips padding, no TM prefix
+_GENERATE_SQL = """
+    INSERT INTO gold.dim_date (
+        date_key, full_date, day_of_week, day_name, day_of_month, day_of_year,
+        week_of_year, month_number, month_name, month_short_name,
+        quarter_number, quarter_name, year_number, is_weekend,
+        is_holiday, holiday_name, fiscal_year, fiscal_quarter, fiscal_month
+    )
+    SELECT
+        TO_CHAR(c.d, 'YYYYMMDD')::INT,
+        c.d,
+        EXTRACT(ISODOW FROM c.d)::SMALLINT,
+        TO_CHAR(c.d, 'FMDay'),
+        EXTRACT(DAY FROM c.d)::SMALLINT,
+        EXTRACT(DOY FROM c.d)::SMALLINT,
+        EXTRACT(WEEK FROM c.d)::SMALLINT,
+        EXTRACT(MONTH FROM c.d)::SMALLINT,
+        TO_CHAR(c.d, 'FMMonth'),
+        TO_CHAR(c.d, 'Mon'),
+        EXTRACT(QUARTER FROM c.d)::SMALLINT,
+        'Q' || EXTRACT(QUARTER FROM c.d)::INT,
+        EXTRACT(YEAR FROM c.d)::SMALLINT,
+        EXTRACT(ISODOW FROM c.d) >= 6,
+        h.name IS NOT NULL,
+        COALESCE(h.name, ''),
+        EXTRACT(YEAR FROM c.d + make_interval(months => %(fy_year_shift)s))::SMALLINT,
+        EXTRACT(QUARTER FROM c.d - make_interval(months => %(fy_month_shift)s))::SMALLINT,
+        EXTRACT(MONTH FROM c.d - make_interval(months => %(fy_month_shift)s))::SMALLINT
+    FROM (
+        SELECT gs::date AS d
+        FROM generate_series(%(start)s::date, %(end)s::date, INTERVAL '1 day') gs
+    ) c
+    LEFT JOIN unnest(%(holiday_dates)s::date[], %(holiday_names)s::text[]) AS h(day, name)
+        ON h.day = c.d
+    ON CONFLICT (date_key) DO NOTHING
+"""
+
+
+def date_key(d: date) -> int:
+    """YYYYMMDD integer key of a date."""
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+class DateDimension:
+    """Fill gold.dim_date ranges set-based and remember which date_keys exist.
+
+    One instance can be shared by aggregators on different connections; callers pass the
+    connection to use.
+    """
+
+    def __init__(self, config: Optional[CalendarConfig] = None):
+        self.config = config or CalendarConfig()
+        self._known: Set[int] = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self, connection) -> None:
+        cursor = connection.cursor()
+        cursor.execute("SELECT date_key FROM gold.dim_date")
+        keys = {int(row[0]) for row in cursor.fetchall()}
+        cursor.close()
+        self._known |= keys
+        self._loaded = True
+
+    def forget(self, start: Optional[date] = None, end: Optional[date] = None) -> None:
+        """Drop cached keys (all, or a range) after rows were deleted from gold.dim_date."""
+        with self._lock:
+            if start is None or end is None:
+                self._known.clear()
+                self._loaded = False
+                return
+            day = start
+            while day <= end:
+                self._known.discard(date_key(day))
+                day += timedelta(days=1)
+
+    def ensure_range(self, connection, start: date, end: date) -> int:
+        """Make sure every date in [start, end] exists in gold.dim_date; returns rows inserted."""
+        if end < start:
+            return 0
+        with self._lock:
+            if not self._loaded:
+                self._load(connection)
+            days = (end - start).days + 1
+            keys = [date_key(start + timedelta(days=i)) for i in range(days)]
+            if all(k in self._known for k in keys):
+                return 0
+            holidays = self.config.holidays_between(start, end)
+            cursor = connection.cursor()
+            try:
+                cursor.execute(_GENERATE_SQL, {
+                    'start': start,
+                    'end': end,
+                    'fy_year_shift': self.config.fiscal_year_shift,
+                    'fy_month_shift': self.config.fiscal_month_shift,
+                    'holiday_dates': [d for d, _ in holidays],
+                    'holiday_names': [name for _, name in holidays],
+                })
+                inserted = cursor.rowcount
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+            self._known.update(keys)
+        if inserted:
+            logger.info("  dim_date: inserted %s dates (%s..%s)", f"{inserted:,}", start, end)
+        return inserted
+
+    def ensure_dates(self, connection, dates: Iterable[date]) -> int:
+        """Make sure the given dates exist; fills the whole span between the earliest and latest."""
+        dates = [d for d in dates if d is not None]
+        if not dates:
+            return 0
+        return self.ensure_range(connection, min(dates), max(dates))
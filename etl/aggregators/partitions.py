@@ -0,0 +1,223 @@
+"""
+Monthly range partitions for the gold fact tables.
+
+gold.fact_sales / gold.fact_orders (order_date_key) and gold.fact_inventory_snapshot
+(snapshot_date_key) are range-partitioned on their YYYYMMDD date key: one partition per month
+(``<table>_pYYYYMM``) plus a DEFAULT partition (``<table>_default``) for keys no month
+partition covers yet. Dashboard range queries and the fact loads' MAX(order_id) watermark
+then only touch the partitions they need.
+
+FactPartitionManager creates month partitions ahead of each load (moving matching rows out
+of the DEFAULT partition if any landed there), attaches / detaches partitions, and names the
+partition a month's rows are written into. On an unpartitioned (heap) table every method is a
+no-op and the parent table is the write target, so SilverToGoldAggregator works against
+either layout. scripts/migrations/partition_gold_facts.sql converts an existing warehouse.
+"""
+
+import logging
+import re
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fact table -> YYYYMMDD partition key column
+PARTITIONED_FACTS = {
+    'fact_sales': 'order_date_key',
+    'fact_orders': 'order_date_key',
+    'fact_inventory_snapshot': 'snapshot_date_key',
+}
+
+# Month partitions created past the newest month being loaded
+DEFAULT_MONTHS_AHEAD = 3
+
+_MONTH_SUFFIX = re.compile(r'_p(\d{4})(\d{2})$')
+
+
+def month_start(d: date) -> date:
+    """First day of ``d``'s month."""
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    """First day of the month ``months`` after ``d``'s month."""
+    index = d.year * 12 + d.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month: date) -> Tuple[int, int]:
+    """[lower, upper) YYYYMMDD date keys of a month partition."""
+    lower = month_start(month)
+    upper = add_months(lower, 1)
+    return int(lower.strftime('%Y%m%d')), int(upper.strftime('%Y%m%d'))
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of ``table``'s partition for ``month`` (``fact_sales_p202401``)."""
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+class FactPartitionManager:
+    """Create, attach and detach monthly partitions of the gold fact tables."""
+
+    def __init__(self, connection, schema: str = 'gold',
+                 months_ahead: int = DEFAULT_MONTHS_AHEAD):
+        self.connection = connection
+        self.schema = schema
+        self.months_ahead = months_ahead
+        self._partitioned: Dict[str, bool] = {}
+
+    def is_partitioned(self, table: str) -> bool:
+        """True when ``schema.table`` is a declaratively partitioned table."""
+        if table not in self._partitioned:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                "SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(%s)",
+                (f"{self.schema}.{table}",),
+            )
+            row = cursor.fetchone()
+            cursor.close()
+            self._partitioned[table] = bool(row and row[0])
+        return self._partitioned[table]
+
+    def partitions(self, table: str) -> Dict[str, Optional[date]]:
+        """Attached partitions of ``table``: name -> month (None for DEFAULT / other bounds)."""
+        cursor = self.connection.cursor()
+        cursor.execute(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s)
+            """,
+            (f"{self.schema}.{table}",),
+        )
+        names = [row[0] for row in cursor.fetchall()]
+        cursor.close()
+        out: Dict[str, Optional[date]] = {}
+        for name in names:
+            m = _MONTH_SUFFIX.search(name)
+            out[name] = date(int(m.group(1)), int(m.group(2)), 1) if m else None
+        return out
+
+    def target(self, table: str, month: Optional[date] = None) -> str:
+        """Qualified table that rows for ``month`` are written into (parent when unpartitioned)."""
+        if month is None or not self.is_partitioned(table):
+            return f"{self.schema}.{table}"
+        return f"{self.schema}.{partition_name(table, month)}"
+
+    def ensure_months(self, table: str, first: date, last: date) -> List[str]:
+        """Create missing month partitions from ``first`` through ``last`` + months_ahead.
+
+        Returns the names of the partitions created (empty for heap tables).
+        """
+        if not self.is_partitioned(table):
+            return []
+        existing = set(self.partitions(table))
+        created = []
+        month = month_start(first)
+        stop = add_months(month_start(last), self.months_ahead)
+        while month <= stop:
+            name = partition_name(table, month)
+            if name not in existing:
+                self._create(table, month)
+                created.append(name)
+            month = add_months(month, 1)
+        if created:
+            logger.info("  Created %s partition(s) of %s.%s: %s..%s", len(created),
+                        self.schema, table, created[0], created[-1])
+        return created
+
+    def _create(self, table: str, month: date) -> None:
+        """Create one month partition, moving its rows out of the DEFAULT partition first."""
+        key = PARTITIONED_FACTS[table]
+        lower, upper = month_bounds(month)
+        parent = f"{self.schema}.{table}"
+        part = f"{self.schema}.{partition_name(table, month)}"
+        default = f"{self.schema}.{table}_default"
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (default,))
+            has_default = cursor.fetchone()[0]
+            stray = False
+            if has_default:
+                cursor.execute(
+                    f"SELECT 1 FROM {default} WHERE {key} >= %s AND {key} < %s LIMIT 1",
+                    (lower, upper),
+                )
+                stray = cursor.fetchone() is not None
+            if not stray:
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS {part} PARTITION OF {parent} "
+                    f"FOR VALUES FROM ({lower}) TO ({upper})"
+                )
+            else:
+                # Postgres refuses a new partition while DEFAULT holds rows for its range
+                cursor.execute(f"ALTER TABLE {parent} DETACH PARTITION {default}")
+                cursor.execute(
+                    f"CREATE TABLE {part} PARTITION OF {parent} "
+                    f"FOR VALUES FROM ({lower}) TO ({upper})"
+                )
+                cursor.execute(
+                    f"INSERT INTO {part} SELECT * FROM {default} WHERE {key} >= %s AND {key} < %s",
+                    (lower, upper),
+                )
+                moved = cursor.rowcount
+                cursor.execute(
+                    f"DELETE FROM {default} WHERE {key} >= %s AND {key} < %s", (lower, upper)
+                )
+                cursor.execute(f"ALTER TABLE {parent} ATTACH PARTITION {default} DEFAULT")
+                logger.info("  Moved %s rows of %s from %s into %s", f"{moved:,}",
+                            month.strftime('%Y-%m'), default, part)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def attach(self, table: str, month: date, source_table: Optional[str] = None) -> str:
+        """Attach an existing table as ``table``'s partition for ``month``.
+
+        ``source_table`` defaults to the conventional partition name (e.g. one detached
+        earlier). Postgres validates that every row falls inside the month first.
+        """
+        lower, upper = month_bounds(month)
+        source = source_table or f"{self.schema}.{partition_name(table, month)}"
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"ALTER TABLE {self.schema}.{table} ATTACH PARTITION {source} "
+                f"FOR VALUES FROM ({lower}) TO ({upper})"
+            )
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        logger.info("Attached %s to %s.%s for %s", source, self.schema, table, month.strftime('%Y-%m'))
+        return source
+
+    def detach(self, table: str, month: date) -> str:
+        """Detach ``table``'s partition for ``month``; the rows stay in a standalone table."""
+        part = f"{self.schema}.{partition_name(table, month)}"
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"ALTER TABLE {self.schema}.{table} DETACH PARTITION {part}")
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        logger.info("Detached %s from %s.%s", part, self.schema, table)
+        return part
+
+    def detach_before(self, table: str, before: date) -> List[str]:
+        """Detach every month partition older than ``before``'s month (archival)."""
+        if not self.is_partitioned(table):
+            return []
+        cutoff = month_start(before)
+        old = sorted(m for m in self.partitions(table).values() if m is not None and m < cutoff)
+        return [self.detach(table, m) for m in old]
@@ -0,0 +1,193 @@
+"""
+Materialized views serving the warehouse dashboard endpoints.
+
+The /warehouse/sales-stats, /top-products and /customer-stats endpoints aggregate over the
+gold facts on every request. These views precompute their shapes once per gold load:
+
+- gold.mv_daily_sales_by_category: sales per order date and product category
+  (totals and the daily series are sums over it).
+- gold.mv_top_products: sales per product for fixed trailing windows (``window_days``,
+  0 = all time) counted back from the refresh date.
+- gold.mv_customer_tiers: customers and their orders per lifetime value tier.
+
+Each view has a unique index so it can be refreshed CONCURRENTLY (readers are never blocked);
+the first refresh of an unpopulated view is a plain one. ServingViewManager creates missing
+views, refreshes them right after SilverToGoldAggregator.aggregate_all() and records every
+refresh in monitoring.serving_view_refresh, which the API reads to report staleness.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Trailing windows precomputed by gold.mv_top_products (0 = all time)
+TOP_PRODUCT_WINDOWS = (0, 7, 30, 90, 365)
+
+# view name -> (defining query, unique index columns)
+SERVING_VIEWS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'mv_daily_sales_by_category': ("""
+        SELECT
+            fs.order_date_key,
+            COALESCE(p.category_name, 'Unknown') AS category_name,
+            COUNT(*) AS sales_count,
+            COUNT(fs.net_amount) AS priced_count,
+            COALESCE(SUM(fs.net_amount), 0) AS revenue,
+            COALESCE(SUM(fs.quantity), 0) AS quantity
+        FROM gold.fact_sales fs
+        LEFT JOIN gold.dim_product p ON fs.product_key = p.product_key
+        GROUP BY fs.order_date_key, COALESCE(p.category_name, 'Unknown')
+    """, ('order_date_key', 'category_name')),
+    'mv_top_products': ("""
+        SELECT
+            w.window_days,
+            COALESCE(p.product_name, 'Unknown') AS product_name,
+            COUNT(*) AS sales_count,
+            SUM(fs.net_amount) AS revenue,
+            COALESCE(SUM(fs.quantity), 0) AS quantity
+        FROM unnest(ARRAY[{windows}]) AS w(window_days)
+        JOIN gold.fact_sales fs
+            ON w.window_days = 0
+            OR fs.order_date_key >= TO_CHAR(CURRENT_DATE - w.window_days, 'YYYYMMDD')::INT
+        LEFT JOIN gold.dim_product p ON fs.product_key = p.product_key
+        GROUP BY w.window_days, COALESCE(p.product_name, 'Unknown')
+    """.format(windows=', '.join(str(w) for w in TOP_PRODUCT_WINDOWS)),
+        ('window_days', 'product_name')),
+    'mv_customer_tiers': ("""
+        WITH per_customer AS (
+            SELECT customer_key, COUNT(*) AS orders, SUM(net_amount) AS revenue
+            FROM gold.fact_orders
+            GROUP BY customer_key
+        )
+        SELECT
+            COALESCE(c.lifetime_value_tier, 'Unknown') AS lifetime_value_tier,
+            COUNT(c.customer_key) AS customer_count,
+            COUNT(o.customer_key) AS ordering_customers,
+            COALESCE(SUM(o.orders), 0) AS total_orders,
+            COALESCE(SUM(o.revenue), 0) AS total_revenue
+        FROM gold.dim_customer c
+        FULL JOIN per_customer o ON o.customer_key = c.customer_key
+        GROUP BY COALESCE(c.lifetime_value_tier, 'Unknown')
+    """, ('lifetime_value_tier',)),
+}
+
+
+class ServingViewManager:
+    """Create and refresh the gold serving materialized views, tracking each refresh."""
+
+    def __init__(self, connection, schema: str = 'gold'):
+        self.connection = connection
+        self.schema = schema
+
+    def ensure_table_exists(self) -> None:
+        """Create monitoring.serving_view_refresh if missing."""
+        cursor = self.connection.cursor()
+        cursor.execute("CREATE SCHEMA IF NOT EXISTS monitoring;")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS monitoring.serving_view_refresh (
+                view_name         VARCHAR(100) PRIMARY KEY,
+                refreshed_at      TIMESTAMP,
+                refresh_seconds   NUMERIC(10,3),
+                row_count         BIGINT,
+                concurrent        BOOLEAN,
+                last_error        TEXT,
+                last_attempt_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        self.connection.commit()
+        cursor.close()
+
+    def ensure_views(self) -> List[str]:
+        """Create missing views (WITH NO DATA) and their unique indexes; returns views created."""
+        created = []
+        cursor = self.connection.cursor()
+        try:
+            for name, (query, unique_cols) in SERVING_VIEWS.items():
+                cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (f"{self.schema}.{name}",))
+                if not cursor.fetchone()[0]:
+                    cursor.execute(
+                        f"CREATE MATERIALIZED VIEW {self.schema}.{name} AS {query} WITH NO DATA"
+                    )
+                    created.append(name)
+                cursor.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{name} "
+                    f"ON {self.schema}.{name} ({', '.join(unique_cols)})"
+                )
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        if created:
+            logger.info("  Created serving view(s): %s", ", ".join(created))
+        return created
+
+    def _is_populated(self, name: str) -> bool:
+        cursor = self.connection.cursor()
+        cursor.execute(
+            "SELECT ispopulated FROM pg_matviews WHERE schemaname = %s AND matviewname = %s",
+            (self.schema, name),
+        )
+        row = cursor.fetchone()
+        cursor.close()
+        return bool(row and row[0])
+
+    def _record(self, name: str, seconds: Optional[float], rows: Optional[int],
+                concurrent: Optional[bool], error: Optional[str]) -> None:
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            INSERT INTO monitoring.serving_view_refresh
+                (view_name, refreshed_at, refresh_seconds, row_count, concurrent,
+                 last_error, last_attempt_at)
+            VALUES (%(name)s, CASE WHEN %(error)s IS NULL THEN CURRENT_TIMESTAMP END,
+                    %(seconds)s, %(rows)s, %(concurrent)s, %(error)s, CURRENT_TIMESTAMP)
+            ON CONFLICT (view_name) DO UPDATE SET
+                refreshed_at = COALESCE(EXCLUDED.refreshed_at, monitoring.serving_view_refresh.refreshed_at),
+                refresh_seconds = COALESCE(EXCLUDED.refresh_seconds, monitoring.serving_view_refresh.refresh_seconds),
+                row_count = COALESCE(EXCLUDED.row_count, monitoring.serving_view_refresh.row_count),
+                concurrent = COALESCE(EXCLUDED.concurrent, monitoring.serving_view_refresh.concurrent),
+                last_error = EXCLUDED.last_error,
+                last_attempt_at = CURRENT_TIMESTAMP
+        """, {'name': name, 'seconds': seconds, 'rows': rows,
+              'concurrent': concurrent, 'error': error})
+        self.connection.commit()
+        cursor.close()
+
+    def refresh(self, name: str) -> int:
+        """Refresh one view (CONCURRENTLY once populated); returns its row count."""
+        concurrent = self._is_populated(name)
+        t0 = time.time()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrent else ''}"
+                f"{self.schema}.{name}"
+            )
+            cursor.execute(f"SELECT COUNT(*) FROM {self.schema}.{name}")
+            rows = cursor.fetchone()[0]
+            self.connection.commit()
+        except Exception as e:
+            self.connection.rollback()
+            self._record(name, None, None, None, str(e))
+            raise
+        finally:
+            cursor.close()
+        elapsed = time.time() - t0
+        self._record(name, round(elapsed, 3), rows, concurrent, None)
+        logger.info("  Refreshed %s.%s%s: %s rows in %.2fs", self.schema, name,
+                    " (concurrently)" if concurrent else "", f"{rows:,}", elapsed)
+        return rows
+
+    def refresh_all(self) -> Dict[str, int]:
+        """Create missing views and refresh all of them; a failed view does not stop the rest."""
+        self.ensure_table_exists()
+        self.ensure_views()
+        results = {}
+        for name in SERVING_VIEWS:
+            try:
+                results[name] = self.refresh(name)
+            except Exception as e:
+                logger.warning("Could not refresh %s.%s: %s", self.schema, name, e)
+        return results
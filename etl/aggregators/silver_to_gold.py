@@ -6,32 +6,110 @@ Incremental ETL:
 - Dimensions (dim_product, dim_location, dim_warehouse, dim_employee): insert rows for keys
   that exist in silver but not yet in gold (NOT EXISTS), so append-only bronze/silver loads extend gold.
 - dim_customer / dim_promotion: already merge via NOT EXISTS or ON CONFLICT.
-- fact_sales / fact_orders: full DELETE + INSERT from silver each run (current truth).
+- fact_sales / fact_orders: append new orders past the max(order_id) watermark. When the facts
+  are range-partitioned by month (see partitions.py), missing month partitions are created
+  first and each month's rows are inserted straight into its partition.
 - fact_inventory_snapshot: incremental per snapshot date — carry forward unchanged rows from the
   previous snapshot date, INSERT new/changed keys from silver, UPDATE rows when silver differs from
   gold for that date, DELETE keys no longer in silver. Use force_refresh=True to clear that date first.
-- agg_customer_lifetime, agg_monthly_product_sales, agg_sales_rep_performance: DELETE all then
-  rebuild from silver each run so summaries match new orders/customers.
+  With watermarks, only (product, warehouse) keys whose silver inventory or product rows are newer
+  than the snapshot watermark are re-read from silver; every other key is copied from the previous
+  snapshot without comparing. The full comparison still runs on the reconcile interval.
+  backfill_inventory_snapshots() loads a range of dates set-based, one statement per month.
+- agg_customer_lifetime, agg_monthly_product_sales: delta maintenance. Only groups touched by
+  silver rows newer than the aggregate's watermark (silver _etl_timestamp, kept in
+  monitoring.etl_watermarks as gold.<table>) are recomputed and upserted: customers with new
+  customer/order/order_item rows, and whole (year, month) periods with new orders or items
+  (category_rank is per month). Without a watermark, or once the reconcile interval passes,
+  every group is recomputed. force_refresh=True deletes and rebuilds the table (repair).
+- agg_sales_rep_performance: DELETE all then rebuild from silver each run.
 - agg_daily_sales: per-date inserts; missing dates are filled in aggregate_all().
+- Serving materialized views (serving_views.py) for the dashboard endpoints are refreshed
+  CONCURRENTLY at the end of aggregate_all(); refresh times are kept for staleness reporting.
+- dim_date: missing date ranges are generated set-based by DateDimension (date_dimension.py),
+  which also caches the known date_keys so fact loads skip per-date existence checks. Fiscal
+  year start and holiday rules are configurable (DIM_DATE_* environment variables).
 """
 
 import psycopg2
 from datetime import datetime, date, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import logging
+import threading
 import time
 
+from etl.aggregators.date_dimension import CalendarConfig, DateDimension
+from etl.aggregators.partitions import FactPartitionManager, add_months
+from etl.aggregators.serving_views import ServingViewManager
+from etl.utils.dag_executor import DagExecutor
+from etl.utils import profiling
+
 logger = logging.getLogger(__name__)
 
+# Silver sources of a (product, warehouse) inventory snapshot row
+INVENTORY_SNAPSHOT_SOURCES = ('inventory', 'product')
+
+# Snapshot measures per (product, warehouse) from silver; same derivation as
+# populate_fact_inventory_snapshot's full comparison
+INVENTORY_SNAPSHOT_SELECT = """
+    SELECT
+        i.product_key,
+        i.warehouse_key,
+        COALESCE(i.quantity_on_hand, 0) AS quantity_on_hand,
+        COALESCE(i.quantity_available, 0) AS quantity_available,
+        COALESCE(i.quantity_reserved, 0) AS quantity_reserved,
+        CASE
+            WHEN COALESCE(i.quantity_available, 0) <= 0 THEN 0
+            ELSE LEAST(999, GREATEST(0, (i.quantity_on_hand / NULLIF(i.quantity_available, 0))::INT))
+        END AS days_of_supply,
+        CASE
+            WHEN COALESCE(i.quantity_available, 0) <= 0 THEN 'OUT_OF_STOCK'
+            WHEN COALESCE(i.quantity_available, 0) < 10 THEN 'LOW_STOCK'
+            ELSE 'IN_STOCK'
+        END AS stock_status,
+        ROUND(COALESCE(i.quantity_on_hand, 0) * COALESCE(p.list_price, 0), 2) AS inventory_value
+    FROM silver.inventory i
+    LEFT JOIN silver.product p ON i.product_key = p.product_key AND p.is_valid = TRUE
+    WHERE i.is_valid = TRUE
+"""
+
+INVENTORY_SNAPSHOT_COLUMNS = """
+    snapshot_date_key, product_key, warehouse_key,
+    quantity_on_hand, quantity_available, quantity_reserved,
+    days_of_supply, stock_status, inventory_value
+"""
+
+# (totals key, log label, populate method, dimension dependencies)
+DIMENSION_STEPS = (
+    ('dim_date', 'Date', 'populate_dim_date', ()),
+    ('dim_customer', 'Customer', 'populate_dim_customer', ()),
+    ('dim_product', 'Product', 'populate_dim_product', ()),
+    ('dim_employee', 'Employee', 'populate_dim_employee', ()),
+    ('dim_location', 'Location', 'populate_dim_location', ()),
+    # Only warehouses whose location is already in dim_location are inserted
+    ('dim_warehouse', 'Warehouse', 'populate_dim_warehouse', ('dim_location',)),
+    ('dim_promotion', 'Promotion', 'populate_dim_promotion', ()),
+)
+
 
 class SilverToGoldAggregator:
     """Aggregates Silver layer data to Gold layer."""
     
-    def __init__(self, connection, tracker=None):
-        """Initialize aggregator with database connection."""
+    def __init__(self, connection, tracker=None, watermarks=None, calendar=None):
+        """Initialize aggregator with database connection.
+
+        ``watermarks`` (WatermarkStore) enables delta maintenance of the lifetime and
+        monthly aggregates; without it they are fully recomputed each run. ``calendar``
+        (DateDimension) is shared between aggregators so the known date_keys are loaded once;
+        by default one is built from CalendarConfig.from_env().
+        """
         self.connection = connection
         self.cursor = connection.cursor()
         self.tracker = tracker
+        self.watermarks = watermarks
+        self.partitions = FactPartitionManager(connection)
+        self.calendar = calendar or DateDimension(CalendarConfig.from_env())
+        self.serving_views = ServingViewManager(connection)
     
     def table_is_empty(self, schema: str, table: str) -> bool:
         """Check if a table is empty."""
@@ -42,66 +120,67 @@ class SilverToGoldAggregator:
             logger.error(f"Error checking if {schema}.{table} is empty: {e}")
             return False
     
-    def _ensure_dim_date_for_order_dates(self) -> None:
-        """Ensure gold.dim_date contains every distinct order_date present in silver.orders."""
-        logger.info(
-            "Ensuring dim_date has all order dates (scanning silver.orders; "
-            "this may take several minutes on very large tables)..."
-        )
-        t0 = time.time()
+    def _aggregate_since(self, name: str, source_tables: tuple,
+                         full_reconcile: bool = False):
+        """Delta bound and new high-water for a gold aggregate; (None, hw) recomputes every group."""
+        if not self.watermarks:
+            return None, None
+        step = f"gold.{name}"
+        try:
+            self.watermarks.load()
+            high_water = self.watermarks.silver_high_water(*source_tables)
+        except Exception as e:
+            self.connection.rollback()
+            logger.warning("Could not read watermark for %s, recomputing all groups: %s", step, e)
+            return None, None
+        since = self.watermarks.extract_since(step, force_full=full_reconcile)
+        logger.info("  Delta for %s: %s", name,
+                    f"silver rows since {since:%Y-%m-%d %H:%M:%S}" if since else "all groups")
+        return since, high_water
+    
+    def _advance_aggregate_watermark(self, name: str, source_tables: tuple, high_water,
+                                     full: bool) -> None:
+        """Persist a gold aggregate's watermark after its upsert committed."""
+        if not self.watermarks:
+            return
+        try:
+            self.watermarks.advance(f"gold.{name}", ",".join(f"silver.{t}" for t in source_tables),
+                                    high_water, full_reconcile=full)
+        except Exception as e:
+            self.connection.rollback()
+            logger.warning("Could not advance watermark for gold.%s: %s", name, e)
+    
+    def _fact_load_months(self, table: str, max_order_id: int) -> List[Optional[date]]:
+        """Months of orders past the watermark, with their partitions created; [None] if unpartitioned."""
+        if not self.partitions.is_partitioned(table):
+            return [None]
         self.cursor.execute("""
-            WITH distinct_order_dates AS (
-                SELECT DISTINCT order_date AS d
-                FROM silver.orders
-                WHERE order_date IS NOT NULL
-            )
-            SELECT d.d
-            FROM distinct_order_dates d
-            WHERE NOT EXISTS (
-                SELECT 1 FROM gold.dim_date g WHERE g.full_date = d.d
-            )
+            SELECT DISTINCT date_trunc('month', o.order_date)::date
+            FROM silver.orders o
+            WHERE o.is_valid = TRUE
+              AND o.order_date IS NOT NULL
+              AND o.order_id > %s
             ORDER BY 1
-        """)
-        missing_dates: List[Any] = [row[0] for row in self.cursor.fetchall()]
-        elapsed = time.time() - t0
-        logger.info(
-            "  dim_date gap scan complete in %.1fs (%s dates missing from dim_date)",
-            elapsed,
-            f"{len(missing_dates):,}",
+        """, (max_order_id,))
+        months = [row[0] for row in self.cursor.fetchall()]
+        if months:
+            self.partitions.ensure_months(table, months[0], months[-1])
+        return months
+    
+    def _ensure_dim_date_for_order_dates(self) -> None:
+        """Ensure gold.dim_date covers every date between the first and last silver order."""
+        t0 = time.time()
+        self.cursor.execute(
+            "SELECT MIN(order_date), MAX(order_date) FROM silver.orders WHERE order_date IS NOT NULL"
         )
-        if not missing_dates:
+        first, last = self.cursor.fetchone()
+        if first is None:
             return
-        logger.info(f"  Inserting {len(missing_dates):,} missing dim_date rows...")
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        month_short = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        for order_date in missing_dates:
-            date_key = int(order_date.strftime('%Y%m%d'))
-            day_of_week = order_date.weekday() + 1
-            quarter = (order_date.month - 1) // 3 + 1
-            try:
-                self.cursor.execute("""
-                    INSERT INTO gold.dim_date (
-                        date_key, full_date, day_of_week, day_name, day_of_month, day_of_year,
-                        week_of_year, month_number, month_name, month_short_name,
-                        quarter_number, quarter_name, year_number, is_weekend,
-                        is_holiday, holiday_name, fiscal_year, fiscal_quarter, fiscal_month
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (date_key) DO NOTHING
-                """, (
-                    date_key, order_date, day_of_week, day_names[order_date.weekday()],
-                    order_date.day, order_date.timetuple().tm_yday,
-                    order_date.isocalendar()[1], order_date.month,
-                    month_names[order_date.month - 1], month_short[order_date.month - 1],
-                    quarter, f"Q{quarter}", order_date.year, order_date.weekday() >= 5,
-                    False, '', order_date.year, quarter, order_date.month,
-                ))
-            except Exception as e:
-                logger.warning(f"  Error inserting date {order_date}: {e}")
-        self.connection.commit()
-        logger.info(f"  Populated {len(missing_dates):,} missing dates in dim_date")
+        inserted = self.calendar.ensure_range(self.connection, first, last)
+        logger.info(
+            "  dim_date covers %s..%s (%s dates added in %.1fs)",
+            first, last, f"{inserted:,}", time.time() - t0,
+        )
     
     def aggregate_daily_sales(self, target_date: date = None, force_refresh: bool = False):
         """Aggregate daily sales for a specific date into gold.agg_daily_sales."""
@@ -123,36 +202,7 @@ class SilverToGoldAggregator:
         
         logger.info(f"Aggregating daily sales for {target_date}...")
         
-        # Check if date dimension exists, create if not
-        self.cursor.execute("SELECT 1 FROM gold.dim_date WHERE date_key = %s", (date_key,))
-        if not self.cursor.fetchone():
-            # Create date dimension entry
-            day_of_week = target_date.weekday() + 1  # Monday = 1
-            day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            month_short = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            
-            qn = (target_date.month - 1) // 3 + 1
-            self.cursor.execute("""
-                INSERT INTO gold.dim_date (
-                    date_key, full_date, day_of_week, day_name, day_of_month, day_of_year,
-                    week_of_year, month_number, month_name, month_short_name,
-                    quarter_number, quarter_name, year_number, is_weekend,
-                    is_holiday, holiday_name, fiscal_year, fiscal_quarter, fiscal_month
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (date_key) DO NOTHING
-            """, (
-                date_key, target_date, day_of_week, day_names[target_date.weekday()],
-                target_date.day, target_date.timetuple().tm_yday,
-                target_date.isocalendar()[1], target_date.month,
-                month_names[target_date.month - 1], month_short[target_date.month - 1],
-                qn, f"Q{qn}",
-                target_date.year, target_date.weekday() >= 5,
-                False, '', target_date.year, qn, target_date.month,
-            ))
-            self.connection.commit()
+        self.calendar.ensure_range(self.connection, target_date, target_date)
         
         # Only delete when explicit refresh is requested.
         if force_refresh:
@@ -196,11 +246,16 @@ class SilverToGoldAggregator:
             self.connection.rollback()
             return 0
     
-    def aggregate_customer_lifetime(self, force_refresh: bool = False):
+    def aggregate_customer_lifetime(self, force_refresh: bool = False, full_reconcile: bool = False):
         """Aggregate customer lifetime value into gold.agg_customer_lifetime.
 
-        Always rebuilds from silver (DELETE + INSERT) so new customers/orders after
-        incremental Bronze→Silver are reflected. force_refresh kept for API compatibility.
+        Recomputes and upserts only customers touched since the aggregate's watermark
+        (new or changed silver customer, orders or order_item rows), and deletes customers
+        whose silver row changed to invalid. Deletions leave no newer silver row behind, so
+        orders deleted or moved away from a customer are only picked up by full_reconcile
+        (forced, or when the watermark's reconcile interval elapses), which recomputes every
+        customer, deletes those no longer valid in silver and refreshes date-relative RFM
+        recency and tenure; force_refresh deletes the table and rebuilds it from silver.
         """
         # Check prerequisite tables
         try:
@@ -208,17 +263,18 @@ class SilverToGoldAggregator:
         except:
             pass
         
-        self.cursor.execute("SELECT COUNT(*) FROM silver.customer WHERE is_valid = TRUE")
-        customer_count = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM silver.orders WHERE is_valid = TRUE")
-        orders_count = self.cursor.fetchone()[0]
-        logger.info(f"Aggregating customer lifetime data... (Found {customer_count:,} customers, {orders_count:,} orders in Silver)")
+        logger.info("Aggregating customer lifetime data...")
         
-        if customer_count == 0 or orders_count == 0:
+        if self.table_is_empty('silver', 'customer') or self.table_is_empty('silver', 'orders'):
             logger.warning("[WARN] silver.customer or silver.orders is empty - cannot aggregate customer lifetime")
             logger.warning("  [WARN] Ensure silver.customer and silver.orders are populated first")
             return 0
         
+        sources = ('customer', 'orders', 'order_item')
+        since, high_water = self._aggregate_since(
+            'agg_customer_lifetime', sources, full_reconcile=full_reconcile or force_refresh
+        )
+        
         aggregate_query = """
             INSERT INTO gold.agg_customer_lifetime (
                 customer_key, first_order_date, last_order_date, customer_tenure_days,
@@ -227,7 +283,19 @@ class SilverToGoldAggregator:
                 rfm_recency_score, rfm_frequency_score, rfm_monetary_score,
                 rfm_segment, customer_tier
             )
-            WITH customer_stats AS (
+            WITH touched_customers AS (
+                SELECT c.customer_key FROM silver.customer c
+                WHERE c._etl_timestamp >= %(since)s
+                UNION
+                SELECT o.customer_key FROM silver.orders o
+                WHERE o._etl_timestamp >= %(since)s
+                UNION
+                SELECT o.customer_key
+                FROM silver.order_item oi
+                JOIN silver.orders o ON o.order_key = oi.order_key
+                WHERE oi._etl_timestamp >= %(since)s
+            ),
+            customer_stats AS (
                 SELECT
                     c.customer_key,
                     MIN(o.order_date) as first_order_date,
@@ -244,6 +312,8 @@ class SilverToGoldAggregator:
                 LEFT JOIN silver.orders o ON c.customer_key = o.customer_key
                 LEFT JOIN silver.order_item oi ON o.order_key = oi.order_key
                 WHERE c.is_valid = TRUE
+                  AND (%(since)s::timestamp IS NULL
+                       OR c.customer_key IN (SELECT customer_key FROM touched_customers))
                 GROUP BY c.customer_key
             ),
             rfm_scores AS (
@@ -309,19 +379,59 @@ class SilverToGoldAggregator:
                     ELSE 'BRONZE'
                 END as customer_tier
             FROM rfm_scores rfm
-            WHERE NOT EXISTS (
-                SELECT 1
-                FROM gold.agg_customer_lifetime g
-                WHERE g.customer_key = rfm.customer_key
-            )
+            ON CONFLICT (customer_key) DO UPDATE SET
+                first_order_date = EXCLUDED.first_order_date,
+                last_order_date = EXCLUDED.last_order_date,
+                customer_tenure_days = EXCLUDED.customer_tenure_days,
+                total_orders = EXCLUDED.total_orders,
+                total_items_purchased = EXCLUDED.total_items_purchased,
+                lifetime_gross_value = EXCLUDED.lifetime_gross_value,
+                lifetime_net_value = EXCLUDED.lifetime_net_value,
+                avg_order_value = EXCLUDED.avg_order_value,
+                avg_order_frequency_days = EXCLUDED.avg_order_frequency_days,
+                rfm_recency_score = EXCLUDED.rfm_recency_score,
+                rfm_frequency_score = EXCLUDED.rfm_frequency_score,
+                rfm_monetary_score = EXCLUDED.rfm_monetary_score,
+                rfm_segment = EXCLUDED.rfm_segment,
+                customer_tier = EXCLUDED.customer_tier
         """
         
+        # Customers that no longer aggregate: on a delta run those invalidated since the
+        # watermark, on a full run every customer removed from silver or no longer valid
+        if since is None:
+            delete_stale_query = """
+                DELETE FROM gold.agg_customer_lifetime g
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM silver.customer c
+                    WHERE c.customer_key = g.customer_key AND c.is_valid = TRUE
+                )
+            """
+        else:
+            delete_stale_query = """
+                DELETE FROM gold.agg_customer_lifetime g
+                USING silver.customer c
+                WHERE c.customer_key = g.customer_key
+                  AND c._etl_timestamp >= %(since)s
+                  AND c.is_valid IS DISTINCT FROM TRUE
+            """
+        
         try:
-            self.cursor.execute(aggregate_query)
+            if force_refresh:
+                self.cursor.execute("DELETE FROM gold.agg_customer_lifetime")
+            self.cursor.execute(aggregate_query, {'since': since})
             count = self.cursor.rowcount
+            if force_refresh:
+                removed = 0
+            else:
+                self.cursor.execute(delete_stale_query, {'since': since})
+                removed = self.cursor.rowcount
             self.connection.commit()
+            if removed:
+                logger.info(f"  Removed {removed:,} customers no longer valid in silver")
+            self._advance_aggregate_watermark('agg_customer_lifetime', sources, high_water,
+                                              full=since is None)
             if count == 0:
-                logger.warning("[WARN] No records inserted into agg_customer_lifetime - check data quality")
+                logger.info("  No customers touched since the last run")
             else:
                 logger.info(f"Successfully aggregated {count:,} customer lifetime records")
             return count
@@ -330,10 +440,15 @@ class SilverToGoldAggregator:
             self.connection.rollback()
             return 0
     
-    def aggregate_monthly_product_sales(self, force_refresh: bool = False):
+    def aggregate_monthly_product_sales(self, force_refresh: bool = False, full_reconcile: bool = False):
         """Aggregate monthly product sales into gold.agg_monthly_product_sales.
 
-        Rebuilt each pipeline run from silver so incremental loads update category/month metrics.
+        Recomputes only (year, month) periods with orders or order items loaded since the
+        aggregate's watermark, plus months in gold without any silver orders left. Such a
+        month's rows are deleted and rebuilt in one transaction, so categories that no longer
+        have sales disappear and category_rank stays consistent. full_reconcile recomputes
+        every month (catching deletes inside months that still have orders); force_refresh
+        deletes the table and rebuilds it from silver.
         """
         # Check prerequisite tables
         try:
@@ -341,24 +456,57 @@ class SilverToGoldAggregator:
         except:
             pass
         
-        self.cursor.execute("SELECT COUNT(*) FROM silver.orders WHERE is_valid = TRUE")
-        orders_count = self.cursor.fetchone()[0]
-        self.cursor.execute("SELECT COUNT(*) FROM silver.order_item WHERE is_valid = TRUE")
-        items_count = self.cursor.fetchone()[0]
-        logger.info(f"Aggregating monthly product sales... (Found {orders_count:,} orders, {items_count:,} order items in Silver)")
+        logger.info("Aggregating monthly product sales...")
         
-        if orders_count == 0 or items_count == 0:
+        if self.table_is_empty('silver', 'orders') or self.table_is_empty('silver', 'order_item'):
             logger.warning("[WARN] silver.orders or silver.order_item is empty - cannot aggregate monthly product sales")
             logger.warning("  [WARN] Ensure silver.orders and silver.order_item are populated first")
             return 0
         
-        aggregate_query = """
+        sources = ('orders', 'order_item')
+        since, high_water = self._aggregate_since(
+            'agg_monthly_product_sales', sources, full_reconcile=full_reconcile or force_refresh
+        )
+        
+        touched_months = """
+            touched_months AS (
+                SELECT EXTRACT(YEAR FROM o.order_date)::INT AS year_number,
+                       EXTRACT(MONTH FROM o.order_date)::INT AS month_number
+                FROM silver.orders o
+                WHERE o._etl_timestamp >= %(since)s
+                UNION
+                SELECT EXTRACT(YEAR FROM o.order_date)::INT, EXTRACT(MONTH FROM o.order_date)::INT
+                FROM silver.order_item oi
+                JOIN silver.orders o ON o.order_key = oi.order_key
+                WHERE oi._etl_timestamp >= %(since)s
+                UNION
+                -- Months whose orders were all deleted or moved to another month
+                SELECT g.year_number, g.month_number
+                FROM gold.agg_monthly_product_sales g
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM silver.orders o
+                    WHERE o.order_date >= make_date(g.year_number, g.month_number, 1)
+                      AND o.order_date < make_date(g.year_number, g.month_number, 1) + INTERVAL '1 month'
+                )
+            )
+        """
+        
+        # Rows of the months being rebuilt; categories without sales left are not re-inserted
+        delete_months_query = f"""
+            WITH {touched_months}
+            DELETE FROM gold.agg_monthly_product_sales g
+            WHERE %(since)s::timestamp IS NULL
+               OR (g.year_number, g.month_number) IN (SELECT year_number, month_number FROM touched_months)
+        """
+        
+        aggregate_query = f"""
             INSERT INTO gold.agg_monthly_product_sales (
                 year_number, month_number, category_name,
                 total_quantity_sold, total_orders, gross_revenue,
                 net_revenue, avg_unit_price, category_rank
             )
-            WITH monthly_stats AS (
+            WITH {touched_months},
+            monthly_stats AS (
                 SELECT
                     EXTRACT(YEAR FROM o.order_date)::INT as year_number,
                     EXTRACT(MONTH FROM o.order_date)::INT as month_number,
@@ -375,6 +523,9 @@ class SilverToGoldAggregator:
                 JOIN silver.order_item oi ON o.order_key = oi.order_key
                 JOIN silver.product p ON oi.product_key = p.product_key
                 WHERE p.is_valid = TRUE
+                  AND (%(since)s::timestamp IS NULL
+                       OR (EXTRACT(YEAR FROM o.order_date)::INT, EXTRACT(MONTH FROM o.order_date)::INT)
+                          IN (SELECT year_number, month_number FROM touched_months))
                 GROUP BY EXTRACT(YEAR FROM o.order_date), EXTRACT(MONTH FROM o.order_date), p.category_name
             )
             SELECT
@@ -391,15 +542,27 @@ class SilverToGoldAggregator:
                     ORDER BY ms.net_revenue DESC
                 ) as category_rank
             FROM monthly_stats ms
-            ON CONFLICT (year_number, month_number, category_name) DO NOTHING
+            ON CONFLICT (year_number, month_number, category_name) DO UPDATE SET
+                total_quantity_sold = EXCLUDED.total_quantity_sold,
+                total_orders = EXCLUDED.total_orders,
+                gross_revenue = EXCLUDED.gross_revenue,
+                net_revenue = EXCLUDED.net_revenue,
+                avg_unit_price = EXCLUDED.avg_unit_price,
+                category_rank = EXCLUDED.category_rank
         """
         
         try:
-            self.cursor.execute(aggregate_query)
+            if force_refresh:
+                self.cursor.execute("DELETE FROM gold.agg_monthly_product_sales")
+            else:
+                self.cursor.execute(delete_months_query, {'since': since})
+            self.cursor.execute(aggregate_query, {'since': since})
             count = self.cursor.rowcount
             self.connection.commit()
+            self._advance_aggregate_watermark('agg_monthly_product_sales', sources, high_water,
+                                              full=since is None)
             if count == 0:
-                logger.warning("[WARN] No records inserted into agg_monthly_product_sales - check data quality")
+                logger.info("  No months touched since the last run")
             else:
                 logger.info(f"Successfully aggregated {count:,} monthly product sales records")
             return count
@@ -409,12 +572,11 @@ class SilverToGoldAggregator:
             return 0
     
     def populate_dim_date(self, start_date: date = None, end_date: date = None, force_refresh: bool = False):
-        """Populate dim_date for all dates in the data range."""
-        # Check if table is empty - if not empty and not force_refresh, skip
-        if not force_refresh and not self.table_is_empty('gold', 'dim_date'):
-            logger.info("[SKIP] gold.dim_date already has data; skipping.")
-            return 0
-        
+        """Populate dim_date for all dates in the data range.
+
+        Missing dates are generated in one set-based statement (see date_dimension.py); dates
+        already present are left alone, so calling this on a populated table is cheap.
+        """
         logger.info("Populating date dimension...")
         
         # Get date range from Silver orders if not provided
@@ -442,48 +604,10 @@ class SilverToGoldAggregator:
             # Delete all dates in the range
             self.cursor.execute("DELETE FROM gold.dim_date WHERE full_date >= %s AND full_date <= %s", 
                               (start_date, end_date))
-        else:
-            # If not force_refresh, we're here because table is empty, so no need to delete
-            pass
-        
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        month_short = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        
-        current_date = start_date
-        inserted = 0
-        while current_date <= end_date:
-            date_key = int(current_date.strftime('%Y%m%d'))
-            day_of_week = current_date.weekday() + 1
-            quarter = (current_date.month - 1) // 3 + 1
-            
-            try:
-                self.cursor.execute("""
-                    INSERT INTO gold.dim_date (
-                        date_key, full_date, day_of_week, day_name, day_of_month, day_of_year,
-                        week_of_year, month_number, month_name, month_short_name,
-                        quarter_number, quarter_name, year_number, is_weekend,
-                        is_holiday, holiday_name, fiscal_year, fiscal_quarter, fiscal_month
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (date_key) DO NOTHING
-                """, (
-                    date_key, current_date, day_of_week, day_names[current_date.weekday()],
-                    current_date.day, current_date.timetuple().tm_yday,
-                    current_date.isocalendar()[1], current_date.month,
-                    month_names[current_date.month - 1], month_short[current_date.month - 1],
-                    quarter, f"Q{quarter}", current_date.year, current_date.weekday() >= 5,
-                    False, '', current_date.year, quarter, current_date.month,
-                ))
-                if self.cursor.rowcount > 0:
-                    inserted += 1
-            except Exception as e:
-                logger.warning(f"Error inserting date {current_date}: {e}")
-            
-            current_date += timedelta(days=1)
+            self.connection.commit()
+            self.calendar.forget(start_date, end_date)
         
-        self.connection.commit()
+        inserted = self.calendar.ensure_range(self.connection, start_date, end_date)
         logger.info(f"Populated {inserted:,} date dimension records")
         return inserted
     
@@ -575,22 +699,15 @@ class SilverToGoldAggregator:
                 logger.info("  All customers already in dim_customer")
                 return 0
             
-            # Get count before
-            self.cursor.execute("SELECT COUNT(*) FROM gold.dim_customer")
-            count_before = self.cursor.fetchone()[0]
-            
+            # INSERT ... SELECT rowcount is exact (ON CONFLICT rows are not counted)
             self.cursor.execute(query)
+            actual_inserted = max(0, self.cursor.rowcount)
             self.connection.commit()
             
-            # Get count after
-            self.cursor.execute("SELECT COUNT(*) FROM gold.dim_customer")
-            count_after = self.cursor.fetchone()[0]
-            actual_inserted = count_after - count_before
-            
             if actual_inserted == 0:
                 logger.warning(f"[WARN] No records inserted into dim_customer despite {to_insert:,} candidates - check JOIN conditions and data quality")
             else:
-                logger.info(f"Populated {actual_inserted:,} customer dimension records (total now: {count_after:,})")
+                logger.info(f"Populated {actual_inserted:,} customer dimension records")
             return actual_inserted
         except Exception as e:
             logger.error(f"[ERROR] Error populating customer dimension: {e}", exc_info=True)
@@ -947,7 +1064,7 @@ class SilverToGoldAggregator:
         logger.info("  gold.fact_sales max(order_id) watermark: %s", f"{max_order_id:,}")
         
         query = """
-            INSERT INTO gold.fact_sales (
+            INSERT INTO {target} (
                 order_date_key, customer_key, product_key, employee_key,
                 location_key, promotion_key, order_id, order_item_id,
                 order_code, quantity, unit_price, discount_amount,
@@ -989,10 +1106,11 @@ class SilverToGoldAggregator:
             WHERE o.is_valid = TRUE
                 AND oi.is_valid = TRUE
                 AND o.order_date IS NOT NULL
-                AND o.order_id > %s
+                AND o.order_id > %(max_order_id)s
+                {month_filter}
                 AND NOT EXISTS (
                     SELECT 1
-                    FROM gold.fact_sales fs
+                    FROM {target} fs
                     WHERE fs.order_id = o.order_id
                       AND fs.order_item_id = oi.order_item_id
                 )
@@ -1000,9 +1118,10 @@ class SilverToGoldAggregator:
 
         try:
             t_ins = time.time()
-            self.cursor.execute(query, (max_order_id,))
+            inserted = 0
+            for month in self._fact_load_months('fact_sales', max_order_id):
+                inserted += self._insert_fact_month('fact_sales', query, month, max_order_id)
             ins_elapsed = time.time() - t_ins
-            inserted = self.cursor.rowcount
             self.connection.commit()
             if inserted == 0:
                 logger.info("[OK] No new fact_sales rows to insert (already up to date).")
@@ -1044,7 +1163,8 @@ class SilverToGoldAggregator:
         
         # Incremental append-only load:
         # - Watermark by max(order_id) already in gold.fact_orders to avoid rescanning from the beginning.
-        # - gold.fact_orders has UNIQUE(order_id), so ON CONFLICT DO NOTHING prevents duplicates.
+        # - ON CONFLICT DO NOTHING on gold.fact_orders' unique key prevents duplicates: (order_id,
+        #   order_date_key) when partitioned (it must include the partition key), order_id on a heap.
         logger.info("Incrementally populating gold.fact_orders (insert new orders only; watermark by max order_id)...")
 
         try:
@@ -1056,7 +1176,7 @@ class SilverToGoldAggregator:
         logger.info("  gold.fact_orders max(order_id) watermark: %s", f"{max_order_id:,}")
         
         query = """
-            INSERT INTO gold.fact_orders (
+            INSERT INTO {target} (
                 order_date_key, customer_key, employee_key, promotion_key,
                 order_id, order_code, total_quantity, total_items,
                 distinct_products, gross_amount, discount_amount, net_amount,
@@ -1089,18 +1209,24 @@ class SilverToGoldAggregator:
             LEFT JOIN silver.order_item oi ON o.order_key = oi.order_key AND oi.is_valid = TRUE
             WHERE o.is_valid = TRUE
                 AND o.order_date IS NOT NULL
-                AND o.order_id > %s
+                AND o.order_id > %(max_order_id)s
+                {month_filter}
             GROUP BY o.order_id, o.order_date, o.customer_key, o.sales_rep_key,
                      o.promotion_code, o.order_code, o.order_status,
                      o.order_status_category, o.order_currency, o._etl_timestamp
-            ON CONFLICT (order_id) DO NOTHING
+            ON CONFLICT ({conflict}) DO NOTHING
         """
+        # Unique keys of a partitioned table must include the partition key
+        conflict = ('order_id, order_date_key' if self.partitions.is_partitioned('fact_orders')
+                    else 'order_id')
 
         try:
             t_ins = time.time()
-            self.cursor.execute(query, (max_order_id,))
+            inserted = 0
+            for month in self._fact_load_months('fact_orders', max_order_id):
+                inserted += self._insert_fact_month('fact_orders', query, month, max_order_id,
+                                                    conflict=conflict)
             ins_elapsed = time.time() - t_ins
-            inserted = self.cursor.rowcount
             self.connection.commit()
             if inserted == 0:
                 logger.info("[OK] No new fact_orders rows to insert (already up to date).")
@@ -1116,6 +1242,20 @@ class SilverToGoldAggregator:
             logger.error(f"[ERROR] Error incrementally populating fact_orders: {e}", exc_info=True)
             return 0
     
+    def _insert_fact_month(self, table: str, query: str, month: Optional[date],
+                           max_order_id: int, **fmt) -> int:
+        """Run a fact INSERT for one month's orders into its partition (all orders if month is None)."""
+        params = {'max_order_id': max_order_id}
+        month_filter = ''
+        if month is not None:
+            month_filter = 'AND o.order_date >= %(month_start)s AND o.order_date < %(month_end)s'
+            params.update(month_start=month, month_end=add_months(month, 1))
+        self.cursor.execute(
+            query.format(target=self.partitions.target(table, month), month_filter=month_filter, **fmt),
+            params,
+        )
+        return self.cursor.rowcount
+    
     def _previous_inventory_snapshot_date_key(self, date_key: int) -> Optional[int]:
         self.cursor.execute(
             """
@@ -1130,13 +1270,18 @@ class SilverToGoldAggregator:
             return None
         return int(row[0])
 
-    def populate_fact_inventory_snapshot(self, snapshot_date: date = None, force_refresh: bool = False):
+    def populate_fact_inventory_snapshot(self, snapshot_date: date = None, force_refresh: bool = False,
+                                         full_reconcile: bool = False):
         """Populate fact_inventory_snapshot from silver.inventory for one snapshot date.
 
         Incremental load when a prior snapshot exists for an earlier date: carry forward unchanged
         (product + warehouse) rows from that snapshot, INSERT missing keys from silver, UPDATE rows
         where silver-derived measures differ from gold for this date, DELETE keys no longer in silver.
 
+        Change-tracked when a watermark is available (see _apply_inventory_deltas): only keys with
+        silver rows newer than the watermark are rebuilt, the rest are copied from the prior
+        snapshot. full_reconcile forces the full comparison above.
+
         If there is no prior snapshot row in gold, falls back to a full INSERT from silver (cold start).
 
         Set force_refresh=True to DELETE all rows for this snapshot_date_key first, then reload.
@@ -1147,38 +1292,13 @@ class SilverToGoldAggregator:
         date_key = int(snapshot_date.strftime('%Y%m%d'))
 
         logger.info(f"Populating inventory snapshot fact for {snapshot_date}...")
+        try:
+            self.partitions.ensure_months('fact_inventory_snapshot', snapshot_date, snapshot_date)
+        except Exception as e:
+            logger.warning("Could not create fact_inventory_snapshot partition for %s: %s",
+                           snapshot_date, e)
 
-        # Ensure date dimension exists (populate_dim_date skips when table not empty, so insert single date if missing)
-        self.cursor.execute("SELECT 1 FROM gold.dim_date WHERE date_key = %s", (date_key,))
-        if not self.cursor.fetchone():
-            self.populate_dim_date(snapshot_date, snapshot_date)
-            self.cursor.execute("SELECT 1 FROM gold.dim_date WHERE date_key = %s", (date_key,))
-            if not self.cursor.fetchone():
-                day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                              'July', 'August', 'September', 'October', 'November', 'December']
-                month_short = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                d = snapshot_date
-                day_of_week = d.weekday() + 1
-                quarter = (d.month - 1) // 3 + 1
-                self.cursor.execute("""
-                    INSERT INTO gold.dim_date (
-                        date_key, full_date, day_of_week, day_name, day_of_month, day_of_year,
-                        week_of_year, month_number, month_name, month_short_name,
-                        quarter_number, quarter_name, year_number, is_weekend,
-                        is_holiday, holiday_name, fiscal_year, fiscal_quarter, fiscal_month
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (date_key) DO NOTHING
-                """, (
-                    date_key, d, day_of_week, day_names[d.weekday()],
-                    d.day, d.timetuple().tm_yday,
-                    d.isocalendar()[1], d.month,
-                    month_names[d.month - 1], month_short[d.month - 1],
-                    quarter, f"Q{quarter}", d.year, d.weekday() >= 5,
-                    False, '', d.year, quarter, d.month,
-                ))
-                self.connection.commit()
+        self.calendar.ensure_range(self.connection, snapshot_date, snapshot_date)
 
         insert_from_silver_sql = """
             INSERT INTO gold.fact_inventory_snapshot (
@@ -1305,6 +1425,12 @@ class SilverToGoldAggregator:
         """
 
         try:
+            # Read the watermark before any write: on a failed read _aggregate_since rolls back,
+            # which would also undo the force_refresh DELETE below
+            since, high_water = self._aggregate_since(
+                'fact_inventory_snapshot', INVENTORY_SNAPSHOT_SOURCES,
+                full_reconcile=full_reconcile or force_refresh,
+            )
             if force_refresh:
                 self.cursor.execute(
                     "DELETE FROM gold.fact_inventory_snapshot WHERE snapshot_date_key = %s",
@@ -1318,7 +1444,9 @@ class SilverToGoldAggregator:
             updated = 0
             deleted = 0
 
-            if prev_key is None:
+            if prev_key is not None and since is not None:
+                carried, inserted, deleted = self._apply_inventory_deltas(date_key, prev_key, since)
+            elif prev_key is None:
                 self.cursor.execute(insert_from_silver_sql, (date_key, date_key))
                 inserted = self.cursor.rowcount
                 logger.info(
@@ -1338,18 +1466,19 @@ class SilverToGoldAggregator:
                     f"{inserted:,}",
                 )
 
-            self.cursor.execute(update_from_silver_sql, (date_key,))
-            updated = self.cursor.rowcount
-            if updated:
-                logger.info(
-                    "Inventory snapshot aligned gold with silver (updates for snapshot date): %s rows",
-                    f"{updated:,}",
-                )
+            if since is None or prev_key is None:
+                self.cursor.execute(update_from_silver_sql, (date_key,))
+                updated = self.cursor.rowcount
+                if updated:
+                    logger.info(
+                        "Inventory snapshot aligned gold with silver (updates for snapshot date): %s rows",
+                        f"{updated:,}",
+                    )
 
-            self.cursor.execute(delete_orphans_sql, (date_key,))
-            deleted = self.cursor.rowcount
-            if deleted:
-                logger.info("Inventory snapshot removed %s orphan rows (no longer in silver)", f"{deleted:,}")
+                self.cursor.execute(delete_orphans_sql, (date_key,))
+                deleted = self.cursor.rowcount
+                if deleted:
+                    logger.info("Inventory snapshot removed %s orphan rows (no longer in silver)", f"{deleted:,}")
 
             self.cursor.execute(
                 "SELECT COUNT(*) FROM gold.fact_inventory_snapshot WHERE snapshot_date_key = %s",
@@ -1358,6 +1487,8 @@ class SilverToGoldAggregator:
             total_for_date = self.cursor.fetchone()[0]
 
             self.connection.commit()
+            self._advance_aggregate_watermark('fact_inventory_snapshot', INVENTORY_SNAPSHOT_SOURCES,
+                                              high_water, full=since is None or prev_key is None)
             logger.info(
                 "Inventory snapshot for %s: total rows for date_key=%s is %s",
                 snapshot_date,
@@ -1370,6 +1501,132 @@ class SilverToGoldAggregator:
             self.connection.rollback()
             return 0
     
+    def _apply_inventory_deltas(self, date_key: int, prev_key: int, since: datetime):
+        """Build a snapshot date from the previous one plus the keys changed in silver since ``since``.
+
+        Changed keys are (product, warehouse) pairs with a silver.inventory row, or a
+        silver.product row, loaded at or after the watermark. Their rows for the date are
+        replaced from silver; every other key is copied from the previous snapshot as is.
+        Runs in the caller's transaction; returns (carried, inserted, deleted).
+        """
+        self.cursor.execute("""
+            CREATE TEMP TABLE inventory_changed_keys ON COMMIT DROP AS
+            SELECT i.product_key, i.warehouse_key
+            FROM silver.inventory i
+            WHERE i._etl_timestamp >= %(since)s
+            UNION
+            SELECT i.product_key, i.warehouse_key
+            FROM silver.product p
+            JOIN silver.inventory i ON i.product_key = p.product_key
+            WHERE p._etl_timestamp >= %(since)s
+        """, {'since': since})
+        changed = self.cursor.rowcount
+        
+        self.cursor.execute("""
+            DELETE FROM gold.fact_inventory_snapshot g
+            USING inventory_changed_keys c
+            WHERE g.snapshot_date_key = %(date_key)s
+              AND g.product_key = c.product_key
+              AND g.warehouse_key = c.warehouse_key
+        """, {'date_key': date_key})
+        deleted = self.cursor.rowcount
+        
+        self.cursor.execute(f"""
+            INSERT INTO gold.fact_inventory_snapshot ({INVENTORY_SNAPSHOT_COLUMNS})
+            SELECT
+                %(date_key)s, f.product_key, f.warehouse_key,
+                f.quantity_on_hand, f.quantity_available, f.quantity_reserved,
+                f.days_of_supply, f.stock_status, f.inventory_value
+            FROM gold.fact_inventory_snapshot f
+            WHERE f.snapshot_date_key = %(prev_key)s
+              AND NOT EXISTS (
+                  SELECT 1 FROM inventory_changed_keys c
+                  WHERE c.product_key = f.product_key AND c.warehouse_key = f.warehouse_key
+              )
+              AND NOT EXISTS (
+                  SELECT 1 FROM gold.fact_inventory_snapshot g
+                  WHERE g.snapshot_date_key = %(date_key)s
+                    AND g.product_key = f.product_key
+                    AND g.warehouse_key = f.warehouse_key
+              )
+        """, {'date_key': date_key, 'prev_key': prev_key})
+        carried = self.cursor.rowcount
+        
+        self.cursor.execute(f"""
+            INSERT INTO gold.fact_inventory_snapshot ({INVENTORY_SNAPSHOT_COLUMNS})
+            SELECT %(date_key)s, s.*
+            FROM ({INVENTORY_SNAPSHOT_SELECT}) s
+            JOIN inventory_changed_keys c
+              ON c.product_key = s.product_key AND c.warehouse_key = s.warehouse_key
+        """, {'date_key': date_key})
+        inserted = self.cursor.rowcount
+        
+        logger.info(
+            "Inventory snapshot change-tracked: prev_date_key=%s, changed_keys=%s, "
+            "carried_forward=%s, rebuilt=%s, replaced=%s",
+            prev_key, f"{changed:,}", f"{carried:,}", f"{inserted:,}", f"{deleted:,}",
+        )
+        return carried, inserted, deleted
+    
+    def backfill_inventory_snapshots(self, start_date: date, end_date: date,
+                                     force_refresh: bool = False) -> int:
+        """Load fact_inventory_snapshot for every date in [start_date, end_date] set-based.
+
+        Same result as calling populate_fact_inventory_snapshot per date (each date gets the
+        current silver state) but one INSERT ... SELECT over generate_series per month, each
+        written into that month's partition and committed on its own. Keys already present
+        for a date are kept, so an interrupted backfill can simply be re-run; force_refresh
+        deletes the range first. Returns rows inserted.
+        """
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+        logger.info("Backfilling inventory snapshots %s..%s...", start_date, end_date)
+        
+        self.calendar.ensure_range(self.connection, start_date, end_date)
+        self.partitions.ensure_months('fact_inventory_snapshot', start_date, end_date)
+        
+        total = 0
+        month = date(start_date.year, start_date.month, 1)
+        try:
+            while month <= end_date:
+                lo = max(start_date, month)
+                next_month = add_months(month, 1)
+                hi = min(end_date, next_month - timedelta(days=1))
+                target = self.partitions.target('fact_inventory_snapshot', month)
+                params = {'lo': lo, 'hi': hi,
+                          'lo_key': int(lo.strftime('%Y%m%d')), 'hi_key': int(hi.strftime('%Y%m%d'))}
+                t0 = time.time()
+                if force_refresh:
+                    self.cursor.execute(
+                        f"DELETE FROM {target} "
+                        f"WHERE snapshot_date_key BETWEEN %(lo_key)s AND %(hi_key)s",
+                        params,
+                    )
+                self.cursor.execute(f"""
+                    INSERT INTO {target} ({INVENTORY_SNAPSHOT_COLUMNS})
+                    SELECT TO_CHAR(d, 'YYYYMMDD')::INT, s.*
+                    FROM generate_series(%(lo)s::date, %(hi)s::date, INTERVAL '1 day') d
+                    CROSS JOIN ({INVENTORY_SNAPSHOT_SELECT}) s
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM {target} g
+                        WHERE g.snapshot_date_key = TO_CHAR(d, 'YYYYMMDD')::INT
+                          AND g.product_key = s.product_key
+                          AND g.warehouse_key = s.warehouse_key
+                    )
+                """, params)
+                rows = self.cursor.rowcount
+                self.connection.commit()
+                total += rows
+                logger.info("  %s..%s: %s rows in %.1fs", lo, hi, f"{rows:,}", time.time() - t0)
+                month = next_month
+        except Exception as e:
+            self.connection.rollback()
+            logger.error(f"[ERROR] Inventory snapshot backfill failed: {e}", exc_info=True)
+            raise
+        
+        logger.info("[OK] Backfilled %s inventory snapshot rows", f"{total:,}")
+        return total
+    
     def aggregate_sales_rep_performance(self, force_refresh: bool = False):
         """Aggregate sales rep performance into gold.agg_sales_rep_performance.
 
@@ -1454,98 +1711,93 @@ class SilverToGoldAggregator:
             self.connection.rollback()
             return 0
     
-    def aggregate_all(self):
-        """Aggregate all Gold layer tables (only empty ones)."""
-        logger.info("=" * 80)
-        logger.info("SILVER TO GOLD AGGREGATION - STARTING")
-        logger.info("=" * 80)
-        logger.info(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info("")
-        
-        totals = {}
-        aggregation_start = time.time()
-        
-        # Step 1: Populate Date Dimension (must be first)
-        logger.info("-" * 80)
-        logger.info("STEP 1/11: Populating Date Dimension")
-        logger.info("-" * 80)
-        logger.info("Creating date dimension for all dates in data range...")
-        logger.info("")
-        
-        date_start = time.time()
-        date_count = self.populate_dim_date()
-        date_elapsed = time.time() - date_start
-        totals['dim_date'] = date_count
-        logger.info(f"[OK] Date Dimension Complete: {date_count:,} records in {date_elapsed:.2f}s")
-        logger.info("")
+    def _populate_dimensions_parallel(self, max_workers: int,
+                                      connection_factory: Callable[[], Any]) -> Dict[str, int]:
+        """Populate the dimensions on a DagExecutor, one connection per worker thread."""
+        local = threading.local()
+        opened = []
+        opened_lock = threading.Lock()
+        
+        def worker() -> "SilverToGoldAggregator":
+            aggregator = getattr(local, "aggregator", None)
+            if aggregator is None:
+                connection = connection_factory()
+                with opened_lock:
+                    opened.append(connection)
+                aggregator = local.aggregator = SilverToGoldAggregator(
+                    connection, tracker=self.tracker, calendar=self.calendar)
+            return aggregator
+        
+        def node(label, method):
+            def run():
+                with profiling.span(method, "step"):
+                    dim_count = getattr(worker(), method)()
+                logger.info(f"[OK] {label} Dimension Complete: {dim_count:,} records")
+                return dim_count
+            return run
         
-        # Step 2: Populate Dimension Tables
         logger.info("-" * 80)
-        logger.info("STEP 2/11: Populating Customer Dimension")
+        logger.info(f"STEPS 1-7/11: Populating dimensions on up to {max_workers} workers")
         logger.info("-" * 80)
-        dim_customer_start = time.time()
-        dim_customer_count = self.populate_dim_customer()
-        dim_customer_elapsed = time.time() - dim_customer_start
-        totals['dim_customer'] = dim_customer_count
-        logger.info(f"[OK] Customer Dimension Complete: {dim_customer_count:,} records in {dim_customer_elapsed:.2f}s")
+        try:
+            result = DagExecutor(max_workers).run([
+                (name, node(label, method), deps) for name, label, method, deps in DIMENSION_STEPS
+            ])
+        finally:
+            for connection in opened:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+        logger.info(f"[OK] Dimensions complete in {result.elapsed:.2f}s; "
+                    f"critical path: {' -> '.join(result.critical_path)}")
         logger.info("")
+        return result.results
+    
+    def aggregate_all(self, max_workers: int = 1,
+                      connection_factory: Optional[Callable[[], Any]] = None,
+                      full_reconcile: bool = False, rebuild_aggregates: bool = False):
+        """Aggregate all Gold layer tables (only empty ones).
         
-        logger.info("-" * 80)
-        logger.info("STEP 3/11: Populating Product Dimension")
-        logger.info("-" * 80)
-        dim_product_start = time.time()
-        dim_product_count = self.populate_dim_product()
-        dim_product_elapsed = time.time() - dim_product_start
-        totals['dim_product'] = dim_product_count
-        logger.info(f"[OK] Product Dimension Complete: {dim_product_count:,} records in {dim_product_elapsed:.2f}s")
-        logger.info("")
+        With ``max_workers`` > 1 and a ``connection_factory`` (returns a new psycopg2
+        connection), independent dimensions are populated concurrently; facts and
+        aggregates still run in order afterwards.
         
-        logger.info("-" * 80)
-        logger.info("STEP 4/11: Populating Employee Dimension")
-        logger.info("-" * 80)
-        dim_employee_start = time.time()
-        dim_employee_count = self.populate_dim_employee()
-        dim_employee_elapsed = time.time() - dim_employee_start
-        totals['dim_employee'] = dim_employee_count
-        logger.info(f"[OK] Employee Dimension Complete: {dim_employee_count:,} records in {dim_employee_elapsed:.2f}s")
-        logger.info("")
-        
-        logger.info("-" * 80)
-        logger.info("STEP 5/11: Populating Location Dimension")
-        logger.info("-" * 80)
-        dim_location_start = time.time()
-        dim_location_count = self.populate_dim_location()
-        dim_location_elapsed = time.time() - dim_location_start
-        totals['dim_location'] = dim_location_count
-        logger.info(f"[OK] Location Dimension Complete: {dim_location_count:,} records in {dim_location_elapsed:.2f}s")
+        ``full_reconcile`` recomputes every group of the delta-maintained aggregates;
+        ``rebuild_aggregates`` deletes and rebuilds them from silver (repair).
+        """
+        logger.info("=" * 80)
+        logger.info("SILVER TO GOLD AGGREGATION - STARTING")
+        logger.info("=" * 80)
+        logger.info(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("")
         
-        logger.info("-" * 80)
-        logger.info("STEP 6/11: Populating Warehouse Dimension")
-        logger.info("-" * 80)
-        dim_warehouse_start = time.time()
-        dim_warehouse_count = self.populate_dim_warehouse()
-        dim_warehouse_elapsed = time.time() - dim_warehouse_start
-        totals['dim_warehouse'] = dim_warehouse_count
-        logger.info(f"[OK] Warehouse Dimension Complete: {dim_warehouse_count:,} records in {dim_warehouse_elapsed:.2f}s")
-        logger.info("")
+        totals = {}
+        aggregation_start = time.time()
         
-        logger.info("-" * 80)
-        logger.info("STEP 7/11: Populating Promotion Dimension")
-        logger.info("-" * 80)
-        dim_promotion_start = time.time()
-        dim_promotion_count = self.populate_dim_promotion()
-        dim_promotion_elapsed = time.time() - dim_promotion_start
-        totals['dim_promotion'] = dim_promotion_count
-        logger.info(f"[OK] Promotion Dimension Complete: {dim_promotion_count:,} records in {dim_promotion_elapsed:.2f}s")
-        logger.info("")
+        # Steps 1-7: Populate Dimension Tables (date first when sequential)
+        if max_workers > 1 and connection_factory is not None:
+            totals.update(self._populate_dimensions_parallel(max_workers, connection_factory))
+        else:
+            for step_num, (name, label, method, _) in enumerate(DIMENSION_STEPS, 1):
+                logger.info("-" * 80)
+                logger.info(f"STEP {step_num}/11: Populating {label} Dimension")
+                logger.info("-" * 80)
+                dim_start = time.time()
+                with profiling.span(method, "step"):
+                    dim_count = getattr(self, method)()
+                dim_elapsed = time.time() - dim_start
+                totals[name] = dim_count
+                logger.info(f"[OK] {label} Dimension Complete: {dim_count:,} records in {dim_elapsed:.2f}s")
+                logger.info("")
         
         # Step 3: Populate Fact Tables
         logger.info("-" * 80)
         logger.info("STEP 8/11: Populating Sales Fact Table")
         logger.info("-" * 80)
         fact_sales_start = time.time()
-        fact_sales_count = self.populate_fact_sales()
+        with profiling.span("populate_fact_sales", "step"):
+            fact_sales_count = self.populate_fact_sales()
         fact_sales_elapsed = time.time() - fact_sales_start
         totals['fact_sales'] = fact_sales_count
         logger.info(f"[OK] Sales Fact Complete: {fact_sales_count:,} records in {fact_sales_elapsed:.2f}s")
@@ -1555,7 +1807,8 @@ class SilverToGoldAggregator:
         logger.info("STEP 9/11: Populating Orders Fact Table")
         logger.info("-" * 80)
         fact_orders_start = time.time()
-        fact_orders_count = self.populate_fact_orders()
+        with profiling.span("populate_fact_orders", "step"):
+            fact_orders_count = self.populate_fact_orders()
         fact_orders_elapsed = time.time() - fact_orders_start
         totals['fact_orders'] = fact_orders_count
         logger.info(f"[OK] Orders Fact Complete: {fact_orders_count:,} records in {fact_orders_elapsed:.2f}s")
@@ -1565,7 +1818,8 @@ class SilverToGoldAggregator:
         logger.info("STEP 10/11: Populating Inventory Snapshot Fact Table")
         logger.info("-" * 80)
         fact_inv_start = time.time()
-        fact_inv_count = self.populate_fact_inventory_snapshot()
+        with profiling.span("populate_fact_inventory_snapshot", "step"):
+            fact_inv_count = self.populate_fact_inventory_snapshot(full_reconcile=full_reconcile)
         fact_inv_elapsed = time.time() - fact_inv_start
         totals['fact_inventory_snapshot'] = fact_inv_count
         logger.info(f"[OK] Inventory Snapshot Fact Complete: {fact_inv_count:,} records in {fact_inv_elapsed:.2f}s")
@@ -1688,7 +1942,9 @@ class SilverToGoldAggregator:
         logger.info("Aggregating Customer Lifetime Value")
         logger.info("-" * 80)
         customer_start = time.time()
-        customer_count = self.aggregate_customer_lifetime()
+        customer_count = self.aggregate_customer_lifetime(
+            force_refresh=rebuild_aggregates, full_reconcile=full_reconcile
+        )
         customer_elapsed = time.time() - customer_start
         totals['agg_customer_lifetime'] = customer_count
         logger.info(f"[OK] Customer Lifetime Complete: {customer_count:,} records in {customer_elapsed:.2f}s")
@@ -1699,7 +1955,9 @@ class SilverToGoldAggregator:
         logger.info("Aggregating Monthly Product Sales")
         logger.info("-" * 80)
         product_start = time.time()
-        product_count = self.aggregate_monthly_product_sales()
+        product_count = self.aggregate_monthly_product_sales(
+            force_refresh=rebuild_aggregates, full_reconcile=full_reconcile
+        )
         product_elapsed = time.time() - product_start
         totals['agg_monthly_product_sales'] = product_count
         logger.info(f"[OK] Monthly Product Sales Complete: {product_count:,} records in {product_elapsed:.2f}s")
@@ -1716,6 +1974,20 @@ class SilverToGoldAggregator:
         logger.info(f"[OK] Sales Rep Performance Complete: {sales_rep_count:,} records in {sales_rep_elapsed:.2f}s")
         logger.info("")
         
+        # Serving views read by the dashboard endpoints; refreshed after every gold load
+        logger.info("-" * 80)
+        logger.info("Refreshing Serving Materialized Views")
+        logger.info("-" * 80)
+        views_start = time.time()
+        try:
+            refreshed = self.serving_views.refresh_all()
+        except Exception as e:
+            logger.warning(f"Could not refresh serving views: {e}")
+            refreshed = {}
+        totals['serving_views'] = len(refreshed)
+        logger.info(f"[OK] Serving Views Complete: {len(refreshed)} refreshed in {time.time() - views_start:.2f}s")
+        logger.info("")
+        
         total_elapsed = time.time() - aggregation_start
         
         logger.info("=" * 80)
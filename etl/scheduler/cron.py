@@ -0,0 +1,155 @@
+"""
+Five-field cron expressions: ``minute hour day-of-month month day-of-week``.
+
+Each field is a comma-separated list of ``*``, ``N``, ``A-B`` items, each optionally with a
+``/STEP`` (``*/15``, ``1-5/2``, ``10/20`` = from 10 to the field maximum). Months and weekdays
+also accept three-letter names (``jan``, ``mon-fri``); day-of-week 0 and 7 are both Sunday.
+As in Vixie cron, when both day-of-month and day-of-week are restricted a day matches if
+either does. The macros ``@yearly``/``@annually``, ``@monthly``, ``@weekly``,
+``@daily``/``@midnight`` and ``@hourly`` are accepted.
+
+CronExpression.next_after() computes the next fire time directly (skipping whole months,
+days and hours that cannot match) so the scheduler daemon can keep a heap of fire times
+instead of testing every job every minute.
+"""
+
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import FrozenSet, List, Optional, Tuple
+
+MACROS = {
+    '@yearly': '0 0 1 1 *',
+    '@annually': '0 0 1 1 *',
+    '@monthly': '0 0 1 * *',
+    '@weekly': '0 0 * * 0',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@hourly': '0 * * * *',
+}
+
+_MONTH_NAMES = {name: i for i, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+_DOW_NAMES = {name: i for i, name in enumerate(['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'])}
+
+# (name, min, max, names) per field
+_FIELDS = (
+    ('minute', 0, 59, {}),
+    ('hour', 0, 23, {}),
+    ('day-of-month', 1, 31, {}),
+    ('month', 1, 12, _MONTH_NAMES),
+    ('day-of-week', 0, 7, _DOW_NAMES),
+)
+
+# Give up looking for a fire time this many years ahead (e.g. "0 0 31 2 *")
+_MAX_YEARS_AHEAD = 8
+
+
+def _value(token: str, lo: int, hi: int, names: dict, field: str) -> int:
+    token = token.strip().lower()
+    if token in names:
+        return names[token]
+    try:
+        value = int(token)
+    except ValueError:
+        raise ValueError(f"Invalid {field} value {token!r}") from None
+    if not lo <= value <= hi:
+        raise ValueError(f"{field} value {value} outside {lo}-{hi}")
+    return value
+
+
+def parse_field(text: str, lo: int, hi: int, names: Optional[dict] = None,
+                field: str = 'field') -> FrozenSet[int]:
+    """Set of values matched by one cron field."""
+    names = names or {}
+    values = set()
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            raise ValueError(f"Empty item in {field} {text!r}")
+        base, _, step_text = item.partition('/')
+        step = 1
+        if step_text:
+            try:
+                step = int(step_text)
+            except ValueError:
+                raise ValueError(f"Invalid {field} step {step_text!r}") from None
+            if step < 1:
+                raise ValueError(f"{field} step must be >= 1")
+        if base == '*':
+            start, end = lo, hi
+        elif '-' in base:
+            a, b = base.split('-', 1)
+            start, end = _value(a, lo, hi, names, field), _value(b, lo, hi, names, field)
+            if end < start:
+                raise ValueError(f"Invalid {field} range {base!r}")
+        else:
+            start = _value(base, lo, hi, names, field)
+            end = hi if step_text else start
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronExpression:
+    """A parsed cron expression that can test datetimes and compute the next fire time."""
+
+    def __init__(self, expression: str):
+        text = (expression or '').strip()
+        text = MACROS.get(text.lower(), text)
+        parts = text.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {expression!r}")
+        self.expression = expression
+        fields = [parse_field(part, lo, hi, names, name)
+                  for part, (name, lo, hi, names) in zip(parts, _FIELDS)]
+        self.minutes: List[int] = sorted(fields[0])
+        self.hours: List[int] = sorted(fields[1])
+        self.days = fields[2]
+        self.months = fields[3]
+        # Sunday is 0 and 7
+        self.weekdays = frozenset(d % 7 for d in fields[4])
+        self.dom_restricted = not parts[2].startswith('*')
+        self.dow_restricted = not parts[4].startswith('*')
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        dom = dt.day in self.days
+        dow = (dt.weekday() + 1) % 7 in self.weekdays
+        if self.dom_restricted and self.dow_restricted:
+            return dom or dow
+        return dom and dow
+
+    def matches(self, dt: datetime) -> bool:
+        """True when ``dt``'s minute is a fire time."""
+        return (dt.month in self.months and self._day_matches(dt)
+                and dt.hour in self.hours and dt.minute in self.minutes)
+
+    @staticmethod
+    def _next_in(values: List[int], current: int) -> Tuple[Optional[int], bool]:
+        i = bisect_left(values, current)
+        return (values[i], True) if i < len(values) else (None, False)
+
+    def next_after(self, dt: datetime) -> datetime:
+        """First fire time strictly after ``dt`` (minute resolution, same tzinfo)."""
+        t = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt.year + _MAX_YEARS_AHEAD
+        while t.year <= limit:
+            if t.month not in self.months:
+                t = (t.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            hour, found = self._next_in(self.hours, t.hour)
+            if not found:
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if hour != t.hour:
+                t = t.replace(hour=hour, minute=0)
+            minute, found = self._next_in(self.minutes, t.minute)
+            if not found:
+                t = t.replace(minute=0) + timedelta(hours=1)
+                continue
+            return t.replace(minute=minute)
+        raise ValueError(f"Cron expression {self.expression!r} never fires")
@@ -0,0 +1,300 @@
+"""
+Long-running ETL scheduler.
+
+Replaces launching job_scheduler.py from the OS every minute. The daemon loads the active
+jobs from monitoring.etl_jobs, keeps a heap of each job's next fire time (cron.py) and sleeps
+until the earliest one, so idle minutes cost nothing. Due jobs run in-process on a thread
+pool: the pipeline calls run_etl_pipeline() and the ingestion jobs call their script's
+run_once(), without a new interpreter and imports per run.
+
+Each job may have at most ``max_concurrent_per_job`` runs in flight; a fire time that
+arrives while the job is still at its limit is skipped (logged), not queued. Fire times
+missed while the process was busy or suspended run once, then the schedule continues from
+now. Jobs are re-read every ``reload_interval`` seconds, so edits to cron_pattern or
+active_status take effect without a restart.
+
+Run from the project root:
+
+    python etl/scheduler/run_scheduler_loop.py --workers 4
+"""
+
+import heapq
+import importlib
+import itertools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from etl.scheduler.cron import CronExpression
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_CONCURRENT_PER_JOB = 1
+DEFAULT_RELOAD_INTERVAL = 60.0
+
+JOB_QUERY = """
+    SELECT job_id, job_name, job_type, cron_pattern
+    FROM monitoring.etl_jobs
+    WHERE cron_pattern IS NOT NULL AND cron_pattern <> ''
+      AND COALESCE(TRIM(active_status), 'A') = 'A'
+"""
+
+
+def _script(name: str):
+    """Import an ETL script module (etl/scripts is not a regular package)."""
+    return importlib.import_module(f"etl.scripts.{name}")
+
+
+def run_pipeline() -> None:
+    _script("run_etl").run_etl_pipeline()
+
+
+def run_shopping_ingestion() -> None:
+    module = _script("populate_bronze_shopping_every_minute")
+    if not module.is_shopping_job_active():
+        logger.info("Shopping ingestion inactive (active_status=I); skipping run.")
+        return
+    tracker = None
+    try:
+        from ml_optimization.utils.etl_job_tracker import ETLJobTracker
+        tracker = ETLJobTracker()
+        tracker.ensure_table_exists()
+    except Exception:
+        tracker = None
+    try:
+        module.run_once(tracker=tracker)
+    finally:
+        if tracker:
+            tracker.close()
+
+
+def run_random_populator() -> None:
+    _script("populate_bronze_random_tables_with_orders_items").run_once(100)
+
+
+# (job_type, job_name or None for any name) -> in-process runner
+JOB_RUNNERS: Dict[Tuple[str, Optional[str]], Callable[[], None]] = {
+    ("pipeline", None): run_pipeline,
+    ("ingestion", "BRONZE - Shopping Orders Ingestion"): run_shopping_ingestion,
+    ("ingestion", "BRONZE - Random Bronze Tables Populator (100)"): run_random_populator,
+}
+
+
+def resolve_runner(job_type: str, job_name: str) -> Optional[Callable[[], None]]:
+    """Runner for a job, matching its exact name first, then any job of its type."""
+    return JOB_RUNNERS.get((job_type, job_name)) or JOB_RUNNERS.get((job_type, None))
+
+
+@dataclass
+class ScheduledJob:
+    job_id: str
+    job_name: str
+    job_type: str
+    cron_pattern: str
+    cron: CronExpression
+    runner: Callable[[], None]
+    next_fire: Optional[datetime] = None
+    # New on every (re)load; heap entries of older versions are dropped
+    version: int = 0
+    skipped: int = 0
+
+
+class SchedulerDaemon:
+    """Fire monitoring.etl_jobs on their cron schedules and run them on a worker pool."""
+
+    def __init__(self, connection_factory: Optional[Callable] = None,
+                 workers: int = DEFAULT_WORKERS,
+                 max_concurrent_per_job: int = DEFAULT_MAX_CONCURRENT_PER_JOB,
+                 reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+                 clock: Callable[[], datetime] = datetime.utcnow):
+        """
+        Args:
+            connection_factory: Context manager yielding a connection (default: get_db_connection).
+            workers: Threads running due jobs.
+            max_concurrent_per_job: Runs of one job allowed in flight at once.
+            reload_interval: Seconds between re-reads of monitoring.etl_jobs.
+            clock: Current time; cron patterns are evaluated in UTC like job_scheduler.py.
+        """
+        if connection_factory is None:
+            from ml_optimization.utils.db_utils import get_db_connection
+            connection_factory = get_db_connection
+        self.connection_factory = connection_factory
+        self.workers = max(1, workers)
+        self.max_concurrent_per_job = max(1, max_concurrent_per_job)
+        self.reload_interval = reload_interval
+        self.clock = clock
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[Tuple[datetime, str, int]] = []
+        self._versions = itertools.count()
+        # job_id -> runs in flight (kept across reloads of the job)
+        self._running: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _schedule(self, job: ScheduledJob, after: datetime) -> None:
+        job.next_fire = job.cron.next_after(after)
+        heapq.heappush(self._heap, (job.next_fire, job.job_id, job.version))
+
+    def reload(self, now: Optional[datetime] = None) -> None:
+        """Re-read active jobs; new or changed jobs are (re)scheduled, removed ones dropped."""
+        now = now or self.clock()
+        with self.connection_factory() as conn:
+            cur = conn.cursor()
+            cur.execute(JOB_QUERY)
+            rows = cur.fetchall()
+            cur.close()
+        seen = set()
+        with self._lock:
+            for job_id, job_name, job_type, cron_pattern in rows:
+                seen.add(job_id)
+                current = self.jobs.get(job_id)
+                if current and current.cron_pattern == cron_pattern:
+                    continue
+                runner = resolve_runner(job_type, job_name)
+                if runner is None:
+                    logger.warning("Unknown job_type '%s' for job_id=%s; not scheduled", job_type, job_id)
+                    continue
+                # A pattern that does not parse or never fires keeps the job's current schedule
+                # (if any) and must not stop the remaining jobs from loading
+                try:
+                    job = ScheduledJob(job_id, job_name, job_type, cron_pattern,
+                                       CronExpression(cron_pattern), runner,
+                                       version=next(self._versions))
+                    self._schedule(job, now)
+                except ValueError as e:
+                    logger.error("Invalid cron_pattern %r for job_id=%s: %s", cron_pattern, job_id, e)
+                    continue
+                self.jobs[job_id] = job
+                logger.info("Scheduled job_id=%s name=%s cron=%s next=%s",
+                            job_id, job_name, cron_pattern, job.next_fire.isoformat())
+            for job_id in set(self.jobs) - seen:
+                logger.info("Unscheduled job_id=%s (inactive or removed)", job_id)
+                del self.jobs[job_id]
+
+    def next_fire_time(self) -> Optional[datetime]:
+        """Earliest pending fire time, ignoring entries of removed / rescheduled jobs."""
+        with self._lock:
+            while self._heap:
+                fire, job_id, version = self._heap[0]
+                job = self.jobs.get(job_id)
+                if job and job.version == version:
+                    return fire
+                heapq.heappop(self._heap)
+            return None
+
+    def run_pending(self, now: Optional[datetime] = None) -> List[str]:
+        """Dispatch every job whose fire time has passed; returns the job_ids started."""
+        now = now or self.clock()
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                fire, job_id, version = heapq.heappop(self._heap)
+                job = self.jobs.get(job_id)
+                if not job or job.version != version:
+                    continue
+                due.append(job)
+                # Missed fire times collapse into this one
+                try:
+                    self._schedule(job, now)
+                except ValueError as e:
+                    logger.error("Unscheduled job_id=%s: %s", job_id, e)
+                    del self.jobs[job_id]
+        return [job.job_id for job in due if self._dispatch(job)]
+
+    def _dispatch(self, job: ScheduledJob) -> bool:
+        with self._lock:
+            running = self._running.get(job.job_id, 0)
+            if running >= self.max_concurrent_per_job:
+                job.skipped += 1
+                logger.warning("Skipping job_id=%s name=%s: %s run(s) still in progress",
+                               job.job_id, job.job_name, running)
+                return False
+            self._running[job.job_id] = running + 1
+        logger.info("Dispatching job_id=%s name=%s type=%s cron=%s",
+                    job.job_id, job.job_name, job.job_type, job.cron_pattern)
+        self._executor.submit(self._run, job)
+        return True
+
+    def _run(self, job: ScheduledJob) -> None:
+        started = self.clock()
+        try:
+            job.runner()
+            logger.info("Job job_id=%s finished in %.1fs", job.job_id,
+                        (self.clock() - started).total_seconds())
+        except BaseException as e:
+            # SystemExit from a script must not take a worker thread down silently
+            logger.exception("Job job_id=%s failed: %s", job.job_id, e)
+        finally:
+            with self._lock:
+                self._running[job.job_id] -= 1
+
+    def run_forever(self) -> None:
+        """Run until stop() is called (or KeyboardInterrupt)."""
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="etl-job")
+        logger.info("Scheduler daemon started (workers=%s, max %s concurrent run(s) per job)",
+                    self.workers, self.max_concurrent_per_job)
+        next_reload = 0.0
+        try:
+            while not self._stop.is_set():
+                if time.monotonic() >= next_reload:
+                    try:
+                        self.reload()
+                    except Exception as e:
+                        logger.exception("Could not reload jobs: %s", e)
+                    next_reload = time.monotonic() + self.reload_interval
+                self.run_pending()
+                wait = next_reload - time.monotonic()
+                fire = self.next_fire_time()
+                if fire is not None:
+                    wait = min(wait, (fire - self.clock()).total_seconds())
+                self._stop.wait(max(0.0, wait))
+        finally:
+            self._executor.shutdown(wait=True)
+            logger.info("Scheduler daemon stopped")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def main() -> None:
+    import argparse
+
+    log_dir = os.path.join(os.path.dirname(__file__), "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(threadName)s %(name)s - %(message)s",
+        handlers=[
+            logging.FileHandler(os.path.join(log_dir, "scheduler_daemon.log")),
+            logging.StreamHandler(),
+        ],
+    )
+    parser = argparse.ArgumentParser(description="Run monitoring.etl_jobs on their cron schedules")
+    parser.add_argument("--workers", type=int,
+                        default=int(os.getenv("SCHEDULER_WORKERS", DEFAULT_WORKERS)),
+                        help=f"Threads running due jobs (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--max-concurrent-per-job", type=int,
+                        default=int(os.getenv("SCHEDULER_MAX_CONCURRENT_PER_JOB",
+                                              DEFAULT_MAX_CONCURRENT_PER_JOB)),
+                        help="Runs of one job allowed at once; later fire times are skipped "
+                             f"(default: {DEFAULT_MAX_CONCURRENT_PER_JOB})")
+    parser.add_argument("--reload-interval", type=float, default=DEFAULT_RELOAD_INTERVAL,
+                        help="Seconds between re-reads of monitoring.etl_jobs")
+    args = parser.parse_args()
+
+    daemon = SchedulerDaemon(workers=args.workers,
+                             max_concurrent_per_job=args.max_concurrent_per_job,
+                             reload_interval=args.reload_interval)
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
+        logger.info("Stopped by user.")
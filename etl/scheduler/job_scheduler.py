@@ -8,12 +8,18 @@ from datetime import datetime, timedelta
 CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0) if sys.platform == "win32" else 0
 
 from ml_optimization.utils.db_utils import get_db_connection
+from etl.scheduler.cron import CronExpression
 
 
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_PATH = os.path.join(LOG_DIR, "job_scheduler.log")
 
+# Runs of one job allowed at once; a due job at its limit is not dispatched this tick
+MAX_CONCURRENT_PER_JOB = int(os.getenv("SCHEDULER_MAX_CONCURRENT_PER_JOB", "1"))
+# 'running' rows older than this are treated as dead runs (same default as the monitoring API)
+STALE_RUNNING_MINUTES = int(os.getenv("ETL_STALE_RUNNING_MINUTES", "360"))
+
 logging.basicConfig(
     filename=LOG_PATH,
     level=logging.INFO,
@@ -22,63 +28,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _matches_cron_field(value: int, field: str) -> bool:
-    """
-    Minimal cron field matcher.
-
-    Supports:
-      *       -> always
-      */N     -> every N units
-      X       -> exact value
-    """
-    field = field.strip()
-    if field == "*" or field == "":
-        return True
-    if field.startswith("*/"):
-        try:
-            step = int(field[2:])
-        except ValueError:
-            return False
-        if step <= 0:
-            return False
-        return value % step == 0
-    try:
-        return value == int(field)
-    except ValueError:
-        return False
-
-
 def cron_matches_now(pattern: str, now: datetime) -> bool:
     """
-    Check if a simple cron pattern matches the current datetime.
+    Check if a cron pattern ("m h dom mon dow", see cron.py) matches the current minute.
 
-    Pattern format: "m h dom mon dow"
-    Only minute and hour are meaningfully handled; the rest must be "*" to match.
+    Invalid patterns never match.
     """
     if not pattern:
         return False
-
-    parts = pattern.split()
-    if len(parts) != 5:
-        return False
-
-    minute_s, hour_s, dom_s, mon_s, dow_s = parts
-
-    if not _matches_cron_field(now.minute, minute_s):
-        return False
-    if not _matches_cron_field(now.hour, hour_s):
-        return False
-
-    # For now we only support "*" for day-of-month, month, day-of-week
-    if dom_s not in ("*", ""):
-        return False
-    if mon_s not in ("*", ""):
-        return False
-    if dow_s not in ("*", ""):
+    try:
+        return CronExpression(pattern).matches(now)
+    except ValueError:
+        logger.warning("Invalid cron pattern %r", pattern)
         return False
 
-    return True
-
 
 def run_due_jobs() -> None:
     """
@@ -87,7 +50,9 @@ def run_due_jobs() -> None:
 
     This script is intended to be triggered every minute by the OS
     scheduler (e.g. Windows Task Scheduler). Changing cron_pattern in
-    monitoring.etl_jobs will then change when jobs fire.
+    monitoring.etl_jobs will then change when jobs fire. The long-running
+    daemon (daemon.py / run_scheduler_loop.py) does the same without a
+    process per tick and runs the jobs in-process.
     """
     now = datetime.utcnow()
     logger.info("Scheduler tick at %s", now.isoformat())
@@ -111,19 +76,20 @@ def run_due_jobs() -> None:
                 if not cron_matches_now(cron_pattern, now):
                     continue
 
-                # Avoid double-firing: check if this job_id has a run
-                # that started within the last minute.
+                # Per-job concurrency limit: skip while earlier runs are still in progress.
                 cur.execute(
                     """
-                    SELECT 1
+                    SELECT COUNT(*)
                     FROM monitoring.job_runs
                     WHERE job_id = %s
-                      AND started_at >= (CURRENT_TIMESTAMP - INTERVAL '59 seconds')
-                    LIMIT 1
+                      AND status = 'running'
+                      AND started_at >= CURRENT_TIMESTAMP - make_interval(mins => %s)
                     """,
-                    (job_id,),
+                    (job_id, STALE_RUNNING_MINUTES),
                 )
-                if cur.fetchone():
+                running = cur.fetchone()[0]
+                if running >= MAX_CONCURRENT_PER_JOB:
+                    logger.info("Skipping job_id=%s: %s run(s) still in progress", job_id, running)
                     continue
 
                 logger.info(
@@ -1,7 +1,20 @@
 """
-Scheduler entry point – does nothing. To run ETL on a schedule, use Task Scheduler
-(or cron) with run_etl_cron.ps1 / run_etl.py or job_scheduler.py directly.
+Scheduler entry point: runs the long-lived scheduler daemon (etl/scheduler/daemon.py), which
+fires the active monitoring.etl_jobs on their cron_pattern and runs them in-process.
+
+    python etl/scheduler/run_scheduler_loop.py [--workers N] [--max-concurrent-per-job N]
+
+job_scheduler.py remains for one-shot ticks from Task Scheduler / cron.
 """
 
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from etl.scheduler.daemon import main
+
 if __name__ == "__main__":
-    pass
+    main()
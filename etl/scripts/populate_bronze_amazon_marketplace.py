@@ -9,6 +9,10 @@ Populate the Bronze layer with realistic Amazon-style marketplace data.
   (no primary-key reuse, no duplicate rows from re-running the script).
 - Foreign keys for this load point at rows created in the same run (or existing keys that are
   guaranteed present), so reruns stay valid even if older bronze keys are not contiguous from 1.
+- --workers N splits the large tables (persons, products, inventory, orders, order items, ...)
+  into N id ranges generated by N processes that COPY on their own connections. The same --seed
+  and --workers reproduce the same rows. Unlike the default single-transaction load, each
+  foreign-key wave commits on its own, so a failed parallel run can leave earlier waves behind.
 
 Requires: PostgreSQL with bronze schema per data-warehouse/schemas/complete_warehouse.sql (FKs on).
 
@@ -16,20 +20,23 @@ Usage:
   python etl/scripts/populate_bronze_amazon_marketplace.py
   python etl/scripts/populate_bronze_amazon_marketplace.py --max-rows 2000000
   python etl/scripts/populate_bronze_amazon_marketplace.py --truncate   # optional full reset only
+  python etl/scripts/populate_bronze_amazon_marketplace.py --truncate --workers 8 --seed 42
 """
 
 from __future__ import annotations
 
 import argparse
+import itertools
 import logging
 import random
 import string
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, replace
 from datetime import date, timedelta
 from pathlib import Path
 import time
-from typing import Any, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from psycopg2.extras import execute_batch
 
@@ -126,17 +133,17 @@ def _clip(s: str, max_len: int) -> str:
     return s[: max_len - 1] + "…"
 
 
-def _fake_asin() -> str:
-    body = "".join(random.choices(string.ascii_uppercase + string.digits, k=9))
+def _fake_asin(rng=random) -> str:
+    body = "".join(rng.choices(string.ascii_uppercase + string.digits, k=9))
     return f"B0{body}"
 
 
-def build_product_row(product_id: int, batch_id: int) -> Tuple[Any, ...]:
-    cat = random.randint(1, 10)
-    brand = random.choice(BRANDS)
-    ptype = random.choice(PRODUCT_TYPES[cat])
-    variant = random.choice(("2024 Model", "Gen 2", "Pro", "Lite", "Plus", "XL", "Pack of 2", "")).strip()
-    color = random.choice(("Black", "White", "Navy", "Silver", "Graphite", ""))
+def build_product_row(product_id: int, batch_id: int, rng=random) -> Tuple[Any, ...]:
+    cat = rng.randint(1, 10)
+    brand = rng.choice(BRANDS)
+    ptype = rng.choice(PRODUCT_TYPES[cat])
+    variant = rng.choice(("2024 Model", "Gen 2", "Pro", "Lite", "Plus", "XL", "Pack of 2", "")).strip()
+    color = rng.choice(("Black", "White", "Navy", "Silver", "Graphite", ""))
     parts = [brand, ptype]
     if variant:
         parts.append(variant)
@@ -147,23 +154,23 @@ def build_product_row(product_id: int, batch_id: int) -> Tuple[Any, ...]:
         f"{title}. Ships from Amazon. Category: {CATEGORIES[cat]}. "
         f"Satisfaction guaranteed. Prime eligible where available."
     )
-    list_p = round(random.uniform(9.99, 899.99), 2)
+    list_p = round(rng.uniform(9.99, 899.99), 2)
     min_p = round(min(list_p * 0.7, list_p - 0.01), 2)
     if min_p < 0:
         min_p = round(list_p * 0.85, 2)
-    url = _clip(f"https://www.amazon.com/dp/{_fake_asin()}/ref=bronze_catalog?pid={product_id}", 256)
+    url = _clip(f"https://www.amazon.com/dp/{_fake_asin(rng)}/ref=bronze_catalog?pid={product_id}", 256)
     return (
         product_id,
         title,
         desc,
         cat,
-        random.randint(1, 5),
-        random.choice((12, 24, 36)),
-        random.randint(1, 9999),
-        random.choice(STATUS_OK),
+        rng.randint(1, 5),
+        rng.choice((12, 24, 36)),
+        rng.randint(1, 9999),
+        rng.choice(STATUS_OK),
         list_p,
         min_p,
-        random.choice(CURRENCIES),
+        rng.choice(CURRENCIES),
         url,
         "AMAZON_MARKETPLACE",
         batch_id,
@@ -491,142 +498,213 @@ def insert_employment_jobs(
     )
 
 
-def insert_persons(cur, n: int, batch_id: int, person0: int) -> None:
-    batch: List[Tuple[Any, ...]] = []
-    page = 5000
-    for i in range(1, n + 1):
+# --- Large tables ------------------------------------------------------------------------
+# Row generators share the signature (rng, lo, hi, batch_id, ...) and yield the rows with
+# sequence numbers lo..hi, so a table is generated whole by the single-connection load or
+# one id range per worker by the parallel load (see load_parallel).
+
+BRONZE_COLUMNS = {
+    "bronze.person": (
+        "person_id", "first_name", "last_name", "middle_names", "nickname",
+        "nat_lang_code", "culture_code", "gender", "_source_system", "_batch_id",
+    ),
+    "bronze.restricted_info": (
+        "person_id", "date_of_birth", "date_of_death", "government_id", "passport_id",
+        "hire_date", "seniority_code", "_source_system", "_batch_id",
+    ),
+    "bronze.person_location": (
+        "persons_person_id", "locations_location_id", "sub_address", "location_usage", "notes",
+        "_source_system", "_batch_id",
+    ),
+    "bronze.phone_number": (
+        "phone_number_id", "persons_person_id", "locations_location_id",
+        "phone_number", "country_code", "phone_type_id", "_source_system", "_batch_id",
+    ),
+    "bronze.customer": (
+        "customer_id", "person_id", "customer_employee_id", "accountmgr_id", "income_level",
+        "_source_system", "_batch_id",
+    ),
+    "bronze.employment": (
+        "employee_id", "person_id", "hr_job_id", "manager_employee_id", "start_date", "end_date",
+        "salary", "commission_percent", "employment_status", "_source_system", "_batch_id",
+    ),
+    "bronze.product": (
+        "product_id", "product_name", "description", "category", "weight_class", "warranty_period",
+        "supplier_id", "status", "list_price", "minimum_price", "price_currency", "catalog_url",
+        "_source_system", "_batch_id",
+    ),
+    "bronze.inventory": (
+        "inventory_id", "product_id", "warehouse_id", "quantity_on_hand", "quantity_available",
+        "_source_system", "_batch_id",
+    ),
+    "bronze.orders": (
+        "order_id", "customer_id", "sales_rep_id", "order_date", "order_code", "order_status",
+        "order_total", "order_currency", "promotion_code", "_source_system", "_batch_id",
+    ),
+    "bronze.order_item": (
+        "order_item_id", "order_id", "product_id", "unit_price", "quantity",
+        "_source_system", "_batch_id",
+    ),
+}
+
+
+def _insert_sql(table: str, suffix: str = "") -> str:
+    columns = BRONZE_COLUMNS[table]
+    return "INSERT INTO {0} ({1}) VALUES ({2}) {3}".format(
+        table, ", ".join(columns), ",".join(["%s"] * len(columns)), suffix
+    )
+
+
+def _execute_pages(
+    cur, sql: str, rows: Iterable[Tuple[Any, ...]], page_size: int, label: str = "",
+    total: int = 0, log_every: int = 0,
+) -> int:
+    page: List[Tuple[Any, ...]] = []
+    written = 0
+    next_log = log_every
+    for row in rows:
+        page.append(row)
+        if len(page) >= page_size:
+            execute_batch(cur, sql, page, page_size=page_size)
+            written += len(page)
+            page = []
+            if log_every and written >= next_log:
+                logger.info("  %s: %s / %s", label, written, total)
+                next_log += log_every
+    if page:
+        execute_batch(cur, sql, page, page_size=len(page))
+        written += len(page)
+    return written
+
+
+def person_rows(rng, lo: int, hi: int, batch_id: int, person0: int) -> Iterator[Tuple[Any, ...]]:
+    for i in range(lo, hi + 1):
         fn = FIRST_NAMES[i % len(FIRST_NAMES)]
         ln = LAST_NAMES[i % len(LAST_NAMES)]
-        batch.append(
-            (
-                person0 + i,
-                fn,
-                ln,
-                _clip("" if i % 3 else "Marie", 100),
-                _clip("" if i % 4 else f"{fn[:3]}y", 50),
-                1033,
-                1033,
-                random.choice(("M", "F", "Non-binary", "Prefer not to say")),
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
-        )
-        if len(batch) >= page:
-            execute_batch(
-                cur,
-                """
-                INSERT INTO bronze.person (
-                    person_id, first_name, last_name, middle_names, nickname,
-                    nat_lang_code, culture_code, gender, _source_system, _batch_id
-                ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                """,
-                batch,
-                page_size=page,
-            )
-            batch = []
-    if batch:
-        execute_batch(
-            cur,
-            """
-            INSERT INTO bronze.person (
-                person_id, first_name, last_name, middle_names, nickname,
-                nat_lang_code, culture_code, gender, _source_system, _batch_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            batch,
-            page_size=len(batch),
+        yield (
+            person0 + i,
+            fn,
+            ln,
+            _clip("" if i % 3 else "Marie", 100),
+            _clip("" if i % 4 else f"{fn[:3]}y", 50),
+            1033,
+            1033,
+            rng.choice(("M", "F", "Non-binary", "Prefer not to say")),
+            "AMAZON_MARKETPLACE",
+            batch_id,
         )
 
 
-def insert_restricted(cur, r: int, batch_id: int, person0: int) -> None:
-    rows = []
-    for k in range(1, r + 1):
+def restricted_rows(rng, lo: int, hi: int, batch_id: int, person0: int) -> Iterator[Tuple[Any, ...]]:
+    for k in range(lo, hi + 1):
         pid = person0 + k
         dob = date(1970, 1, 1) + timedelta(days=k % 12_000)
-        rows.append(
-            (
-                pid,
-                dob,
-                None,
-                _clip(f"SSN-ALT-{pid:08d}", 50),
-                _clip(f"PPT-{pid:09d}", 50),
-                dob + timedelta(days=365 * (18 + k % 20)),
-                min(5, 1 + k % 5),
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
-        )
-        if len(rows) >= 3000:
-            execute_batch(
-                cur,
-                """
-                INSERT INTO bronze.restricted_info (
-                    person_id, date_of_birth, date_of_death, government_id, passport_id,
-                    hire_date, seniority_code, _source_system, _batch_id
-                ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                """,
-                rows,
-                page_size=3000,
-            )
-            rows = []
-    if rows:
-        execute_batch(
-            cur,
-            """
-            INSERT INTO bronze.restricted_info (
-                person_id, date_of_birth, date_of_death, government_id, passport_id,
-                hire_date, seniority_code, _source_system, _batch_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            rows,
-            page_size=len(rows),
+        yield (
+            pid,
+            dob,
+            None,
+            _clip(f"SSN-ALT-{pid:08d}", 50),
+            _clip(f"PPT-{pid:09d}", 50),
+            dob + timedelta(days=365 * (18 + k % 20)),
+            min(5, 1 + k % 5),
+            "AMAZON_MARKETPLACE",
+            batch_id,
         )
 
 
-def insert_person_locations(
-    cur,
-    n: int,
+def person_location_rows(
+    rng,
+    lo: int,
+    hi: int,
     batch_id: int,
     person0: int,
-    new_person_count: int,
+    person_lo: int,
+    person_hi: int,
     loc0: int,
     new_location_count: int,
-) -> None:
+) -> Iterator[Tuple[Any, ...]]:
+    """Up to hi - lo + 1 distinct (person, location) pairs for persons person_lo..person_hi."""
+    n = hi - lo + 1
     seen = set()
-    rows = []
     i = 0
-    npc = max(1, new_person_count)
     nl = max(1, new_location_count)
-    while len(rows) < n and i < n * 3:
+    while len(seen) < n and i < n * 3:
         i += 1
-        pid = person0 + 1 + random.randint(0, npc - 1)
-        lid = loc0 + 1 + random.randint(0, nl - 1)
+        pid = person0 + rng.randint(person_lo, person_hi)
+        lid = loc0 + 1 + rng.randint(0, nl - 1)
         if (pid, lid) in seen:
             continue
         seen.add((pid, lid))
-        usage = random.choice(("HOME", "WORK", "SHIPPING", "BILLING"))
-        rows.append(
-            (
-                pid,
-                lid,
-                _clip(f"Apt {pid % 500}", 100),
-                usage,
-                _clip(f"Verified {usage.lower()} address; updated {date.today().isoformat()}", 5000)[:2000],
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
+        usage = rng.choice(("HOME", "WORK", "SHIPPING", "BILLING"))
+        yield (
+            pid,
+            lid,
+            _clip(f"Apt {pid % 500}", 100),
+            usage,
+            _clip(f"Verified {usage.lower()} address; updated {date.today().isoformat()}", 5000)[:2000],
+            "AMAZON_MARKETPLACE",
+            batch_id,
         )
-    execute_batch(
+
+
+def phone_rows(
+    rng,
+    lo: int,
+    hi: int,
+    batch_id: int,
+    phone0: int,
+    person0: int,
+    new_person_count: int,
+    loc0: int,
+    new_location_count: int,
+) -> Iterator[Tuple[Any, ...]]:
+    npc = max(1, new_person_count)
+    nl = max(1, new_location_count)
+    for i in range(lo, hi + 1):
+        nxx = 200 + (i % 799)
+        sub = 1000 + (i % 8999)
+        yield (
+            phone0 + i,
+            person0 + 1 + ((i - 1) % npc),
+            None if i % 3 == 0 else loc0 + 1 + ((i * 11) % nl),
+            f"555{nxx:03d}{sub:04d}",
+            "+1",
+            1 + (i % 5),
+            "AMAZON_MARKETPLACE",
+            batch_id,
+        )
+
+
+def insert_persons(cur, n: int, batch_id: int, person0: int) -> None:
+    _execute_pages(cur, _insert_sql("bronze.person"), person_rows(random, 1, n, batch_id, person0), 5000)
+
+
+def insert_restricted(cur, r: int, batch_id: int, person0: int) -> None:
+    _execute_pages(
+        cur, _insert_sql("bronze.restricted_info"), restricted_rows(random, 1, r, batch_id, person0), 3000
+    )
+
+
+def insert_person_locations(
+    cur,
+    n: int,
+    batch_id: int,
+    person0: int,
+    new_person_count: int,
+    loc0: int,
+    new_location_count: int,
+) -> None:
+    rows = person_location_rows(
+        random, 1, n, batch_id, person0, 1, max(1, new_person_count), loc0, new_location_count
+    )
+    _execute_pages(
         cur,
-        """
-        INSERT INTO bronze.person_location (
-            persons_person_id, locations_location_id, sub_address, location_usage, notes,
-            _source_system, _batch_id
-        ) VALUES (%s,%s,%s,%s,%s,%s,%s)
-        ON CONFLICT (persons_person_id, locations_location_id) DO NOTHING
-        """,
+        _insert_sql(
+            "bronze.person_location",
+            "ON CONFLICT (persons_person_id, locations_location_id) DO NOTHING",
+        ),
         rows,
-        page_size=3000,
+        3000,
     )
 
 
@@ -640,52 +718,8 @@ def insert_phones(
     loc0: int,
     new_location_count: int,
 ) -> None:
-    rows = []
-    npc = max(1, new_person_count)
-    nl = max(1, new_location_count)
-    for i in range(1, n + 1):
-        pid = person0 + 1 + ((i - 1) % npc)
-        lid = None if i % 3 == 0 else loc0 + 1 + ((i * 11) % nl)
-        nxx = 200 + (i % 799)
-        sub = 1000 + (i % 8999)
-        ptype = 1 + (i % 5)
-        rows.append(
-            (
-                phone0 + i,
-                pid,
-                lid,
-                f"555{nxx:03d}{sub:04d}",
-                "+1",
-                ptype,
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
-        )
-        if len(rows) >= 5000:
-            execute_batch(
-                cur,
-                """
-                INSERT INTO bronze.phone_number (
-                    phone_number_id, persons_person_id, locations_location_id,
-                    phone_number, country_code, phone_type_id, _source_system, _batch_id
-                ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)
-                """,
-                rows,
-                page_size=5000,
-            )
-            rows = []
-    if rows:
-        execute_batch(
-            cur,
-            """
-            INSERT INTO bronze.phone_number (
-                phone_number_id, persons_person_id, locations_location_id,
-                phone_number, country_code, phone_type_id, _source_system, _batch_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            rows,
-            page_size=len(rows),
-        )
+    rows = phone_rows(random, 1, n, batch_id, phone0, person0, new_person_count, loc0, new_location_count)
+    _execute_pages(cur, _insert_sql("bronze.phone_number"), rows, 5000)
 
 
 def insert_companies(cur, n: int, batch_id: int, company0: int) -> None:
@@ -748,311 +782,259 @@ def insert_customer_employees(
     )
 
 
-def insert_customers(
-    cur,
-    n: int,
+def customer_rows(
+    rng,
+    lo: int,
+    hi: int,
     batch_id: int,
     cust0: int,
     person0: int,
-    new_person_count: int,
     ce0: int,
     ce_new: int,
-) -> None:
-    rows = []
-    for i in range(1, n + 1):
-        pid = person0 + i
+) -> Iterator[Tuple[Any, ...]]:
+    for i in range(lo, hi + 1):
         if i % 4 == 0 or ce_new < 1:
             ce = None
         else:
             ce = ce0 + 1 + (i % ce_new)
-        rows.append(
-            (
-                cust0 + i,
-                pid,
-                ce,
-                5000 + (i % 500),
-                min(10, 1 + (i % 10)),
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
+        yield (
+            cust0 + i,
+            person0 + i,
+            ce,
+            5000 + (i % 500),
+            min(10, 1 + (i % 10)),
+            "AMAZON_MARKETPLACE",
+            batch_id,
         )
-    execute_batch(
-        cur,
-        """
-        INSERT INTO bronze.customer (
-            customer_id, person_id, customer_employee_id, accountmgr_id, income_level,
-            _source_system, _batch_id
-        ) VALUES (%s,%s,%s,%s,%s,%s,%s)
-        """,
-        rows,
-        page_size=5000,
-    )
 
 
-def insert_employment(
-    cur,
-    n: int,
+def employment_rows(
+    rng,
+    lo: int,
+    hi: int,
     batch_id: int,
     emp0: int,
     person0: int,
     new_person_count: int,
     job0: int,
     job_new: int,
-) -> None:
+    total: int,
+) -> Iterator[Tuple[Any, ...]]:
     """New employees use high person IDs in this batch (same layout as first load, offset)."""
-    rows = []
-    base_rel = max(1, new_person_count - n - 1)
+    base_rel = max(1, new_person_count - total - 1)
     jn = max(1, job_new)
-    for i in range(1, n + 1):
+    for i in range(lo, hi + 1):
         pid = person0 + base_rel + i
         if pid > person0 + new_person_count:
             pid = person0 + 1 + (i % max(1, new_person_count))
-        jid = job0 + 1 + ((i - 1) % jn)
         start = date.today() - timedelta(days=100 + (i % 2000))
-        rows.append(
-            (
-                emp0 + i,
-                pid,
-                jid,
-                None,
-                start,
-                None if i % 11 else start + timedelta(days=200),
-                round(38_000 + (i % 100) * 800.0, 2),
-                round((i % 8) * 0.25, 2),
-                "ACTIVE" if i % 11 else "ON_LEAVE",
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
+        yield (
+            emp0 + i,
+            pid,
+            job0 + 1 + ((i - 1) % jn),
+            None,
+            start,
+            None if i % 11 else start + timedelta(days=200),
+            round(38_000 + (i % 100) * 800.0, 2),
+            round((i % 8) * 0.25, 2),
+            "ACTIVE" if i % 11 else "ON_LEAVE",
+            "AMAZON_MARKETPLACE",
+            batch_id,
         )
-    execute_batch(
-        cur,
-        """
-        INSERT INTO bronze.employment (
-            employee_id, person_id, hr_job_id, manager_employee_id, start_date, end_date,
-            salary, commission_percent, employment_status, _source_system, _batch_id
-        ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        """,
-        rows,
-        page_size=5000,
-    )
 
 
-def insert_products(
-    cur, n: int, batch_id: int, product0: int, batch_size: int = 8000
-) -> None:
-    buf: List[Tuple[Any, ...]] = []
-    for k in range(1, n + 1):
-        product_id = product0 + k
-        buf.append(build_product_row(product_id, batch_id))
-        if len(buf) >= batch_size:
-            execute_batch(
-                cur,
-                """
-                INSERT INTO bronze.product (
-                    product_id, product_name, description, category, weight_class, warranty_period,
-                    supplier_id, status, list_price, minimum_price, price_currency, catalog_url,
-                    _source_system, _batch_id
-                ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                """,
-                buf,
-                page_size=batch_size,
-            )
-            buf = []
-            if k % 200_000 == 0:
-                logger.info("  products: %s / %s", k, n)
-    if buf:
-        execute_batch(
-            cur,
-            """
-            INSERT INTO bronze.product (
-                product_id, product_name, description, category, weight_class, warranty_period,
-                supplier_id, status, list_price, minimum_price, price_currency, catalog_url,
-                _source_system, _batch_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            buf,
-            page_size=len(buf),
-        )
+def product_rows(rng, lo: int, hi: int, batch_id: int, product0: int) -> Iterator[Tuple[Any, ...]]:
+    for k in range(lo, hi + 1):
+        yield build_product_row(product0 + k, batch_id, rng)
 
 
-def insert_inventory(
-    cur,
-    n: int,
+def inventory_rows(
+    rng,
+    lo: int,
+    hi: int,
     batch_id: int,
     inv0: int,
     product0: int,
-    new_product_count: int,
+    product_lo: int,
+    product_hi: int,
     wh0: int,
     new_warehouse_count: int,
-) -> None:
-    buf = []
+) -> Iterator[Tuple[Any, ...]]:
+    """Up to hi - lo + 1 stock rows with distinct (product, warehouse) for products product_lo..product_hi.
+
+    Inventory ids start at inv0 + lo; retries that exhaust the pairs leave the tail of the range unused.
+    """
+    n = hi - lo + 1
     seen = set()
     attempts = 0
-    inv_seq = 0
-    npc = max(1, new_product_count)
     nw = max(1, new_warehouse_count)
-    while len(buf) < n and attempts < n * 5:
+    while len(seen) < n and attempts < n * 5:
         attempts += 1
-        pid = product0 + 1 + random.randint(0, npc - 1)
-        wid = wh0 + 1 + random.randint(0, nw - 1)
+        pid = product0 + rng.randint(product_lo, product_hi)
+        wid = wh0 + 1 + rng.randint(0, nw - 1)
         if (pid, wid) in seen:
             continue
         seen.add((pid, wid))
-        inv_seq += 1
-        on_hand = random.randint(0, 5000)
-        buf.append(
-            (
-                inv0 + inv_seq,
-                pid,
-                wid,
-                on_hand,
-                max(0, on_hand - random.randint(0, min(50, on_hand))),
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
-        )
-        if len(buf) >= 8000:
-            execute_batch(
-                cur,
-                """
-                INSERT INTO bronze.inventory (
-                    inventory_id, product_id, warehouse_id, quantity_on_hand, quantity_available,
-                    _source_system, _batch_id
-                ) VALUES (%s,%s,%s,%s,%s,%s,%s)
-                """,
-                buf,
-                page_size=8000,
-            )
-            buf = []
-    if buf:
-        execute_batch(
-            cur,
-            """
-            INSERT INTO bronze.inventory (
-                inventory_id, product_id, warehouse_id, quantity_on_hand, quantity_available,
-                _source_system, _batch_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s)
-            """,
-            buf,
-            page_size=len(buf),
+        on_hand = rng.randint(0, 5000)
+        yield (
+            inv0 + lo - 1 + len(seen),
+            pid,
+            wid,
+            on_hand,
+            max(0, on_hand - rng.randint(0, min(50, on_hand))),
+            "AMAZON_MARKETPLACE",
+            batch_id,
         )
 
 
-def insert_orders(
-    cur,
-    n: int,
+def order_rows(
+    rng,
+    lo: int,
+    hi: int,
     batch_id: int,
     order0: int,
     cust0: int,
     new_customer_count: int,
     emp0: int,
     new_employee_count: int,
-) -> None:
-    buf = []
+) -> Iterator[Tuple[Any, ...]]:
     statuses = ("PENDING", "SHIPPED", "DELIVERED", "CANCELLED")
     promos = ("", "", "PRIME10", "SAVE5", "FRESH20", "FALL2025")
     if new_customer_count < 1:
         raise ValueError("new_customer_count must be >= 1")
     ncc = new_customer_count
     nec = new_employee_count
-    for k in range(1, n + 1):
+    for k in range(lo, hi + 1):
         oid = order0 + k
-        cid = cust0 + 1 + (k % ncc)
-        if nec < 1:
-            rep = None
-        else:
-            rep = emp0 + 1 + (k % nec)
-        od = date.today() - timedelta(days=k % 900)
-        buf.append(
-            (
-                oid,
-                cid,
-                rep,
-                od,
-                _clip(f"AMZ-{oid:010d}", 20),
-                random.choice(statuses),
-                0.0,
-                "USD",
-                random.choice(promos) or None,
-                "AMAZON_MARKETPLACE",
-                batch_id,
-            )
-        )
-        if len(buf) >= 5000:
-            execute_batch(
-                cur,
-                """
-                INSERT INTO bronze.orders (
-                    order_id, customer_id, sales_rep_id, order_date, order_code, order_status,
-                    order_total, order_currency, promotion_code, _source_system, _batch_id
-                ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                """,
-                buf,
-                page_size=5000,
-            )
-            buf = []
-    if buf:
-        execute_batch(
-            cur,
-            """
-            INSERT INTO bronze.orders (
-                order_id, customer_id, sales_rep_id, order_date, order_code, order_status,
-                order_total, order_currency, promotion_code, _source_system, _batch_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """,
-            buf,
-            page_size=len(buf),
+        yield (
+            oid,
+            cust0 + 1 + (k % ncc),
+            None if nec < 1 else emp0 + 1 + (k % nec),
+            date.today() - timedelta(days=k % 900),
+            _clip(f"AMZ-{oid:010d}", 20),
+            rng.choice(statuses),
+            0.0,
+            "USD",
+            rng.choice(promos) or None,
+            "AMAZON_MARKETPLACE",
+            batch_id,
         )
 
 
-def insert_order_items(
-    cur,
-    n: int,
+def order_item_rows(
+    rng,
+    lo: int,
+    hi: int,
     batch_id: int,
     oi0: int,
     order0: int,
     new_order_count: int,
     product0: int,
     new_product_count: int,
-) -> None:
+) -> Iterator[Tuple[Any, ...]]:
     if new_order_count < 1:
         raise ValueError("new_order_count must be >= 1")
-    buf = []
     npc = max(1, new_product_count)
-    for k in range(1, n + 1):
-        oiid = oi0 + k
+    for k in range(lo, hi + 1):
         oid = order0 + 1 + ((k - 1) % new_order_count)
-        pid = product0 + 1 + random.randint(0, npc - 1)
-        price = round(random.uniform(4.99, 299.99), 2)
-        qty = round(random.uniform(1, 5), 2)
-        buf.append((oiid, oid, pid, price, qty, "AMAZON_MARKETPLACE", batch_id))
-        if len(buf) >= 12_000:
-            execute_batch(
-                cur,
-                """
-                INSERT INTO bronze.order_item (
-                    order_item_id, order_id, product_id, unit_price, quantity,
-                    _source_system, _batch_id
-                ) VALUES (%s,%s,%s,%s,%s,%s,%s)
-                """,
-                buf,
-                page_size=12_000,
-            )
-            buf = []
-            if k % 400_000 == 0:
-                logger.info("  order_item: %s / %s", k, n)
-    if buf:
-        execute_batch(
-            cur,
-            """
-            INSERT INTO bronze.order_item (
-                order_item_id, order_id, product_id, unit_price, quantity,
-                _source_system, _batch_id
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s)
-            """,
-            buf,
-            page_size=len(buf),
-        )
+        pid = product0 + 1 + rng.randint(0, npc - 1)
+        price = round(rng.uniform(4.99, 299.99), 2)
+        qty = round(rng.uniform(1, 5), 2)
+        yield (oi0 + k, oid, pid, price, qty, "AMAZON_MARKETPLACE", batch_id)
+
+
+def insert_customers(
+    cur,
+    n: int,
+    batch_id: int,
+    cust0: int,
+    person0: int,
+    new_person_count: int,
+    ce0: int,
+    ce_new: int,
+) -> None:
+    rows = customer_rows(random, 1, n, batch_id, cust0, person0, ce0, ce_new)
+    _execute_pages(cur, _insert_sql("bronze.customer"), rows, 5000)
+
+
+def insert_employment(
+    cur,
+    n: int,
+    batch_id: int,
+    emp0: int,
+    person0: int,
+    new_person_count: int,
+    job0: int,
+    job_new: int,
+) -> None:
+    rows = employment_rows(random, 1, n, batch_id, emp0, person0, new_person_count, job0, job_new, n)
+    _execute_pages(cur, _insert_sql("bronze.employment"), rows, 5000)
+
+
+def insert_products(
+    cur, n: int, batch_id: int, product0: int, batch_size: int = 8000
+) -> None:
+    _execute_pages(
+        cur,
+        _insert_sql("bronze.product"),
+        product_rows(random, 1, n, batch_id, product0),
+        batch_size,
+        label="products",
+        total=n,
+        log_every=200_000,
+    )
+
+
+def insert_inventory(
+    cur,
+    n: int,
+    batch_id: int,
+    inv0: int,
+    product0: int,
+    new_product_count: int,
+    wh0: int,
+    new_warehouse_count: int,
+) -> None:
+    rows = inventory_rows(
+        random, 1, n, batch_id, inv0, product0, 1, max(1, new_product_count), wh0, new_warehouse_count
+    )
+    _execute_pages(cur, _insert_sql("bronze.inventory"), rows, 8000)
+
+
+def insert_orders(
+    cur,
+    n: int,
+    batch_id: int,
+    order0: int,
+    cust0: int,
+    new_customer_count: int,
+    emp0: int,
+    new_employee_count: int,
+) -> None:
+    rows = order_rows(random, 1, n, batch_id, order0, cust0, new_customer_count, emp0, new_employee_count)
+    _execute_pages(cur, _insert_sql("bronze.orders"), rows, 5000)
+
+
+def insert_order_items(
+    cur,
+    n: int,
+    batch_id: int,
+    oi0: int,
+    order0: int,
+    new_order_count: int,
+    product0: int,
+    new_product_count: int,
+) -> None:
+    rows = order_item_rows(random, 1, n, batch_id, oi0, order0, new_order_count, product0, new_product_count)
+    _execute_pages(
+        cur,
+        _insert_sql("bronze.order_item"),
+        rows,
+        12_000,
+        label="order_item",
+        total=n,
+        log_every=400_000,
+    )
 
 
 def update_order_totals(cur) -> None:
@@ -1096,6 +1078,299 @@ def count_bronze_rows(cur) -> int:
     return int(cur.fetchone()[0])
 
 
+# --- Parallel load -----------------------------------------------------------------------
+# With --workers N the reference tables are written by the main process, then the large tables
+# are split into N id ranges and generated by a process pool in foreign-key waves. Each
+# partition draws from its own random.Random seeded by (seed, table, partition) and streams its
+# rows with COPY on its own connection, so the output depends only on the seed and the worker
+# count. Pairs that must be unique (person_location, inventory) are drawn from the partition's
+# own slice of persons / products, so partitions never collide. Order totals are recomputed
+# once at the end, after every line item is in.
+
+ROW_GENERATORS = {
+    "bronze.person": person_rows,
+    "bronze.restricted_info": restricted_rows,
+    "bronze.person_location": person_location_rows,
+    "bronze.phone_number": phone_rows,
+    "bronze.customer": customer_rows,
+    "bronze.employment": employment_rows,
+    "bronze.product": product_rows,
+    "bronze.inventory": inventory_rows,
+    "bronze.orders": order_rows,
+    "bronze.order_item": order_item_rows,
+}
+
+
+def _copy_field(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+        )
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+class _CopyStream:
+    """File-like reader over rows in COPY text format, for cursor.copy_expert()."""
+
+    def __init__(self, rows: Iterable[Tuple[Any, ...]], rows_per_fill: int = 2000):
+        self._rows = iter(rows)
+        self._rows_per_fill = rows_per_fill
+        self._buf = ""
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buf) < size:
+            lines = [
+                "\t".join(_copy_field(v) for v in row) + "\n"
+                for row in itertools.islice(self._rows, self._rows_per_fill)
+            ]
+            if not lines:
+                break
+            self.rows += len(lines)
+            self._buf += "".join(lines)
+        if size < 0:
+            data, self._buf = self._buf, ""
+        else:
+            data, self._buf = self._buf[:size], self._buf[size:]
+        return data
+
+
+def copy_rows(cur, table: str, rows: Iterable[Tuple[Any, ...]]) -> int:
+    """Stream rows into table with COPY FROM STDIN; returns the number of rows written."""
+    stream = _CopyStream(rows)
+    cur.copy_expert(
+        "COPY {0} ({1}) FROM STDIN".format(table, ", ".join(BRONZE_COLUMNS[table])),
+        stream,
+        size=65536,
+    )
+    return stream.rows
+
+
+@dataclass
+class PartitionTask:
+    table: str
+    part: int
+    lo: int
+    hi: int
+    seed: int
+    batch_id: int
+    params: Dict[str, Any]
+
+
+def partition_range(n: int, parts: int) -> List[Tuple[int, int]]:
+    """Split 1..n into at most `parts` contiguous inclusive ranges whose sizes differ by <= 1."""
+    if n < 1:
+        return []
+    parts = max(1, min(parts, n))
+    base, extra = divmod(n, parts)
+    ranges = []
+    lo = 1
+    for p in range(parts):
+        size = base + (1 if p < extra else 0)
+        ranges.append((lo, lo + size - 1))
+        lo += size
+    return ranges
+
+
+def plan_parallel_load(
+    b: RowBudget, mx: MaxIds, workers: int, seed: int, batch_id: int
+) -> List[List[PartitionTask]]:
+    """Partition tasks per wave; a wave only references tables loaded by earlier waves."""
+
+    def split(table: str, n: int, **params: Any) -> List[PartitionTask]:
+        return [
+            PartitionTask(table, p, lo, hi, seed, batch_id, dict(params))
+            for p, (lo, hi) in enumerate(partition_range(n, workers))
+        ]
+
+    def split_by_owner(
+        table: str, n: int, owners: List[Tuple[int, int]], owner_lo: str, owner_hi: str, **params: Any
+    ) -> List[PartitionTask]:
+        # Partition p draws its pairs from owner range p only, so pairs are unique across partitions
+        return [
+            PartitionTask(
+                table, p, lo, hi, seed, batch_id, dict(params, **{owner_lo: o_lo, owner_hi: o_hi})
+            )
+            for p, ((lo, hi), (o_lo, o_hi)) in enumerate(zip(partition_range(n, len(owners)), owners))
+        ]
+
+    person_parts = partition_range(b.persons, workers)
+    product_parts = partition_range(b.products, workers)
+    return [
+        split("bronze.person", b.persons, person0=mx.person)
+        + split("bronze.product", b.products, product0=mx.product),
+        split("bronze.restricted_info", b.restricted, person0=mx.person)
+        + split_by_owner(
+            "bronze.person_location", b.person_locations, person_parts, "person_lo", "person_hi",
+            person0=mx.person, loc0=mx.location, new_location_count=b.locations,
+        )
+        + split(
+            "bronze.phone_number", b.phones, phone0=mx.phone, person0=mx.person,
+            new_person_count=b.persons, loc0=mx.location, new_location_count=b.locations,
+        )
+        + split(
+            "bronze.customer", b.customers, cust0=mx.customer, person0=mx.person,
+            ce0=mx.customer_employee, ce_new=b.customer_employees,
+        )
+        + split(
+            "bronze.employment", b.employees, emp0=mx.employee, person0=mx.person,
+            new_person_count=b.persons, job0=mx.hr_job, job_new=b.employment_jobs, total=b.employees,
+        )
+        + split_by_owner(
+            "bronze.inventory", b.inventory, product_parts, "product_lo", "product_hi",
+            inv0=mx.inventory, product0=mx.product, wh0=mx.warehouse,
+            new_warehouse_count=b.warehouses,
+        ),
+        split(
+            "bronze.orders", b.orders, order0=mx.order_, cust0=mx.customer,
+            new_customer_count=b.customers, emp0=mx.employee, new_employee_count=b.employees,
+        ),
+        split(
+            "bronze.order_item", b.order_items, oi0=mx.order_item, order0=mx.order_,
+            new_order_count=b.orders, product0=mx.product, new_product_count=b.products,
+        ),
+    ]
+
+
+def partition_rows(task: PartitionTask) -> Iterator[Tuple[Any, ...]]:
+    rng = random.Random(f"{task.seed}:{task.table}:{task.part}")
+    return ROW_GENERATORS[task.table](rng, task.lo, task.hi, task.batch_id, **task.params)
+
+
+def _load_partition(task: PartitionTask) -> Tuple[str, int]:
+    """Worker entry point: generate one partition and COPY it on a connection of its own."""
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        try:
+            written = copy_rows(cur, task.table, partition_rows(task))
+        finally:
+            cur.close()
+    return task.table, written
+
+
+def load_parallel(b: RowBudget, mx: MaxIds, workers: int, seed: int, batch_id: int) -> Dict[str, int]:
+    """Load the large tables with a process pool; each wave commits before the next starts."""
+    waves = plan_parallel_load(b, mx, workers, seed, batch_id)
+    written: Dict[str, int] = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for number, wave in enumerate(waves, 1):
+            tables = sorted({t.table for t in wave})
+            logger.info("Wave %s/%s: %s (%s partitions)…", number, len(waves), ", ".join(tables), len(wave))
+            futures = [pool.submit(_load_partition, task) for task in wave]
+            for future in as_completed(futures):
+                table, n = future.result()
+                written[table] = written.get(table, 0) + n
+            for table in tables:
+                logger.info("  %s: %s rows", table, f"{written.get(table, 0):,}")
+    return written
+
+
+def load_reference_tables(cur, b: RowBudget, mx: MaxIds, batch_id: int) -> None:
+    logger.info("Loading countries (%s)…", b.countries)
+    insert_countries(cur, b.countries, batch_id, mx.country)
+    logger.info("Loading locations (%s)…", b.locations)
+    insert_locations(cur, b.locations, batch_id, mx.location, mx.country, b.countries)
+    logger.info("Loading warehouses (%s)…", b.warehouses)
+    insert_warehouses(cur, b.warehouses, batch_id, mx.warehouse, mx.location, b.locations)
+    logger.info("Loading employment_jobs (%s)…", b.employment_jobs)
+    insert_employment_jobs(cur, b.employment_jobs, batch_id, mx.hr_job, mx.country, b.countries)
+    logger.info("Loading customer_company (%s)…", b.companies)
+    insert_companies(cur, b.companies, batch_id, mx.company)
+    logger.info("Loading customer_employee (%s)…", b.customer_employees)
+    insert_customer_employees(
+        cur, b.customer_employees, batch_id, mx.customer_employee, mx.company, b.companies
+    )
+
+
+def load_large_tables(cur, b: RowBudget, mx: MaxIds, batch_id: int) -> None:
+    logger.info("Loading persons (%s)…", b.persons)
+    insert_persons(cur, b.persons, batch_id, mx.person)
+    logger.info("Loading restricted_info (%s)…", b.restricted)
+    insert_restricted(cur, b.restricted, batch_id, mx.person)
+    logger.info("Loading person_location (%s)…", b.person_locations)
+    insert_person_locations(
+        cur,
+        b.person_locations,
+        batch_id,
+        mx.person,
+        b.persons,
+        mx.location,
+        b.locations,
+    )
+    logger.info("Loading phone_number (%s)…", b.phones)
+    insert_phones(
+        cur,
+        b.phones,
+        batch_id,
+        mx.phone,
+        mx.person,
+        b.persons,
+        mx.location,
+        b.locations,
+    )
+    logger.info("Loading customers (%s)…", b.customers)
+    insert_customers(
+        cur,
+        b.customers,
+        batch_id,
+        mx.customer,
+        mx.person,
+        b.persons,
+        mx.customer_employee,
+        b.customer_employees,
+    )
+    logger.info("Loading employment (%s)…", b.employees)
+    insert_employment(
+        cur,
+        b.employees,
+        batch_id,
+        mx.employee,
+        mx.person,
+        b.persons,
+        mx.hr_job,
+        b.employment_jobs,
+    )
+    logger.info("Loading products (%s)…", b.products)
+    insert_products(cur, b.products, batch_id, mx.product)
+    logger.info("Loading inventory (%s)…", b.inventory)
+    insert_inventory(
+        cur,
+        b.inventory,
+        batch_id,
+        mx.inventory,
+        mx.product,
+        b.products,
+        mx.warehouse,
+        b.warehouses,
+    )
+    logger.info("Loading orders (%s)…", b.orders)
+    insert_orders(
+        cur,
+        b.orders,
+        batch_id,
+        mx.order_,
+        mx.customer,
+        b.customers,
+        mx.employee,
+        b.employees,
+    )
+    logger.info("Loading order_item (%s)…", b.order_items)
+    insert_order_items(
+        cur,
+        b.order_items,
+        batch_id,
+        mx.order_item,
+        mx.order_,
+        b.orders,
+        mx.product,
+        b.products,
+    )
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--max-rows", type=int, default=5_000_000, help="Hard cap on total bronze rows (default 5M)")
@@ -1104,12 +1379,28 @@ def main() -> int:
         action="store_true",
         help="TRUNCATE all bronze tables first (full replace). Default: append using next free IDs.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Generate the large tables in N processes, each COPYing on its own connection (default 1: "
+        "single transaction)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed; the same seed and --workers reproduce the same rows (and _batch_id)",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     if args.max_rows < 50_000:
         logger.error("--max-rows too small; use at least 50000")
         return 2
+    if args.workers < 1:
+        logger.error("--workers must be >= 1")
+        return 2
 
     with get_db_connection() as conn:
         conn.autocommit = False
@@ -1154,104 +1445,30 @@ def main() -> int:
                 f"{existing:,}",
                 f"{args.max_rows:,}",
             )
-            batch_id = abs(hash((time.time(), b.total(), mx.product))) % 2_000_000_000
-
-            logger.info("Loading countries (%s)…", b.countries)
-            insert_countries(cur, b.countries, batch_id, mx.country)
-            logger.info("Loading locations (%s)…", b.locations)
-            insert_locations(cur, b.locations, batch_id, mx.location, mx.country, b.countries)
-            logger.info("Loading warehouses (%s)…", b.warehouses)
-            insert_warehouses(cur, b.warehouses, batch_id, mx.warehouse, mx.location, b.locations)
-            logger.info("Loading employment_jobs (%s)…", b.employment_jobs)
-            insert_employment_jobs(cur, b.employment_jobs, batch_id, mx.hr_job, mx.country, b.countries)
-            logger.info("Loading persons (%s)…", b.persons)
-            insert_persons(cur, b.persons, batch_id, mx.person)
-            logger.info("Loading restricted_info (%s)…", b.restricted)
-            insert_restricted(cur, b.restricted, batch_id, mx.person)
-            logger.info("Loading person_location (%s)…", b.person_locations)
-            insert_person_locations(
-                cur,
-                b.person_locations,
-                batch_id,
-                mx.person,
-                b.persons,
-                mx.location,
-                b.locations,
-            )
-            logger.info("Loading phone_number (%s)…", b.phones)
-            insert_phones(
-                cur,
-                b.phones,
-                batch_id,
-                mx.phone,
-                mx.person,
-                b.persons,
-                mx.location,
-                b.locations,
-            )
-            logger.info("Loading customer_company (%s)…", b.companies)
-            insert_companies(cur, b.companies, batch_id, mx.company)
-            logger.info("Loading customer_employee (%s)…", b.customer_employees)
-            insert_customer_employees(
-                cur, b.customer_employees, batch_id, mx.customer_employee, mx.company, b.companies
-            )
-            logger.info("Loading customers (%s)…", b.customers)
-            insert_customers(
-                cur,
-                b.customers,
-                batch_id,
-                mx.customer,
-                mx.person,
-                b.persons,
-                mx.customer_employee,
-                b.customer_employees,
-            )
-            logger.info("Loading employment (%s)…", b.employees)
-            insert_employment(
-                cur,
-                b.employees,
-                batch_id,
-                mx.employee,
-                mx.person,
-                b.persons,
-                mx.hr_job,
-                b.employment_jobs,
-            )
-            logger.info("Loading products (%s)…", b.products)
-            insert_products(cur, b.products, batch_id, mx.product)
-            logger.info("Loading inventory (%s)…", b.inventory)
-            insert_inventory(
-                cur,
-                b.inventory,
-                batch_id,
-                mx.inventory,
-                mx.product,
-                b.products,
-                mx.warehouse,
-                b.warehouses,
-            )
-            logger.info("Loading orders (%s)…", b.orders)
-            insert_orders(
-                cur,
-                b.orders,
-                batch_id,
-                mx.order_,
-                mx.customer,
-                b.customers,
-                mx.employee,
-                b.employees,
-            )
-            logger.info("Loading order_item (%s)…", b.order_items)
-            insert_order_items(
-                cur,
-                b.order_items,
-                batch_id,
-                mx.order_item,
-                mx.order_,
-                b.orders,
-                mx.product,
-                b.products,
-            )
+            seed = args.seed
+            if seed is None and args.workers > 1:
+                seed = random.SystemRandom().randrange(2_000_000_000)
+            if seed is not None:
+                random.seed(seed)
+                batch_id = seed % 2_000_000_000
+                logger.info("Seed %s (rerun with --seed %s --workers %s to reproduce)", seed, seed, args.workers)
+            else:
+                batch_id = abs(hash((time.time(), b.total(), mx.product))) % 2_000_000_000
+
+            load_reference_tables(cur, b, mx, batch_id)
+            if args.workers > 1:
+                # Workers insert on their own connections and must see the referenced rows
+                conn.commit()
+                logger.info("Loading large tables with %s workers…", args.workers)
+                try:
+                    load_parallel(b, mx, args.workers, seed, batch_id)
+                except Exception:
+                    logger.error(
+                        "Parallel load failed; waves already committed are tagged _batch_id=%s", batch_id
+                    )
+                    raise
+            else:
+                load_large_tables(cur, b, mx, batch_id)
             logger.info("Recomputing order totals from line items…")
             update_order_totals(cur)
 
@@ -2,7 +2,6 @@
 
 import sys
 import logging
-import psycopg2
 import os
 from pathlib import Path
 from datetime import datetime
@@ -16,8 +15,12 @@ sys.path.insert(0, str(project_root))
 # Import ETL modules
 try:
     from etl.transformers.bronze_to_silver import BronzeToSilverTransformer
+    from etl.transformers.watermarks import WatermarkStore
+    from etl.transformers.backfill import DEFAULT_CHUNK_SIZE, KeysetBackfill
+    from etl.transformers.streaming import DEFAULT_ITERSIZE
     from etl.aggregators.silver_to_gold import SilverToGoldAggregator
-    from etl.utils.duplicate_checker import validate_silver_layer, validate_gold_layer
+    from etl.utils.duplicate_checker import DuplicateValidator, validate_layers
+    from etl.utils import profiling
 except ImportError as e:
     print(f"Error importing ETL modules: {e}")
     print(f"Script directory: {script_dir}")
@@ -77,14 +80,64 @@ def get_table_counts(connection, schema, tables):
     return counts
 
 
-def run_etl_pipeline(batch_size=1000):
+def connection_params_from_env():
+    """psycopg2.connect keyword arguments from the POSTGRES_* environment variables."""
+    return dict(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        database=os.getenv("POSTGRES_DB", "datawarehouse"),
+        user=os.getenv("POSTGRES_USER", "postgres"),
+        password=os.getenv("POSTGRES_PASSWORD", "postgres")
+    )
+
+
+def connect_from_env():
+    """Open a new warehouse connection from the POSTGRES_* environment variables."""
+    return profiling.connect(**connection_params_from_env())
+
+
+def run_etl_pipeline(batch_size=1000, bulk_load=None, pushdown=None,
+                     use_watermarks=True, full_reconcile=False, workers=1,
+                     backfill=None, backfill_chunk_size=DEFAULT_CHUNK_SIZE,
+                     rebuild_aggregates=False, stream=None, itersize=DEFAULT_ITERSIZE,
+                     profile=False, profile_dir=None,
+                     explain_threshold_ms=profiling.DEFAULT_EXPLAIN_THRESHOLD_MS,
+                     explain_analyze=False):
     """
     Run the complete ETL pipeline with job tracking.
     
     Args:
         batch_size: Number of records to process per batch (default: 1000)
+        bulk_load: Bronze -> Silver steps that write via COPY staging + merge
+            (comma-separated string or list of step names, or "all")
+        pushdown: Bronze -> Silver steps cleansed set-based inside Postgres
+            (same format as bulk_load)
+        use_watermarks: Only extract bronze rows newer than each step's persisted
+            _load_timestamp watermark (monitoring.etl_watermarks)
+        full_reconcile: Ignore watermarks for this run and scan all of bronze (and recompute
+            every gold aggregate group)
+        workers: Run independent steps concurrently on this many connections (default: 1)
+        backfill: Bronze -> Silver steps loaded by natural-key range in a process pool of
+            ``workers`` processes, resuming a crashed backfill (same format as bulk_load)
+        backfill_chunk_size: Natural-key ids per backfill range
+        rebuild_aggregates: Delete and rebuild the delta-maintained gold aggregates instead of
+            upserting only groups touched since their watermark
+        stream: Bronze -> Silver steps read through a server-side cursor and written as they
+            stream, so memory stays flat for any batch size (same format as bulk_load)
+        itersize: Rows per server-side fetch and per write for streamed steps
+        profile: Trace SQL statements, commits and pipeline steps; writes a Chrome trace to
+            ``profile_dir`` and stores a summary on the job run under ``metadata.profile``
+        profile_dir: Directory for trace files (default: etl/scripts/profiles)
+        explain_threshold_ms: When profiling, capture plans of statements at least this slow
+            (None: never)
+        explain_analyze: When auto_explain is unavailable, re-run slow SELECTs under
+            EXPLAIN ANALYZE instead of plain EXPLAIN (executes them twice)
     """
     pipeline_start_time = datetime.now()
+    profiler = None
+    if profile:
+        profiler = profiling.Profiler(explain_threshold_ms=explain_threshold_ms,
+                                      explain_analyze=explain_analyze).activate()
     
     logger.info("")
     logger.info("=" * 80)
@@ -92,20 +145,19 @@ def run_etl_pipeline(batch_size=1000):
     logger.info("=" * 80)
     logger.info(f"Start Time: {pipeline_start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info(f"Batch Size: {batch_size:,}")
+    logger.info(f"Workers: {workers}")
+    if profiler:
+        logger.info(f"Profiling: on (plans of statements >= {explain_threshold_ms} ms)")
     logger.info("")
     
     # Database connection
     try:
-        connection = psycopg2.connect(
-            host=os.getenv("POSTGRES_HOST", "localhost"),
-            port=int(os.getenv("POSTGRES_PORT", "5432")),
-            database=os.getenv("POSTGRES_DB", "datawarehouse"),
-            user=os.getenv("POSTGRES_USER", "postgres"),
-            password=os.getenv("POSTGRES_PASSWORD", "postgres")
-        )
+        connection = connect_from_env()
         logger.info("[OK] Database connection established")
     except Exception as e:
         logger.error(f"[ERROR] Failed to connect to database: {e}")
+        if profiler:
+            profiler.deactivate()
         raise
     
     tracker = None
@@ -144,8 +196,21 @@ def run_etl_pipeline(batch_size=1000):
     # so inactive pipeline is never started in the background.
     if not is_pipeline_job_active(connection):
         logger.info("Complete ETL Pipeline job is inactive (active_status=I). Exiting without running.")
+        if profiler:
+            profiler.deactivate()
+        if tracker:
+            tracker.close()
         return
 
+    # Rows written from here on are this run's; duplicate validation only checks their keys
+    # (a full reconcile audits whole tables instead)
+    validation_since = None
+    if not full_reconcile:
+        try:
+            validation_since = DuplicateValidator.window_start(connection)
+        except Exception as e:
+            logger.warning(f"[WARN] Could not read run window start, validating whole tables: {e}")
+
     # Get initial counts - ensure transaction is clean first
     try:
         connection.rollback()  # Start with clean transaction
@@ -222,8 +287,33 @@ def run_etl_pipeline(batch_size=1000):
         logger.info("")
         
         step1_start = time.time()
-        transformer = BronzeToSilverTransformer(connection, tracker=tracker)
-        transformation_results = transformer.transform_all(batch_size=batch_size)
+        watermarks = None
+        if use_watermarks:
+            try:
+                watermarks = WatermarkStore(connection)
+                watermarks.ensure_table_exists()
+            except Exception as e:
+                connection.rollback()
+                logger.warning(f"[WARN] Watermarks unavailable, running full scans: {e}")
+                watermarks = None
+        backfiller = None
+        if backfill:
+            backfiller = KeysetBackfill(
+                connection, connection_params_from_env(), tracker=tracker, run_id=pipeline_job_id,
+                job_name="Complete ETL Pipeline", job_type="pipeline",
+                chunk_size=backfill_chunk_size, workers=workers,
+            )
+        transformer = BronzeToSilverTransformer(
+            connection, tracker=tracker, run_id=pipeline_job_id, watermarks=watermarks,
+            backfiller=backfiller,
+        )
+        with profiling.span("bronze_to_silver", "phase"):
+            transformation_results = transformer.transform_all(
+                batch_size=batch_size, bulk_load=bulk_load, pushdown=pushdown,
+                full_reconcile=full_reconcile,
+                max_workers=workers, connection_factory=connect_from_env, backfill=backfill,
+                stream=stream, itersize=itersize,
+            )
         step1_elapsed = time.time() - step1_start
         
         logger.info("")
@@ -263,8 +353,12 @@ def run_etl_pipeline(batch_size=1000):
         logger.info("")
         
         step2_start = time.time()
-        aggregator = SilverToGoldAggregator(connection, tracker=tracker)
-        aggregation_results = aggregator.aggregate_all()
+        aggregator = SilverToGoldAggregator(connection, tracker=tracker, watermarks=watermarks)
+        with profiling.span("silver_to_gold", "phase"):
+            aggregation_results = aggregator.aggregate_all(
+                max_workers=workers, connection_factory=connect_from_env,
+                full_reconcile=full_reconcile, rebuild_aggregates=rebuild_aggregates,
+            )
         step2_elapsed = time.time() - step2_start
         
         logger.info("")
@@ -301,8 +395,12 @@ def run_etl_pipeline(batch_size=1000):
         logger.info("")
         
         validation_start = time.time()
-        silver_validation = validate_silver_layer(connection)
-        gold_validation = validate_gold_layer(connection)
+        with profiling.span("duplicate_validation", "phase"):
+            validation = validate_layers(
+                connection, run_id=pipeline_job_id, since=validation_since,
+                max_workers=workers, connection_factory=connect_from_env,
+            )
+        silver_validation, gold_validation = validation['silver'], validation['gold']
         validation_elapsed = time.time() - validation_start
         
         # Check if validation passed
@@ -370,21 +468,93 @@ def run_etl_pipeline(batch_size=1000):
         logger.error("=" * 80)
         raise
     finally:
+        if profiler:
+            _finish_profile(profiler, profile_dir, tracker if pipeline_job_id else None, pipeline_job_id)
+        if tracker:
+            tracker.close()
         connection.close()
         logger.info("")
         logger.info("Database connection closed.")
 
 
+def _finish_profile(profiler, profile_dir, tracker, run_id):
+    """Write the run's Chrome trace and store its summary on the job run."""
+    profiler.deactivate()
+    directory = Path(profile_dir) if profile_dir else script_dir / 'profiles'
+    name = f"etl_profile_{datetime.now():%Y%m%d_%H%M%S}_{(run_id or 'untracked')[:8]}.json"
+    summary = profiler.summary()
+    try:
+        summary['trace_file'] = profiler.write_trace(str(directory / name))
+        logger.info(f"Profile trace written to {summary['trace_file']} "
+                    "(open in chrome://tracing, ui.perfetto.dev or speedscope.app)")
+    except Exception as e:
+        logger.warning(f"[WARN] Could not write profile trace: {e}")
+    for category, totals in summary['self_seconds_by_category'].items():
+        logger.info(f"  Profile {category:10s}: {totals['seconds']:>10.2f}s self time "
+                    f"in {totals['spans']:,} span(s)")
+    if tracker and run_id:
+        try:
+            tracker.record_profile(run_id, summary)
+        except Exception as e:
+            logger.warning(f"[WARN] Could not store profile summary on the job run: {e}")
+
+
 if __name__ == "__main__":
     import argparse
     
     parser = argparse.ArgumentParser(description='Run ETL Pipeline: Bronze -> Silver -> Gold')
     parser.add_argument('--batch-size', type=int, default=1000,
                        help='Number of records to process per batch (default: 1000)')
+    parser.add_argument('--bulk-load', default=None,
+                       help='Comma-separated Bronze->Silver steps to load via COPY staging '
+                            '(e.g. orders,order_items), or "all"')
+    parser.add_argument('--pushdown', default=None,
+                       help='Comma-separated Bronze->Silver steps to cleanse with set-based SQL '
+                            '(e.g. locations,order_items), or "all"')
+    parser.add_argument('--full-reconcile', action='store_true',
+                       help='Ignore _load_timestamp watermarks and scan all of bronze this run')
+    parser.add_argument('--no-watermarks', action='store_true',
+                       help='Do not read or advance watermarks (always full scans)')
+    parser.add_argument('--rebuild-aggregates', action='store_true',
+                       help='Delete and rebuild the delta-maintained gold aggregates '
+                            '(agg_customer_lifetime, agg_monthly_product_sales) from silver')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Run independent ETL steps in parallel on this many connections '
+                            '(default: 1, sequential)')
+    parser.add_argument('--backfill', default=None,
+                       help='Comma-separated Bronze->Silver steps to load by key range in a process '
+                            'pool of --workers processes (e.g. order_items); resumes a crashed backfill')
+    parser.add_argument('--backfill-chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                       help=f'Natural-key ids per backfill range (default: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--stream', default=None,
+                       help='Comma-separated Bronze->Silver steps to stream through server-side '
+                            'cursors (inventory, orders, order_items), or "all"')
+    parser.add_argument('--itersize', type=int, default=DEFAULT_ITERSIZE,
+                       help=f'Rows per server-side fetch and write for --stream steps '
+                            f'(default: {DEFAULT_ITERSIZE:,})')
+    parser.add_argument('--profile', action='store_true',
+                       help='Trace SQL statements, commits and steps; writes a Chrome trace / '
+                            'speedscope JSON file and stores a summary on the job run')
+    parser.add_argument('--profile-dir', default=None,
+                       help='Directory for profile traces (default: etl/scripts/profiles)')
+    parser.add_argument('--explain-threshold-ms', type=float,
+                       default=profiling.DEFAULT_EXPLAIN_THRESHOLD_MS,
+                       help='With --profile, capture plans of statements at least this slow '
+                            f'(default: {profiling.DEFAULT_EXPLAIN_THRESHOLD_MS:g})')
+    parser.add_argument('--explain-analyze', action='store_true',
+                       help='With --profile and no auto_explain, re-run slow SELECTs under '
+                            'EXPLAIN ANALYZE instead of plain EXPLAIN (runs them twice)')
     args = parser.parse_args()
     
     try:
-        run_etl_pipeline(batch_size=args.batch_size)
+        run_etl_pipeline(batch_size=args.batch_size, bulk_load=args.bulk_load,
+                         pushdown=args.pushdown, use_watermarks=not args.no_watermarks,
+                         full_reconcile=args.full_reconcile, workers=args.workers,
+                         backfill=args.backfill, backfill_chunk_size=args.backfill_chunk_size,
+                         rebuild_aggregates=args.rebuild_aggregates, stream=args.stream,
+                         itersize=args.itersize, profile=args.profile,
+                         profile_dir=args.profile_dir, explain_threshold_ms=args.explain_threshold_ms,
+                         explain_analyze=args.explain_analyze)
     except KeyboardInterrupt:
         logger.info("\nETL pipeline interrupted by user.")
         sys.exit(1)
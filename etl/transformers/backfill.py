@@ -0,0 +1,192 @@
+"""
+Keyset-range backfill for very large Bronze→Silver entities.
+
+On an initial load the LIMIT-batched transforms re-run DISTINCT ON and the silver anti-join
+over the whole bronze table for every batch, so each batch is slower than the last. A
+backfill instead splits the bronze natural-key space into fixed ranges
+(``key BETWEEN start AND end``) and loads every range with one set-based INSERT ... SELECT
+(the step's PushdownRule) in a process pool. Each range runs on its own connection and
+commits on its own, so the work per statement stays constant.
+
+Progress is kept in the pipeline run's metadata in monitoring.job_runs
+(``backfill.<step>``) and written after every committed range. A crashed backfill resumes
+from the latest unfinished state: only ranges not recorded as completed run again. A range
+that committed but was not recorded yet is re-run harmlessly (anti-join + ON CONFLICT).
+
+Only steps with a pushdown rule can be backfilled, and their parents must be in silver
+already (BronzeToSilverTransformer runs the backfill in the step's slot of transform_all).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+import psycopg2
+
+from etl.transformers.pushdown import PUSHDOWN_RULES, has_pushdown_rule, run_pushdown_batch
+
+logger = logging.getLogger(__name__)
+
+# Natural-key ids per range; one INSERT ... SELECT and one commit each
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def plan_ranges(low: int, high: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Split ``[low, high]`` into consecutive inclusive ranges of ``chunk_size`` ids."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    return [(start, min(start + chunk_size - 1, high)) for start in range(low, high + 1, chunk_size)]
+
+
+def _load_range(connection_params: Dict[str, Any], step: str, key_range: Tuple[int, int],
+                bronze_schema: str, silver_schema: str) -> int:
+    """Process-pool worker: load one key range on a fresh connection and commit it."""
+    connection = psycopg2.connect(**connection_params)
+    try:
+        cursor = connection.cursor()
+        rows = run_pushdown_batch(cursor, step, None, bronze_schema, silver_schema,
+                                  key_range=key_range)
+        connection.commit()
+        cursor.close()
+        return rows
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+
+class KeysetBackfill:
+    """Load a step's bronze key space in parallel ranges with resumable progress."""
+
+    def __init__(self, connection, connection_params: Dict[str, Any], tracker=None,
+                 run_id: Optional[str] = None, job_name: Optional[str] = None,
+                 job_type: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 workers: int = 4, bronze_schema: str = "bronze", silver_schema: str = "silver"):
+        """
+        Args:
+            connection: psycopg2 connection for key bounds (workers open their own).
+            connection_params: ``psycopg2.connect`` keyword arguments for the workers.
+            tracker: Optional ETLJobTracker; progress is stored on ``run_id``.
+            run_id: Job run that records this backfill's progress.
+            job_name / job_type: Job whose earlier runs are searched for progress to resume.
+            chunk_size: Natural-key ids per range.
+            workers: Size of the process pool.
+        """
+        self.connection = connection
+        self.connection_params = connection_params
+        self.tracker = tracker
+        self.run_id = run_id
+        self.job_name = job_name
+        self.job_type = job_type
+        self.chunk_size = chunk_size
+        self.workers = max(1, workers)
+        self.bronze_schema = bronze_schema
+        self.silver_schema = silver_schema
+
+    def key_bounds(self, step: str) -> Tuple[Optional[int], Optional[int]]:
+        """MIN / MAX natural key of the step's bronze table."""
+        rule = PUSHDOWN_RULES[step]
+        cursor = self.connection.cursor()
+        cursor.execute(
+            f"SELECT MIN({rule.key}), MAX({rule.key}) FROM {self.bronze_schema}.{rule.source}"
+        )
+        low, high = cursor.fetchone()
+        cursor.close()
+        return low, high
+
+    def _resume_state(self, step: str) -> Optional[Dict[str, Any]]:
+        """Latest unfinished progress for ``step`` from earlier runs of the job, if any."""
+        if not (self.tracker and self.job_name and self.job_type):
+            return None
+        try:
+            state = self.tracker.latest_backfill_state(self.job_name, self.job_type, step)
+        except Exception as e:
+            logger.warning("Could not read backfill progress for %s: %s", step, e)
+            return None
+        if not state or state.get("finished"):
+            return None
+        return state
+
+    def _save(self, step: str, state: Dict[str, Any]) -> None:
+        if not (self.tracker and self.run_id):
+            return
+        try:
+            self.tracker.record_backfill_state(self.run_id, step, state)
+        except Exception as e:
+            logger.warning("Could not record backfill progress for %s: %s", step, e)
+
+    def run(self, step: str) -> int:
+        """Backfill one step; returns the silver rows inserted by this run."""
+        if not has_pushdown_rule(step):
+            raise ValueError(f"Backfill needs a pushdown rule; none for step {step!r}")
+        rule = PUSHDOWN_RULES[step]
+        low, high = self.key_bounds(step)
+        if low is None:
+            logger.info("  Backfill %s: bronze.%s is empty", step, rule.source)
+            return 0
+
+        state = {
+            "key": rule.key,
+            "chunk_size": self.chunk_size,
+            "low": low,
+            "high": high,
+            "completed": [],
+            "rows": 0,
+            "finished": False,
+        }
+        resumed = self._resume_state(step)
+        if resumed:
+            # Keep the earlier range boundaries so completed ranges line up
+            chunk_size, base = resumed["chunk_size"], resumed["low"]
+            if low < base:
+                base -= -(-(base - low) // chunk_size) * chunk_size
+            state.update(
+                chunk_size=chunk_size,
+                low=base,
+                high=max(high, resumed["high"]),
+                completed=list(resumed.get("completed", [])),
+                rows=resumed.get("rows", 0),
+            )
+            logger.info("  Backfill %s: resuming, %s ranges already completed",
+                        step, len(state["completed"]))
+
+        done = {tuple(r) for r in state["completed"]}
+        todo = [r for r in plan_ranges(state["low"], state["high"], state["chunk_size"])
+                if r not in done]
+        logger.info("  Backfill %s: %s..%s in %s ranges of %s (%s to run, %s workers)",
+                    rule.key, state["low"], state["high"], len(done) + len(todo),
+                    state["chunk_size"], len(todo), self.workers)
+        self._save(step, state)
+
+        inserted = 0
+        start = time.time()
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            futures = {
+                pool.submit(_load_range, self.connection_params, step, r,
+                            self.bronze_schema, self.silver_schema): r
+                for r in todo
+            }
+            for n, future in enumerate(as_completed(futures), 1):
+                key_range = futures[future]
+                rows = future.result()
+                inserted += rows
+                state["completed"].append(list(key_range))
+                state["rows"] += rows
+                self._save(step, state)
+                elapsed = time.time() - start
+                logger.info("  Backfill %s: range %s-%s +%s rows (%s/%s, %.0f rows/s)",
+                            step, key_range[0], key_range[1], rows, n, len(todo),
+                            inserted / elapsed if elapsed > 0 else 0.0)
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown(wait=True)
+
+        state["finished"] = True
+        self._save(step, state)
+        return inserted
@@ -5,36 +5,497 @@ Incremental behavior (aligned with append-only bronze loads):
   bronze row wins when duplicates exist.
 - Anti-join to silver on the same natural key (e.g. country_id) selects only keys not yet loaded.
 - INSERT ... ON CONFLICT (natural_key) DO NOTHING avoids duplicate silver rows when re-run.
+- With a WatermarkStore, the DISTINCT ON scan (extraction and pending counts) only covers
+  bronze rows with _load_timestamp >= the step's watermark minus an overlap window; a
+  periodic full reconcile re-reads all of bronze to catch late arrivals (see watermarks.py).
 
 Dependency order in transform_all() matches FKs (e.g. country before location; customer before orders).
+
+Write modes (selectable per step via transform_all(bulk_load=...)):
+- "rows" (default): execute_values of INSERT ... VALUES ... ON CONFLICT DO NOTHING RETURNING.
+- "copy": stream the transformed batch into a session temp staging table with COPY FROM STDIN
+  (in-memory text buffer), then merge into silver with one INSERT ... SELECT ... ON CONFLICT.
+
+Engines (selectable per step via transform_all(pushdown=...)):
+- "python" (default): fetch the batch, cleanse row by row (clean_*_row), write it back.
+- "pushdown": run the step's declared cleansing rules as one INSERT ... SELECT inside Postgres
+  (see pushdown.py). Steps without a rule, or whose statement fails, fall back to "python".
+
+Row accounting: every write reports exactly how many rows it inserted (RETURNING or the
+merge statement's rowcount), so batches need no COUNT(*) over silver. Per step the
+transformer keeps inserted / skipped (missing FK) / conflicted (already in silver) counts
+in ``row_counts`` and feeds them to the tracker's progress.
 """
 
 import psycopg2
-from psycopg2.extras import execute_batch
-from typing import Dict, Any, Optional
+from psycopg2.extras import execute_values
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple, Union
 from datetime import datetime, date, timedelta
+import io
 import logging
 import hashlib
+import re
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
-from etl.transformers.incremental_pending import fetch_pending_count
+from etl.transformers.incremental_pending import PendingEstimator
+from etl.transformers.pushdown import has_pushdown_rule, run_pushdown_batch
+from etl.transformers.key_cache import KeyLookupCache, KeyMap
+from etl.transformers.watermarks import WatermarkStore
+from etl.transformers.backfill import KeysetBackfill
+from etl.transformers.streaming import DEFAULT_ITERSIZE, chunked, stream_rows
+from etl.utils.dag_executor import DagExecutor
+from etl.utils import memory, profiling
 
 # Silver table name -> Bronze table name (when they differ)
 BRONZE_TABLE_FOR_SILVER = {
     "employee": "employment",  # silver.employee is populated from bronze.employment
 }
 
+# FK prerequisites per step (silver keys looked up by the step). transform_all keeps the
+# declared order when run sequentially; the parallel executor only enforces these edges.
+STEP_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    'countries': (),
+    'locations': ('countries',),
+    'warehouses': ('locations',),
+    'products': (),
+    'inventory': ('products', 'warehouses'),
+    'persons': (),
+    'restricted_info': ('persons',),
+    'person_locations': ('persons', 'locations'),
+    'phone_numbers': ('persons', 'locations'),
+    'customer_companies': (),
+    'customer_employees': ('customer_companies',),
+    'employment_jobs': ('countries',),
+    'employees': ('persons', 'employment_jobs'),
+    'customers': ('persons', 'customer_employees'),
+    'orders': ('customers', 'employees'),
+    'order_items': ('orders', 'products'),
+}
+
+# Share of the tracked run's progress (0-100) covered by Bronze -> Silver; run_etl.py
+# reports 50 once transform_all returns and Silver -> Gold takes the rest.
+TRANSFORM_PROGRESS_SHARE = 50
+
+WRITE_MODE_ROWS = "rows"
+WRITE_MODE_COPY = "copy"
+
+ENGINE_PYTHON = "python"
+ENGINE_PUSHDOWN = "pushdown"
+
+# Steps whose extract -> clean -> write runs as a pipeline and can stream (see streaming.py)
+STREAMING_STEPS = ('inventory', 'orders', 'order_items')
+
+# Consecutive batches inserting nothing before a step with an estimated pending count stops.
+# A batch whose rows were all skipped (missing FK) or conflicted also inserts nothing, so
+# one empty batch does not mean bronze is drained.
+ESTIMATED_ZERO_BATCHES = 3
+
+_INSERT_TARGET_RE = re.compile(
+    r"INSERT\s+INTO\s+silver\.(\w+)\s*\((.*?)\)\s*VALUES.*?ON\s+CONFLICT\s*\((.*?)\)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _parse_insert_target(insert_query: str) -> Tuple[str, Tuple[str, ...], str]:
+    """Return (silver table, column names, conflict target) from a transform's INSERT statement."""
+    m = _INSERT_TARGET_RE.search(insert_query)
+    if not m:
+        raise ValueError("Cannot derive insert target from insert query")
+    columns = tuple(c.strip() for c in m.group(2).split(",") if c.strip())
+    return m.group(1), columns, " ".join(m.group(3).split())
+
+
+def _select_steps(spec: Union[str, Iterable[str]], step_names: Sequence[str],
+                  option: str) -> list:
+    """Resolve a step selection ("all", "a,b" or a list) against known step names."""
+    if isinstance(spec, str):
+        spec = step_names if spec == "all" else [s.strip() for s in spec.split(",")]
+    selected = []
+    for step in spec:
+        if step not in step_names:
+            logger.warning("Unknown %s step %r ignored", option, step)
+            continue
+        selected.append(step)
+    return selected
+
+
+def _copy_text_value(value: Any) -> str:
+    """Render one value as a field in PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex input; the leading backslash is itself escaped for COPY text format
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+# Row cleaners shared by the Python path and the pushdown parity test. Each takes the
+# transform's SELECT row (plus resolved surrogate keys) and returns the cleansed business
+# columns; audit columns (is_valid, valid_from, ...) are appended by the transform.
+# Keep in sync with etl/transformers/pushdown.py.
+
+_WEIGHT_CLASSES = {1: 'Light', 2: 'Medium', 3: 'Heavy', 4: 'Very Heavy', 5: 'Extra Heavy'}
+
+
+def clean_country_row(row: tuple) -> tuple:
+    """Cleanse one bronze.country row (country_id .. currency_code)."""
+    return (
+        row[0],  # country_id
+        row[1] or 'Unknown',  # country_name
+        (row[2] or 'XXX')[:3],  # country_code
+        row[3] if row[3] is not None else 1033,  # nat_lang_code
+        (row[4] or 'USD')[:10],  # currency_code
+    )
+
+
+def clean_location_row(row: tuple, country_key: Optional[int]) -> tuple:
+    """Cleanse one bronze.location row; builds a non-empty full_address for analytics."""
+    a1 = (row[2] or '').strip() or 'Address pending'
+    a2 = (row[3] or '').strip()
+    city = (row[4] or '').strip() or 'Unknown'
+    st = (row[5] or '').strip() or 'NA'
+    dist = (row[6] or '').strip() or '—'
+    pc = (row[7] or '').strip() or '00000'
+    address_parts = [p for p in [a1, a2, city, st, pc] if p]
+    full_address = ', '.join(address_parts)
+    return (
+        row[0],  # location_id
+        country_key,  # country_key
+        a1,
+        a2 or '—',
+        city,
+        st,
+        dist,
+        pc,
+        f"TYPE_{row[8]}" if row[8] is not None else 'TYPE_0',
+        (row[9] or '').strip() or 'No description',
+        (row[10] or '').strip() or 'No shipping notes',
+        full_address,
+    )
+
+
+def clean_warehouse_row(row: tuple, location_key: Optional[int]) -> tuple:
+    """Cleanse one bronze.warehouse row."""
+    return (
+        row[0],  # warehouse_id
+        location_key,  # location_key
+        (row[2] or '').strip() or f'Warehouse {row[0]}',  # warehouse_name
+    )
+
+
+def clean_product_row(row: tuple) -> tuple:
+    """Cleanse one bronze.product row (product_id .. catalog_url)."""
+    cat_id = row[3]
+    return (
+        row[0],  # product_id
+        row[1] or 'Unknown Product',  # product_name
+        (row[2] or '').strip() or 'No description available',  # description
+        cat_id if cat_id is not None else 0,  # category_id
+        f"Category_{cat_id}" if cat_id is not None else 'Uncategorized',  # category_name
+        row[4] if row[4] is not None else 1,  # weight_class
+        _WEIGHT_CLASSES.get(row[4], 'Standard') if row[4] is not None else 'Standard',
+        row[5] if row[5] is not None else 0,  # warranty_period_months
+        row[6] if row[6] is not None else 0,  # supplier_id
+        (row[7] or 'ACTIVE').strip()[:20],  # product_status
+        row[8] or 0.0,  # list_price
+        row[9] or 0.0,  # minimum_price
+        (row[10] or 'USD')[:3],  # price_currency
+        (row[11] or '').strip() or f'https://catalog.local/product/{row[0]}',  # catalog_url
+    )
+
+
+def clean_inventory_row(row: tuple, product_key: int, warehouse_key: int) -> tuple:
+    """Cleanse one bronze.inventory row whose product and warehouse keys are resolved."""
+    return (
+        row[0],  # inventory_id
+        product_key,  # product_key
+        warehouse_key,  # warehouse_key
+        row[3] or 0,  # quantity_on_hand
+        row[4] or 0,  # quantity_available
+    )
+
+
+def clean_order_item_row(row: tuple, order_key: int, product_key: int) -> tuple:
+    """Cleanse one bronze.order_item row (with the order's promotion_code) to 2-decimal amounts."""
+    # Validate and normalize unit_price
+    unit_price = float(row[3]) if row[3] is not None else 0.0
+    if unit_price < 0:
+        unit_price = 0.0
+    unit_price = round(unit_price, 2)  # Ensure 2 decimal precision
+    
+    # Validate and normalize quantity
+    quantity = float(row[4]) if row[4] is not None else 0.0
+    if quantity < 0:
+        quantity = 0.0
+    quantity = round(quantity, 2)  # Ensure 2 decimal precision
+    
+    # Calculate discount_amount if promotion exists
+    discount_amount = 0.0
+    promotion_code = row[5]
+    
+    if promotion_code and promotion_code.strip():
+        # Apply 10% discount for promotions (can be enhanced with actual promotion logic)
+        # Discount is calculated on the line total
+        line_total = unit_price * quantity
+        discount_amount = round(line_total * 0.10, 2)  # 10% discount
+    
+    # Ensure discount doesn't exceed line total
+    line_total = unit_price * quantity
+    if discount_amount > line_total:
+        discount_amount = round(line_total, 2)
+    
+    discount_amount = round(discount_amount, 2)  # Ensure 2 decimal precision
+    
+    return (
+        row[0],  # order_item_id
+        order_key,  # order_key
+        product_key,  # product_key
+        unit_price,  # unit_price (validated and rounded)
+        quantity,  # quantity (validated and rounded)
+        discount_amount,  # discount_amount (calculated)
+    )
+
 
 class BronzeToSilverTransformer:
     """Transforms Bronze layer data to Silver layer."""
     
-    def __init__(self, connection, tracker=None):
-        """Initialize transformer with database connection."""
+    def __init__(self, connection, tracker=None, run_id: Optional[str] = None,
+                 watermarks: Optional[WatermarkStore] = None,
+                 backfiller: Optional[KeysetBackfill] = None):
+        """Initialize transformer with database connection.
+
+        Args:
+            connection: psycopg2 connection used for all reads and writes.
+            tracker: Optional ETLJobTracker; per-step throughput is recorded on ``run_id``.
+            run_id: Job run id (from tracker.start_job) that step metrics are attached to.
+            watermarks: Optional WatermarkStore; when set, steps only extract bronze rows
+                newer than their persisted ``_load_timestamp`` watermark.
+            backfiller: Optional KeysetBackfill for the steps selected by
+                ``transform_all(backfill=...)``.
+        """
         self.connection = connection
         self.cursor = connection.cursor()
         self.tracker = tracker
+        self.run_id = run_id
+        self.write_modes: Dict[str, str] = {}
+        self.engines: Dict[str, str] = {}
+        # Surrogate-key lookups, loaded once per run and refreshed above a high-water mark
+        self.key_cache = KeyLookupCache()
+        self.watermarks = watermarks
+        # Per-step lower _load_timestamp bound for this run (None = full bronze scan)
+        self.extract_since: Dict[str, Optional[datetime]] = {}
+        self.backfiller = backfiller
+        self.backfill_steps: set = set()
+        # Per-step inserted / skipped / conflicted rows for this run (see _write_rows)
+        self.row_counts: Dict[str, Dict[str, int]] = {}
+        # Per-step completed fraction, for tracker progress
+        self.step_fractions: Dict[str, float] = {}
+        # Pending keys per step: exact over watermark deltas, catalog estimates otherwise
+        self.pending = PendingEstimator()
+        # Serializes tracker writes when steps run on parallel workers
+        self._metrics_lock = threading.Lock()
+        # Steps read through a server-side cursor, itersize rows per fetch and per write
+        self.stream_steps: set = set()
+        self.itersize = DEFAULT_ITERSIZE
+        # Empty batches in a row that end a step whose pending count is estimated
+        self.estimated_zero_batches = ESTIMATED_ZERO_BATCHES
+        # Reset the process peak RSS per step (only meaningful when steps run one at a time)
+        self.step_local_peak_rss = True
+    
+    def _extract_params(self, step: str, batch_size: int) -> Dict[str, Any]:
+        """Query parameters for a step's bronze SELECT (watermark bound + batch LIMIT)."""
+        return {"since": self.extract_since.get(step), "batch_size": batch_size}
+    
+    def _advance_watermark(self, step: str, bronze_table: str, high_water: Optional[datetime]) -> None:
+        """Persist a drained step's watermark; failures only cost a wider scan next run."""
+        if not self.watermarks:
+            return
+        try:
+            self.watermarks.advance(step, bronze_table, high_water,
+                                    full_reconcile=self.extract_since.get(step) is None)
+        except Exception as e:
+            self.connection.rollback()
+            logger.warning("Could not advance watermark for %s: %s", step, e)
+    
+    def write_mode(self, step: str) -> str:
+        """Return the write mode ("rows" or "copy") configured for a transform step."""
+        return self.write_modes.get(step, WRITE_MODE_ROWS)
+    
+    def _key_map(self, table: str, id_column: str, key_column: str) -> KeyMap:
+        """Return the cached silver.<table> id -> surrogate key map, refreshed incrementally."""
+        return self.key_cache.get_map(self.cursor, table, id_column, key_column)
+    
+    def engine(self, step: str) -> str:
+        """Return the engine ("python" or "pushdown") configured for a transform step."""
+        return self.engines.get(step, ENGINE_PYTHON)
+    
+    def _pushdown_batch(self, step: str, transform_func, batch_size: int) -> int:
+        """Run one batch of a step in Postgres; falls back to the Python transform on failure."""
+        try:
+            count = run_pushdown_batch(self.cursor, step, batch_size,
+                                       since=self.extract_since.get(step))
+            self.connection.commit()
+            self._count_rows(step, inserted=count)
+            return count
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            logger.warning("Pushdown failed for %s, falling back to python engine: %s", step, e)
+            self.engines[step] = ENGINE_PYTHON
+            return transform_func(batch_size)
+    
+    def _count_rows(self, step: str, inserted: int = 0, skipped: int = 0,
+                    conflicted: int = 0) -> None:
+        """Add a batch's outcome to the step's row accounting."""
+        # Parallel steps share row_counts; _report_progress sums it from other threads
+        with self._metrics_lock:
+            counts = self.row_counts.setdefault(step, {"inserted": 0, "skipped": 0, "conflicted": 0})
+            counts["inserted"] += inserted
+            counts["skipped"] += skipped
+            counts["conflicted"] += conflicted
+        self.pending.note_committed(step, inserted)
+    
+    def _write_rows(self, step: str, insert_query: str, rows: Sequence[tuple],
+                    page_size: Optional[int] = None, skipped: int = 0) -> int:
+        """Write transformed rows for a step using its configured write mode.
+
+        Returns the exact number of inserted rows: RETURNING on the rows path, the merge
+        statement's rowcount on the COPY path. Rows not inserted hit ON CONFLICT and are
+        counted as conflicted; ``skipped`` are rows the caller dropped (missing FKs).
+        """
+        if not rows:
+            inserted = 0
+        elif self.write_mode(step) == WRITE_MODE_COPY:
+            inserted = self._copy_merge(insert_query, rows)
+        else:
+            table, columns, conflict = _parse_insert_target(insert_query)
+            returned = execute_values(
+                self.cursor,
+                f"INSERT INTO silver.{table} ({', '.join(columns)}) VALUES %s "
+                f"ON CONFLICT ({conflict}) DO NOTHING RETURNING 1",
+                rows,
+                page_size=page_size or 100,
+                fetch=True,
+            )
+            inserted = len(returned)
+        self._count_rows(step, inserted=inserted, skipped=skipped,
+                         conflicted=len(rows) - inserted)
+        return inserted
+    
+    def _extract(self, step: str, select_query: str, batch_size: int) -> Iterable[tuple]:
+        """A batch of a step's bronze rows: streamed from a server-side cursor or fetched whole."""
+        params = self._extract_params(step, batch_size)
+        if step in self.stream_steps:
+            return stream_rows(self.connection, select_query, params, self.itersize,
+                               name=f"etl_{step}")
+        self.cursor.execute(select_query, params)
+        return self.cursor.fetchall()
+    
+    def _write_stream(self, step: str, insert_query: str, rows: Iterator[tuple],
+                      source: Iterable[tuple]) -> int:
+        """Write cleaned rows in chunks of ``itersize`` when streaming (all at once otherwise).
+
+        ``rows`` is the cleaning generator over ``source``, the step's ``_extract`` result.
+        Skipped rows are counted by the caller once the rows are drained.
+        """
+        inserted = 0
+        try:
+            for chunk in chunked(rows, self.itersize if step in self.stream_steps else None):
+                inserted += self._write_rows(step, insert_query, chunk, page_size=len(chunk))
+        finally:
+            rows.close()
+            # Closing the cleaning generator does not close the one it reads from; close the
+            # stream_rows generator too so its named cursor is closed here, before the caller
+            # commits or rolls back, and not whenever the generator is garbage collected
+            if hasattr(source, 'close'):
+                source.close()
+        return inserted
+    
+    def _copy_merge(self, insert_query: str, rows: Sequence[tuple]) -> int:
+        """COPY rows into a temp staging table, then merge into silver in one statement.
+
+        The staging table lives for the session, carries only the insert columns (no
+        constraints or sequence defaults) and is emptied by ON COMMIT DELETE ROWS.
+        """
+        table, columns, conflict = _parse_insert_target(insert_query)
+        stage = f"_stg_silver_{table}"
+        col_list = ", ".join(columns)
+        # IF NOT EXISTS also covers a staging table lost with a rolled-back first batch.
+        self.cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} ON COMMIT DELETE ROWS AS "
+            f"SELECT {col_list} FROM silver.{table} WITH NO DATA"
+        )
+        
+        buf = io.StringIO()
+        for row in rows:
+            buf.write("\t".join(_copy_text_value(v) for v in row))
+            buf.write("\n")
+        buf.seek(0)
+        self.cursor.copy_expert(f"COPY {stage} ({col_list}) FROM STDIN", buf)
+        self.cursor.execute(
+            f"INSERT INTO silver.{table} ({col_list}) "
+            f"SELECT {col_list} FROM {stage} "
+            f"ON CONFLICT ({conflict}) DO NOTHING"
+        )
+        inserted = max(0, self.cursor.rowcount)
+        # A streamed batch merges several chunks before its commit empties the stage
+        self.cursor.execute(f"TRUNCATE {stage}")
+        return inserted
+    
+    def _report_progress(self, step: str, done: int, total: int, total_steps: int) -> None:
+        """Push run progress and inserted rows to the tracker from the exact row counts."""
+        if not self.tracker or not self.run_id:
+            return
+        # Held through the tracker calls so parallel steps write progress in order
+        with self._metrics_lock:
+            self.step_fractions[step] = min(1.0, done / total) if total > 0 else 1.0
+            fractions = list(self.step_fractions.values())
+            inserted = [c["inserted"] for c in list(self.row_counts.values())]
+            progress = int(TRANSFORM_PROGRESS_SHARE * sum(fractions) / total_steps)
+            try:
+                self.tracker.update_progress(self.run_id, progress, records_processed=sum(inserted))
+                self.tracker.record_pending(self.run_id, self.pending.snapshot())
+            except Exception as e:
+                logger.warning("Could not update progress for step %s: %s", step, e)
+    
+    def _record_step_metrics(self, step: str, metrics: Dict[str, Any]) -> None:
+        """Attach per-step metrics (rows, seconds, rows/s, write mode) to the tracked run."""
+        if not self.tracker or not self.run_id:
+            return
+        try:
+            with self._metrics_lock:
+                self.tracker.record_step_metrics(self.run_id, step, metrics)
+        except Exception as e:
+            logger.warning("Could not record metrics for step %s: %s", step, e)
+    
+    def _record_step_failure(self, step: str, error: Exception) -> None:
+        """Record a failed step and the rows it wrote before the error propagates."""
+        # The tracker may share this connection; never commit the failed batch with the record
+        try:
+            self.connection.rollback()
+        except Exception:
+            pass
+        with self._metrics_lock:
+            counts = dict(self.row_counts.get(step, {}))
+        self._record_step_metrics(step, {
+            "status": "failed",
+            "error": str(error)[:500],
+            "rows": counts.get("inserted", 0),
+            "skipped": counts.get("skipped", 0),
+            "conflicted": counts.get("conflicted", 0),
+        })
     
     def table_is_empty(self, schema: str, table: str) -> bool:
         """Check if a table is empty."""
@@ -56,15 +517,16 @@ class BronzeToSilverTransformer:
                 SELECT DISTINCT ON (b2.country_id)
                     b2.country_id, b2.country_name, b2.country_code, b2.nat_lang_code, b2.currency_code
                 FROM bronze.country b2
+                WHERE (%(since)s::timestamp IS NULL OR b2._load_timestamp >= %(since)s)
                 ORDER BY b2.country_id, b2._load_timestamp DESC NULLS LAST
             ) b
             LEFT JOIN silver.country s ON b.country_id = s.country_id
             WHERE s.country_id IS NULL
             ORDER BY b.country_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('countries', batch_size))
         bronze_countries = self.cursor.fetchall()
         
         if not bronze_countries:
@@ -81,24 +543,16 @@ class BronzeToSilverTransformer:
             ON CONFLICT (country_id) DO NOTHING
         """
         
-        transformed = []
-        for row in bronze_countries:
-            transformed.append((
-                row[0],  # country_id
-                row[1] or 'Unknown',  # country_name
-                (row[2] or 'XXX')[:3],  # country_code
-                row[3] if row[3] is not None else 1033,  # nat_lang_code
-                (row[4] or 'USD')[:10],  # currency_code
-                True,  # is_valid
-                datetime.now(),  # valid_from
-                date(9999, 12, 31),  # valid_to
-                datetime.now()  # _etl_timestamp
-            ))
+        now = datetime.now()
+        transformed = [
+            clean_country_row(row) + (True, now, date(9999, 12, 31), now)
+            for row in bronze_countries
+        ]
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('countries', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} countries")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} countries")
+        return inserted
     
     def transform_locations(self, batch_size: int = 1000):
         """Transform bronze.location to silver.location."""
@@ -115,15 +569,16 @@ class BronzeToSilverTransformer:
                     l2.city, l2.state, l2.district, l2.postal_code, l2.location_type_code,
                     l2.description, l2.shipping_notes
                 FROM bronze.location l2
+                WHERE (%(since)s::timestamp IS NULL OR l2._load_timestamp >= %(since)s)
                 ORDER BY l2.location_id, l2._load_timestamp DESC NULLS LAST
             ) l
             LEFT JOIN silver.location s ON l.location_id = s.location_id
             WHERE s.location_id IS NULL
             ORDER BY l.location_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('locations', batch_size))
         bronze_locations = self.cursor.fetchall()
         
         if not bronze_locations:
@@ -133,8 +588,7 @@ class BronzeToSilverTransformer:
         logger.info(f"Transforming {len(bronze_locations)} locations...")
         
         # Get country keys
-        self.cursor.execute("SELECT country_id, country_key FROM silver.country;")
-        country_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        country_map = self._key_map('country', 'country_id', 'country_key')
         
         insert_query = """
             INSERT INTO silver.location 
@@ -145,43 +599,17 @@ class BronzeToSilverTransformer:
             ON CONFLICT (location_id) DO NOTHING
         """
         
-        transformed = []
-        for row in bronze_locations:
-            country_key = country_map.get(row[1])  # country_id -> country_key
-            
-            # Build full address (non-empty string for analytics)
-            a1 = (row[2] or '').strip() or 'Address pending'
-            a2 = (row[3] or '').strip()
-            city = (row[4] or '').strip() or 'Unknown'
-            st = (row[5] or '').strip() or 'NA'
-            dist = (row[6] or '').strip() or '—'
-            pc = (row[7] or '').strip() or '00000'
-            address_parts = [p for p in [a1, a2, city, st, pc] if p]
-            full_address = ', '.join(address_parts)
-
-            transformed.append((
-                row[0],  # location_id
-                country_key,  # country_key
-                a1,
-                a2 or '—',
-                city,
-                st,
-                dist,
-                pc,
-                f"TYPE_{row[8]}" if row[8] is not None else 'TYPE_0',
-                (row[9] or '').strip() or 'No description',
-                (row[10] or '').strip() or 'No shipping notes',
-                full_address,
-                True,  # is_valid
-                datetime.now(),  # valid_from
-                date(9999, 12, 31),  # valid_to
-                datetime.now()  # _etl_timestamp
-            ))
+        now = datetime.now()
+        transformed = [
+            # country_id -> country_key
+            clean_location_row(row, country_map.get(row[1])) + (True, now, date(9999, 12, 31), now)
+            for row in bronze_locations
+        ]
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('locations', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} locations")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} locations")
+        return inserted
     
     def transform_warehouses(self, batch_size: int = 1000):
         """Transform bronze.warehouse to silver.warehouse."""
@@ -193,15 +621,16 @@ class BronzeToSilverTransformer:
                 SELECT DISTINCT ON (w2.warehouse_id)
                     w2.warehouse_id, w2.location_id, w2.warehouse_name
                 FROM bronze.warehouse w2
+                WHERE (%(since)s::timestamp IS NULL OR w2._load_timestamp >= %(since)s)
                 ORDER BY w2.warehouse_id, w2._load_timestamp DESC NULLS LAST
             ) w
             LEFT JOIN silver.warehouse s ON w.warehouse_id = s.warehouse_id
             WHERE s.warehouse_id IS NULL
             ORDER BY w.warehouse_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('warehouses', batch_size))
         bronze_warehouses = self.cursor.fetchall()
         
         if not bronze_warehouses:
@@ -211,8 +640,7 @@ class BronzeToSilverTransformer:
         logger.info(f"Transforming {len(bronze_warehouses)} warehouses...")
         
         # Get location keys
-        self.cursor.execute("SELECT location_id, location_key FROM silver.location;")
-        location_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        location_map = self._key_map('location', 'location_id', 'location_key')
         
         insert_query = """
             INSERT INTO silver.warehouse 
@@ -221,24 +649,17 @@ class BronzeToSilverTransformer:
             ON CONFLICT (warehouse_id) DO NOTHING
         """
         
-        transformed = []
-        for row in bronze_warehouses:
-            location_key = location_map.get(row[1])  # location_id -> location_key
-            
-            transformed.append((
-                row[0],  # warehouse_id
-                location_key,  # location_key
-                (row[2] or '').strip() or f'Warehouse {row[0]}',  # warehouse_name
-                True,  # is_valid
-                datetime.now(),  # valid_from
-                date(9999, 12, 31),  # valid_to
-                datetime.now()  # _etl_timestamp
-            ))
+        now = datetime.now()
+        transformed = [
+            # location_id -> location_key
+            clean_warehouse_row(row, location_map.get(row[1])) + (True, now, date(9999, 12, 31), now)
+            for row in bronze_warehouses
+        ]
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('warehouses', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} warehouses")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} warehouses")
+        return inserted
     
     def transform_products(self, batch_size: int = 1000):
         """Transform bronze.product to silver.product."""
@@ -254,15 +675,16 @@ class BronzeToSilverTransformer:
                     b2.warranty_period, b2.supplier_id, b2.status, b2.list_price, b2.minimum_price,
                     b2.price_currency, b2.catalog_url
                 FROM bronze.product b2
+                WHERE (%(since)s::timestamp IS NULL OR b2._load_timestamp >= %(since)s)
                 ORDER BY b2.product_id, b2._load_timestamp DESC NULLS LAST
             ) b
             LEFT JOIN silver.product s ON b.product_id = s.product_id
             WHERE s.product_id IS NULL
             ORDER BY b.product_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('products', batch_size))
         bronze_products = self.cursor.fetchall()
         
         if not bronze_products:
@@ -281,36 +703,16 @@ class BronzeToSilverTransformer:
             ON CONFLICT (product_id) DO NOTHING
         """
         
-        transformed = []
-        for row in bronze_products:
-            weight_classes = {1: 'Light', 2: 'Medium', 3: 'Heavy', 4: 'Very Heavy', 5: 'Extra Heavy'}
-            
-            cat_id = row[3]
-            transformed.append((
-                row[0],  # product_id
-                row[1] or 'Unknown Product',  # product_name
-                (row[2] or '').strip() or 'No description available',  # description
-                cat_id if cat_id is not None else 0,  # category_id
-                f"Category_{cat_id}" if cat_id is not None else 'Uncategorized',  # category_name
-                row[4] if row[4] is not None else 1,  # weight_class
-                weight_classes.get(row[4], 'Standard') if row[4] is not None else 'Standard',
-                row[5] if row[5] is not None else 0,  # warranty_period_months
-                row[6] if row[6] is not None else 0,  # supplier_id
-                (row[7] or 'ACTIVE').strip()[:20],  # product_status
-                row[8] or 0.0,  # list_price
-                row[9] or 0.0,  # minimum_price
-                (row[10] or 'USD')[:3],  # price_currency
-                (row[11] or '').strip() or f'https://catalog.local/product/{row[0]}',  # catalog_url
-                True,  # is_valid
-                datetime.now(),  # valid_from
-                date(9999, 12, 31),  # valid_to
-                datetime.now()  # _etl_timestamp
-            ))
+        now = datetime.now()
+        transformed = [
+            clean_product_row(row) + (True, now, date(9999, 12, 31), now)
+            for row in bronze_products
+        ]
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('products', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} products")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} products")
+        return inserted
     
     def transform_inventory(self, batch_size: int = 1000):
         """Transform bronze.inventory to silver.inventory."""
@@ -322,30 +724,22 @@ class BronzeToSilverTransformer:
                 SELECT DISTINCT ON (i2.inventory_id)
                     i2.inventory_id, i2.product_id, i2.warehouse_id, i2.quantity_on_hand, i2.quantity_available
                 FROM bronze.inventory i2
+                WHERE (%(since)s::timestamp IS NULL OR i2._load_timestamp >= %(since)s)
                 ORDER BY i2.inventory_id, i2._load_timestamp DESC NULLS LAST
             ) i
             LEFT JOIN silver.inventory s ON i.inventory_id = s.inventory_id
             WHERE s.inventory_id IS NULL
             ORDER BY i.inventory_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
-        bronze_inventory = self.cursor.fetchall()
-        
-        if not bronze_inventory:
-            logger.info("No new inventory to transform")
-            return 0
-        
-        logger.info(f"Transforming {len(bronze_inventory)} inventory records...")
+        bronze_inventory = self._extract('inventory', select_query, batch_size)
         
         # Get product keys
-        self.cursor.execute("SELECT product_id, product_key FROM silver.product;")
-        product_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        product_map = self._key_map('product', 'product_id', 'product_key')
         
         # Get warehouse keys
-        self.cursor.execute("SELECT warehouse_id, warehouse_key FROM silver.warehouse;")
-        warehouse_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        warehouse_map = self._key_map('warehouse', 'warehouse_id', 'warehouse_key')
         
         insert_query = """
             INSERT INTO silver.inventory 
@@ -355,30 +749,33 @@ class BronzeToSilverTransformer:
             ON CONFLICT (inventory_id) DO NOTHING
         """
         
-        transformed = []
-        for row in bronze_inventory:
-            product_key = product_map.get(row[1])  # product_id -> product_key
-            warehouse_key = warehouse_map.get(row[2])  # warehouse_id -> warehouse_key
-            
-            # Skip if required foreign keys are missing
-            if not product_key or not warehouse_key:
-                continue
-            
-            transformed.append((
-                row[0],  # inventory_id
-                product_key,  # product_key
-                warehouse_key,  # warehouse_key
-                row[3] or 0,  # quantity_on_hand
-                row[4] or 0,  # quantity_available
-                datetime.now().date(),  # last_stock_date
-                True,  # is_valid
-                datetime.now()  # _etl_timestamp
-            ))
+        stats = {"selected": 0, "skipped": 0}
         
-        execute_batch(self.cursor, insert_query, transformed)
+        def cleaned():
+            for row in bronze_inventory:
+                stats["selected"] += 1
+                product_key = product_map.get(row[1])  # product_id -> product_key
+                warehouse_key = warehouse_map.get(row[2])  # warehouse_id -> warehouse_key
+                
+                # Skip if required foreign keys are missing
+                if not product_key or not warehouse_key:
+                    stats["skipped"] += 1
+                    continue
+                
+                yield clean_inventory_row(row, product_key, warehouse_key) + (
+                    datetime.now().date(),  # last_stock_date
+                    True,  # is_valid
+                    datetime.now()  # _etl_timestamp
+                )
+        
+        inserted = self._write_stream('inventory', insert_query, cleaned(), bronze_inventory)
+        self._count_rows('inventory', skipped=stats["skipped"])
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} inventory records")
-        return len(transformed)
+        if not stats["selected"]:
+            logger.info("No new inventory to transform")
+            return 0
+        logger.info(f"Successfully transformed {inserted} of {stats['selected']} inventory records")
+        return inserted
     
     def transform_persons(self, batch_size: int = 1000):
         """Transform bronze.person to silver.person."""
@@ -392,15 +789,16 @@ class BronzeToSilverTransformer:
                     b2.person_id, b2.first_name, b2.last_name, b2.middle_names, b2.nickname,
                     b2.nat_lang_code, b2.culture_code, b2.gender
                 FROM bronze.person b2
+                WHERE (%(since)s::timestamp IS NULL OR b2._load_timestamp >= %(since)s)
                 ORDER BY b2.person_id, b2._load_timestamp DESC NULLS LAST
             ) b
             LEFT JOIN silver.person s ON b.person_id = s.person_id
             WHERE s.person_id IS NULL
             ORDER BY b.person_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('persons', batch_size))
         bronze_persons = self.cursor.fetchall()
         
         if not bronze_persons:
@@ -448,10 +846,10 @@ class BronzeToSilverTransformer:
                 datetime.now()  # _etl_timestamp
             ))
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('persons', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} persons")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} persons")
+        return inserted
     
     def transform_restricted_info(self, batch_size: int = 1000):
         """Transform bronze.restricted_info to silver.restricted_info."""
@@ -465,16 +863,17 @@ class BronzeToSilverTransformer:
                     r2.person_id, r2.date_of_birth, r2.date_of_death, r2.government_id, r2.passport_id,
                     r2.hire_date, r2.seniority_code
                 FROM bronze.restricted_info r2
+                WHERE (%(since)s::timestamp IS NULL OR r2._load_timestamp >= %(since)s)
                 ORDER BY r2.person_id, r2._load_timestamp DESC NULLS LAST
             ) r
             INNER JOIN silver.person p ON r.person_id = p.person_id
             LEFT JOIN silver.restricted_info s ON p.person_key = s.person_key
             WHERE s.person_key IS NULL
             ORDER BY r.person_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('restricted_info', batch_size))
         bronze_restricted = self.cursor.fetchall()
         
         if not bronze_restricted:
@@ -541,22 +940,20 @@ class BronzeToSilverTransformer:
                 datetime.now()  # _etl_timestamp
             ))
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('restricted_info', insert_query, transformed, skipped=len(bronze_restricted) - len(transformed))
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} restricted info records")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} restricted info records")
+        return inserted
     
     def transform_person_locations(self, batch_size: int = 1000):
         """Transform bronze.person_location to silver.person_location."""
         logger.info("Starting person location transformation...")
         
         # Get person keys mapping first
-        self.cursor.execute("SELECT person_id, person_key FROM silver.person;")
-        person_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        person_map = self._key_map('person', 'person_id', 'person_key')
         
         # Get location keys mapping first
-        self.cursor.execute("SELECT location_id, location_key FROM silver.location;")
-        location_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        location_map = self._key_map('location', 'location_id', 'location_key')
         
         # Now select bronze records that don't exist in silver
         # Join through person and location tables to get the correct keys for comparison
@@ -568,6 +965,7 @@ class BronzeToSilverTransformer:
                     pl2.persons_person_id, pl2.locations_location_id, pl2.sub_address,
                     pl2.location_usage, pl2.notes
                 FROM bronze.person_location pl2
+                WHERE (%(since)s::timestamp IS NULL OR pl2._load_timestamp >= %(since)s)
                 ORDER BY pl2.persons_person_id, pl2.locations_location_id, pl2._load_timestamp DESC NULLS LAST
             ) pl
             INNER JOIN silver.person p ON pl.persons_person_id = p.person_id
@@ -576,10 +974,10 @@ class BronzeToSilverTransformer:
                 AND l.location_key = s.location_key
             WHERE s.person_location_key IS NULL
             ORDER BY pl.persons_person_id, pl.locations_location_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('person_locations', batch_size))
         bronze_person_locs = self.cursor.fetchall()
         
         if not bronze_person_locs:
@@ -597,7 +995,6 @@ class BronzeToSilverTransformer:
         """
         
         transformed = []
-        skipped_duplicates = 0
         for row in bronze_person_locs:
             person_key = person_map.get(row[0])  # persons_person_id -> person_key
             location_key = location_map.get(row[1])  # locations_location_id -> location_key
@@ -606,17 +1003,6 @@ class BronzeToSilverTransformer:
             if not person_key or not location_key:
                 continue
             
-            # Additional safety check: verify this combination doesn't already exist
-            # (This is redundant with ON CONFLICT but provides better logging)
-            self.cursor.execute("""
-                SELECT 1 FROM silver.person_location 
-                WHERE person_key = %s AND location_key = %s
-                LIMIT 1
-            """, (person_key, location_key))
-            if self.cursor.fetchone():
-                skipped_duplicates += 1
-                continue  # Skip if already exists
-            
             # Determine location usage type
             usage = (row[3] or '').upper()
             if 'HOME' in usage:
@@ -644,18 +1030,20 @@ class BronzeToSilverTransformer:
                 datetime.now()  # _etl_timestamp
             ))
         
-        if transformed:
-            execute_batch(self.cursor, insert_query, transformed)
-            self.connection.commit()
-            logger.info(f"Successfully transformed {len(transformed)} person location records")
-            if skipped_duplicates > 0:
-                logger.info(f"Skipped {skipped_duplicates} duplicate records")
+        # Existing (person_key, location_key) pairs are left to ON CONFLICT and come back
+        # as conflicted rows instead of being probed one by one.
+        inserted = self._write_rows('person_locations', insert_query, transformed,
+                                    skipped=len(bronze_person_locs) - len(transformed))
+        self.connection.commit()
+        duplicates = len(transformed) - inserted
+        if inserted:
+            logger.info(f"Successfully transformed {inserted} person location records")
         else:
             logger.info("No new person location records to insert after filtering")
-            if skipped_duplicates > 0:
-                logger.info(f"All {skipped_duplicates} records were duplicates")
+        if duplicates > 0:
+            logger.info(f"Skipped {duplicates} duplicate records")
         
-        return len(transformed)
+        return inserted
     
     def transform_phone_numbers(self, batch_size: int = 1000):
         """Transform bronze.phone_number to silver.phone_number."""
@@ -669,15 +1057,16 @@ class BronzeToSilverTransformer:
                     pn2.phone_number_id, pn2.persons_person_id, pn2.locations_location_id,
                     pn2.phone_number, pn2.country_code, pn2.phone_type_id
                 FROM bronze.phone_number pn2
+                WHERE (%(since)s::timestamp IS NULL OR pn2._load_timestamp >= %(since)s)
                 ORDER BY pn2.phone_number_id, pn2._load_timestamp DESC NULLS LAST
             ) pn
             LEFT JOIN silver.phone_number s ON pn.phone_number_id = s.phone_id
             WHERE s.phone_id IS NULL
             ORDER BY pn.phone_number_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('phone_numbers', batch_size))
         bronze_phones = self.cursor.fetchall()
         
         if not bronze_phones:
@@ -687,12 +1076,10 @@ class BronzeToSilverTransformer:
         logger.info(f"Transforming {len(bronze_phones)} phone number records...")
         
         # Get person keys
-        self.cursor.execute("SELECT person_id, person_key FROM silver.person;")
-        person_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        person_map = self._key_map('person', 'person_id', 'person_key')
         
         # Get location keys
-        self.cursor.execute("SELECT location_id, location_key FROM silver.location;")
-        location_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        location_map = self._key_map('location', 'location_id', 'location_key')
         
         insert_query = """
             INSERT INTO silver.phone_number 
@@ -732,10 +1119,10 @@ class BronzeToSilverTransformer:
                 datetime.now()  # _etl_timestamp
             ))
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('phone_numbers', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} phone number records")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} phone number records")
+        return inserted
     
     def transform_customer_companies(self, batch_size: int = 1000):
         """Transform bronze.customer_company to silver.customer_company."""
@@ -747,15 +1134,16 @@ class BronzeToSilverTransformer:
                 SELECT DISTINCT ON (b2.company_id)
                     b2.company_id, b2.company_name, b2.company_credit_limit, b2.credit_limit_currency
                 FROM bronze.customer_company b2
+                WHERE (%(since)s::timestamp IS NULL OR b2._load_timestamp >= %(since)s)
                 ORDER BY b2.company_id, b2._load_timestamp DESC NULLS LAST
             ) b
             LEFT JOIN silver.customer_company s ON b.company_id = s.company_id
             WHERE s.company_id IS NULL
             ORDER BY b.company_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('customer_companies', batch_size))
         bronze_companies = self.cursor.fetchall()
         
         if not bronze_companies:
@@ -797,10 +1185,10 @@ class BronzeToSilverTransformer:
                 datetime.now()  # _etl_timestamp
             ))
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('customer_companies', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} customer companies")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} customer companies")
+        return inserted
     
     def transform_customer_employees(self, batch_size: int = 1000):
         """Transform bronze.customer_employee to silver.customer_employee."""
@@ -814,15 +1202,16 @@ class BronzeToSilverTransformer:
                     ce2.customer_employee_id, ce2.company_id, ce2.badge_number, ce2.job_title,
                     ce2.department, ce2.credit_limit, ce2.credit_limit_currency
                 FROM bronze.customer_employee ce2
+                WHERE (%(since)s::timestamp IS NULL OR ce2._load_timestamp >= %(since)s)
                 ORDER BY ce2.customer_employee_id, ce2._load_timestamp DESC NULLS LAST
             ) ce
             LEFT JOIN silver.customer_employee s ON ce.customer_employee_id = s.customer_employee_id
             WHERE s.customer_employee_id IS NULL
             ORDER BY ce.customer_employee_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
-        self.cursor.execute(select_query, (batch_size,))
+        self.cursor.execute(select_query, self._extract_params('customer_employees', batch_size))
         bronze_employees = self.cursor.fetchall()
         
         if not bronze_employees:
@@ -832,8 +1221,7 @@ class BronzeToSilverTransformer:
         logger.info(f"Transforming {len(bronze_employees)} customer employees...")
         
         # Get company keys
-        self.cursor.execute("SELECT company_id, company_key FROM silver.customer_company;")
-        company_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        company_map = self._key_map('customer_company', 'company_id', 'company_key')
         
         insert_query = """
             INSERT INTO silver.customer_employee 
@@ -861,10 +1249,10 @@ class BronzeToSilverTransformer:
                 datetime.now()  # _etl_timestamp
             ))
         
-        execute_batch(self.cursor, insert_query, transformed)
+        inserted = self._write_rows('customer_employees', insert_query, transformed)
         self.connection.commit()
-        logger.info(f"Successfully transformed {len(transformed)} customer employees")
-        return len(transformed)
+        logger.info(f"Successfully transformed {inserted} customer employees")
+        return inserted
     
     def transform_employment_jobs(self, batch_size: int = 1000):
         """Transform bronze.employment_jobs to silver.employment_jobs."""
@@ -875,34 +1263,23 @@ class BronzeToSilverTransformer:
         except Exception:
             pass
         
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM silver.employment_jobs")
-            silver_count = self.cursor.fetchone()[0]
-        except Exception as e:
-            logger.warning(f"Could not check silver.employment_jobs count: {e}")
-            silver_count = 0
-        
-        logger.info(
-            "  silver.employment_jobs current count: %s",
-            f"{silver_count:,}" if silver_count is not None else "unknown",
-        )
-        
         select_query = """
             SELECT ej.hr_job_id, ej.countries_country_id, ej.job_title, ej.min_salary, ej.max_salary
             FROM (
                 SELECT DISTINCT ON (j.hr_job_id)
                     j.hr_job_id, j.countries_country_id, j.job_title, j.min_salary, j.max_salary
                 FROM bronze.employment_jobs j
+                WHERE (%(since)s::timestamp IS NULL OR j._load_timestamp >= %(since)s)
                 ORDER BY j.hr_job_id, j._load_timestamp DESC NULLS LAST
             ) ej
             LEFT JOIN silver.employment_jobs s ON ej.hr_job_id = s.hr_job_id
             WHERE s.hr_job_id IS NULL
             ORDER BY ej.hr_job_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
         try:
-            self.cursor.execute(select_query, (batch_size,))
+            self.cursor.execute(select_query, self._extract_params('employment_jobs', batch_size))
             bronze_jobs = self.cursor.fetchall()
         except Exception as e:
             logger.error(f"  [ERROR] Failed to execute SELECT query: {e}")
@@ -912,25 +1289,9 @@ class BronzeToSilverTransformer:
         logger.info(f"  Selected {len(bronze_jobs)} records from bronze for processing")
         
         if not bronze_jobs:
-            pending = fetch_pending_count(self.cursor, "employment_jobs")
-            if pending is None or pending == 0:
-                self.cursor.execute("SELECT COUNT(*) FROM bronze.employment_jobs")
-                bronze_total = self.cursor.fetchone()[0]
-                self.cursor.execute(
-                    "SELECT COUNT(DISTINCT hr_job_id) FROM bronze.employment_jobs WHERE hr_job_id IS NOT NULL"
-                )
-                bronze_distinct = self.cursor.fetchone()[0]
-                if bronze_total > 0:
-                    logger.info(
-                        "  No new hr_job_id to load (%s bronze rows, %s distinct hr_job_id; all in silver).",
-                        f"{bronze_total:,}",
-                        f"{bronze_distinct:,}",
-                    )
-                    if bronze_total != bronze_distinct:
-                        logger.info(
-                            "  bronze.employment_jobs row count > distinct hr_job_id (duplicate rows in bronze)."
-                        )
-            elif pending > 0:
+            # Exact only when counted over a watermark delta (see PendingEstimator)
+            pending = self.pending.remaining("employment_jobs")
+            if pending:
                 logger.error(
                     "  [ERROR] %s employment_jobs pending by key but SELECT returned 0.",
                     f"{pending:,}",
@@ -945,13 +1306,12 @@ class BronzeToSilverTransformer:
         logger.info(f"Transforming {len(bronze_jobs)} employment jobs...")
         
         # Get country keys
-        self.cursor.execute("SELECT country_id, country_key FROM silver.country;")
-        country_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        country_map = self._key_map('country', 'country_id', 'country_key')
         logger.info(f"  Found {len(country_map)} countries in silver.country")
         
         # Check for missing country_ids
         unique_country_ids = set(row[1] for row in bronze_jobs if row[1] is not None)
-        missing_countries = unique_country_ids - set(country_map.keys())
+        missing_countries = country_map.missing(unique_country_ids)
         if missing_countries:
             logger.warning(f"  [WARN] {len(missing_countries)} country_ids from bronze don't exist in silver.country")
             logger.warning(f"  Missing country_ids: {sorted(list(missing_countries))[:10]}{'...' if len(missing_countries) > 10 else ''}")
@@ -992,19 +1352,12 @@ class BronzeToSilverTransformer:
         if transformed:
             try:
                 logger.info(f"  Attempting to insert {len(transformed)} employment jobs...")
-                execute_batch(self.cursor, insert_query, transformed, page_size=len(transformed))
-                rows_inserted = self.cursor.rowcount
+                actual_inserted = self._write_rows('employment_jobs', insert_query, transformed,
+                                                   page_size=len(transformed))
                 self.connection.commit()
                 
-                # Verify insertion - ON CONFLICT DO NOTHING returns 0 rowcount even on success
-                # So we check the actual table count instead
-                self.cursor.execute("SELECT COUNT(*) FROM silver.employment_jobs")
-                new_count = self.cursor.fetchone()[0]
-                actual_inserted = new_count - silver_count if silver_count is not None else new_count
-                
-                logger.info(f"  Cursor rowcount: {rows_inserted} (may be 0 due to ON CONFLICT)")
-                logger.info(f"  Actual records inserted: {actual_inserted:,}")
-                logger.info(f"  Total records in silver.employment_jobs after insert: {new_count:,}")
+                logger.info(f"  Records inserted: {actual_inserted:,} "
+                            f"(conflicted: {len(transformed) - actual_inserted:,})")
                 
                 if actual_inserted == 0 and len(transformed) > 0:
                     logger.error(f"  [ERROR] No rows inserted despite {len(transformed)} records prepared!")
@@ -1023,7 +1376,7 @@ class BronzeToSilverTransformer:
                         logger.error(f"  [ERROR] Records don't exist but weren't inserted - check constraints/errors")
                 
                 logger.info(f"Successfully transformed {actual_inserted} employment jobs")
-                return max(0, actual_inserted)
+                return actual_inserted
             except Exception as e:
                 self.connection.rollback()
                 logger.error(f"[ERROR] Failed to insert employment jobs: {e}")
@@ -1038,7 +1391,7 @@ class BronzeToSilverTransformer:
             else:
                 logger.warning("[WARN] No employment jobs to insert (all skipped or already exist)")
         
-        return len(transformed)
+        return 0
     
     def transform_employees(self, batch_size: int = 1000):
         """Transform bronze.employment to silver.employee."""
@@ -1050,17 +1403,9 @@ class BronzeToSilverTransformer:
         except:
             pass
         
-        # Check if table is empty first
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM silver.employee")
-            silver_count = self.cursor.fetchone()[0]
-        except Exception as e:
-            logger.warning(f"Could not check silver.employee count: {e}")
-            silver_count = None
-        
-        logger.info(f"  silver.employee current count: {silver_count if silver_count is not None else 'unknown'}")
+        silver_empty = self.table_is_empty('silver', 'employee')
         
-        if silver_count is None or silver_count == 0:
+        if silver_empty:
             logger.info(
                 "  Loading deduped bronze.employment (latest row per employee_id by _load_timestamp) "
                 "with valid person_id in silver.person"
@@ -1078,16 +1423,17 @@ class BronzeToSilverTransformer:
                 FROM bronze.employment e2
                 WHERE e2.person_id IS NOT NULL
                   AND e2.person_id IN (SELECT person_id FROM silver.person)
+                  AND (%(since)s::timestamp IS NULL OR e2._load_timestamp >= %(since)s)
                 ORDER BY e2.employee_id, e2._load_timestamp DESC NULLS LAST
             ) e
             LEFT JOIN silver.employee s ON e.employee_id = s.employee_id
             WHERE s.employee_id IS NULL
             ORDER BY e.employee_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
         try:
-            self.cursor.execute(select_query, (batch_size,))
+            self.cursor.execute(select_query, self._extract_params('employees', batch_size))
             bronze_employees = self.cursor.fetchall()
         except Exception as e:
             logger.error(f"  [ERROR] Failed to execute SELECT query: {e}")
@@ -1097,28 +1443,8 @@ class BronzeToSilverTransformer:
         logger.info(f"  Selected {len(bronze_employees)} records from bronze for processing")
         
         if not bronze_employees:
-            pending = fetch_pending_count(self.cursor, "employees")
-            if pending is None or pending == 0:
-                self.cursor.execute("SELECT COUNT(*) FROM bronze.employment")
-                bronze_total = self.cursor.fetchone()[0]
-                self.cursor.execute(
-                    "SELECT COUNT(DISTINCT employee_id) FROM bronze.employment "
-                    "WHERE employee_id IS NOT NULL"
-                )
-                bronze_distinct_ids = self.cursor.fetchone()[0]
-                if bronze_total > 0:
-                    logger.info(
-                        "  No new employee_ids to load (%s bronze rows, %s distinct employee_id; "
-                        "all ids already in silver.employee).",
-                        f"{bronze_total:,}",
-                        f"{bronze_distinct_ids:,}",
-                    )
-                    if bronze_total != bronze_distinct_ids:
-                        logger.info(
-                            "  bronze.employment row count > distinct employee_id "
-                            "(duplicate employment rows in bronze)."
-                        )
-            elif pending > 0:
+            pending = self.pending.remaining("employees")
+            if pending:
                 logger.error(
                     "  [ERROR] %s employees pending by key but SELECT returned 0.",
                     f"{pending:,}",
@@ -1137,8 +1463,7 @@ class BronzeToSilverTransformer:
             self.connection.rollback()
         except:
             pass
-        self.cursor.execute("SELECT person_id, person_key FROM silver.person;")
-        person_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        person_map = self._key_map('person', 'person_id', 'person_key')
         logger.info(f"  Found {len(person_map)} persons in silver.person")
         
         if len(person_map) == 0:
@@ -1148,26 +1473,24 @@ class BronzeToSilverTransformer:
         
         # Check for missing person_ids
         unique_person_ids = set(row[1] for row in bronze_employees if row[1] is not None)
-        missing_persons = unique_person_ids - set(person_map.keys())
+        missing_persons = person_map.missing(unique_person_ids)
         if missing_persons:
             logger.warning(f"  [WARN] {len(missing_persons)} person_ids from bronze don't exist in silver.person")
             logger.warning(f"  Missing person_ids (first 10): {sorted(list(missing_persons))[:10]}")
         
         # Get job keys
-        self.cursor.execute("SELECT hr_job_id, job_key FROM silver.employment_jobs;")
-        job_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        job_map = self._key_map('employment_jobs', 'hr_job_id', 'job_key')
         logger.info(f"  Found {len(job_map)} employment_jobs in silver.employment_jobs")
         
         # Check for missing hr_job_ids
         unique_job_ids = set(row[2] for row in bronze_employees if row[2] is not None)
-        missing_jobs = unique_job_ids - set(job_map.keys())
+        missing_jobs = job_map.missing(unique_job_ids)
         if missing_jobs:
             logger.warning(f"  [WARN] {len(missing_jobs)} hr_job_ids from bronze don't exist in silver.employment_jobs")
             logger.warning(f"  Missing hr_job_ids (first 10): {sorted(list(missing_jobs))[:10]}")
         
         # Get manager employee keys (for self-reference)
-        self.cursor.execute("SELECT employee_id, employee_key FROM silver.employee;")
-        manager_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        manager_map = self._key_map('employee', 'employee_id', 'employee_key')
         logger.info(f"  Found {len(manager_map)} existing employees in silver.employee (for manager lookup)")
         
         insert_query = """
@@ -1243,25 +1566,19 @@ class BronzeToSilverTransformer:
         if transformed:
             try:
                 logger.info(f"  Attempting to insert {len(transformed)} employees...")
-                execute_batch(self.cursor, insert_query, transformed, page_size=len(transformed))
-                rows_inserted = self.cursor.rowcount
+                actual_inserted = self._write_rows('employees', insert_query, transformed,
+                                                   page_size=len(transformed), skipped=skipped)
                 self.connection.commit()
                 
-                # Verify insertion - check actual table count
-                self.cursor.execute("SELECT COUNT(*) FROM silver.employee")
-                new_count = self.cursor.fetchone()[0]
-                actual_inserted = new_count - silver_count if silver_count is not None else new_count
-                
-                logger.info(f"  Cursor rowcount: {rows_inserted} (may be 0 due to ON CONFLICT)")
-                logger.info(f"  Actual records inserted: {actual_inserted:,}")
-                logger.info(f"  Total records in silver.employee after insert: {new_count:,}")
+                logger.info(f"  Records inserted: {actual_inserted:,} "
+                            f"(conflicted: {len(transformed) - actual_inserted:,}, skipped: {skipped:,})")
                 
                 if actual_inserted == 0 and len(transformed) > 0:
                     logger.error(f"  [ERROR] No rows inserted despite {len(transformed)} records prepared!")
                     logger.error(f"  [ERROR] Check constraints, foreign keys, or if records already exist")
                 
                 logger.info(f"Successfully transformed {actual_inserted} employees")
-                return max(0, actual_inserted)
+                return actual_inserted
             except Exception as e:
                 self.connection.rollback()
                 logger.error(f"[ERROR] Failed to insert employees: {e}")
@@ -1278,7 +1595,8 @@ class BronzeToSilverTransformer:
         
         if skipped > 0:
             logger.warning(f"  Note: {skipped} employees were skipped due to missing person_key (required)")
-        return len(transformed)
+        self._count_rows('employees', skipped=skipped)
+        return 0
     
     def transform_customers(self, batch_size: int = 1000):
         """Transform bronze.customer to silver.customer."""
@@ -1290,17 +1608,9 @@ class BronzeToSilverTransformer:
         except:
             pass
         
-        # Check if table is empty first
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM silver.customer")
-            silver_count = self.cursor.fetchone()[0]
-        except Exception as e:
-            logger.warning(f"Could not check silver.customer count: {e}")
-            silver_count = None
-        
-        logger.info(f"  silver.customer current count: {silver_count if silver_count is not None else 'unknown'}")
+        silver_empty = self.table_is_empty('silver', 'customer')
         
-        if silver_count is None or silver_count == 0:
+        if silver_empty:
             logger.info(
                 "  Loading deduped bronze.customer (latest per customer_id) with valid person_id"
             )
@@ -1315,16 +1625,17 @@ class BronzeToSilverTransformer:
                 FROM bronze.customer c2
                 WHERE c2.person_id IS NOT NULL
                   AND c2.person_id IN (SELECT person_id FROM silver.person)
+                  AND (%(since)s::timestamp IS NULL OR c2._load_timestamp >= %(since)s)
                 ORDER BY c2.customer_id, c2._load_timestamp DESC NULLS LAST
             ) c
             LEFT JOIN silver.customer s ON c.customer_id = s.customer_id
             WHERE s.customer_id IS NULL
             ORDER BY c.customer_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
         try:
-            self.cursor.execute(select_query, (batch_size,))
+            self.cursor.execute(select_query, self._extract_params('customers', batch_size))
             bronze_customers = self.cursor.fetchall()
         except Exception as e:
             logger.error(f"  [ERROR] Failed to execute SELECT query: {e}")
@@ -1334,25 +1645,8 @@ class BronzeToSilverTransformer:
         logger.info(f"  Selected {len(bronze_customers)} records from bronze for processing")
         
         if not bronze_customers:
-            pending = fetch_pending_count(self.cursor, "customers")
-            if pending is None or pending == 0:
-                self.cursor.execute("SELECT COUNT(*) FROM bronze.customer")
-                bronze_total = self.cursor.fetchone()[0]
-                distinct = 0
-                try:
-                    self.cursor.execute(
-                        "SELECT COUNT(DISTINCT customer_id) FROM bronze.customer WHERE customer_id IS NOT NULL"
-                    )
-                    distinct = self.cursor.fetchone()[0]
-                except Exception:
-                    pass
-                if bronze_total > 0:
-                    logger.info(
-                        "  No new customer_id to load (%s bronze rows, %s distinct; all in silver).",
-                        f"{bronze_total:,}",
-                        f"{distinct:,}",
-                    )
-            elif pending > 0:
+            pending = self.pending.remaining("customers")
+            if pending:
                 logger.error(
                     "  [ERROR] %s customers pending by key but SELECT returned 0.",
                     f"{pending:,}",
@@ -1371,8 +1665,7 @@ class BronzeToSilverTransformer:
             self.connection.rollback()
         except:
             pass
-        self.cursor.execute("SELECT person_id, person_key FROM silver.person;")
-        person_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        person_map = self._key_map('person', 'person_id', 'person_key')
         logger.info(f"  Found {len(person_map)} persons in silver.person")
         
         if len(person_map) == 0:
@@ -1382,14 +1675,13 @@ class BronzeToSilverTransformer:
         
         # Check for missing person_ids
         unique_person_ids = set(row[1] for row in bronze_customers if row[1] is not None)
-        missing_persons = unique_person_ids - set(person_map.keys())
+        missing_persons = person_map.missing(unique_person_ids)
         if missing_persons:
             logger.warning(f"  [WARN] {len(missing_persons)} person_ids from bronze don't exist in silver.person")
             logger.warning(f"  Missing person_ids (first 10): {sorted(list(missing_persons))[:10]}")
         
         # Get customer employee keys
-        self.cursor.execute("SELECT customer_employee_id, customer_employee_key FROM silver.customer_employee;")
-        employee_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        employee_map = self._key_map('customer_employee', 'customer_employee_id', 'customer_employee_key')
         logger.info(f"  Found {len(employee_map)} customer_employees in silver.customer_employee")
         
         insert_query = """
@@ -1447,25 +1739,19 @@ class BronzeToSilverTransformer:
         if transformed:
             try:
                 logger.info(f"  Attempting to insert {len(transformed)} customers...")
-                execute_batch(self.cursor, insert_query, transformed, page_size=len(transformed))
-                rows_inserted = self.cursor.rowcount
+                actual_inserted = self._write_rows('customers', insert_query, transformed,
+                                                   page_size=len(transformed), skipped=skipped)
                 self.connection.commit()
                 
-                # Verify insertion - check actual table count
-                self.cursor.execute("SELECT COUNT(*) FROM silver.customer")
-                new_count = self.cursor.fetchone()[0]
-                actual_inserted = new_count - silver_count if silver_count is not None else new_count
-                
-                logger.info(f"  Cursor rowcount: {rows_inserted} (may be 0 due to ON CONFLICT)")
-                logger.info(f"  Actual records inserted: {actual_inserted:,}")
-                logger.info(f"  Total records in silver.customer after insert: {new_count:,}")
+                logger.info(f"  Records inserted: {actual_inserted:,} "
+                            f"(conflicted: {len(transformed) - actual_inserted:,}, skipped: {skipped:,})")
                 
                 if actual_inserted == 0 and len(transformed) > 0:
                     logger.error(f"  [ERROR] No rows inserted despite {len(transformed)} records prepared!")
                     logger.error(f"  [ERROR] Check constraints, foreign keys, or if records already exist")
                 
                 logger.info(f"Successfully transformed {actual_inserted} customers")
-                return max(0, actual_inserted)
+                return actual_inserted
             except Exception as e:
                 self.connection.rollback()
                 logger.error(f"[ERROR] Failed to insert customers: {e}")
@@ -1482,7 +1768,8 @@ class BronzeToSilverTransformer:
         
         if skipped > 0:
             logger.warning(f"  Note: {skipped} customers were skipped due to missing person_key")
-        return len(transformed)
+        self._count_rows('customers', skipped=skipped)
+        return 0
     
     def transform_orders(self, batch_size: int = 1000):
         """Transform bronze.orders to silver.orders."""
@@ -1494,31 +1781,24 @@ class BronzeToSilverTransformer:
         except:
             pass
         
-        # Check if table is empty first
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM silver.orders")
-            silver_count = self.cursor.fetchone()[0]
-        except Exception as e:
-            logger.warning(f"Could not check silver.orders count: {e}")
-            silver_count = None
-        
-        logger.info(f"  silver.orders current count: {silver_count if silver_count is not None else 'unknown'}")
+        silver_empty = self.table_is_empty('silver', 'orders')
         
         self.cursor.execute("""
-            SELECT COUNT(*) FROM bronze.orders o
-            WHERE o.customer_id IS NOT NULL
-              AND o.customer_id IN (SELECT customer_id FROM silver.customer)
+            SELECT EXISTS (
+                SELECT 1 FROM bronze.orders o
+                WHERE o.customer_id IS NOT NULL
+                  AND o.customer_id IN (SELECT customer_id FROM silver.customer)
+            )
         """)
         orders_matchable = self.cursor.fetchone()[0]
-        if orders_matchable == 0:
-            self.cursor.execute("SELECT COUNT(*) FROM bronze.orders")
-            if self.cursor.fetchone()[0] > 0:
+        if not orders_matchable:
+            if not self.table_is_empty('bronze', 'orders'):
                 logger.error(
                     "  [ERROR] bronze.orders has rows but none reference silver.customer — populate customer first."
                 )
                 return 0
         
-        if silver_count is None or silver_count == 0:
+        if silver_empty:
             logger.info("  Loading deduped bronze.orders (latest per order_id) with valid customer_id")
         else:
             logger.info(f"  Incremental: new order_id only")
@@ -1533,71 +1813,28 @@ class BronzeToSilverTransformer:
                 FROM bronze.orders o2
                 WHERE o2.customer_id IS NOT NULL
                   AND o2.customer_id IN (SELECT customer_id FROM silver.customer)
+                  AND (%(since)s::timestamp IS NULL OR o2._load_timestamp >= %(since)s)
                 ORDER BY o2.order_id, o2._load_timestamp DESC NULLS LAST
             ) o
             LEFT JOIN silver.orders s ON o.order_id = s.order_id
             WHERE s.order_id IS NULL
             ORDER BY o.order_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
         try:
-            self.cursor.execute(select_query, (batch_size,))
-            bronze_orders = self.cursor.fetchall()
+            bronze_orders = self._extract('orders', select_query, batch_size)
         except Exception as e:
             logger.error(f"  [ERROR] Failed to execute SELECT query: {e}")
             self.connection.rollback()
             raise
         
-        logger.info(f"  Selected {len(bronze_orders)} records from bronze for processing")
-        
-        if not bronze_orders:
-            pending = fetch_pending_count(self.cursor, "orders")
-            if pending is None or pending == 0:
-                self.cursor.execute("SELECT COUNT(*) FROM bronze.orders")
-                bronze_total = self.cursor.fetchone()[0]
-                try:
-                    self.cursor.execute(
-                        "SELECT COUNT(DISTINCT order_id) FROM bronze.orders WHERE order_id IS NOT NULL"
-                    )
-                    distinct = self.cursor.fetchone()[0]
-                except Exception:
-                    distinct = 0
-                if bronze_total > 0:
-                    logger.info(
-                        "  No new order_id to load (%s bronze rows, %s distinct order_id; all in silver or missing customer).",
-                        f"{bronze_total:,}",
-                        f"{distinct:,}",
-                    )
-            elif pending > 0:
-                logger.error(
-                    "  [ERROR] %s orders pending by key but SELECT returned 0.",
-                    f"{pending:,}",
-                )
-            logger.info("No new orders to transform")
-            return 0
-        
-        # Log sample of selected records
-        if bronze_orders:
-            logger.info(f"  Sample first record: order_id={bronze_orders[0][0]}, customer_id={bronze_orders[0][1]}")
-        
-        logger.info(f"Transforming {len(bronze_orders)} orders...")
-        
         # Get customer keys
-        self.cursor.execute("SELECT customer_id, customer_key FROM silver.customer;")
-        customer_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        customer_map = self._key_map('customer', 'customer_id', 'customer_key')
         logger.info(f"  Found {len(customer_map)} customers in silver.customer")
         
-        # Check for missing customer_ids
-        unique_customer_ids = set(row[1] for row in bronze_orders if row[1] is not None)
-        missing_customers = unique_customer_ids - set(customer_map.keys())
-        if missing_customers:
-            logger.warning(f"  [WARN] {len(missing_customers)} customer_ids from bronze don't exist in silver.customer")
-            logger.warning(f"  Missing customer_ids (first 10): {sorted(list(missing_customers))[:10]}")
-        
         # Get employee keys (for sales_rep)
-        self.cursor.execute("SELECT employee_id, employee_key FROM silver.employee;")
-        employee_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        employee_map = self._key_map('employee', 'employee_id', 'employee_key')
         logger.info(f"  Found {len(employee_map)} employees in silver.employee (for sales_rep lookup)")
         
         insert_query = """
@@ -1609,92 +1846,99 @@ class BronzeToSilverTransformer:
             ON CONFLICT (order_id) DO NOTHING
         """
         
-        transformed = []
-        skipped = 0
-        for row in bronze_orders:
-            customer_key = customer_map.get(row[1])  # customer_id -> customer_key
-            
-            # Skip if required foreign key is missing
-            if not customer_key:
-                skipped += 1
-                continue
-            
-            sales_rep_key = employee_map.get(row[2]) if row[2] else None  # sales_rep_id -> employee_key
-            
-            # Categorize order status
-            status = (row[5] or 'PENDING').upper()
-            if status in ['PENDING', 'PROCESSING']:
-                status_category = 'PROCESSING'
-            elif status in ['SHIPPED', 'DELIVERED', 'COMPLETED']:
-                status_category = 'COMPLETED'
-            elif status in ['CANCELLED', 'CANCELED']:
-                status_category = 'CANCELLED'
-            else:
-                status_category = 'PENDING'
-            
-            # order_date and order_status are NOT NULL in schema - provide defaults if missing
-            order_date = row[3] or datetime.now().date()
-            order_status = status  # Already handled with default 'PENDING'
-            
-            oc = (row[4] or '').strip() or f'ORD-{row[0]:010d}'
-            promo = (row[8] or '').strip() or ''
-            transformed.append((
-                row[0],  # order_id
-                customer_key,  # customer_key
-                sales_rep_key,  # sales_rep_key
-                order_date,  # order_date (NOT NULL - use current date if missing)
-                oc[:20],  # order_code
-                order_status,  # order_status (NOT NULL - already has default 'PENDING')
-                status_category,  # order_status_category
-                row[6] or 0.0,  # order_total
-                (row[7] or 'USD')[:3],  # order_currency
-                promo,  # promotion_code (empty string if none)
-                True,  # is_valid
-                datetime.now()  # _etl_timestamp
-            ))
-        
-        if skipped > 0:
-            logger.warning(f"Skipped {skipped} orders due to missing customer_key (customer may not be populated yet)")
+        stats = {"selected": 0, "skipped": 0, "missing": set()}
         
-        if transformed:
-            try:
-                logger.info(f"  Attempting to insert {len(transformed)} orders...")
-                execute_batch(self.cursor, insert_query, transformed, page_size=len(transformed))
-                rows_inserted = self.cursor.rowcount
-                self.connection.commit()
+        def cleaned():
+            for row in bronze_orders:
+                stats["selected"] += 1
+                if stats["selected"] == 1:
+                    logger.info(f"  Sample first record: order_id={row[0]}, customer_id={row[1]}")
+                customer_key = customer_map.get(row[1])  # customer_id -> customer_key
                 
-                # Verify insertion - check actual table count
-                self.cursor.execute("SELECT COUNT(*) FROM silver.orders")
-                new_count = self.cursor.fetchone()[0]
-                actual_inserted = new_count - silver_count if silver_count is not None else new_count
+                # Skip if required foreign key is missing
+                if not customer_key:
+                    stats["skipped"] += 1
+                    if row[1] is not None and len(stats["missing"]) < 10:
+                        stats["missing"].add(row[1])
+                    continue
                 
-                logger.info(f"  Cursor rowcount: {rows_inserted} (may be 0 due to ON CONFLICT)")
-                logger.info(f"  Actual records inserted: {actual_inserted:,}")
-                logger.info(f"  Total records in silver.orders after insert: {new_count:,}")
+                sales_rep_key = employee_map.get(row[2]) if row[2] else None  # sales_rep_id -> employee_key
                 
-                if actual_inserted == 0 and len(transformed) > 0:
-                    logger.error(f"  [ERROR] No rows inserted despite {len(transformed)} records prepared!")
-                    logger.error(f"  [ERROR] Check constraints, foreign keys, or if records already exist")
+                # Categorize order status
+                status = (row[5] or 'PENDING').upper()
+                if status in ['PENDING', 'PROCESSING']:
+                    status_category = 'PROCESSING'
+                elif status in ['SHIPPED', 'DELIVERED', 'COMPLETED']:
+                    status_category = 'COMPLETED'
+                elif status in ['CANCELLED', 'CANCELED']:
+                    status_category = 'CANCELLED'
+                else:
+                    status_category = 'PENDING'
                 
-                logger.info(f"Successfully transformed {actual_inserted} orders")
-                return max(0, actual_inserted)
-            except Exception as e:
-                self.connection.rollback()
-                logger.error(f"[ERROR] Failed to insert orders: {e}")
-                logger.error(f"[ERROR] Exception type: {type(e).__name__}")
-                import traceback
-                logger.error(f"[ERROR] Traceback: {traceback.format_exc()}")
-                raise
-        else:
-            if skipped > 0:
-                logger.error(f"[ERROR] No orders inserted - all {skipped} records were skipped due to missing customer_key")
-                logger.error(f"[ERROR] Check that silver.customer is populated and customer_id values match")
-            else:
-                logger.warning("[WARN] No orders to insert (all skipped or already exist)")
+                # order_date and order_status are NOT NULL in schema - provide defaults if missing
+                order_date = row[3] or datetime.now().date()
+                order_status = status  # Already handled with default 'PENDING'
+                
+                oc = (row[4] or '').strip() or f'ORD-{row[0]:010d}'
+                promo = (row[8] or '').strip() or ''
+                yield (
+                    row[0],  # order_id
+                    customer_key,  # customer_key
+                    sales_rep_key,  # sales_rep_key
+                    order_date,  # order_date (NOT NULL - use current date if missing)
+                    oc[:20],  # order_code
+                    order_status,  # order_status (NOT NULL - already has default 'PENDING')
+                    status_category,  # order_status_category
+                    row[6] or 0.0,  # order_total
+                    (row[7] or 'USD')[:3],  # order_currency
+                    promo,  # promotion_code (empty string if none)
+                    True,  # is_valid
+                    datetime.now()  # _etl_timestamp
+                )
+        
+        try:
+            actual_inserted = self._write_stream('orders', insert_query, cleaned(), bronze_orders)
+            self._count_rows('orders', skipped=stats["skipped"])
+            self.connection.commit()
+        except Exception as e:
+            self.connection.rollback()
+            logger.error(f"[ERROR] Failed to insert orders: {e}")
+            logger.error(f"[ERROR] Exception type: {type(e).__name__}")
+            import traceback
+            logger.error(f"[ERROR] Traceback: {traceback.format_exc()}")
+            raise
+        
+        selected, skipped = stats["selected"], stats["skipped"]
+        logger.info(f"  Selected {selected} records from bronze for processing")
+        if not selected:
+            pending = self.pending.remaining("orders")
+            if pending:
+                logger.error(
+                    "  [ERROR] %s orders pending by key but SELECT returned 0.",
+                    f"{pending:,}",
+                )
+            logger.info("No new orders to transform")
+            return 0
         
         if skipped > 0:
-            logger.warning(f"  Note: {skipped} orders were skipped due to missing customer_key")
-        return len(transformed)
+            logger.warning(f"Skipped {skipped} orders due to missing customer_key (customer may not be populated yet)")
+            logger.warning(f"  Missing customer_ids (first 10): {sorted(stats['missing'])}")
+        
+        prepared = selected - skipped
+        if prepared:
+            logger.info(f"  Records inserted: {actual_inserted:,} "
+                        f"(conflicted: {prepared - actual_inserted:,}, skipped: {skipped:,})")
+            
+            if actual_inserted == 0:
+                logger.error(f"  [ERROR] No rows inserted despite {prepared} records prepared!")
+                logger.error(f"  [ERROR] Check constraints, foreign keys, or if records already exist")
+            
+            logger.info(f"Successfully transformed {actual_inserted} orders")
+            return actual_inserted
+        
+        logger.error(f"[ERROR] No orders inserted - all {skipped} records were skipped due to missing customer_key")
+        logger.error(f"[ERROR] Check that silver.customer is populated and customer_id values match")
+        return 0
     
     def transform_order_items(self, batch_size: int = 1000):
         """Transform bronze.order_item to silver.order_item with improved precision."""
@@ -1706,32 +1950,25 @@ class BronzeToSilverTransformer:
         except:
             pass
         
-        # Check if table is empty first
-        try:
-            self.cursor.execute("SELECT COUNT(*) FROM silver.order_item")
-            silver_count = self.cursor.fetchone()[0]
-        except Exception as e:
-            logger.warning(f"Could not check silver.order_item count: {e}")
-            silver_count = None
-        
-        logger.info(f"  silver.order_item current count: {silver_count if silver_count is not None else 'unknown'}")
+        silver_empty = self.table_is_empty('silver', 'order_item')
         
         self.cursor.execute("""
-            SELECT COUNT(*) FROM bronze.order_item oi
-            WHERE oi.order_id IS NOT NULL AND oi.product_id IS NOT NULL
-              AND oi.order_id IN (SELECT order_id FROM silver.orders)
-              AND oi.product_id IN (SELECT product_id FROM silver.product)
+            SELECT EXISTS (
+                SELECT 1 FROM bronze.order_item oi
+                WHERE oi.order_id IS NOT NULL AND oi.product_id IS NOT NULL
+                  AND oi.order_id IN (SELECT order_id FROM silver.orders)
+                  AND oi.product_id IN (SELECT product_id FROM silver.product)
+            )
         """)
         items_matchable = self.cursor.fetchone()[0]
-        if items_matchable == 0:
-            self.cursor.execute("SELECT COUNT(*) FROM bronze.order_item")
-            if self.cursor.fetchone()[0] > 0:
+        if not items_matchable:
+            if not self.table_is_empty('bronze', 'order_item'):
                 logger.error(
                     "  [ERROR] bronze.order_item has rows but none join silver.orders + silver.product — run those steps first."
                 )
                 return 0
         
-        if silver_count is None or silver_count == 0:
+        if silver_empty:
             logger.info("  Loading deduped bronze.order_item (latest per order_item_id) with valid FKs")
         else:
             logger.info(f"  Incremental: new order_item_id only")
@@ -1746,6 +1983,7 @@ class BronzeToSilverTransformer:
                 WHERE oi2.order_id IS NOT NULL AND oi2.product_id IS NOT NULL
                   AND oi2.order_id IN (SELECT order_id FROM silver.orders)
                   AND oi2.product_id IN (SELECT product_id FROM silver.product)
+                  AND (%(since)s::timestamp IS NULL OR oi2._load_timestamp >= %(since)s)
                 ORDER BY oi2.order_item_id, oi2._load_timestamp DESC NULLS LAST
             ) oi
             INNER JOIN bronze.orders o ON oi.order_id = o.order_id
@@ -1753,76 +1991,24 @@ class BronzeToSilverTransformer:
             LEFT JOIN silver.order_item s ON oi.order_item_id = s.order_item_id
             WHERE s.order_item_id IS NULL
             ORDER BY oi.order_item_id
-            LIMIT %s
+            LIMIT %(batch_size)s
         """
         
         try:
-            self.cursor.execute(select_query, (batch_size,))
-            bronze_items = self.cursor.fetchall()
+            bronze_items = self._extract('order_items', select_query, batch_size)
         except Exception as e:
             logger.error(f"  [ERROR] Failed to execute SELECT query: {e}")
             self.connection.rollback()
             raise
         
-        logger.info(f"  Selected {len(bronze_items)} records from bronze for processing")
-        
-        if not bronze_items:
-            pending = fetch_pending_count(self.cursor, "order_items")
-            if pending is None or pending == 0:
-                self.cursor.execute("SELECT COUNT(*) FROM bronze.order_item")
-                bronze_total = self.cursor.fetchone()[0]
-                try:
-                    self.cursor.execute(
-                        "SELECT COUNT(DISTINCT order_item_id) FROM bronze.order_item "
-                        "WHERE order_item_id IS NOT NULL"
-                    )
-                    distinct = self.cursor.fetchone()[0]
-                except Exception:
-                    distinct = 0
-                if bronze_total > 0:
-                    logger.info(
-                        "  No new order_item_id to load (%s bronze rows, %s distinct; synced or FK mismatch).",
-                        f"{bronze_total:,}",
-                        f"{distinct:,}",
-                    )
-            elif pending > 0:
-                logger.error(
-                    "  [ERROR] %s order_items pending by key but SELECT returned 0.",
-                    f"{pending:,}",
-                )
-            logger.info("No new order items to transform")
-            return 0
-        
-        # Log sample of selected records
-        if bronze_items:
-            logger.info(f"  Sample first record: order_item_id={bronze_items[0][0]}, order_id={bronze_items[0][1]}")
-        
-        logger.info(f"Transforming {len(bronze_items)} order items...")
-        
         # Get order keys
-        self.cursor.execute("SELECT order_id, order_key FROM silver.orders;")
-        order_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        order_map = self._key_map('orders', 'order_id', 'order_key')
         logger.info(f"  Found {len(order_map)} orders in silver.orders")
         
-        # Check for missing order_ids
-        unique_order_ids = set(row[1] for row in bronze_items if row[1] is not None)
-        missing_orders = unique_order_ids - set(order_map.keys())
-        if missing_orders:
-            logger.warning(f"  [WARN] {len(missing_orders)} order_ids from bronze don't exist in silver.orders")
-            logger.warning(f"  Missing order_ids (first 10): {sorted(list(missing_orders))[:10]}")
-        
         # Get product keys
-        self.cursor.execute("SELECT product_id, product_key FROM silver.product;")
-        product_map = {row[0]: row[1] for row in self.cursor.fetchall()}
+        product_map = self._key_map('product', 'product_id', 'product_key')
         logger.info(f"  Found {len(product_map)} products in silver.product")
         
-        # Check for missing product_ids
-        unique_product_ids = set(row[2] for row in bronze_items if row[2] is not None)
-        missing_products = unique_product_ids - set(product_map.keys())
-        if missing_products:
-            logger.warning(f"  [WARN] {len(missing_products)} product_ids from bronze don't exist in silver.product")
-            logger.warning(f"  Missing product_ids (first 10): {sorted(list(missing_products))[:10]}")
-        
         insert_query = """
             INSERT INTO silver.order_item 
             (order_item_id, order_key, product_key, unit_price, quantity, discount_amount,
@@ -1831,110 +2017,366 @@ class BronzeToSilverTransformer:
             ON CONFLICT (order_item_id) DO NOTHING
         """
         
-        transformed = []
-        skipped = 0
-        for row in bronze_items:
-            order_key = order_map.get(row[1])  # order_id -> order_key
-            product_key = product_map.get(row[2])  # product_id -> product_key
-            
-            if not order_key or not product_key:
-                skipped += 1
-                continue  # Skip if foreign keys are missing
-            
-            # Validate and normalize unit_price
-            unit_price = float(row[3]) if row[3] is not None else 0.0
-            if unit_price < 0:
-                unit_price = 0.0
-            unit_price = round(unit_price, 2)  # Ensure 2 decimal precision
-            
-            # Validate and normalize quantity
-            quantity = float(row[4]) if row[4] is not None else 0.0
-            if quantity < 0:
-                quantity = 0.0
-            quantity = round(quantity, 2)  # Ensure 2 decimal precision
-            
-            # Calculate discount_amount if promotion exists
-            discount_amount = 0.0
-            promotion_code = row[5]
-            list_price = float(row[6]) if row[6] is not None else unit_price
-            
-            if promotion_code and promotion_code.strip():
-                # Apply 10% discount for promotions (can be enhanced with actual promotion logic)
-                # Discount is calculated on the line total
-                line_total = unit_price * quantity
-                discount_amount = round(line_total * 0.10, 2)  # 10% discount
-            
-            # Ensure discount doesn't exceed line total
-            line_total = unit_price * quantity
-            if discount_amount > line_total:
-                discount_amount = round(line_total, 2)
-            
-            discount_amount = round(discount_amount, 2)  # Ensure 2 decimal precision
-            
-            transformed.append((
-                row[0],  # order_item_id
-                order_key,  # order_key
-                product_key,  # product_key
-                unit_price,  # unit_price (validated and rounded)
-                quantity,  # quantity (validated and rounded)
-                discount_amount,  # discount_amount (calculated)
-                True,  # is_valid
-                datetime.now()  # _etl_timestamp
-            ))
+        stats = {"selected": 0, "skipped": 0, "missing_orders": set(), "missing_products": set()}
         
+        def cleaned():
+            for row in bronze_items:
+                stats["selected"] += 1
+                if stats["selected"] == 1:
+                    logger.info(f"  Sample first record: order_item_id={row[0]}, order_id={row[1]}")
+                order_key = order_map.get(row[1])  # order_id -> order_key
+                product_key = product_map.get(row[2])  # product_id -> product_key
+                
+                if not order_key or not product_key:
+                    stats["skipped"] += 1
+                    # Sample of the ids that failed to resolve, for the warning below
+                    for missing, key, natural_id in (("missing_orders", order_key, row[1]),
+                                                     ("missing_products", product_key, row[2])):
+                        if not key and natural_id is not None and len(stats[missing]) < 10:
+                            stats[missing].add(natural_id)
+                    continue  # Skip if foreign keys are missing
+                
+                yield clean_order_item_row(row, order_key, product_key) + (
+                    True,  # is_valid
+                    datetime.now()  # _etl_timestamp
+                )
+        
+        try:
+            actual_inserted = self._write_stream('order_items', insert_query, cleaned(), bronze_items)
+            self._count_rows('order_items', skipped=stats["skipped"])
+            self.connection.commit()
+        except Exception as e:
+            self.connection.rollback()
+            logger.error(f"[ERROR] Failed to insert order items: {e}")
+            logger.error(f"[ERROR] Exception type: {type(e).__name__}")
+            import traceback
+            logger.error(f"[ERROR] Traceback: {traceback.format_exc()}")
+            raise
+        
+        selected, skipped = stats["selected"], stats["skipped"]
+        logger.info(f"  Selected {selected} records from bronze for processing")
+        if not selected:
+            pending = self.pending.remaining("order_items")
+            if pending:
+                logger.error(
+                    "  [ERROR] %s order_items pending by key but SELECT returned 0.",
+                    f"{pending:,}",
+                )
+            logger.info("No new order items to transform")
+            return 0
+        
+        if stats["missing_orders"]:
+            logger.warning(f"  [WARN] Missing order_ids in silver.orders (first 10): {sorted(stats['missing_orders'])}")
+        if stats["missing_products"]:
+            logger.warning(f"  [WARN] Missing product_ids in silver.product (first 10): {sorted(stats['missing_products'])}")
         if skipped > 0:
             logger.warning(f"Skipped {skipped} order items due to missing foreign keys")
         
-        if transformed:
+        prepared = selected - skipped
+        if prepared:
+            logger.info(f"  Records inserted: {actual_inserted:,} "
+                        f"(conflicted: {prepared - actual_inserted:,}, skipped: {skipped:,})")
+            
+            if actual_inserted == 0:
+                logger.error(f"  [ERROR] No rows inserted despite {prepared} records prepared!")
+                logger.error(f"  [ERROR] Check constraints, foreign keys, or if records already exist")
+            
+            logger.info(f"Successfully transformed {actual_inserted} order items")
+            return actual_inserted
+        
+        logger.error(f"[ERROR] No order items inserted - all {skipped} records were skipped")
+        logger.error(f"[ERROR] Check that silver.orders and silver.product are populated")
+        logger.error(f"[ERROR] Missing order_keys: {skipped} records")
+        return 0
+    
+    def _run_step(self, step_num: int, total_steps: int, name: str, transform_func,
+                  table_name: str, batch_size: int, full_reconcile: bool = False) -> int:
+        """Run one transform step in batches until drained; returns rows transformed."""
+        step_start = time.time()
+        rss_start = memory.current_rss_bytes()
+        peak_is_step = self.step_local_peak_rss and memory.reset_peak_rss()
+        bronze_table = BRONZE_TABLE_FOR_SILVER.get(table_name, table_name)
+        
+        # Watermark: capture bronze high-water before extracting so rows loaded during
+        # the step are picked up next run.
+        high_water = None
+        if self.watermarks:
+            since = self.watermarks.extract_since(name, force_full=full_reconcile)
+            self.extract_since[name] = since
             try:
-                logger.info(f"  Attempting to insert {len(transformed)} order items...")
-                execute_batch(self.cursor, insert_query, transformed, page_size=len(transformed))
-                rows_inserted = self.cursor.rowcount
-                self.connection.commit()
-                
-                # Verify insertion - check actual table count
-                self.cursor.execute("SELECT COUNT(*) FROM silver.order_item")
-                new_count = self.cursor.fetchone()[0]
-                actual_inserted = new_count - silver_count if silver_count is not None else new_count
-                
-                logger.info(f"  Cursor rowcount: {rows_inserted} (may be 0 due to ON CONFLICT)")
-                logger.info(f"  Actual records inserted: {actual_inserted:,}")
-                logger.info(f"  Total records in silver.order_item after insert: {new_count:,}")
-                
-                if actual_inserted == 0 and len(transformed) > 0:
-                    logger.error(f"  [ERROR] No rows inserted despite {len(transformed)} records prepared!")
-                    logger.error(f"  [ERROR] Check constraints, foreign keys, or if records already exist")
-                
-                logger.info(f"Successfully transformed {actual_inserted} order items")
-                return max(0, actual_inserted)
+                high_water = self.watermarks.bronze_high_water(bronze_table)
             except Exception as e:
                 self.connection.rollback()
-                logger.error(f"[ERROR] Failed to insert order items: {e}")
-                logger.error(f"[ERROR] Exception type: {type(e).__name__}")
-                import traceback
-                logger.error(f"[ERROR] Traceback: {traceback.format_exc()}")
-                raise
+                logger.warning("Could not read high-water for bronze.%s: %s", bronze_table, e)
+            logger.info(
+                "  Extraction for %s: %s", name,
+                f"since {since:%Y-%m-%d %H:%M:%S}" if since else "full reconcile",
+            )
+        # Exact count over the watermark delta; planner statistics on full scans. An
+        # estimate only sizes progress: the batch loop then runs until
+        # estimated_zero_batches batches in a row insert nothing. Table sizes are the
+        # planner's too; no step counts its bronze or silver table.
+        estimate = self.pending.estimate(self.cursor, name, self.extract_since.get(name))
+        exact = estimate.exact
+        bronze_rows, silver_before = estimate.bronze_rows, estimate.silver_rows
+        
+        logger.info(
+            "Step %s/%s: %s (bronze~%s, silver~%s, pending=%s%s)",
+            step_num,
+            total_steps,
+            name,
+            "?" if bronze_rows is None else f"{bronze_rows:,}",
+            "?" if silver_before is None else f"{silver_before:,}",
+            "" if exact else "~",
+            "?" if estimate.rows is None else f"{estimate.rows:,}",
+        )
+        
+        if estimate.rows == 0:
+            logger.info("  Skipping — no pending rows for silver.%s", table_name)
+            self._advance_watermark(name, bronze_table, high_water)
+            self._report_progress(name, 1, 1, total_steps)
+            return 0
+        
+        # Unknown or estimated: at least one batch, then run until batches come back empty
+        records_to_process = estimate.rows if exact else max(estimate.rows or 0, 1)
+
+        # Transform in batches
+        batch_num = 0
+        step_total = 0
+        consecutive_zero_batches = 0
+        max_consecutive_zeros = 3  # Stop after 3 consecutive zero batches
+        
+        is_empty_table = silver_before == 0
+        if self.backfiller is not None and name in self.backfill_steps:
+            # Key ranges in a process pool; the batch loop below only picks up leftovers
+            step_total = self.backfiller.run(name)
+            self._count_rows(name, inserted=step_total)
+            estimate = self.pending.estimate(self.cursor, name, self.extract_since.get(name),
+                                             refresh=True)
+            exact = estimate.exact
+            records_to_process = step_total + (estimate.rows or 0)
+            is_empty_table = False
+        if is_empty_table:
+            effective_batch_size = min(batch_size * 10, 50000)
         else:
-            if skipped > 0:
-                logger.error(f"[ERROR] No order items inserted - all {skipped} records were skipped")
-                logger.error(f"[ERROR] Check that silver.orders and silver.product are populated")
-                logger.error(f"[ERROR] Missing order_keys: {skipped} records")
+            effective_batch_size = batch_size
+        
+        if not exact:
+            # Estimated pending: no row target, the step runs until batches come back empty
+            max_consecutive_zeros = self.estimated_zero_batches
+        while not exact or step_total < records_to_process:
+            batch_start = time.time()
+            step_batch_size = effective_batch_size if is_empty_table else batch_size
+            if self.engine(name) == ENGINE_PUSHDOWN:
+                count = self._pushdown_batch(name, transform_func, step_batch_size)
             else:
-                logger.warning("[WARN] No order items to insert (all skipped or already exist)")
+                count = transform_func(step_batch_size)
+            batch_elapsed = time.time() - batch_start
+            
+            if count == 0:
+                consecutive_zero_batches += 1
+                # For empty tables, be more patient - allow more zero batches
+                max_zeros_for_empty = 5 if is_empty_table else max_consecutive_zeros
+                if consecutive_zero_batches >= max_zeros_for_empty:
+                    if is_empty_table and step_total == 0:
+                        logger.warning("silver.%s still empty; check FK lookups", table_name)
+                    break
+                # Continue to next batch in case of temporary issues
+            else:
+                consecutive_zero_batches = 0  # Reset counter on successful batch
+                batch_num += 1
+                step_total += count
+                
+                logger.info(
+                    "Batch %s: %s records in %.1fs (%.0f rows/s, %s/%s)",
+                    batch_num,
+                    count,
+                    batch_elapsed,
+                    count / batch_elapsed if batch_elapsed > 0 else 0.0,
+                    self.engine(name),
+                    self.write_mode(name),
+                )
+                # An estimate can undershoot; keep the step short of done until it drains
+                total = records_to_process if exact else max(records_to_process, step_total + 1)
+                self._report_progress(name, step_total, total, total_steps)
+            
+            if exact and records_to_process > 0 and step_total >= records_to_process:
+                break
         
-        return len(transformed)
+        # Exact inserted counts: no COUNT(*) over silver after the step
+        silver_after = (silver_before or 0) + step_total
+        with self._metrics_lock:
+            counts = dict(self.row_counts.get(name, {}))
+        self._report_progress(name, 1, 1, total_steps)
+        
+        step_elapsed = time.time() - step_start
+        self._advance_watermark(name, bronze_table, high_water)
+        
+        logger.info("")
+        logger.info(f"[OK] {name.replace('_', ' ').title()} Transformation Complete")
+        logger.info(f"  Records transformed: {step_total:,}")
+        if counts.get("skipped") or counts.get("conflicted"):
+            logger.info(f"  Skipped (missing FK): {counts.get('skipped', 0):,}  "
+                        f"Conflicted (already in silver): {counts.get('conflicted', 0):,}")
+        logger.info(f"  Silver records after: ~{silver_after:,}")
+        logger.info(f"  Time taken: {step_elapsed:.2f}s ({step_elapsed/60:.2f} min)")
+        rows_per_sec = step_total / step_elapsed if step_elapsed > 0 else 0.0
+        if step_total > 0:
+            logger.info(f"  Average speed: {rows_per_sec:.0f} records/sec ({self.engine(name)}/{self.write_mode(name)})")
+        peak_rss = memory.to_mb(memory.peak_rss_bytes())
+        if peak_rss is not None:
+            logger.info(f"  Peak RSS: {peak_rss:,.1f} MB ({'step' if peak_is_step else 'process'})"
+                        f"{' streamed' if name in self.stream_steps else ''}")
+        self._record_step_metrics(name, {
+            "status": "completed",
+            "rows": step_total,
+            "skipped": counts.get("skipped", 0),
+            "conflicted": counts.get("conflicted", 0),
+            "batches": batch_num,
+            "seconds": round(step_elapsed, 3),
+            "rows_per_sec": round(rows_per_sec, 1),
+            "write_mode": self.write_mode(name),
+            "engine": self.engine(name),
+            "full_scan": self.extract_since.get(name) is None,
+            "streamed": name in self.stream_steps,
+            "rss_start_mb": memory.to_mb(rss_start),
+            "rss_end_mb": memory.to_mb(memory.current_rss_bytes()),
+            "peak_rss_mb": peak_rss,
+            "peak_rss_scope": "step" if peak_is_step else "process",
+        })
+        
+        # Warn if table is still empty but should have data
+        if bronze_rows and silver_after == 0 and step_total == 0:
+            logger.error("")
+            logger.error(f"  [ERROR] Table silver.{table_name} is still empty after transformation!")
+            logger.error(f"  [ERROR] Bronze has ~{bronze_rows:,} records but Silver has 0")
+            logger.error(f"  [ERROR] This indicates all records were skipped - check foreign key matching")
+            logger.error(f"  [ERROR] Check prerequisite tables and foreign key values")
+            logger.error("")
+        
+        return step_total
+
+    
+    def _worker_transformer(self, connection) -> "BronzeToSilverTransformer":
+        """Transformer on its own connection that shares this run's settings and caches."""
+        worker = BronzeToSilverTransformer(
+            connection, tracker=self.tracker, run_id=self.run_id,
+            watermarks=self.watermarks.for_connection(connection) if self.watermarks else None,
+        )
+        worker.write_modes = self.write_modes
+        worker.engines = self.engines
+        worker.key_cache = self.key_cache
+        worker.extract_since = self.extract_since
+        worker.backfiller = self.backfiller
+        worker.backfill_steps = self.backfill_steps
+        worker.stream_steps = self.stream_steps
+        worker.itersize = self.itersize
+        worker.estimated_zero_batches = self.estimated_zero_batches
+        # Steps overlap on worker threads, so no step owns the process peak
+        worker.step_local_peak_rss = False
+        worker.row_counts = self.row_counts
+        worker.step_fractions = self.step_fractions
+        worker.pending = self.pending
+        worker._metrics_lock = self._metrics_lock
+        return worker
     
-    def transform_all(self, batch_size: int = 1000):
-        """Run all Bronze -> Silver transforms in dependency order."""
+    def _run_steps_parallel(self, transformation_order, batch_size: int, full_reconcile: bool,
+                            max_workers: int, connection_factory: Callable[[], Any]) -> Dict[str, int]:
+        """Run steps on a DagExecutor, one pooled connection per worker thread."""
+        local = threading.local()
+        opened = []
+        opened_lock = threading.Lock()
+        
+        def worker() -> "BronzeToSilverTransformer":
+            transformer = getattr(local, "transformer", None)
+            if transformer is None:
+                connection = connection_factory()
+                with opened_lock:
+                    opened.append(connection)
+                transformer = local.transformer = self._worker_transformer(connection)
+            return transformer
+        
+        total_steps = len(transformation_order)
+        
+        def node(step_num, name, transform_func, table_name):
+            def run():
+                w = worker()
+                with profiling.span(name, "step"):
+                    try:
+                        return w._run_step(step_num, total_steps, name,
+                                           getattr(w, transform_func.__name__),
+                                           table_name, batch_size, full_reconcile)
+                    except Exception as e:
+                        w._record_step_failure(name, e)
+                        raise
+            return run
+        
+        nodes = [
+            (name, node(step_num, name, transform_func, table_name), STEP_DEPENDENCIES.get(name, ()))
+            for step_num, (name, transform_func, table_name) in enumerate(transformation_order, 1)
+        ]
+        logger.info("Running %s steps on up to %s workers", len(nodes), max_workers)
+        try:
+            result = DagExecutor(max_workers).run(nodes)
+        except Exception as e:
+            # Which steps ran, failed or were skipped, before the run itself is marked failed
+            if getattr(e, "dag_result", None) is not None:
+                self._record_step_metrics("dag", e.dag_result.to_metrics())
+            raise
+        finally:
+            for connection in opened:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+        
+        logger.info("")
+        logger.info("Step timings (parallel, %.2fs wall):", result.elapsed)
+        for name, t in sorted(result.timings.items(), key=lambda kv: kv[1]["start"]):
+            logger.info("  %-20s start +%7.2fs  %7.2fs  [%s]", name, t["start"], t["seconds"], t["worker"])
+        logger.info("Critical path: %s", " -> ".join(result.critical_path))
+        self._record_step_metrics("dag", result.to_metrics())
+        return {name: result.results.get(name, 0) for name, _, _ in transformation_order}
+    
+    def transform_all(self, batch_size: int = 1000,
+                      bulk_load: Optional[Union[str, Iterable[str]]] = None,
+                      pushdown: Optional[Union[str, Iterable[str]]] = None,
+                      full_reconcile: bool = False,
+                      max_workers: int = 1,
+                      connection_factory: Optional[Callable[[], Any]] = None,
+                      backfill: Optional[Union[str, Iterable[str]]] = None,
+                      stream: Optional[Union[str, Iterable[str]]] = None,
+                      itersize: int = DEFAULT_ITERSIZE,
+                      estimated_zero_batches: int = ESTIMATED_ZERO_BATCHES):
+        """Run all Bronze -> Silver transforms in dependency order.
+
+        Args:
+            batch_size: Rows selected from bronze per batch.
+            bulk_load: Step names (e.g. ["orders", "order_items"]) that write through the
+                COPY staging path instead of execute_batch; "all" selects every step.
+            pushdown: Step names cleansed set-based inside Postgres; "all" selects every
+                step that has a pushdown rule. Other steps keep the Python engine.
+            full_reconcile: Ignore watermarks and scan all of bronze for every step (also
+                happens per step once its reconcile interval has elapsed).
+            max_workers: Steps run concurrently (as STEP_DEPENDENCIES allow) when > 1.
+            connection_factory: Returns a new psycopg2 connection; required for
+                max_workers > 1, one connection is opened per worker thread.
+            backfill: Steps loaded by key range through ``self.backfiller`` (same format as
+                bulk_load; only steps with a pushdown rule).
+            stream: Steps that read bronze through a server-side cursor and write as they go,
+                keeping memory flat for any batch_size (same format as bulk_load; only
+                STREAMING_STEPS).
+            itersize: Rows per server-side fetch and per write for streamed steps.
+            estimated_zero_batches: Consecutive batches inserting nothing after which a step
+                whose pending count is a planner estimate (full scans) counts as drained.
+                Steps with an exact count stop at that count instead.
+        """
+        self.estimated_zero_batches = max(1, estimated_zero_batches)
         logger.info("Bronze -> Silver (batch_size=%s)", batch_size)
         try:
-            self.cursor.execute("SELECT COUNT(*) FROM silver.person")
-            pc = self.cursor.fetchone()[0]
-            self.cursor.execute("SELECT COUNT(*) FROM silver.country")
-            cc = self.cursor.fetchone()[0]
-            if pc == 0:
+            if self.table_is_empty('silver', 'person'):
                 logger.warning("silver.person is empty; person step will run first")
-            if cc == 0:
+            if self.table_is_empty('silver', 'country'):
                 logger.warning("silver.country is empty; country step will run first")
         except Exception as e:
             logger.warning("Could not check prerequisites: %s", e)
@@ -1960,125 +2402,58 @@ class BronzeToSilverTransformer:
         
         total_steps = len(transformation_order)
         
-        for step_num, (name, transform_func, table_name) in enumerate(transformation_order, 1):
-            step_start = time.time()
-            bronze_table = BRONZE_TABLE_FOR_SILVER.get(table_name, table_name)
+        step_names = [name for name, _, _ in transformation_order]
+        if bulk_load:
+            for step in _select_steps(bulk_load, step_names, "bulk_load"):
+                self.write_modes[step] = WRITE_MODE_COPY
+            logger.info("COPY bulk-load steps: %s", ", ".join(sorted(self.write_modes)) or "none")
+        if pushdown:
+            requested = _select_steps(pushdown, step_names, "pushdown")
+            for step in requested:
+                if has_pushdown_rule(step):
+                    self.engines[step] = ENGINE_PUSHDOWN
+                elif not isinstance(pushdown, str) or pushdown != "all":
+                    logger.warning("No pushdown rule for %s; using python engine", step)
+            logger.info("Pushdown steps: %s", ", ".join(sorted(self.engines)) or "none")
+        if backfill:
+            for step in _select_steps(backfill, step_names, "backfill"):
+                if self.backfiller is None:
+                    logger.warning("No backfiller configured; %s runs in batches", step)
+                elif has_pushdown_rule(step):
+                    self.backfill_steps.add(step)
+                elif not isinstance(backfill, str) or backfill != "all":
+                    logger.warning("No pushdown rule for %s; cannot backfill by key range", step)
+            logger.info("Backfill steps: %s", ", ".join(sorted(self.backfill_steps)) or "none")
+        if stream:
+            self.itersize = max(1, itersize)
+            for step in _select_steps(stream, step_names, "stream"):
+                if step in STREAMING_STEPS:
+                    self.stream_steps.add(step)
+                elif not isinstance(stream, str) or stream != "all":
+                    logger.warning("%s cannot stream; it fetches each batch whole", step)
+            logger.info("Streamed steps: %s (itersize=%s)",
+                        ", ".join(sorted(self.stream_steps)) or "none", self.itersize)
+        if self.watermarks:
             try:
-                self.cursor.execute(f"SELECT COUNT(*) FROM bronze.{bronze_table};")
-                bronze_count = self.cursor.fetchone()[0]
-                self.cursor.execute(f"SELECT COUNT(*) FROM silver.{table_name};")
-                silver_before = self.cursor.fetchone()[0]
+                self.watermarks.load()
             except Exception as e:
-                logger.warning("Counts failed for %s / %s: %s", bronze_table, table_name, e)
-                bronze_count = 0
-                silver_before = 0
-            pending_n = fetch_pending_count(self.cursor, name)
-            if pending_n is not None:
-                records_to_process = pending_n
-            else:
-                records_to_process = max(0, bronze_count - silver_before)
-                if bronze_count > 0 and silver_before == 0:
-                    records_to_process = bronze_count
-            
-            logger.info(
-                "Step %s/%s: %s (bronze=%s, silver=%s, pending=%s)",
-                step_num,
-                total_steps,
-                name,
-                f"{bronze_count:,}",
-                f"{silver_before:,}",
-                f"{records_to_process:,}",
+                self.connection.rollback()
+                logger.warning("Could not read watermarks, running full scans: %s", e)
+                self.watermarks = None
+        
+        if max_workers > 1 and connection_factory is not None:
+            totals = self._run_steps_parallel(
+                transformation_order, batch_size, full_reconcile, max_workers, connection_factory
             )
-            
-            if records_to_process <= 0:
-                totals[name] = 0
-                logger.info("  Skipping — no pending rows for silver.%s", table_name)
-                continue
-            
-            # Job tracking: only "Complete ETL Pipeline" is tracked at run_etl.py level.
-            # Do not create per-table jobs in monitoring.etl_jobs (only two jobs allowed).
-            job_id = None
-
-            # Transform in batches
-            batch_num = 0
-            step_total = 0
-            consecutive_zero_batches = 0
-            max_consecutive_zeros = 3  # Stop after 3 consecutive zero batches
-            
-            is_empty_table = (silver_before == 0 and records_to_process > 0)
-            if is_empty_table:
-                effective_batch_size = min(batch_size * 10, 50000)
-            else:
-                effective_batch_size = batch_size
-            
-            while True:
-                batch_start = time.time()
-                count = transform_func(effective_batch_size if is_empty_table else batch_size)
-                batch_elapsed = time.time() - batch_start
-                
-                if count == 0:
-                    consecutive_zero_batches += 1
-                    # For empty tables, be more patient - allow more zero batches
-                    max_zeros_for_empty = 5 if is_empty_table else max_consecutive_zeros
-                    if consecutive_zero_batches >= max_zeros_for_empty:
-                        if is_empty_table:
-                            try:
-                                self.cursor.execute(f"SELECT COUNT(*) FROM silver.{table_name};")
-                                if self.cursor.fetchone()[0] == 0:
-                                    logger.warning("silver.%s still empty; check FK lookups", table_name)
-                            except Exception:
-                                pass
-                        break
-                    # Continue to next batch in case of temporary issues
-                else:
-                    consecutive_zero_batches = 0  # Reset counter on successful batch
-                    batch_num += 1
-                    step_total += count
-                    
-                    logger.info("Batch %s: %s records in %.1fs", batch_num, count, batch_elapsed)
-                
-                if records_to_process > 0 and step_total >= records_to_process:
-                    break
-                
-                # For empty tables, also check if we've processed a reasonable amount
-                if is_empty_table and step_total >= bronze_count * 0.1:  # Process at least 10% before giving up
-                    # Check actual table count
+        else:
+            for step_num, (name, transform_func, table_name) in enumerate(transformation_order, 1):
+                with profiling.span(name, "step"):
                     try:
-                        self.cursor.execute(f"SELECT COUNT(*) FROM silver.{table_name};")
-                        actual_count = self.cursor.fetchone()[0]
-                        if actual_count == 0 and step_total > 1000:
-                            logger.error(f"  [ERROR] Processed {step_total:,} records but table is still empty!")
-                            logger.error(f"  [ERROR] All records are being filtered out - check foreign key constraints")
-                            break
-                    except:
-                        pass
-            
-            # Get after count
-            try:
-                self.cursor.execute(f"SELECT COUNT(*) FROM silver.{table_name};")
-                silver_after = self.cursor.fetchone()[0]
-            except:
-                silver_after = silver_before
-            
-            step_elapsed = time.time() - step_start
-            totals[name] = step_total
-            
-            logger.info("")
-            logger.info(f"[OK] {name.replace('_', ' ').title()} Transformation Complete")
-            logger.info(f"  Records transformed: {step_total:,}")
-            logger.info(f"  Silver records after: {silver_after:,}")
-            logger.info(f"  Time taken: {step_elapsed:.2f}s ({step_elapsed/60:.2f} min)")
-            if step_total > 0:
-                logger.info(f"  Average speed: {step_total/step_elapsed:.0f} records/sec")
-            
-            # Warn if table is still empty but should have data
-            if bronze_count > 0 and silver_after == 0 and step_total == 0:
-                logger.error("")
-                logger.error(f"  [ERROR] Table silver.{table_name} is still empty after transformation!")
-                logger.error(f"  [ERROR] Bronze has {bronze_count:,} records but Silver has 0")
-                logger.error(f"  [ERROR] This indicates all records were skipped - check foreign key matching")
-                logger.error(f"  [ERROR] Check prerequisite tables and foreign key values")
-                logger.error("")
+                        totals[name] = self._run_step(step_num, total_steps, name, transform_func,
+                                                      table_name, batch_size, full_reconcile)
+                    except Exception as e:
+                        self._record_step_failure(name, e)
+                        raise
         
         logger.info("")
         logger.info("=" * 80)
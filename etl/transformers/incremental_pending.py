@@ -3,12 +3,26 @@ Accurate \"pending row\" counts for Bronze→Silver batching.
 
 Bronze tables often have no primary key; row counts can exceed distinct business keys.
 transform_all uses these queries so records_to_process and batch exit logic stay correct.
+Each query takes a ``since`` parameter: NULL scans all of bronze, a timestamp only rows
+loaded at or after it (Postgres folds the unused branch away at plan time).
+
+PendingEstimator avoids the unbounded count: with a watermark the count above only covers
+the delta since the watermark and stays exact; for full scans it estimates from planner
+statistics (pg_class.reltuples, pg_stats.n_distinct) instead of running DISTINCT ON over
+all of bronze. Estimates are cached per run and decremented as batches commit. The same
+catalog query supplies the bronze / silver row counts transform_all logs, so no step counts
+its tables.
+An estimated step has no row target: transform_all runs it until ``estimated_zero_batches``
+batches in a row insert nothing.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +32,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (b.country_id) b.country_id
           FROM bronze.country b
+          WHERE (%(since)s::timestamp IS NULL OR b._load_timestamp >= %(since)s)
           ORDER BY b.country_id, b._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.country s WHERE s.country_id = d.country_id)
@@ -26,6 +41,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (l.location_id) l.location_id
           FROM bronze.location l
+          WHERE (%(since)s::timestamp IS NULL OR l._load_timestamp >= %(since)s)
           ORDER BY l.location_id, l._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.location s WHERE s.location_id = d.location_id)
@@ -34,6 +50,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (w.warehouse_id) w.warehouse_id
           FROM bronze.warehouse w
+          WHERE (%(since)s::timestamp IS NULL OR w._load_timestamp >= %(since)s)
           ORDER BY w.warehouse_id, w._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.warehouse s WHERE s.warehouse_id = d.warehouse_id)
@@ -42,6 +59,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (p.product_id) p.product_id
           FROM bronze.product p
+          WHERE (%(since)s::timestamp IS NULL OR p._load_timestamp >= %(since)s)
           ORDER BY p.product_id, p._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.product s WHERE s.product_id = d.product_id)
@@ -50,6 +68,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (i.inventory_id) i.inventory_id
           FROM bronze.inventory i
+          WHERE (%(since)s::timestamp IS NULL OR i._load_timestamp >= %(since)s)
           ORDER BY i.inventory_id, i._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.inventory s WHERE s.inventory_id = d.inventory_id)
@@ -58,6 +77,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (b.person_id) b.person_id
           FROM bronze.person b
+          WHERE (%(since)s::timestamp IS NULL OR b._load_timestamp >= %(since)s)
           ORDER BY b.person_id, b._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.person s WHERE s.person_id = d.person_id)
@@ -67,6 +87,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
           SELECT DISTINCT ON (r.person_id) r.person_id, p.person_key
           FROM bronze.restricted_info r
           INNER JOIN silver.person p ON r.person_id = p.person_id
+          WHERE (%(since)s::timestamp IS NULL OR r._load_timestamp >= %(since)s)
           ORDER BY r.person_id, r._load_timestamp DESC NULLS LAST
         ) x
         WHERE NOT EXISTS (SELECT 1 FROM silver.restricted_info s WHERE s.person_key = x.person_key)
@@ -76,6 +97,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
           SELECT DISTINCT ON (pl.persons_person_id, pl.locations_location_id)
             pl.persons_person_id, pl.locations_location_id
           FROM bronze.person_location pl
+          WHERE (%(since)s::timestamp IS NULL OR pl._load_timestamp >= %(since)s)
           ORDER BY pl.persons_person_id, pl.locations_location_id, pl._load_timestamp DESC NULLS LAST
         ) bd
         INNER JOIN silver.person p ON bd.persons_person_id = p.person_id
@@ -89,6 +111,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (pn.phone_number_id) pn.phone_number_id
           FROM bronze.phone_number pn
+          WHERE (%(since)s::timestamp IS NULL OR pn._load_timestamp >= %(since)s)
           ORDER BY pn.phone_number_id, pn._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.phone_number s WHERE s.phone_id = d.phone_number_id)
@@ -97,6 +120,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (b.company_id) b.company_id
           FROM bronze.customer_company b
+          WHERE (%(since)s::timestamp IS NULL OR b._load_timestamp >= %(since)s)
           ORDER BY b.company_id, b._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.customer_company s WHERE s.company_id = d.company_id)
@@ -105,6 +129,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (ce.customer_employee_id) ce.customer_employee_id
           FROM bronze.customer_employee ce
+          WHERE (%(since)s::timestamp IS NULL OR ce._load_timestamp >= %(since)s)
           ORDER BY ce.customer_employee_id, ce._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (
@@ -115,6 +140,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
         SELECT COUNT(*) FROM (
           SELECT DISTINCT ON (ej.hr_job_id) ej.hr_job_id
           FROM bronze.employment_jobs ej
+          WHERE (%(since)s::timestamp IS NULL OR ej._load_timestamp >= %(since)s)
           ORDER BY ej.hr_job_id, ej._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.employment_jobs s WHERE s.hr_job_id = d.hr_job_id)
@@ -125,6 +151,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
           FROM bronze.employment e
           WHERE e.person_id IS NOT NULL
             AND e.person_id IN (SELECT person_id FROM silver.person)
+            AND (%(since)s::timestamp IS NULL OR e._load_timestamp >= %(since)s)
           ORDER BY e.employee_id, e._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.employee s WHERE s.employee_id = d.employee_id)
@@ -135,6 +162,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
           FROM bronze.customer c
           WHERE c.person_id IS NOT NULL
             AND c.person_id IN (SELECT person_id FROM silver.person)
+            AND (%(since)s::timestamp IS NULL OR c._load_timestamp >= %(since)s)
           ORDER BY c.customer_id, c._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.customer s WHERE s.customer_id = d.customer_id)
@@ -145,6 +173,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
           FROM bronze.orders o
           WHERE o.customer_id IS NOT NULL
             AND o.customer_id IN (SELECT customer_id FROM silver.customer)
+            AND (%(since)s::timestamp IS NULL OR o._load_timestamp >= %(since)s)
           ORDER BY o.order_id, o._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (SELECT 1 FROM silver.orders s WHERE s.order_id = d.order_id)
@@ -157,6 +186,7 @@ PENDING_COUNT_SQL: dict[str, str] = {
             AND oi.product_id IS NOT NULL
             AND oi.order_id IN (SELECT order_id FROM silver.orders)
             AND oi.product_id IN (SELECT product_id FROM silver.product)
+            AND (%(since)s::timestamp IS NULL OR oi._load_timestamp >= %(since)s)
           ORDER BY oi.order_item_id, oi._load_timestamp DESC NULLS LAST
         ) d
         WHERE NOT EXISTS (
@@ -166,13 +196,17 @@ PENDING_COUNT_SQL: dict[str, str] = {
 }
 
 
-def fetch_pending_count(cursor, step_name: str) -> Optional[int]:
-    """Return pending natural-key rows for a step, or None if query fails."""
+def fetch_pending_count(cursor, step_name: str, since: Optional[datetime] = None) -> Optional[int]:
+    """Return pending natural-key rows for a step, or None if query fails.
+
+    ``since`` limits the scan to bronze rows with ``_load_timestamp >= since`` (see watermarks.py);
+    None counts over the full bronze history.
+    """
     sql = PENDING_COUNT_SQL.get(step_name)
     if not sql:
         return None
     try:
-        cursor.execute(sql)
+        cursor.execute(sql, {"since": since})
         return int(cursor.fetchone()[0])
     except Exception as e:
         logger.warning("Pending count failed for %s: %s", step_name, e)
@@ -181,3 +215,150 @@ def fetch_pending_count(cursor, step_name: str) -> Optional[int]:
         except Exception:
             pass
         return None
+
+
+# Step -> (bronze table, natural key column or None for composite keys, silver table)
+PENDING_ESTIMATE_SOURCES: dict[str, tuple] = {
+    "countries": ("country", "country_id", "country"),
+    "locations": ("location", "location_id", "location"),
+    "warehouses": ("warehouse", "warehouse_id", "warehouse"),
+    "products": ("product", "product_id", "product"),
+    "inventory": ("inventory", "inventory_id", "inventory"),
+    "persons": ("person", "person_id", "person"),
+    "restricted_info": ("restricted_info", "person_id", "restricted_info"),
+    "person_locations": ("person_location", None, "person_location"),
+    "phone_numbers": ("phone_number", "phone_number_id", "phone_number"),
+    "customer_companies": ("customer_company", "company_id", "customer_company"),
+    "customer_employees": ("customer_employee", "customer_employee_id", "customer_employee"),
+    "employment_jobs": ("employment_jobs", "hr_job_id", "employment_jobs"),
+    "employees": ("employment", "employee_id", "employee"),
+    "customers": ("customer", "customer_id", "customer"),
+    "orders": ("orders", "order_id", "orders"),
+    "order_items": ("order_item", "order_item_id", "order_item"),
+}
+
+# Distinct bronze keys (n_distinct < 0 is a fraction of reltuples) minus silver rows.
+# reltuples is -1 (PG14+) or 0 for never-analyzed tables; those come back as NULL.
+_ESTIMATE_SQL = """
+    SELECT
+        (SELECT NULLIF(GREATEST(c.reltuples, 0), 0) FROM pg_class c
+          WHERE c.oid = to_regclass('bronze.' || %(bronze)s)),
+        (SELECT st.n_distinct FROM pg_stats st
+          WHERE st.schemaname = 'bronze' AND st.tablename = %(bronze)s AND st.attname = %(key)s),
+        (SELECT GREATEST(c.reltuples, 0) FROM pg_class c
+          WHERE c.oid = to_regclass('silver.' || %(silver)s))
+"""
+
+
+def _planner_stats(cursor, step_name: str) -> Optional[Tuple[Optional[float], Optional[float], Optional[float]]]:
+    """(bronze reltuples, bronze key n_distinct, silver reltuples) of a step, None on failure."""
+    source = PENDING_ESTIMATE_SOURCES.get(step_name)
+    if not source:
+        return None
+    bronze, key, silver = source
+    try:
+        cursor.execute(_ESTIMATE_SQL, {"bronze": bronze, "key": key, "silver": silver})
+        return cursor.fetchone()
+    except Exception as e:
+        logger.warning("Pending estimate failed for %s: %s", step_name, e)
+        try:
+            cursor.connection.rollback()
+        except Exception:
+            pass
+        return None
+
+
+def _pending_from_stats(stats) -> Optional[int]:
+    if stats is None:
+        return None
+    bronze_rows, n_distinct, silver_rows = stats
+    if bronze_rows is None:
+        return None
+    if n_distinct is None:
+        distinct = bronze_rows
+    elif n_distinct < 0:
+        distinct = -n_distinct * bronze_rows
+    else:
+        distinct = n_distinct
+    return max(0, int(distinct - (silver_rows or 0)))
+
+
+def estimate_pending_count(cursor, step_name: str) -> Optional[int]:
+    """Planner-statistics estimate of pending keys for a step; None when not analyzed yet."""
+    return _pending_from_stats(_planner_stats(cursor, step_name))
+
+
+@dataclass
+class PendingEstimate:
+    """Pending keys for one step; ``exact`` is False for statistics-based estimates."""
+
+    rows: Optional[int]
+    exact: bool
+    since: Optional[datetime] = None
+    processed: int = 0
+    # Planner row counts (pg_class.reltuples) of the bronze and silver tables, for logging
+    bronze_rows: Optional[int] = None
+    silver_rows: Optional[int] = None
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.rows is None:
+            return None
+        return max(0, self.rows - self.processed)
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "rows": self.rows,
+            "remaining": self.remaining,
+            "exact": self.exact,
+            "since": self.since.isoformat() if self.since else None,
+        }
+
+
+class PendingEstimator:
+    """Per-run cache of pending counts: exact over watermark deltas, estimated otherwise."""
+
+    def __init__(self):
+        self._estimates: Dict[str, PendingEstimate] = {}
+        self._lock = threading.Lock()
+
+    def estimate(self, cursor, step_name: str, since: Optional[datetime] = None,
+                 refresh: bool = False) -> PendingEstimate:
+        """Return the cached estimate for a step, computing it on first use."""
+        with self._lock:
+            cached = self._estimates.get(step_name)
+        if cached is not None and not refresh:
+            return cached
+        stats = _planner_stats(cursor, step_name)
+        if since is not None:
+            rows = fetch_pending_count(cursor, step_name, since)
+            result = PendingEstimate(rows, rows is not None, since)
+        else:
+            result = PendingEstimate(_pending_from_stats(stats), False)
+        if stats is not None:
+            bronze_rows, _, silver_rows = stats
+            result.bronze_rows = int(bronze_rows or 0)
+            result.silver_rows = int(silver_rows or 0)
+        with self._lock:
+            self._estimates[step_name] = result
+        return result
+
+    def note_committed(self, step_name: str, rows: int) -> None:
+        """Count rows a committed batch moved to silver against the step's estimate."""
+        with self._lock:
+            cached = self._estimates.get(step_name)
+            if cached is not None:
+                cached.processed += rows
+
+    def remaining(self, step_name: str) -> Optional[int]:
+        """Exact remaining pending keys, or None when unknown or only estimated."""
+        with self._lock:
+            cached = self._estimates.get(step_name)
+            if cached is None or not cached.exact:
+                return None
+            return cached.remaining
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """JSON-friendly view of all cached estimates (stored on the tracked run)."""
+        with self._lock:
+            return {step: est.as_dict() for step, est in self._estimates.items()}
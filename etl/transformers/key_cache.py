@@ -0,0 +1,159 @@
+"""
+Compact natural-id -> surrogate-key lookups for Bronze→Silver transforms.
+
+Transforms resolve foreign keys (order_id -> order_key, product_id -> product_key, ...) for
+every batch. Instead of re-reading ``SELECT id, key FROM silver.<table>`` into a dict each
+time, KeyLookupCache keeps one sorted pair of ``array('q')`` per table (16 bytes per entry),
+loads it once per run and afterwards only pulls rows whose surrogate key is above the
+table's high-water mark.
+
+The high-water mark relies on silver surrogate keys being BIGSERIAL and on the transformer
+being the only writer of its silver tables during a run. If rows can be removed or keys
+reused (e.g. TRUNCATE ... RESTART IDENTITY), call ``invalidate()`` first.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from etl.utils import profiling
+
+logger = logging.getLogger(__name__)
+
+FETCH_SIZE = 50000
+
+
+class KeyMap:
+    """Sorted id -> key map for one silver table, with a dict-like ``get``.
+
+    Parallel steps read a shared map while one of them refreshes it. ``refresh`` builds new
+    arrays and publishes them with a single assignment of the ``(ids, keys)`` pair, and
+    readers take that pair once per lookup, so they always see matching ids and keys.
+    """
+
+    def __init__(self, table: str, id_column: str, key_column: str):
+        self.table = table
+        self.id_column = id_column
+        self.key_column = key_column
+        self._pairs: Tuple[array, array] = (array("q"), array("q"))
+        self.high_water = 0  # largest surrogate key loaded so far
+
+    @property
+    def ids(self) -> array:
+        return self._pairs[0]
+
+    @property
+    def keys(self) -> array:
+        return self._pairs[1]
+
+    def __len__(self) -> int:
+        return len(self._pairs[0])
+
+    def __contains__(self, natural_id) -> bool:
+        return self.get(natural_id) is not None
+
+    @staticmethod
+    def _lookup(pairs: Tuple[array, array], natural_id):
+        if natural_id is None:
+            return None
+        ids, keys = pairs
+        i = bisect_left(ids, natural_id)
+        if i < len(ids) and ids[i] == natural_id:
+            return keys[i]
+        return None
+
+    def get(self, natural_id, default=None):
+        """Return the surrogate key for a natural id, or ``default``."""
+        key = self._lookup(self._pairs, natural_id)
+        return default if key is None else key
+
+    def missing(self, natural_ids: Iterable) -> Set:
+        """Return the ids (None excluded) that have no surrogate key yet."""
+        pairs = self._pairs
+        return {i for i in natural_ids if i is not None and self._lookup(pairs, i) is None}
+
+    def refresh(self, cursor) -> int:
+        """Pull rows above the high-water mark and merge them in; returns rows added."""
+        cursor.execute(
+            f"SELECT {self.id_column}, {self.key_column} FROM silver.{self.table} "
+            f"WHERE {self.key_column} > %s AND {self.id_column} IS NOT NULL "
+            f"ORDER BY {self.id_column}",
+            (self.high_water,),
+        )
+        new_ids = array("q")
+        new_keys = array("q")
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for natural_id, key in rows:
+                new_ids.append(natural_id)
+                new_keys.append(key)
+        if not new_ids:
+            return 0
+
+        ids, keys = self._pairs
+        if not ids or new_ids[0] > ids[-1]:
+            # Common case: new silver rows carry larger natural ids
+            self._pairs = (ids + new_ids, keys + new_keys)
+        else:
+            self._pairs = self._merge(ids, keys, new_ids, new_keys)
+        self.high_water = max(self.high_water, max(new_keys))
+        return len(new_ids)
+
+    @staticmethod
+    def _merge(old_ids: array, old_keys: array,
+               new_ids: array, new_keys: array) -> Tuple[array, array]:
+        """Merge sorted new pairs into copies of the arrays; a re-inserted id takes its newer key."""
+        ids, keys = array("q"), array("q")
+        i = j = 0
+        while i < len(old_ids) and j < len(new_ids):
+            if old_ids[i] < new_ids[j]:
+                ids.append(old_ids[i])
+                keys.append(old_keys[i])
+                i += 1
+            else:
+                if old_ids[i] == new_ids[j]:
+                    i += 1
+                ids.append(new_ids[j])
+                keys.append(new_keys[j])
+                j += 1
+        ids.extend(old_ids[i:])
+        keys.extend(old_keys[i:])
+        ids.extend(new_ids[j:])
+        keys.extend(new_keys[j:])
+        return ids, keys
+
+
+class KeyLookupCache:
+    """Per-run cache of KeyMaps, refreshed incrementally on every lookup."""
+
+    def __init__(self):
+        self._maps: Dict[Tuple[str, str, str], KeyMap] = {}
+        self._lock = threading.Lock()
+
+    def get_map(self, cursor, table: str, id_column: str, key_column: str) -> KeyMap:
+        """Return the up-to-date id -> key map for ``silver.<table>``."""
+        with self._lock:
+            ident = (table, id_column, key_column)
+            key_map = self._maps.get(ident)
+            if key_map is None:
+                key_map = self._maps[ident] = KeyMap(table, id_column, key_column)
+            with profiling.span(f"key_map silver.{table}", "keymap"):
+                added = key_map.refresh(cursor)
+            if added:
+                logger.debug("Key cache silver.%s: +%s (total %s)", table, added, len(key_map))
+            return key_map
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Drop cached maps (all, or those of one silver table)."""
+        with self._lock:
+            if table is None:
+                self._maps.clear()
+            else:
+                for ident in [k for k in self._maps if k[0] == table]:
+                    del self._maps[ident]
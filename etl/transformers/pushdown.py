@@ -0,0 +1,264 @@
+"""
+Set-based ("pushdown") Bronze→Silver cleansing.
+
+Each entity's cleansing rules are declared once as SQL column expressions and compiled into a
+single ``INSERT INTO silver.x SELECT ... FROM bronze.x`` that runs entirely inside Postgres, so
+batches never travel to Python and back. The statement keeps the incremental contract of the
+Python path (DISTINCT ON latest bronze row, anti-join on the natural key, ON CONFLICT DO NOTHING)
+and takes the batch size and an optional watermark (``since``) as parameters.
+
+Expressions mirror the row cleaners in bronze_to_silver.py (clean_*_row); the parity test in
+tests/integration/test_pushdown_parity.py runs both on the same bronze fixture. Steps without a
+rule here always use the Python path.
+
+Inside expressions ``b`` is the deduplicated bronze row; joins may add further aliases.
+``{bronze}`` / ``{silver}`` in joins and filters are replaced by the compile-time schema names.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Python's str.strip() removes all ASCII whitespace; BTRIM() defaults to spaces only.
+_WS = r"E' \t\n\r\x0b\x0c'"
+
+
+def literal(value: str) -> str:
+    """Quote a Python string as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def strip_or(expr: str, default: str) -> str:
+    """SQL for ``(value or '').strip() or default``."""
+    return f"COALESCE(NULLIF(BTRIM({expr}, {_WS}), ''), {default})"
+
+
+def text_or(expr: str, default: str) -> str:
+    """SQL for ``value or default`` on a text column (empty string counts as missing)."""
+    return f"COALESCE(NULLIF({expr}, ''), {default})"
+
+
+def non_negative(expr: str) -> str:
+    """SQL for a numeric value defaulted to 0, clamped at 0 and rounded to 2 decimals."""
+    return f"ROUND(GREATEST(COALESCE({expr}, 0), 0), 2)"
+
+
+VALID_TO_SQL = "DATE '9999-12-31'"
+
+# Audit columns shared by the SCD-style silver tables
+SCD_AUDIT_COLUMNS = (
+    ("is_valid", "TRUE"),
+    ("valid_from", "LOCALTIMESTAMP"),
+    ("valid_to", VALID_TO_SQL),
+    ("_etl_timestamp", "LOCALTIMESTAMP"),
+)
+
+
+@dataclass(frozen=True)
+class PushdownRule:
+    """Declarative cleansing rule for one Bronze→Silver step."""
+
+    step: str
+    source: str  # bronze table
+    target: str  # silver table
+    key: str  # natural key, shared by bronze and silver
+    columns: tuple  # (silver column, SQL expression) pairs
+    joins: tuple = ()  # extra FROM clauses after the deduplicated bronze row ``b``
+    source_filter: Optional[str] = None  # applied before DISTINCT ON, as in the Python SELECT
+
+
+_WEIGHT_CLASS_SQL = (
+    "CASE b.weight_class WHEN 1 THEN 'Light' WHEN 2 THEN 'Medium' WHEN 3 THEN 'Heavy' "
+    "WHEN 4 THEN 'Very Heavy' WHEN 5 THEN 'Extra Heavy' ELSE 'Standard' END"
+)
+
+_LOCATION_A2 = f"NULLIF(BTRIM(b.address_line_2, {_WS}), '')"
+
+PUSHDOWN_RULES: dict[str, PushdownRule] = {
+    "countries": PushdownRule(
+        step="countries",
+        source="country",
+        target="country",
+        key="country_id",
+        columns=(
+            ("country_id", "b.country_id"),
+            ("country_name", text_or("b.country_name", literal("Unknown"))),
+            ("country_code", f"LEFT({text_or('b.country_code', literal('XXX'))}, 3)"),
+            ("national_language_code", "COALESCE(b.nat_lang_code, 1033)"),
+            ("currency_code", f"LEFT({text_or('b.currency_code', literal('USD'))}, 10)"),
+        ) + SCD_AUDIT_COLUMNS,
+    ),
+    "locations": PushdownRule(
+        step="locations",
+        source="location",
+        target="location",
+        key="location_id",
+        columns=(
+            ("location_id", "b.location_id"),
+            ("country_key", "c.country_key"),
+            ("address_line_1", strip_or("b.address_line_1", literal("Address pending"))),
+            ("address_line_2", f"COALESCE({_LOCATION_A2}, '—')"),
+            ("city", strip_or("b.city", literal("Unknown"))),
+            ("state_province", strip_or("b.state", literal("NA"))),
+            ("district", strip_or("b.district", literal("—"))),
+            ("postal_code", strip_or("b.postal_code", literal("00000"))),
+            ("location_type", "COALESCE('TYPE_' || b.location_type_code, 'TYPE_0')"),
+            ("description", strip_or("b.description", literal("No description"))),
+            ("shipping_notes", strip_or("b.shipping_notes", literal("No shipping notes"))),
+            ("full_address", "CONCAT_WS(', ', "
+                f"{strip_or('b.address_line_1', literal('Address pending'))}, {_LOCATION_A2}, "
+                f"{strip_or('b.city', literal('Unknown'))}, {strip_or('b.state', literal('NA'))}, "
+                f"{strip_or('b.postal_code', literal('00000'))})"),
+        ) + SCD_AUDIT_COLUMNS,
+        joins=("LEFT JOIN {silver}.country c ON c.country_id = b.country_id",),
+    ),
+    "warehouses": PushdownRule(
+        step="warehouses",
+        source="warehouse",
+        target="warehouse",
+        key="warehouse_id",
+        columns=(
+            ("warehouse_id", "b.warehouse_id"),
+            ("location_key", "l.location_key"),
+            ("warehouse_name", strip_or("b.warehouse_name", "'Warehouse ' || b.warehouse_id")),
+        ) + SCD_AUDIT_COLUMNS,
+        joins=("LEFT JOIN {silver}.location l ON l.location_id = b.location_id",),
+    ),
+    "products": PushdownRule(
+        step="products",
+        source="product",
+        target="product",
+        key="product_id",
+        columns=(
+            ("product_id", "b.product_id"),
+            ("product_name", text_or("b.product_name", literal("Unknown Product"))),
+            ("description", strip_or("b.description", literal("No description available"))),
+            ("category_id", "COALESCE(b.category, 0)"),
+            ("category_name", "COALESCE('Category_' || b.category, 'Uncategorized')"),
+            ("weight_class", "COALESCE(b.weight_class, 1)"),
+            ("weight_class_description", _WEIGHT_CLASS_SQL),
+            ("warranty_period_months", "COALESCE(b.warranty_period, 0)"),
+            ("supplier_id", "COALESCE(b.supplier_id, 0)"),
+            ("product_status", f"LEFT(BTRIM({text_or('b.status', literal('ACTIVE'))}, {_WS}), 20)"),
+            ("list_price", "COALESCE(b.list_price, 0)"),
+            ("minimum_price", "COALESCE(b.minimum_price, 0)"),
+            ("price_currency", f"LEFT({text_or('b.price_currency', literal('USD'))}, 3)"),
+            ("catalog_url", strip_or("b.catalog_url", "'https://catalog.local/product/' || b.product_id")),
+        ) + SCD_AUDIT_COLUMNS,
+    ),
+    "inventory": PushdownRule(
+        step="inventory",
+        source="inventory",
+        target="inventory",
+        key="inventory_id",
+        columns=(
+            ("inventory_id", "b.inventory_id"),
+            ("product_key", "p.product_key"),
+            ("warehouse_key", "w.warehouse_key"),
+            ("quantity_on_hand", "COALESCE(b.quantity_on_hand, 0)"),
+            ("quantity_available", "COALESCE(b.quantity_available, 0)"),
+            ("last_stock_date", "CURRENT_DATE"),
+            ("is_valid", "TRUE"),
+            ("_etl_timestamp", "LOCALTIMESTAMP"),
+        ),
+        # Inner joins: rows whose product/warehouse is not in silver yet are skipped
+        joins=(
+            "JOIN {silver}.product p ON p.product_id = b.product_id",
+            "JOIN {silver}.warehouse w ON w.warehouse_id = b.warehouse_id",
+        ),
+    ),
+    "order_items": PushdownRule(
+        step="order_items",
+        source="order_item",
+        target="order_item",
+        key="order_item_id",
+        columns=(
+            ("order_item_id", "b.order_item_id"),
+            ("order_key", "so.order_key"),
+            ("product_key", "sp.product_key"),
+            ("unit_price", non_negative("b.unit_price")),
+            ("quantity", non_negative("b.quantity")),
+            # Flat 10% promotion discount on the line total (same rule as the Python path)
+            ("discount_amount", f"CASE WHEN BTRIM(COALESCE(o.promotion_code, ''), {_WS}) <> '' "
+                f"THEN ROUND({non_negative('b.unit_price')} * {non_negative('b.quantity')} * 0.10, 2) "
+                "ELSE 0 END"),
+            ("is_valid", "TRUE"),
+            ("_etl_timestamp", "LOCALTIMESTAMP"),
+        ),
+        joins=(
+            "JOIN {bronze}.orders o ON o.order_id = b.order_id",
+            "JOIN {silver}.orders so ON so.order_id = b.order_id",
+            "JOIN {silver}.product sp ON sp.product_id = b.product_id",
+        ),
+        source_filter=(
+            "b2.order_id IN (SELECT order_id FROM {silver}.orders) "
+            "AND b2.product_id IN (SELECT product_id FROM {silver}.product)"
+        ),
+    ),
+}
+
+
+def compile_pushdown(rule: PushdownRule, bronze_schema: str = "bronze",
+                     silver_schema: str = "silver", key_range: bool = False) -> str:
+    """Compile a rule into one INSERT ... SELECT statement.
+
+    Parameters: ``since`` (lower bronze ``_load_timestamp`` bound, or None for a full scan)
+    and ``batch_size`` (LIMIT; None means no limit). With ``key_range`` the source is also
+    bounded by ``range_start`` / ``range_end`` on the natural key (see backfill.py).
+    """
+    schemas = {"bronze": bronze_schema, "silver": silver_schema}
+    target_cols = ", ".join(col for col, _ in rule.columns)
+    select_exprs = ",\n               ".join(expr for _, expr in rule.columns)
+    joins = "\n        ".join(j.format(**schemas) for j in rule.joins)
+    source_where = "WHERE (%(since)s::timestamp IS NULL OR b2._load_timestamp >= %(since)s)"
+    if key_range:
+        source_where += f"\n              AND b2.{rule.key} BETWEEN %(range_start)s AND %(range_end)s"
+    if rule.source_filter:
+        source_where += f"\n              AND {rule.source_filter.format(**schemas)}"
+    return f"""
+        INSERT INTO {silver_schema}.{rule.target} ({target_cols})
+        SELECT {select_exprs}
+        FROM (
+            SELECT DISTINCT ON (b2.{rule.key}) b2.*
+            FROM {bronze_schema}.{rule.source} b2
+            {source_where}
+            ORDER BY b2.{rule.key}, b2._load_timestamp DESC NULLS LAST
+        ) b
+        {joins}
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {silver_schema}.{rule.target} s WHERE s.{rule.key} = b.{rule.key}
+        )
+        ORDER BY b.{rule.key}
+        LIMIT %(batch_size)s
+        ON CONFLICT ({rule.key}) DO NOTHING
+    """
+
+
+def has_pushdown_rule(step_name: str) -> bool:
+    """True when a step can run on the pushdown engine."""
+    return step_name in PUSHDOWN_RULES
+
+
+def run_pushdown_batch(cursor, step_name: str, batch_size: Optional[int],
+                       bronze_schema: str = "bronze", silver_schema: str = "silver",
+                       since: Optional[datetime] = None,
+                       key_range: Optional[Tuple[int, int]] = None) -> int:
+    """Run one pushdown batch for a step; returns the number of silver rows inserted.
+
+    ``key_range`` restricts the batch to natural keys in ``[start, end]``. The caller owns
+    the transaction (commit / rollback), as with the Python transforms.
+    """
+    rule = PUSHDOWN_RULES[step_name]
+    params = {"since": since, "batch_size": batch_size}
+    if key_range is not None:
+        params["range_start"], params["range_end"] = key_range
+    cursor.execute(
+        compile_pushdown(rule, bronze_schema, silver_schema, key_range=key_range is not None),
+        params,
+    )
+    return max(0, cursor.rowcount)
@@ -0,0 +1,55 @@
+"""
+Streaming extract for Bronze -> Silver transforms.
+
+By default a transform SELECTs a whole batch with a client-side cursor (``fetchall()``), so
+the batch, its cleaned rows and the INSERT parameters are all in memory at once. Streamed
+steps instead read the batch through a named (server-side) cursor ``itersize`` rows per
+round trip, clean rows in a generator and write every ``itersize`` cleaned rows, so memory
+stays flat however large ``batch_size`` is: extract -> clean -> buffer -> write.
+
+The named cursor lives inside the step's transaction (no WITH HOLD) and sees the snapshot
+taken when it was opened, so rows the step inserts while it reads do not show up in it; the
+transaction is committed once the batch is drained, as on the client-side path.
+"""
+
+import itertools
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ITERSIZE = 5000
+
+_cursor_ids = itertools.count(1)
+
+
+def stream_rows(connection, query: str, params: Optional[Dict[str, Any]] = None,
+                itersize: int = DEFAULT_ITERSIZE, name: str = "etl_stream") -> Iterator[tuple]:
+    """Yield the rows of ``query`` from a server-side cursor, ``itersize`` rows per fetch."""
+    cursor = connection.cursor(name=f"{name}_{next(_cursor_ids)}")
+    cursor.itersize = itersize
+    try:
+        cursor.execute(query, params)
+        for row in cursor:
+            yield row
+    finally:
+        try:
+            cursor.close()
+        except Exception:
+            # The transaction already ended (rollback after a failed write)
+            pass
+
+
+def chunked(rows: Iterable[tuple], size: Optional[int]) -> Iterator[List[tuple]]:
+    """Group rows into lists of ``size`` (everything in one list when size is None)."""
+    iterator = iter(rows)
+    if size is None:
+        chunk = list(iterator)
+        if chunk:
+            yield chunk
+        return
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
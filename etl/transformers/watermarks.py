@@ -0,0 +1,135 @@
+"""
+Persisted per-step high-water marks on bronze ``_load_timestamp``.
+
+With a watermark, a Bronze→Silver step only scans bronze rows loaded at or after
+``watermark - overlap`` instead of running DISTINCT ON over the table's whole history.
+Keys with new bronze rows still resolve to their latest row (every newer row is inside the
+window) and the anti-join to silver keeps re-scanned rows idempotent.
+
+Rows that slip behind the window are caught by a periodic full reconcile (no watermark
+filter): bronze rows written with an old or NULL ``_load_timestamp``, rows committed after
+a run read past them, and rows skipped earlier because their parent was not in silver yet.
+
+Gold aggregates use the same store with silver ``_etl_timestamp`` as the source column
+(step names ``gold.<table>``, see SilverToGoldAggregator).
+
+Watermarks live in monitoring.etl_watermarks, next to the job tracker tables.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Re-scan window behind the watermark; covers transactions that committed late with an
+# earlier CURRENT_TIMESTAMP than rows we already saw.
+DEFAULT_OVERLAP = timedelta(minutes=10)
+
+# How often each step ignores its watermark and re-reads all of bronze
+DEFAULT_FULL_RECONCILE_INTERVAL = timedelta(hours=24)
+
+
+class WatermarkStore:
+    """Read and advance bronze ``_load_timestamp`` watermarks per transform step."""
+
+    def __init__(self, connection, overlap: timedelta = DEFAULT_OVERLAP,
+                 full_reconcile_interval: timedelta = DEFAULT_FULL_RECONCILE_INTERVAL):
+        self.connection = connection
+        self.overlap = overlap
+        self.full_reconcile_interval = full_reconcile_interval
+        self._rows: Dict[str, tuple] = {}
+
+    def for_connection(self, connection) -> "WatermarkStore":
+        """Store bound to another connection that shares the loaded watermarks (parallel steps)."""
+        store = WatermarkStore(connection, self.overlap, self.full_reconcile_interval)
+        store._rows = self._rows
+        return store
+
+    def ensure_table_exists(self) -> None:
+        """Create monitoring.etl_watermarks if missing."""
+        cursor = self.connection.cursor()
+        cursor.execute("CREATE SCHEMA IF NOT EXISTS monitoring;")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS monitoring.etl_watermarks (
+                step_name           VARCHAR(100) PRIMARY KEY,
+                bronze_table        VARCHAR(100) NOT NULL,
+                last_load_timestamp TIMESTAMP,
+                last_full_reconcile TIMESTAMP,
+                updated_at          TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        self.connection.commit()
+        cursor.close()
+
+    def load(self) -> None:
+        """Read all watermarks once per run."""
+        cursor = self.connection.cursor()
+        cursor.execute(
+            "SELECT step_name, last_load_timestamp, last_full_reconcile FROM monitoring.etl_watermarks"
+        )
+        self._rows = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+        cursor.close()
+
+    def get(self, step_name: str) -> Optional[datetime]:
+        """Return the stored watermark for a step (None if the step never completed)."""
+        return self._rows.get(step_name, (None, None))[0]
+
+    def reconcile_due(self, step_name: str, now: Optional[datetime] = None) -> bool:
+        """True when the step has no watermark or its last full reconcile is too old."""
+        watermark, last_full = self._rows.get(step_name, (None, None))
+        if watermark is None or last_full is None:
+            return True
+        return (now or datetime.now()) - last_full >= self.full_reconcile_interval
+
+    def extract_since(self, step_name: str, force_full: bool = False) -> Optional[datetime]:
+        """Lower ``_load_timestamp`` bound for this run's extraction; None means full scan."""
+        if force_full or self.reconcile_due(step_name):
+            return None
+        return self.get(step_name) - self.overlap
+
+    def bronze_high_water(self, bronze_table: str) -> Optional[datetime]:
+        """Current MAX(_load_timestamp) of a bronze table (index-backed, see bronze_indexes.sql)."""
+        cursor = self.connection.cursor()
+        cursor.execute(f"SELECT MAX(_load_timestamp) FROM bronze.{bronze_table}")
+        value = cursor.fetchone()[0]
+        cursor.close()
+        return value
+
+    def silver_high_water(self, *silver_tables: str) -> Optional[datetime]:
+        """Latest MAX(_etl_timestamp) across silver tables (source watermark for gold aggregates)."""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT GREATEST({})".format(", ".join(
+            f"(SELECT MAX(_etl_timestamp) FROM silver.{t})" for t in silver_tables
+        )))
+        value = cursor.fetchone()[0]
+        cursor.close()
+        return value
+
+    def advance(self, step_name: str, bronze_table: str, high_water: Optional[datetime],
+                full_reconcile: bool) -> None:
+        """Persist a step's new watermark after it drained; never moves a watermark backwards."""
+        if high_water is None:
+            return
+        reconciled_at = datetime.now() if full_reconcile else None
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            INSERT INTO monitoring.etl_watermarks
+                (step_name, bronze_table, last_load_timestamp, last_full_reconcile, updated_at)
+            VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (step_name) DO UPDATE SET
+                bronze_table = EXCLUDED.bronze_table,
+                last_load_timestamp = GREATEST(
+                    monitoring.etl_watermarks.last_load_timestamp, EXCLUDED.last_load_timestamp
+                ),
+                last_full_reconcile = COALESCE(
+                    EXCLUDED.last_full_reconcile, monitoring.etl_watermarks.last_full_reconcile
+                ),
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING last_load_timestamp, last_full_reconcile
+        """, (step_name, bronze_table, high_water, reconciled_at))
+        self._rows[step_name] = cursor.fetchone()
+        self.connection.commit()
+        cursor.close()
@@ -0,0 +1,185 @@
+"""
+Dependency-graph executor for ETL steps.
+
+Runs named steps on a thread pool as soon as all of their dependencies have finished, so
+independent entities (e.g. countries / products / persons) load at the same time while FK
+order is kept where it is required. Steps must not share a database connection; callers
+give each worker thread its own connection (see BronzeToSilverTransformer.transform_all).
+
+After a run, ``DagRunResult`` holds per-node timings and the critical path: the chain of
+steps that actually gated the finish time, which is where tuning pays off. A failed step
+skips the steps that depend on it; independent branches still run to completion.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (name, callable, dependency names)
+DagNode = Tuple[str, Callable[[], Any], Sequence[str]]
+
+
+class DagRunResult:
+    """Outcome of one DAG run: results, timings and critical path."""
+
+    def __init__(self):
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self.critical_path: List[str] = []
+        self.skipped: List[str] = []  # not run because a dependency failed or was skipped
+        self.elapsed = 0.0
+
+    def to_metrics(self) -> Dict[str, Any]:
+        """JSON-friendly summary for ETLJobTracker.record_step_metrics."""
+        return {
+            "seconds": round(self.elapsed, 3),
+            "critical_path": self.critical_path,
+            "skipped": self.skipped,
+            "critical_path_seconds": round(
+                sum(self.timings[n]["seconds"] for n in self.critical_path), 3
+            ),
+            "nodes": {
+                name: {
+                    "start": round(t["start"], 3),
+                    "seconds": round(t["seconds"], 3),
+                    "worker": t["worker"],
+                    "status": t["status"],
+                }
+                for name, t in self.timings.items()
+            },
+        }
+
+
+def _validate(nodes: Sequence[DagNode]) -> None:
+    """Reject duplicate names, unknown dependencies and cycles."""
+    names = [n[0] for n in nodes]
+    if len(names) != len(set(names)):
+        raise ValueError("Duplicate DAG node names")
+    known = set(names)
+    for name, _, deps in nodes:
+        unknown = set(deps) - known
+        if unknown:
+            raise ValueError(f"Node {name!r} depends on unknown node(s): {sorted(unknown)}")
+    # Kahn's algorithm: every node must become ready at some point
+    remaining = {name: set(deps) for name, _, deps in nodes}
+    while remaining:
+        ready = [n for n, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle among: {sorted(remaining)}")
+        for n in ready:
+            del remaining[n]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+class DagExecutor:
+    """Run DAG nodes on up to ``max_workers`` threads, respecting dependencies."""
+
+    def __init__(self, max_workers: int = 4):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self.max_workers = max_workers
+
+    def run(self, nodes: Sequence[DagNode]) -> DagRunResult:
+        """Execute all nodes; ready nodes start in declaration order.
+
+        A failed node's dependents (and theirs) are skipped; every other node still runs.
+        Once nothing is left to run, the first failure is re-raised with the run's timings
+        and skipped nodes on ``exc.dag_result``.
+        """
+        _validate(nodes)
+        result = DagRunResult()
+        deps_of = {name: tuple(deps) for name, _, deps in nodes}
+        funcs = {name: func for name, func, _ in nodes}
+        pending = [name for name, _, _ in nodes]
+        done: set = set()
+        blocked: set = set()  # failed or skipped
+        failure: Optional[BaseException] = None
+        t0 = time.time()
+
+        def call(name: str):
+            start = time.time()
+            worker = threading.current_thread().name
+            status = "ok"
+            try:
+                return funcs[name]()
+            except BaseException:
+                status = "failed"
+                raise
+            finally:
+                end = time.time()
+                result.timings[name] = {
+                    "start": start - t0,
+                    "end": end - t0,
+                    "seconds": end - start,
+                    "worker": worker,
+                    "status": status,
+                }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="etl-dag") as pool:
+            running = {}
+            while pending or running:
+                self._skip_blocked(pending, deps_of, blocked, result.skipped)
+                for name in [n for n in pending if set(deps_of[n]) <= done]:
+                    if len(running) >= self.max_workers:
+                        break
+                    pending.remove(name)
+                    running[pool.submit(call, name)] = name
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        result.results[name] = future.result()
+                        done.add(name)
+                    except BaseException as e:
+                        logger.error("DAG node %s failed: %s", name, e)
+                        blocked.add(name)
+                        if failure is None:
+                            failure = e
+
+        result.elapsed = time.time() - t0
+        result.critical_path = self._critical_path(result.timings, deps_of)
+        if failure is not None:
+            try:
+                failure.dag_result = result
+            except AttributeError:
+                pass
+            raise failure
+        return result
+
+    @staticmethod
+    def _skip_blocked(pending: List[str], deps_of: Dict[str, Tuple[str, ...]],
+                      blocked: set, skipped: List[str]) -> None:
+        """Move pending nodes downstream of a failed node to ``skipped``."""
+        changed = True
+        while changed:
+            changed = False
+            for name in [n for n in pending if blocked.intersection(deps_of[n])]:
+                logger.warning("DAG node %s skipped: a dependency failed", name)
+                pending.remove(name)
+                blocked.add(name)
+                skipped.append(name)
+                changed = True
+
+    @staticmethod
+    def _critical_path(timings: Dict[str, Dict[str, Any]],
+                       deps_of: Dict[str, Tuple[str, ...]]) -> List[str]:
+        """Walk back from the last node to finish through the dependency that finished last."""
+        if not timings:
+            return []
+        node = max(timings, key=lambda n: timings[n]["end"])
+        path = [node]
+        while True:
+            ran = [d for d in deps_of[node] if d in timings]
+            if not ran:
+                break
+            node = max(ran, key=lambda n: timings[n]["end"])
+            path.append(node)
+        return list(reversed(path))
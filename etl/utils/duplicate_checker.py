@@ -1,14 +1,66 @@
 """
 Duplicate Detection and Validation Utilities
 Checks for duplicate records in Silver and Gold layers after ETL runs
+
+DuplicateValidator checks every table of both layers in one pass, on up to ``max_workers``
+connections, and picks the cheapest check that still answers the question per table:
+
+- constraint: a valid unique index covers the key columns, so duplicates cannot exist and
+  only the catalog is read.
+- window: the table has ``_etl_timestamp`` and the run's window start is known, so only keys
+  written since then are looked up (a run can only create duplicates among its own rows).
+  The window start is read from both clocks that stamp silver rows (see window_start).
+- sample: more than ``sample_threshold`` estimated rows; the keys of a TABLESAMPLE are looked
+  up in the full table and the surplus rows are scaled up (a Horvitz-Thompson estimate; any
+  non-zero estimate means real duplicates were found).
+- full: exact COUNT(*) - COUNT(DISTINCT key) over the whole table.
+
+Every check is recorded per run in monitoring.duplicate_checks for trend queries.
 """
 
 import psycopg2
 import logging
-from typing import Dict, List, Tuple
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Silver tables -> unique key columns
+SILVER_KEYS: Dict[str, List[str]] = {
+    'country': ['country_id'],
+    'location': ['location_id'],
+    'warehouse': ['warehouse_id'],
+    'product': ['product_id'],
+    'inventory': ['inventory_id'],
+    'person': ['person_id'],
+    'customer_company': ['company_id'],
+    'customer_employee': ['customer_employee_id'],
+    'employment_jobs': ['hr_job_id'],
+    'employee': ['employee_id'],
+    'customer': ['customer_id'],
+    'orders': ['order_id'],
+    'order_item': ['order_item_id'],
+    'phone_number': ['phone_id'],
+    'person_location': ['person_key', 'location_key'],
+}
+
+# Gold layer tables -> unique key columns
+GOLD_KEYS: Dict[str, List[str]] = {
+    'agg_daily_sales': ['date_key'],
+    'agg_customer_lifetime': ['customer_key'],
+    'agg_monthly_product_sales': ['year_number', 'month_number', 'category_name'],
+}
+
+DEFAULT_SAMPLE_THRESHOLD = int(os.getenv("DUPLICATE_CHECK_SAMPLE_THRESHOLD", "50000000"))
+DEFAULT_SAMPLE_ROWS = int(os.getenv("DUPLICATE_CHECK_SAMPLE_ROWS", "200000"))
+
+WINDOW_COLUMN = '_etl_timestamp'
+
 
 def check_duplicates_by_id(connection, schema: str, table: str, id_column: str) -> int:
     """
@@ -68,68 +120,283 @@ def check_duplicates_by_composite_key(connection, schema: str, table: str,
         cursor.close()
 
 
-def validate_silver_layer(connection) -> Dict[str, Tuple[int, bool]]:
-    """
-    Validate Silver layer for duplicates.
-    
-    Returns:
-        Dictionary mapping table names to (duplicate_count, has_duplicates)
-    """
-    results = {}
-    
-    # Tables with single ID column
-    single_id_tables = {
-        'country': 'country_id',
-        'location': 'location_id',
-        'warehouse': 'warehouse_id',
-        'product': 'product_id',
-        'inventory': 'inventory_id',
-        'person': 'person_id',
-        'customer_company': 'company_id',
-        'customer_employee': 'customer_employee_id',
-        'employment_jobs': 'hr_job_id',
-        'employee': 'employee_id',
-        'customer': 'customer_id',
-        'orders': 'order_id',
-        'order_item': 'order_item_id',
-        'phone_number': 'phone_id',
-    }
-    
-    # Tables with composite keys or special handling
-    composite_key_tables = {
-        'person_location': ['person_key', 'location_key'],
-    }
-    
+@dataclass
+class DuplicateCheck:
+    """Outcome of one table's duplicate check."""
+    layer: str
+    table: str
+    key_columns: List[str]
+    method: str = 'full'
+    rows_checked: int = 0
+    duplicates: int = 0
+    is_estimate: bool = False
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def has_duplicates(self) -> bool:
+        return self.duplicates > 0
+
+
+class DuplicateValidator:
+    """Check silver and gold tables for duplicate keys, in parallel, recording each check."""
+
+    def __init__(self, connection, run_id: Optional[str] = None,
+                 since: Optional[datetime] = None,
+                 sample_threshold: int = DEFAULT_SAMPLE_THRESHOLD,
+                 sample_rows: int = DEFAULT_SAMPLE_ROWS):
+        """
+        Args:
+            connection: Connection used for catalog reads, recording, and all checks when
+                no connection_factory is given to validate().
+            run_id: Pipeline run the checks are recorded under.
+            since: Start of the run's window; tables with _etl_timestamp only have keys
+                written at or after it checked. None checks whole tables.
+            sample_threshold: Estimated row count above which whole-table checks sample.
+            sample_rows: Approximate rows per sample.
+        """
+        self.connection = connection
+        self.run_id = run_id
+        self.since = since
+        self.sample_threshold = sample_threshold
+        self.sample_rows = max(1, sample_rows)
+
+    @staticmethod
+    def window_start(connection) -> datetime:
+        """
+        Window start for a run about to write silver rows.
+
+        _etl_timestamp is stamped by two clocks: Python steps write the client's
+        datetime.now(), pushdown steps the database's LOCALTIMESTAMP. The earlier of both
+        readings is returned, so skew between the hosts (or their time zones) only widens
+        the window and never drops this run's rows from the check.
+        """
+        client_now = datetime.now()
+        cursor = connection.cursor()
+        cursor.execute("SELECT clock_timestamp()::timestamp")
+        database_now = cursor.fetchone()[0]
+        cursor.close()
+        connection.rollback()
+        return min(client_now, database_now)
+
+    def ensure_table_exists(self) -> None:
+        """Create monitoring.duplicate_checks if missing."""
+        cursor = self.connection.cursor()
+        cursor.execute("CREATE SCHEMA IF NOT EXISTS monitoring;")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS monitoring.duplicate_checks (
+                check_id        BIGSERIAL PRIMARY KEY,
+                run_id          VARCHAR(100),
+                layer           VARCHAR(20) NOT NULL,
+                table_name      VARCHAR(100) NOT NULL,
+                key_columns     TEXT,
+                method          VARCHAR(20) NOT NULL,
+                window_start    TIMESTAMP,
+                rows_checked    BIGINT,
+                duplicate_count BIGINT,
+                is_estimate     BOOLEAN DEFAULT FALSE,
+                check_seconds   NUMERIC(10,3),
+                error_message   TEXT,
+                checked_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_duplicate_checks_table_time
+            ON monitoring.duplicate_checks (layer, table_name, checked_at)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_duplicate_checks_run
+            ON monitoring.duplicate_checks (run_id)
+        """)
+        self.connection.commit()
+        cursor.close()
+
+    # -- planning ----------------------------------------------------------------------------
+
+    @staticmethod
+    def _table_info(cursor, schema: str, table: str,
+                    key_columns: Sequence[str]) -> Tuple[bool, bool, float]:
+        """(unique index covers the key, has _etl_timestamp, estimated rows)."""
+        cursor.execute("""
+            SELECT
+                EXISTS (
+                    SELECT 1
+                    FROM pg_index i
+                    WHERE i.indrelid = c.oid
+                      AND i.indisunique AND i.indisvalid
+                      AND i.indpred IS NULL AND i.indexprs IS NULL
+                      AND ARRAY(
+                          SELECT a.attname::text FROM pg_attribute a
+                          WHERE a.attrelid = c.oid AND a.attnum = ANY(i.indkey)
+                      ) <@ %(keys)s::text[]
+                ),
+                EXISTS (
+                    SELECT 1 FROM pg_attribute a
+                    WHERE a.attrelid = c.oid AND a.attname = %(window)s
+                      AND a.attnum > 0 AND NOT a.attisdropped
+                ),
+                c.reltuples
+            FROM pg_class c
+            WHERE c.oid = to_regclass(%(table)s)
+        """, {'keys': list(key_columns), 'window': WINDOW_COLUMN, 'table': f"{schema}.{table}"})
+        row = cursor.fetchone()
+        if row is None:
+            raise LookupError(f"{schema}.{table} does not exist")
+        return bool(row[0]), bool(row[1]), float(row[2] or 0)
+
+    # -- checks ------------------------------------------------------------------------------
+
+    def _check(self, connection, layer: str, table: str, key_columns: List[str]) -> DuplicateCheck:
+        result = DuplicateCheck(layer, table, key_columns)
+        keys = ', '.join(key_columns)
+        target = f"{layer}.{table}"
+        t0 = time.time()
+        cursor = connection.cursor()
+        try:
+            enforced, windowed, estimated_rows = self._table_info(cursor, layer, table, key_columns)
+            if enforced:
+                result.method = 'constraint'
+            elif windowed and self.since is not None:
+                result.method = 'window'
+                cursor.execute(f"""
+                    WITH touched AS (
+                        SELECT DISTINCT {keys} FROM {target} WHERE {WINDOW_COLUMN} >= %s
+                    )
+                    SELECT (SELECT COUNT(*) FROM touched), COALESCE(SUM(c - 1), 0)
+                    FROM (
+                        SELECT COUNT(*) AS c FROM {target}
+                        WHERE ({keys}) IN (SELECT {keys} FROM touched)
+                        GROUP BY {keys}
+                        HAVING COUNT(*) > 1
+                    ) d
+                """, (self.since,))
+                result.rows_checked, result.duplicates = cursor.fetchone()
+            elif estimated_rows > self.sample_threshold:
+                result.method = 'sample'
+                result.is_estimate = True
+                percent = min(100.0, 100.0 * self.sample_rows / estimated_rows)
+                cursor.execute(f"""
+                    WITH s AS (
+                        SELECT {keys} FROM {target} TABLESAMPLE SYSTEM (%s)
+                    ),
+                    g AS (
+                        SELECT {keys}, COUNT(*) AS c FROM {target}
+                        WHERE ({keys}) IN (SELECT {keys} FROM s)
+                        GROUP BY {keys}
+                    )
+                    SELECT (SELECT COUNT(*) FROM s),
+                           COALESCE(SUM((g.c - 1)::float8 / g.c), 0)
+                    FROM s JOIN g USING ({keys})
+                """, (percent,))
+                sampled, surplus = cursor.fetchone()
+                result.rows_checked = sampled
+                if sampled:
+                    scaled = round(surplus * estimated_rows / sampled)
+                    # Found duplicates never round away to zero
+                    result.duplicates = max(int(scaled), 1 if surplus > 0 else 0)
+            else:
+                cursor.execute(f"SELECT COUNT(*), COUNT(*) - COUNT(DISTINCT ({keys})) FROM {target}")
+                result.rows_checked, result.duplicates = cursor.fetchone()
+            connection.rollback()
+        except Exception as e:
+            logger.error(f"Error checking duplicates in {target}: {e}")
+            try:
+                connection.rollback()
+            except Exception:
+                pass
+            result.duplicates = -1
+            result.error = str(e)
+        finally:
+            cursor.close()
+        result.seconds = time.time() - t0
+        return result
+
+    def validate(self, tables: Dict[str, Dict[str, List[str]]], max_workers: int = 1,
+                 connection_factory: Optional[Callable[[], Any]] = None) -> List[DuplicateCheck]:
+        """
+        Check ``{layer: {table: key columns}}`` and record every check.
+
+        With ``max_workers`` > 1 and a ``connection_factory`` the tables are checked
+        concurrently, one connection per worker thread.
+        """
+        work = [(layer, table, cols) for layer, layer_tables in tables.items()
+                for table, cols in layer_tables.items()]
+        t0 = time.time()
+        if max_workers > 1 and connection_factory is not None and len(work) > 1:
+            local = threading.local()
+            opened = []
+            opened_lock = threading.Lock()
+
+            def run(item):
+                connection = getattr(local, "connection", None)
+                if connection is None:
+                    connection = local.connection = connection_factory()
+                    with opened_lock:
+                        opened.append(connection)
+                return self._check(connection, *item)
+
+            try:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(work)),
+                                        thread_name_prefix="dup-check") as pool:
+                    results = list(pool.map(run, work))
+            finally:
+                for connection in opened:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+        else:
+            results = [self._check(self.connection, *item) for item in work]
+        logger.info(f"Checked {len(results)} table(s) in {time.time() - t0:.2f}s")
+        self._record(results)
+        return results
+
+    def _record(self, results: List[DuplicateCheck]) -> None:
+        try:
+            self.ensure_table_exists()
+            cursor = self.connection.cursor()
+            cursor.executemany("""
+                INSERT INTO monitoring.duplicate_checks
+                    (run_id, layer, table_name, key_columns, method, window_start,
+                     rows_checked, duplicate_count, is_estimate, check_seconds, error_message)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, [
+                (self.run_id, r.layer, r.table, ', '.join(r.key_columns), r.method,
+                 self.since if r.method == 'window' else None,
+                 r.rows_checked, r.duplicates, r.is_estimate, round(r.seconds, 3), r.error)
+                for r in results
+            ])
+            self.connection.commit()
+            cursor.close()
+        except Exception as e:
+            logger.warning(f"Could not record duplicate checks: {e}")
+            try:
+                self.connection.rollback()
+            except Exception:
+                pass
+
+
+def _log_layer(layer: str, results: List[DuplicateCheck]) -> Dict[str, Tuple[int, bool]]:
+    """Log one layer's checks; returns table -> (duplicate_count, has_duplicates)."""
     logger.info("")
     logger.info("=" * 80)
-    logger.info("VALIDATING SILVER LAYER FOR DUPLICATES")
+    logger.info(f"VALIDATING {layer.upper()} LAYER FOR DUPLICATES")
     logger.info("=" * 80)
-    
-    # Check single ID tables
-    for table, id_column in single_id_tables.items():
-        duplicates = check_duplicates_by_id(connection, 'silver', table, id_column)
-        has_duplicates = duplicates > 0
-        results[table] = (duplicates, has_duplicates)
-        
-        if has_duplicates:
-            logger.warning(f"[WARN] {table:30s}: {duplicates:>15,} duplicates found!")
-        else:
-            logger.info(f"  [OK] {table:30s}: No duplicates")
-    
-    # Check composite key tables
-    for table, columns in composite_key_tables.items():
-        duplicates = check_duplicates_by_composite_key(connection, 'silver', table, columns)
-        has_duplicates = duplicates > 0
-        results[table] = (duplicates, has_duplicates)
-        
-        if has_duplicates:
-            logger.warning(f"[WARN] {table:30s}: {duplicates:>15,} duplicates found!")
+
+    summary = {}
+    for r in results:
+        summary[r.table] = (r.duplicates, r.has_duplicates)
+        how = f"[{r.method}{', estimated' if r.is_estimate else ''}]"
+        if r.error:
+            logger.warning(f"[WARN] {r.table:30s}: check failed {how}")
+        elif r.has_duplicates:
+            logger.warning(f"[WARN] {r.table:30s}: {r.duplicates:>15,} duplicates found! {how}")
         else:
-            logger.info(f"  [OK] {table:30s}: No duplicates")
-    
+            logger.info(f"  [OK] {r.table:30s}: No duplicates {how}")
+
     # Summary
-    total_duplicates = sum(count for count, _ in results.values() if count > 0)
-    tables_with_duplicates = sum(1 for _, has_dup in results.values() if has_dup)
+    total_duplicates = sum(count for count, _ in summary.values() if count > 0)
+    tables_with_duplicates = sum(1 for _, has_dup in summary.values() if has_dup)
     
     logger.info("")
     logger.info("-" * 80)
@@ -139,8 +406,37 @@ def validate_silver_layer(connection) -> Dict[str, Tuple[int, bool]]:
     else:
         logger.info(f"[OK] VALIDATION PASSED: No duplicates found in any table")
     logger.info("-" * 80)
+
+    return summary
+
+
+def validate_layers(connection, run_id: Optional[str] = None, since: Optional[datetime] = None,
+                    max_workers: int = 1, connection_factory: Optional[Callable[[], Any]] = None
+                    ) -> Dict[str, Dict[str, Tuple[int, bool]]]:
+    """
+    Validate Silver and Gold layers for duplicates in one pass.
     
-    return results
+    Returns:
+        Dictionary mapping layer -> table -> (duplicate_count, has_duplicates)
+    """
+    validator = DuplicateValidator(connection, run_id=run_id, since=since)
+    results = validator.validate({'silver': SILVER_KEYS, 'gold': GOLD_KEYS},
+                                 max_workers=max_workers, connection_factory=connection_factory)
+    return {
+        layer: _log_layer(layer, [r for r in results if r.layer == layer])
+        for layer in ('silver', 'gold')
+    }
+
+
+def validate_silver_layer(connection, since: Optional[datetime] = None) -> Dict[str, Tuple[int, bool]]:
+    """
+    Validate Silver layer for duplicates.
+    
+    Returns:
+        Dictionary mapping table names to (duplicate_count, has_duplicates)
+    """
+    results = DuplicateValidator(connection, since=since).validate({'silver': SILVER_KEYS})
+    return _log_layer('silver', results)
 
 
 def validate_gold_layer(connection) -> Dict[str, Tuple[int, bool]]:
@@ -150,46 +446,5 @@ def validate_gold_layer(connection) -> Dict[str, Tuple[int, bool]]:
     Returns:
         Dictionary mapping table names to (duplicate_count, has_duplicates)
     """
-    results = {}
-    
-    # Gold layer tables with their unique key columns
-    gold_tables = {
-        'agg_daily_sales': ['date_key'],
-        'agg_customer_lifetime': ['customer_key'],
-        'agg_monthly_product_sales': ['year_number', 'month_number', 'category_name'],
-    }
-    
-    logger.info("")
-    logger.info("=" * 80)
-    logger.info("VALIDATING GOLD LAYER FOR DUPLICATES")
-    logger.info("=" * 80)
-    
-    for table, columns in gold_tables.items():
-        if len(columns) == 1:
-            duplicates = check_duplicates_by_id(connection, 'gold', table, columns[0])
-        else:
-            duplicates = check_duplicates_by_composite_key(connection, 'gold', table, columns)
-        
-        has_duplicates = duplicates > 0
-        results[table] = (duplicates, has_duplicates)
-        
-        if has_duplicates:
-            logger.warning(f"[WARN] {table:30s}: {duplicates:>15,} duplicates found!")
-        else:
-            logger.info(f"  [OK] {table:30s}: No duplicates")
-    
-    # Summary
-    total_duplicates = sum(count for count, _ in results.values() if count > 0)
-    tables_with_duplicates = sum(1 for _, has_dup in results.values() if has_dup)
-    
-    logger.info("")
-    logger.info("-" * 80)
-    if total_duplicates > 0:
-        logger.warning(f"[WARN] VALIDATION FAILED: {tables_with_duplicates} table(s) have duplicates")
-        logger.warning(f"  Total duplicate records: {total_duplicates:,}")
-    else:
-        logger.info(f"[OK] VALIDATION PASSED: No duplicates found in any table")
-    logger.info("-" * 80)
-    
-    return results
-
+    results = DuplicateValidator(connection).validate({'gold': GOLD_KEYS})
+    return _log_layer('gold', results)
@@ -0,0 +1,67 @@
+"""
+Process memory readings for ETL step metrics.
+
+Linux reports the resident set size and its high-water mark in /proc/self/status; writing
+"5" to /proc/self/clear_refs resets the high-water mark, so a step's peak RSS can be measured
+on its own. Elsewhere the peak comes from getrusage() and covers the whole process lifetime.
+"""
+
+import os
+import sys
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_STATUS = "/proc/self/status"
+_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def _status_kb(field: str) -> Optional[int]:
+    try:
+        with open(_STATUS) as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size now, or None where it cannot be read."""
+    kb = _status_kb("VmRSS")
+    return kb * 1024 if kb is not None else None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size since start (or since the last reset_peak_rss())."""
+    kb = _status_kb("VmHWM")
+    if kb is not None:
+        return kb * 1024
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux / BSD
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak RSS to the current RSS; False where the platform cannot."""
+    try:
+        fd = os.open(_CLEAR_REFS, os.O_WRONLY)
+    except OSError:
+        return False
+    try:
+        os.write(fd, b"5")
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def to_mb(value: Optional[int]) -> Optional[float]:
+    return round(value / (1024 * 1024), 1) if value is not None else None
@@ -0,0 +1,363 @@
+"""
+Opt-in pipeline profiler.
+
+Records spans for every SQL statement, commit / rollback and instrumented Python phase
+(pipeline steps, transform steps, key-map refreshes) of a run, on every thread. A run is
+written as a Chrome trace (open it in chrome://tracing, https://ui.perfetto.dev or
+https://www.speedscope.app) and summarized for the job run: self time per category, the
+statements that took longest in total, and the plans of slow statements.
+
+Profiling is off unless a Profiler is activated; ``span()`` is then a no-op context and
+connections are plain psycopg2 connections. Connections that should be traced are opened
+with ``connection_factory=ProfilingConnection`` (see ``connect()``).
+
+Plans: statements slower than ``explain_threshold_ms`` get a plan. Where the session may LOAD
+auto_explain, Postgres reports the ``EXPLAIN (ANALYZE, BUFFERS)`` plan of the statement that
+actually ran. Otherwise plain SELECTs get an estimated plain ``EXPLAIN`` (inside a savepoint),
+which does not execute them; ``explain_analyze=True`` re-runs them under EXPLAIN ANALYZE
+instead, paying their cost a second time. Writes are never re-executed.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+import psycopg2
+import psycopg2.extensions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPLAIN_THRESHOLD_MS = 500.0
+DEFAULT_MAX_EXPLAINS = 25
+# Spans kept for the trace file; totals keep counting past it
+DEFAULT_MAX_SPANS = 500_000
+
+_active: Optional["Profiler"] = None
+
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_VALUE_LISTS = re.compile(r"(\(\?(?:, ?\?)*\))(?:, ?\(\?(?:, ?\?)*\))+")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(query) -> str:
+    """Statement text with literals replaced by ``?`` and VALUES lists collapsed."""
+    if isinstance(query, (bytes, bytearray, memoryview)):
+        query = bytes(query).decode("utf-8", "replace")
+    text = _SPACE.sub(" ", str(query)).strip()
+    text = _LITERAL.sub("?", text)
+    text = _VALUE_LISTS.sub(r"\1, ...", text)
+    return text[:300]
+
+
+def active() -> Optional["Profiler"]:
+    """The activated profiler, or None when profiling is off."""
+    return _active
+
+
+def span(name: str, cat: str = "python", **args):
+    """Context manager timing a block on the active profiler (no-op when profiling is off)."""
+    profiler = _active
+    if profiler is None:
+        return nullcontext()
+    return profiler.span(name, cat, **args)
+
+
+def connect(**params):
+    """psycopg2.connect(), traced when a profiler is active."""
+    if _active is not None:
+        params.setdefault("connection_factory", ProfilingConnection)
+    return psycopg2.connect(**params)
+
+
+class Profiler:
+    """Collect spans across threads and export them as a Chrome trace plus a summary."""
+
+    def __init__(self, explain_threshold_ms: Optional[float] = DEFAULT_EXPLAIN_THRESHOLD_MS,
+                 max_explains: int = DEFAULT_MAX_EXPLAINS, max_spans: int = DEFAULT_MAX_SPANS,
+                 explain_analyze: bool = False):
+        """
+        Args:
+            explain_threshold_ms: Capture plans of statements at least this slow (None: never).
+            max_explains: Plans captured per run at most.
+            max_spans: Spans kept for the trace file.
+            explain_analyze: Without auto_explain, re-run slow SELECTs under EXPLAIN ANALYZE
+                rather than plain EXPLAIN.
+        """
+        self.explain_threshold_ms = explain_threshold_ms
+        self.explain_analyze = explain_analyze
+        self.max_explains = max_explains
+        self.max_spans = max_spans
+        self._t0 = time.perf_counter()
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self._dropped = 0
+        self._self_time: Dict[str, List[float]] = {}
+        self._statements: Dict[str, Dict[str, Any]] = {}
+        self.plans: List[Dict[str, Any]] = []
+
+    # -- activation --------------------------------------------------------------------------
+
+    def activate(self) -> "Profiler":
+        global _active
+        _active = self
+        return self
+
+    def deactivate(self) -> None:
+        global _active
+        if _active is self:
+            _active = None
+
+    # -- recording ---------------------------------------------------------------------------
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, cat: str = "python", **args):
+        """Time the enclosed block as one span; nested spans are subtracted from its self time."""
+        stack = self._stack()
+        frame = [time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            duration = end - frame[0]
+            if stack:
+                stack[-1][1] += duration
+            self._add(name, cat, frame[0], duration, duration - frame[1], args)
+
+    def _add(self, name: str, cat: str, start: float, duration: float, self_time: float,
+             args: Dict[str, Any]) -> None:
+        thread = threading.current_thread()
+        with self._lock:
+            totals = self._self_time.setdefault(cat, [0.0, 0])
+            totals[0] += self_time
+            totals[1] += 1
+            self._threads.setdefault(thread.ident, thread.name)
+            if len(self._events) >= self.max_spans:
+                self._dropped += 1
+                return
+            event = {
+                "name": name, "cat": cat, "ph": "X", "pid": os.getpid(), "tid": thread.ident,
+                "ts": round((start - self._t0) * 1e6, 1), "dur": round(duration * 1e6, 1),
+            }
+            if args:
+                event["args"] = args
+            self._events.append(event)
+
+    def record_statement(self, statement: str, seconds: float, rows: int) -> None:
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None:
+                stats = self._statements[statement] = {"calls": 0, "seconds": 0.0, "max_ms": 0.0,
+                                                       "rows": 0}
+            stats["calls"] += 1
+            stats["seconds"] += seconds
+            stats["max_ms"] = max(stats["max_ms"], seconds * 1000)
+            stats["rows"] += max(rows, 0)
+
+    def wants_plan(self, seconds: float) -> bool:
+        return (self.explain_threshold_ms is not None
+                and seconds * 1000 >= self.explain_threshold_ms
+                and len(self.plans) < self.max_explains)
+
+    def record_plan(self, statement: str, ms: float, plan: Any, source: str) -> None:
+        with self._lock:
+            if len(self.plans) < self.max_explains:
+                self.plans.append({"statement": statement, "ms": round(ms, 1),
+                                   "source": source, "plan": plan})
+
+    # -- export ------------------------------------------------------------------------------
+
+    def trace(self) -> Dict[str, Any]:
+        """Chrome trace (JSON object format) of the recorded spans."""
+        with self._lock:
+            pid = os.getpid()
+            meta = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                     "args": {"name": name}} for tid, name in self._threads.items()]
+            events = meta + list(self._events)
+            for i, plan in enumerate(self.plans):
+                events.append({"name": "plan", "cat": "explain", "ph": "i", "s": "g", "pid": pid,
+                               "tid": 0, "ts": 0, "args": {"index": i, **plan}})
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"started_at": self._started_at, "dropped_spans": self._dropped}}
+
+    def write_trace(self, path: str) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.trace(), f, default=str)
+        return path
+
+    def summary(self, top: int = 15) -> Dict[str, Any]:
+        """JSON-friendly summary for the job run."""
+        with self._lock:
+            categories = {
+                cat: {"seconds": round(total, 3), "spans": count}
+                for cat, (total, count) in sorted(self._self_time.items(),
+                                                  key=lambda kv: -kv[1][0])
+            }
+            statements = sorted(self._statements.items(), key=lambda kv: -kv[1]["seconds"])[:top]
+            plans = sorted(self.plans, key=lambda p: -p["ms"])
+        return {
+            "wall_seconds": round(time.perf_counter() - self._t0, 3),
+            "self_seconds_by_category": categories,
+            "top_statements": [
+                {"statement": s, "calls": v["calls"], "seconds": round(v["seconds"], 3),
+                 "max_ms": round(v["max_ms"], 1), "rows": v["rows"]}
+                for s, v in statements
+            ],
+            "slow_plans": [
+                {"statement": p["statement"], "ms": p["ms"], "source": p["source"],
+                 **_plan_totals(p["plan"])}
+                for p in plans
+            ],
+            "dropped_spans": self._dropped,
+        }
+
+
+def _plan_totals(plan: Any) -> Dict[str, Any]:
+    """Execution time and top-node buffer counts of an EXPLAIN (FORMAT JSON) plan."""
+    if isinstance(plan, list) and plan:
+        plan = plan[0]
+    if not isinstance(plan, dict):
+        return {}
+    node = plan.get("Plan", {})
+    return {
+        "node": node.get("Node Type"),
+        # None for plain EXPLAIN plans, which only carry estimates
+        "execution_ms": plan.get("Execution Time", node.get("Actual Total Time")),
+        "shared_hit_blocks": node.get("Shared Hit Blocks"),
+        "shared_read_blocks": node.get("Shared Read Blocks"),
+        "temp_written_blocks": node.get("Temp Written Blocks"),
+    }
+
+
+def _is_select(statement: str) -> bool:
+    head = statement.lstrip("( ").split(" ", 1)[0].upper()
+    return head == "SELECT" and " FOR UPDATE" not in statement.upper()
+
+
+class ProfilingCursor(psycopg2.extensions.cursor):
+    """Cursor that records a span and statement totals per execute on the active profiler."""
+
+    def _profiled(self, method, query, *args):
+        profiler = _active
+        if profiler is None:
+            return method(query, *args)
+        statement = fingerprint(query)
+        start = time.perf_counter()
+        try:
+            with profiler.span(statement[:80], "sql", statement=statement):
+                result = method(query, *args)
+        finally:
+            seconds = time.perf_counter() - start
+            profiler.record_statement(statement, seconds, self.rowcount)
+        if self.name is None and profiler.wants_plan(seconds):
+            self.connection._capture_plan(profiler, statement, self.query, seconds)
+        return result
+
+    def execute(self, query, vars=None):
+        return self._profiled(super().execute, query, vars)
+
+    def executemany(self, query, vars_list):
+        return self._profiled(super().executemany, query, vars_list)
+
+    def copy_expert(self, sql, file, size=8192):
+        return self._profiled(super().copy_expert, sql, file, size)
+
+    def callproc(self, procname, parameters=None):
+        return self._profiled(super().callproc, procname, parameters)
+
+
+class ProfilingConnection(psycopg2.extensions.connection):
+    """Connection whose cursors, commits and rollbacks are traced by the active profiler."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cursor_factory = ProfilingCursor
+        self.notices = deque(maxlen=100)
+        self._auto_explain = False
+        profiler = _active
+        if profiler is not None and profiler.explain_threshold_ms is not None:
+            self._auto_explain = self._enable_auto_explain(profiler.explain_threshold_ms)
+
+    def _enable_auto_explain(self, threshold_ms: float) -> bool:
+        cursor = psycopg2.extensions.cursor(self)
+        try:
+            cursor.execute("LOAD 'auto_explain'")
+            for setting, value in (("log_min_duration", f"{threshold_ms:g}ms"),
+                                   ("log_analyze", "on"), ("log_buffers", "on"),
+                                   ("log_format", "json"), ("log_level", "notice")):
+                cursor.execute(f"SET auto_explain.{setting} = '{value}'")
+            self.commit()
+            return True
+        except psycopg2.Error as e:
+            self.rollback()
+            logger.info("auto_explain unavailable (%s); only slow SELECTs will be explained",
+                        str(e).strip().splitlines()[0])
+            return False
+        finally:
+            cursor.close()
+
+    def _capture_plan(self, profiler: Profiler, statement: str, query, seconds: float) -> None:
+        """Take the plan of a slow statement from auto_explain, or EXPLAIN a SELECT."""
+        if self._auto_explain:
+            while self.notices:
+                notice = self.notices.popleft()
+                brace = notice.find("{")
+                if "plan:" not in notice or brace < 0:
+                    continue
+                try:
+                    plan = json.loads(notice[brace:])
+                except ValueError:
+                    continue
+                profiler.record_plan(statement, seconds * 1000, plan, "auto_explain")
+            return
+        if query is None or not _is_select(statement):
+            return
+        if self.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_INERROR:
+            return
+        if isinstance(query, bytes):
+            query = query.decode("utf-8", "replace")
+        savepoint = not self.autocommit
+        cursor = psycopg2.extensions.cursor(self)
+        try:
+            with profiler.span("explain", "explain", statement=statement):
+                if savepoint:
+                    cursor.execute("SAVEPOINT _profile_explain")
+                # The bound query is sent as-is (no parameters, so % is not a placeholder)
+                options = "ANALYZE, BUFFERS, FORMAT JSON" if profiler.explain_analyze else "FORMAT JSON"
+                cursor.execute(f"EXPLAIN ({options}) " + query)
+                plan = cursor.fetchone()[0]
+                if savepoint:
+                    cursor.execute("RELEASE SAVEPOINT _profile_explain")
+            profiler.record_plan(statement, seconds * 1000, plan,
+                                 "explain_analyze" if profiler.explain_analyze else "explain")
+        except psycopg2.Error as e:
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT _profile_explain")
+            logger.debug("Could not explain %s: %s", statement[:80], e)
+        finally:
+            cursor.close()
+
+    def commit(self):
+        with span("commit", "commit"):
+            return super().commit()
+
+    def rollback(self):
+        with span("rollback", "commit"):
+            return super().rollback()
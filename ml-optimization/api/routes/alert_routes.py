@@ -12,11 +12,14 @@ import json
 import logging
 from functools import lru_cache
 from pathlib import Path
+import numpy as np
+import pandas as pd
 from ml_optimization.utils.db_utils import get_db_connection
 from psycopg2 import sql
 from psycopg2.extras import RealDictCursor, Json, execute_batch
 
 from models.anomaly_detector import QueryAnomalyDetector
+from models.fast_inference import attach_compiled
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -44,6 +47,7 @@ def _load_anomaly_detector() -> Optional[QueryAnomalyDetector]:
         return None
     detector = QueryAnomalyDetector()
     detector.load_model(str(anomaly_path))
+    attach_compiled(detector, anomaly_path)
     return detector
 
 
@@ -94,22 +98,17 @@ def _detect_model_anomalies(
     cursor.close()
 
     anomalies: List[Dict[str, Any]] = []
-    for row in rows:
+    if not rows:
+        return anomalies
+    is_anom, anomaly_scores, reasons = detector.detect_anomalies_batch(pd.DataFrame(rows))
+    for i in np.flatnonzero(is_anom):
+        row = rows[i]
+        anomaly_score = anomaly_scores[i]
+        reason = reasons[i]
         query_text = str(row.get("query_text") or "")
         query_upper = query_text.upper()
         table_hint = _extract_table_hints(query_upper)
 
-        metrics = {
-            "mean_exec_time_ms": float(row.get("mean_exec_time_ms", 0) or 0),
-            "calls": float(row.get("calls", 0) or 0),
-            "rows_affected": float(row.get("rows_affected", 0) or 0),
-            "shared_blks_hit": float(row.get("shared_blks_hit", 0) or 0),
-            "shared_blks_read": float(row.get("shared_blks_read", 0) or 0),
-        }
-        is_anom, anomaly_score, reason = detector.detect_anomaly(metrics)
-        if not is_anom:
-            continue
-
         # In IsolationForest, score_samples is typically "more normal" for higher values.
         # We negate it so bigger => more severe.
         severity_strength = max(0.0, -float(anomaly_score or 0.0))
@@ -70,6 +70,42 @@ def _hours_since_reference(last_updated) -> Optional[float]:
     return None
 
 
+def _estimated_row_counts(cursor, schema: str) -> dict:
+    """Table name -> estimated row count for one schema, from planner statistics.
+
+    Reads pg_class.reltuples (n_live_tup for tables never analyzed; partitioned tables sum
+    their partitions) in one catalog query instead of a COUNT(*) per table. Tables without
+    any statistics map to None.
+    """
+    cursor.execute(
+        """
+        SELECT
+            c.relname AS table_name,
+            COALESCE(
+                (
+                    SELECT SUM(CASE WHEN p.reltuples >= 0 THEN p.reltuples::bigint
+                                    ELSE COALESCE(ps.n_live_tup, 0) END)
+                    FROM pg_inherits i
+                    JOIN pg_class p ON p.oid = i.inhrelid
+                    LEFT JOIN pg_stat_user_tables ps ON ps.relid = p.oid
+                    WHERE i.inhparent = c.oid AND c.relkind = 'p'
+                ),
+                CASE WHEN c.reltuples >= 0 THEN c.reltuples::bigint END,
+                s.n_live_tup
+            ) AS estimated_rows
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+        WHERE n.nspname = %s AND c.relkind IN ('r', 'p') AND NOT c.relispartition
+        """,
+        (schema,),
+    )
+    return {
+        row.get("table_name"): (int(row["estimated_rows"]) if row.get("estimated_rows") is not None else None)
+        for row in cursor.fetchall()
+    }
+
+
 class RunETLJobRequest(BaseModel):
     """
     Request payload for manually running an ETL job.
@@ -536,6 +572,7 @@ def _sync_compute_freshness_dict() -> dict:
                 
                 table_names = list(table_names_set)
                 table_freshness = []
+                row_estimates = _estimated_row_counts(cursor, schema) if schema_exists else {}
                 
                 for table_name in table_names:
                     if not table_name:
@@ -585,14 +622,11 @@ def _sync_compute_freshness_dict() -> dict:
 
                             if col_exists:
                                 cursor.execute(f"""
-                                    SELECT MAX({col}) as max_ts, COUNT(*) as row_count
+                                    SELECT MAX({col}) as max_ts
                                     FROM {schema}.{table_name}
                                 """)
                                 result = cursor.fetchone()
                                 if result:
-                                    row_count = int(result.get('row_count', 0) or 0)
-                                    if row_count > 0:
-                                        total_records = row_count
                                     max_ts = result.get('max_ts')
                                     if max_ts:
                                         if latest_column_ts is None:
@@ -610,12 +644,15 @@ def _sync_compute_freshness_dict() -> dict:
                             continue
                     if latest_column_ts is not None:
                         signal_candidates.append(("column", latest_column_ts, latest_column_name))
+                    # Row count: planner estimate, else rows processed by the last ETL run
+                    if row_estimates.get(table_name):
+                        total_records = row_estimates[table_name]
                     
                     # Candidate 3: maintenance/activity from PostgreSQL table stats
                     try:
                         cursor.execute(
                             """
-                            SELECT last_vacuum, last_autovacuum, last_analyze, last_autoanalyze, n_live_tup
+                            SELECT last_vacuum, last_autovacuum, last_analyze, last_autoanalyze
                             FROM pg_stat_user_tables
                             WHERE schemaname = %s AND relname = %s
                             """,
@@ -643,8 +680,6 @@ def _sync_compute_freshness_dict() -> dict:
                                     best = cand
                             if best is not None:
                                 signal_candidates.append(("pg_stat", best, None))
-                            if (not total_records or total_records == 0) and prow.get("n_live_tup") is not None:
-                                total_records = int(prow.get("n_live_tup") or 0)
                     except Exception as stat_err:
                         logger.debug(
                             "pg_stat_user_tables fallback failed for %s.%s: %s",
@@ -672,18 +707,8 @@ def _sync_compute_freshness_dict() -> dict:
                             source_column = chosen_col
                             last_updated = chosen_ts
                     
-                    # If still no timestamp found, we can still compute row_count for display,
-                    # but freshness must be marked as "unknown" (no invented timestamps).
-                    # If we still don't know when the table was last updated, do NOT invent a timestamp.
-                    # We may still compute `total_records`, but status becomes "unknown".
-                    if not last_updated:
-                        try:
-                            cursor.execute(f"SELECT COUNT(*) as row_count FROM {schema}.{table_name}")
-                            result = cursor.fetchone()
-                            if result:
-                                total_records = int(result.get('row_count', 0) or 0)
-                        except Exception:
-                            total_records = 0
+                    # If we still don't know when the table was last updated, do NOT invent a timestamp;
+                    # `total_records` is still reported, but status becomes "unknown".
                     
                     # Calculate hours ago (UTC-normalized; avoids naive/aware subtraction errors)
                     hours_ago = _hours_since_reference(last_updated)
@@ -738,7 +763,7 @@ def _sync_compute_freshness_dict() -> dict:
                         )
                     else:
                         reason_lines.append(
-                            f"{qn}: No usable timestamp — cannot measure age. Row count uses COUNT(*) or n_live_tup."
+                            f"{qn}: No usable timestamp — cannot measure age. Row count is the planner estimate (pg_class.reltuples)."
                         )
 
                     if hours_ago is not None:
@@ -991,9 +1016,10 @@ def _sync_fetch_etl_errors_dict() -> dict:
                 for table in all_tables[:5]:
                     tablename = table.get("table_name")
                     try:
-                        cursor.execute(f"SELECT COUNT(*) as cnt FROM {schema}.{tablename}")
+                        # Emptiness needs one row, not a count of all of them
+                        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {schema}.{tablename}) AS has_rows")
                         result = cursor.fetchone()
-                        row_count = result.get("cnt", 0) if result else 0
+                        has_rows = bool(result.get("has_rows")) if result else False
 
                         cursor.execute(
                             """
@@ -1006,7 +1032,7 @@ def _sync_fetch_etl_errors_dict() -> dict:
                         job_result = cursor.fetchone()
                         has_completed_jobs = (job_result.get("job_count", 0) or 0) > 0 if job_result else False
 
-                        if has_completed_jobs and row_count == 0:
+                        if has_completed_jobs and not has_rows:
                             errors.append(
                                 {
                                     "error_id": f"{schema}_{tablename}_empty",
@@ -1140,6 +1166,59 @@ def _sync_fetch_throughput_dict() -> dict:
         }
 
 
+def _sync_fetch_etl_pending_dict() -> dict:
+    """Core implementation for GET /etl/pending (own DB connection).
+
+    Reads the pending-row estimates the ETL stores on its latest pipeline run
+    (``metadata.pending``); never counts bronze or silver rows itself.
+    """
+    with get_db_connection() as conn:
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        cursor.execute("""
+            SELECT
+                jr.run_id,
+                jr.status,
+                jr.progress,
+                jr.started_at,
+                jr.updated_at,
+                jr.metadata->'pending' AS pending
+            FROM monitoring.job_runs jr
+            JOIN monitoring.etl_jobs j ON jr.job_id = j.job_id
+            WHERE j.job_name = 'Complete ETL Pipeline'
+            ORDER BY jr.started_at DESC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+
+    if not row:
+        return {"run_id": None, "steps": [], "timestamp": datetime.now().isoformat()}
+
+    pending = row.get("pending") if isinstance(row.get("pending"), dict) else {}
+    steps = [
+        {
+            "step": step,
+            "rows": est.get("rows"),
+            "remaining": est.get("remaining"),
+            "exact": bool(est.get("exact")),
+            "since": est.get("since"),
+        }
+        for step, est in pending.items()
+        if isinstance(est, dict)
+    ]
+    started_at = row.get("started_at")
+    updated_at = row.get("updated_at")
+    return {
+        "run_id": row.get("run_id"),
+        "status": row.get("status"),
+        "progress": int(row.get("progress") or 0),
+        "started_at": started_at.isoformat() if started_at else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "steps": steps,
+        "total_remaining": sum(s["remaining"] or 0 for s in steps),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
 @router.get("/etl/errors")
 def get_etl_errors():
     """Get error and retry tracking information from ETL jobs."""
@@ -1160,13 +1239,24 @@ def get_throughput_metrics():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/etl/pending")
+def get_etl_pending():
+    """Get per-step pending rows of the latest pipeline run (exact or estimated, no table scans)."""
+    try:
+        return _sync_fetch_etl_pending_dict()
+    except Exception as e:
+        logger.error(f"Error in get_etl_pending: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/etl/dashboard-bundle")
 async def get_etl_dashboard_bundle(
     refresh: bool = Query(False, description="Bypass short-lived response cache"),
 ):
     """
     Single request for the ETL Monitoring dashboard core payload.
-    Runs jobs, job-definitions, errors, and throughput in parallel (each uses its own DB connection).
+    Runs jobs, job-definitions, errors, throughput and pending in parallel (each uses its own DB
+    connection); pending is the latest run's stored estimates, as served by /etl/pending.
     The SPA should still call /etl/freshness and /data-quality in parallel with this route.
     """
     if not refresh:
@@ -1183,11 +1273,12 @@ async def get_etl_dashboard_bundle(
             return None
 
     pipeline = _build_pipeline_dag_dict()
-    jobs_raw, defs_raw, err_raw, thr_raw = await asyncio.gather(
+    jobs_raw, defs_raw, err_raw, thr_raw, pending_raw = await asyncio.gather(
         _safe("jobs", _sync_fetch_etl_jobs_dict),
         _safe("job_definitions", _sync_fetch_etl_job_definitions_dict),
         _safe("errors", _sync_fetch_etl_errors_dict),
         _safe("throughput", _sync_fetch_throughput_dict),
+        _safe("pending", _sync_fetch_etl_pending_dict),
     )
 
     frt = 0
@@ -1203,6 +1294,7 @@ async def get_etl_dashboard_bundle(
         "errors": (err_raw or {}).get("errors", []) if isinstance(err_raw, dict) else [],
         "failedRunsTotal": frt,
         "throughput": thr_raw if isinstance(thr_raw, dict) else None,
+        "pending": pending_raw if isinstance(pending_raw, dict) else None,
     }
     _monitoring_cache_set("etl/dashboard-bundle", out)
     return out
@@ -1230,11 +1322,12 @@ async def get_etl_monitoring_page(
             return None
 
     pipeline = _build_pipeline_dag_dict()
-    jobs_raw, defs_raw, err_raw, thr_raw = await asyncio.gather(
+    jobs_raw, defs_raw, err_raw, thr_raw, pending_raw = await asyncio.gather(
         _safe("jobs", _sync_fetch_etl_jobs_dict),
         _safe("job_definitions", _sync_fetch_etl_job_definitions_dict),
         _safe("errors", _sync_fetch_etl_errors_dict),
         _safe("throughput", _sync_fetch_throughput_dict),
+        _safe("pending", _sync_fetch_etl_pending_dict),
     )
 
     def fetch_fresh():
@@ -1273,6 +1366,7 @@ async def get_etl_monitoring_page(
         "errors": (err_raw or {}).get("errors", []) if isinstance(err_raw, dict) else [],
         "failedRunsTotal": frt,
         "throughput": thr_raw if isinstance(thr_raw, dict) else None,
+        "pending": pending_raw if isinstance(pending_raw, dict) else None,
         "freshness": fresh_raw if isinstance(fresh_raw, dict) else {},
         "dataQuality": dq_raw if isinstance(dq_raw, dict) else {},
     }
@@ -1373,26 +1467,19 @@ def _sync_compute_data_quality_dict() -> dict:
                     table_names = [row.get('table_name') for row in cursor.fetchall()]
                 
                 table_metrics = []
+                row_estimates = _estimated_row_counts(cursor, schema)
                 
                 for table_name in table_names:
                     if not table_name:
                         continue
                         
-                    row_count = 0
+                    row_count = row_estimates.get(table_name) or 0
                     dead_rows = 0
                     quality_score = 0.0
                     base_quality_score = None
                     
                     # Try to get table statistics
                     try:
-                        cursor.execute(f"""
-                            SELECT 
-                                COUNT(*) as row_count
-                            FROM {schema}.{table_name}
-                        """)
-                        result = cursor.fetchone()
-                        row_count = int(result.get('row_count', 0) or 0) if result else 0
-                        
                         # Try to get dead tuples from pg_stat_user_tables (column is relname, not tablename)
                         cursor.execute("""
                             SELECT 
@@ -1525,7 +1612,7 @@ def _sync_compute_data_quality_dict() -> dict:
                         0,
                         (
                             f"{schema}.{table_name}: score {qs_rounded:.2f} ({status_label}) — "
-                            f"{row_count:,} rows counted; {dead_rows:,} dead tuples (pg_stat) for this table."
+                            f"~{row_count:,} rows (planner estimate); {dead_rows:,} dead tuples (pg_stat) for this table."
                         ),
                     )
 
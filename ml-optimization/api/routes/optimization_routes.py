@@ -29,6 +29,7 @@ from models.query_time_predictor import QueryTimePredictor
 from models.anomaly_detector import QueryAnomalyDetector
 from models.workload_clustering import WorkloadClusterer
 from models.cache_predictor import CachePredictor
+from models.fast_inference import attach_compiled
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -602,6 +603,7 @@ def _load_trained_models() -> Dict[str, Any]:
         try:
             predictor = QueryTimePredictor()
             predictor.load_model(str(predictor_path))
+            attach_compiled(predictor, predictor_path)
             loaded["predictor"] = predictor
         except Exception as e:
             logger.warning("Failed to load QueryTimePredictor: %s", e)
@@ -616,6 +618,7 @@ def _load_trained_models() -> Dict[str, Any]:
         try:
             detector = QueryAnomalyDetector()
             detector.load_model(str(anomaly_path))
+            attach_compiled(detector, anomaly_path)
             loaded["anomaly_detector"] = detector
         except Exception as e:
             logger.warning("Failed to load QueryAnomalyDetector: %s", e)
@@ -634,6 +637,7 @@ def _load_trained_models() -> Dict[str, Any]:
         try:
             cp = CachePredictor()
             cp.load_model(str(cache_path))
+            attach_compiled(cp, cache_path)
             loaded["cache_predictor"] = cp
         except Exception as e:
             logger.warning("Failed to load CachePredictor: %s", e)
@@ -1612,12 +1616,20 @@ def _generate_model_based_recommendations(
     predicted_ms: Optional[np.ndarray] = None
     if predictor is not None:
         try:
-            X, _y = predictor.extract_features(predict_df)
-            predicted_ms = predictor.predict(X)
+            predicted_ms = predictor.predict_array(predictor.feature_matrix(predict_df))
         except Exception as ex:
             logger.warning("Query time predictor failed for live recommendations (using latency fallback): %s", ex)
             predicted_ms = None
 
+    # Anomaly scores (batch)
+    anomalies: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    if detector is not None:
+        try:
+            anomalies = detector.detect_anomalies_batch(predict_df)
+        except Exception as ex:
+            logger.warning("Anomaly detector failed for live recommendations: %s", ex)
+            anomalies = None
+
     # Candidate grouping
     # key: (type, table, column)
     groups: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
@@ -1637,21 +1649,11 @@ def _generate_model_based_recommendations(
         if not matched_any:
             continue
 
-        # Build model features for anomaly detection lazily (only if needed)
         anom_reason: str = "Model anomaly"
         anomaly_score: Optional[float] = None
-        if detector is not None:
-            metrics = {
-                "mean_exec_time_ms": float(predict_df.iloc[i].get("mean_exec_time_ms", 0) or 0),
-                "calls": float(predict_df.iloc[i].get("calls", 0) or 0),
-                "rows_affected": float(predict_df.iloc[i].get("rows_affected", 0) or 0),
-                "shared_blks_hit": float(predict_df.iloc[i].get("shared_blks_hit", 0) or 0),
-                "shared_blks_read": float(predict_df.iloc[i].get("shared_blks_read", 0) or 0),
-            }
-            is_anom, score, reason = detector.detect_anomaly(metrics)
-            if is_anom:
-                anomaly_score = float(score)
-                anom_reason = reason
+        if anomalies is not None and anomalies[0][i]:
+            anomaly_score = float(anomalies[1][i])
+            anom_reason = anomalies[2][i]
 
         base_actual_ms = float(predict_df.iloc[i].get("mean_exec_time_ms", 0) or 0)
         base_pred_ms = float(predicted_ms[i]) if predicted_ms is not None else base_actual_ms
@@ -1848,23 +1850,13 @@ def _model_score_for_table_column(
     df_logs = pd.DataFrame(rows)
     if predictor is not None:
         try:
-            X, _y = predictor.extract_features(df_logs)
-            predicted_ms = predictor.predict(X)
+            predicted_ms = predictor.predict_array(predictor.feature_matrix(df_logs))
         except Exception:
             predicted_ms = None
 
     if detector is not None:
-        for _, r in df_logs.head(100).iterrows():
-            metrics = {
-                "mean_exec_time_ms": float(r.get("mean_exec_time_ms", 0) or 0),
-                "calls": float(r.get("calls", 0) or 0),
-                "rows_affected": float(r.get("rows_affected", 0) or 0),
-                "shared_blks_hit": float(r.get("shared_blks_hit", 0) or 0),
-                "shared_blks_read": float(r.get("shared_blks_read", 0) or 0),
-            }
-            is_anom, anomaly_score, _reason = detector.detect_anomaly(metrics)
-            if is_anom:
-                severity_strengths.append(max(0.0, -float(anomaly_score or 0.0)))
+        is_anom, anomaly_scores, _reasons = detector.detect_anomalies_batch(df_logs.head(100))
+        severity_strengths = np.maximum(0.0, -anomaly_scores[is_anom]).tolist()
 
     severity_mean = float(np.mean(severity_strengths)) if severity_strengths else 0.0
     pred_avg_ms = float(np.mean(np.maximum(predicted_ms, 0))) if predicted_ms is not None else None
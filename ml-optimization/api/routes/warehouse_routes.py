@@ -4,6 +4,7 @@ API routes for accessing data warehouse information.
 """
 
 import asyncio
+import os
 import re
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
@@ -16,6 +17,91 @@ router = APIRouter()
 # Safe table/schema name pattern (alphanumeric and underscore only)
 SAFE_IDENT = re.compile(r"^[a-zA-Z0-9_]+$")
 
+# Serve dashboard stats from the gold materialized views (etl/aggregators/serving_views.py)
+# unless a request says otherwise via ?from_view=
+SERVE_FROM_VIEWS = os.getenv("WAREHOUSE_SERVE_FROM_VIEWS", "false").lower() in ("1", "true", "yes")
+
+# Trailing windows precomputed in gold.mv_top_products; keep in sync with TOP_PRODUCT_WINDOWS
+# in etl/aggregators/serving_views.py (the API image does not ship the etl package)
+TOP_PRODUCT_VIEW_WINDOWS = frozenset((0, 7, 30, 90, 365))
+
+
+def _tables_source() -> dict:
+    """``source`` of a response computed from the gold tables (same keys as _view_status)."""
+    return {"kind": "tables", "view": None, "refreshed_at": None, "age_seconds": None}
+
+
+def _view_status(conn, view: str) -> Optional[dict]:
+    """Refresh status of a populated gold serving view, or None when it cannot be read."""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT ispopulated FROM pg_matviews WHERE schemaname = 'gold' AND matviewname = %s",
+            (view,),
+        )
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            return None
+        status = {"kind": "view", "view": f"gold.{view}", "refreshed_at": None, "age_seconds": None}
+        try:
+            cursor.execute(
+                """
+                SELECT refreshed_at, EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - refreshed_at))
+                FROM monitoring.serving_view_refresh
+                WHERE view_name = %s
+                """,
+                (view,),
+            )
+            refresh = cursor.fetchone()
+        except Exception:
+            conn.rollback()
+            refresh = None
+    if refresh and refresh[0] is not None:
+        status["refreshed_at"] = refresh[0].isoformat()
+        status["age_seconds"] = round(float(refresh[1]), 1)
+    return status
+
+
+def _fetch_serving_views(conn) -> dict:
+    """Body of GET /warehouse/serving-views: every gold serving view and its staleness."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT to_regclass('monitoring.serving_view_refresh') IS NOT NULL")
+    if not cursor.fetchone()[0]:
+        # No refresh has run yet (the ETL creates the table)
+        cursor.execute(
+            "SELECT matviewname, ispopulated FROM pg_matviews WHERE schemaname = 'gold' ORDER BY 1"
+        )
+        views = [
+            {"view": f"gold.{row[0]}", "populated": bool(row[1]), "refreshed_at": None}
+            for row in cursor.fetchall()
+        ]
+        return {"views": views, "serve_from_views": SERVE_FROM_VIEWS}
+    cursor.execute(
+        """
+        SELECT m.matviewname, m.ispopulated, r.refreshed_at,
+               EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - r.refreshed_at)),
+               r.refresh_seconds, r.row_count, r.concurrent, r.last_error, r.last_attempt_at
+        FROM pg_matviews m
+        LEFT JOIN monitoring.serving_view_refresh r ON r.view_name = m.matviewname
+        WHERE m.schemaname = 'gold'
+        ORDER BY m.matviewname
+        """
+    )
+    views = [
+        {
+            "view": f"gold.{row[0]}",
+            "populated": bool(row[1]),
+            "refreshed_at": row[2].isoformat() if row[2] else None,
+            "age_seconds": round(float(row[3]), 1) if row[3] is not None else None,
+            "refresh_seconds": float(row[4]) if row[4] is not None else None,
+            "row_count": row[5],
+            "concurrent": row[6],
+            "last_error": row[7],
+            "last_attempt_at": row[8].isoformat() if row[8] else None,
+        }
+        for row in cursor.fetchall()
+    ]
+    return {"views": views, "serve_from_views": SERVE_FROM_VIEWS}
+
 
 def _fetch_warehouse_summary(conn) -> dict:
     """Body of GET /warehouse/summary using an existing connection."""
@@ -87,12 +173,19 @@ def _fetch_warehouse_summary(conn) -> dict:
     return {"warehouse_summary": summary, "database": db_name}
 
 
-def _fetch_sales_stats(conn, daily_lookback_days: int = 60) -> dict:
+def _fetch_sales_stats(conn, daily_lookback_days: int = 60, from_view: bool = False) -> dict:
     """Body of GET /warehouse/sales-stats using an existing connection.
 
     `daily_lookback_days` <= 0 means no date filter (all daily buckets in fact_sales).
-    Totals (total_sales) are always all-time.
+    Totals (total_sales) are always all-time. With `from_view`, the stats are read from
+    gold.mv_daily_sales_by_category / gold.mv_top_products when they are populated.
     """
+    if from_view:
+        status = _view_status(conn, "mv_daily_sales_by_category")
+        if status and _view_status(conn, "mv_top_products"):
+            stats = _fetch_sales_stats_from_views(conn, daily_lookback_days)
+            stats["source"] = status
+            return stats
     cursor = conn.cursor()
     stats: dict = {}
     cursor.execute(
@@ -174,11 +267,129 @@ def _fetch_sales_stats(conn, daily_lookback_days: int = 60) -> dict:
         }
         for row in cursor.fetchall()
     ]
+    stats["source"] = _tables_source()
     return stats
 
 
-def _fetch_customer_stats(conn) -> dict:
-    """Body of GET /warehouse/customer-stats using an existing connection."""
+def _daily_key_bounds(daily_lookback_days: int):
+    """(lower, upper) order_date_key bounds of the daily_sales series; lower None = no limit."""
+    today_key = int(date.today().strftime("%Y%m%d"))
+    if daily_lookback_days > 0:
+        threshold_date = date.today() - timedelta(days=int(daily_lookback_days))
+        return int(threshold_date.strftime("%Y%m%d")), today_key
+    return None, today_key
+
+
+def _fetch_sales_stats_from_views(conn, daily_lookback_days: int) -> dict:
+    """Sales stats from the serving views; same shape as the base-table queries."""
+    cursor = conn.cursor()
+    stats: dict = {}
+    cursor.execute(
+        """
+        SELECT SUM(sales_count), SUM(revenue),
+               SUM(revenue) / NULLIF(SUM(priced_count), 0), SUM(quantity)
+        FROM gold.mv_daily_sales_by_category
+        """
+    )
+    row = cursor.fetchone()
+    stats["total_sales"] = {
+        "count": int(row[0] or 0),
+        "revenue": float(row[1] or 0),
+        "avg_sale": float(row[2] or 0),
+        "total_quantity": int(row[3] or 0),
+    }
+    lower_key, upper_key = _daily_key_bounds(daily_lookback_days)
+    cursor.execute(
+        """
+        SELECT
+            TO_CHAR(TO_DATE(order_date_key::text, 'YYYYMMDD'), 'YYYY-MM-DD') as date,
+            SUM(sales_count) as sales_count,
+            SUM(revenue) as revenue
+        FROM gold.mv_daily_sales_by_category
+        WHERE (%s::int IS NULL OR order_date_key >= %s) AND order_date_key <= %s
+        GROUP BY order_date_key
+        ORDER BY order_date_key DESC
+        """,
+        (lower_key, lower_key, upper_key),
+    )
+    stats["daily_sales"] = [
+        {
+            "date": str(row[0]) if row[0] is not None else "",
+            "count": int(row[1] or 0),
+            "revenue": float(row[2] or 0),
+        }
+        for row in cursor.fetchall()
+    ]
+    stats["daily_sales_lookback_days"] = daily_lookback_days if daily_lookback_days and daily_lookback_days > 0 else 0
+    stats["top_products"] = _top_products_from_view(conn, 20, 0)
+    return stats
+
+
+def _top_products_from_view(conn, limit: int, window_days: int) -> list:
+    """Top products by revenue for one precomputed window of gold.mv_top_products."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT product_name, sales_count, revenue, quantity
+        FROM gold.mv_top_products
+        WHERE window_days = %s
+        ORDER BY revenue DESC NULLS LAST
+        LIMIT %s
+        """,
+        (window_days, limit),
+    )
+    return [
+        {
+            "product": row[0],
+            "sales_count": row[1],
+            "revenue": float(row[2] or 0),
+            "quantity": row[3] or 0,
+        }
+        for row in cursor.fetchall()
+    ]
+
+
+def _top_products_from_tables(conn, limit: int, window_days: int) -> list:
+    """Top products by revenue over the trailing `window_days` of gold.fact_sales (0 = all time)."""
+    cursor = conn.cursor()
+    lower_key = (
+        int((date.today() - timedelta(days=window_days)).strftime("%Y%m%d"))
+        if window_days > 0 else None
+    )
+    cursor.execute("""
+        SELECT
+            COALESCE(p.product_name, 'Unknown') as product_name,
+            COUNT(*) as sales_count,
+            SUM(fs.net_amount) as revenue,
+            SUM(fs.quantity) as quantity_sold
+        FROM gold.fact_sales fs
+        LEFT JOIN gold.dim_product p ON fs.product_key = p.product_key
+        WHERE %s::int IS NULL OR fs.order_date_key >= %s
+        GROUP BY p.product_name
+        ORDER BY SUM(fs.net_amount) DESC NULLS LAST
+        LIMIT %s
+    """, (lower_key, lower_key, limit))
+    return [
+        {
+            "product": row[0],
+            "sales_count": row[1],
+            "revenue": float(row[2] or 0),
+            "quantity": row[3] or 0
+        }
+        for row in cursor.fetchall()
+    ]
+
+
+def _fetch_customer_stats(conn, from_view: bool = False) -> dict:
+    """Body of GET /warehouse/customer-stats using an existing connection.
+
+    With `from_view`, totals come from gold.mv_customer_tiers (when populated) and a
+    per-tier breakdown is added.
+    """
+    if from_view:
+        status = _view_status(conn, "mv_customer_tiers")
+        if status:
+            return _fetch_customer_stats_from_view(conn, status)
     cursor = conn.cursor()
     stats: dict = {}
     cursor.execute("SELECT COUNT(*) FROM gold.dim_customer")
@@ -198,9 +409,42 @@ def _fetch_customer_stats(conn) -> dict:
         "total_orders": row[1] or 0,
         "total_revenue": float(row[2] or 0),
     }
+    stats["source"] = _tables_source()
     return stats
 
 
+def _fetch_customer_stats_from_view(conn, status: dict) -> dict:
+    """Customer stats summed over gold.mv_customer_tiers, with the per-tier rows."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT lifetime_value_tier, customer_count, ordering_customers, total_orders, total_revenue
+        FROM gold.mv_customer_tiers
+        ORDER BY customer_count DESC
+        """
+    )
+    tiers = [
+        {
+            "tier": row[0],
+            "customers": int(row[1] or 0),
+            "ordering_customers": int(row[2] or 0),
+            "orders": int(row[3] or 0),
+            "revenue": float(row[4] or 0),
+        }
+        for row in cursor.fetchall()
+    ]
+    return {
+        "total_customers": sum(t["customers"] for t in tiers),
+        "orders": {
+            "unique_customers": sum(t["ordering_customers"] for t in tiers),
+            "total_orders": sum(t["orders"] for t in tiers),
+            "total_revenue": sum(t["revenue"] for t in tiers),
+        },
+        "tiers": tiers,
+        "source": status,
+    }
+
+
 def _fetch_home_health(conn) -> dict:
     """Lightweight health payload for the home dashboard (one DB round-trip)."""
     cursor = conn.cursor()
@@ -413,8 +657,8 @@ async def get_home_dashboard():
     def _build_sync() -> dict:
         with get_db_connection() as conn:
             summary = _fetch_warehouse_summary(conn)
-            sales = _fetch_sales_stats(conn)
-            customers = _fetch_customer_stats(conn)
+            sales = _fetch_sales_stats(conn, from_view=SERVE_FROM_VIEWS)
+            customers = _fetch_customer_stats(conn, from_view=SERVE_FROM_VIEWS)
             alerts = build_active_alerts_payload(conn)
             health = _fetch_home_health(conn)
             return {
@@ -493,11 +737,19 @@ def get_sales_statistics(
         le=5000,
         description="Days of daily_sales history; 0 = all dates in fact_sales",
     ),
+    from_view: Optional[bool] = Query(
+        None,
+        description="Read from the gold serving views (default: WAREHOUSE_SERVE_FROM_VIEWS)",
+    ),
 ):
     """Get sales statistics from gold layer."""
     try:
         with get_db_connection() as conn:
-            return _fetch_sales_stats(conn, daily_lookback_days=days)
+            return _fetch_sales_stats(
+                conn,
+                daily_lookback_days=days,
+                from_view=SERVE_FROM_VIEWS if from_view is None else from_view,
+            )
     except HTTPException:
         raise
     except Exception as e:
@@ -510,40 +762,32 @@ def get_sales_statistics(
 
 
 @router.get("/top-products")
-def get_top_products(limit: int = 20):
+def get_top_products(
+    limit: int = 20,
+    window_days: int = Query(0, ge=0, le=5000, description="Trailing days of sales; 0 = all time"),
+    from_view: Optional[bool] = Query(
+        None,
+        description="Read from gold.mv_top_products (default: WAREHOUSE_SERVE_FROM_VIEWS)",
+    ),
+):
     """Get top products by revenue."""
+    use_view = SERVE_FROM_VIEWS if from_view is None else from_view
     try:
         with get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Top products by revenue
-            cursor.execute("""
-                SELECT 
-                    COALESCE(p.product_name, 'Unknown') as product_name,
-                    COUNT(*) as sales_count,
-                    SUM(fs.net_amount) as revenue,
-                    SUM(fs.quantity) as quantity_sold
-                FROM gold.fact_sales fs
-                LEFT JOIN gold.dim_product p ON fs.product_key = p.product_key
-                GROUP BY p.product_name
-                ORDER BY SUM(fs.net_amount) DESC NULLS LAST
-                LIMIT %s
-            """, (limit,))
-            
-            top_products = [
-                {
-                    "product": row[0],
-                    "sales_count": row[1],
-                    "revenue": float(row[2] or 0),
-                    "quantity": row[3] or 0
-                }
-                for row in cursor.fetchall()
-            ]
+            status = None
+            if use_view and window_days in TOP_PRODUCT_VIEW_WINDOWS:
+                status = _view_status(conn, "mv_top_products")
+            if status:
+                top_products = _top_products_from_view(conn, limit, window_days)
+            else:
+                top_products = _top_products_from_tables(conn, limit, window_days)
             
             return {
                 "products": top_products,
                 "count": len(top_products),
-                "limit": limit
+                "limit": limit,
+                "window_days": window_days,
+                "source": status or _tables_source(),
             }
     except Exception as e:
         import traceback
@@ -554,11 +798,18 @@ def get_top_products(limit: int = 20):
 
 
 @router.get("/customer-stats")
-def get_customer_statistics():
+def get_customer_statistics(
+    from_view: Optional[bool] = Query(
+        None,
+        description="Read from gold.mv_customer_tiers (default: WAREHOUSE_SERVE_FROM_VIEWS)",
+    ),
+):
     """Get customer statistics."""
     try:
         with get_db_connection() as conn:
-            return _fetch_customer_stats(conn)
+            return _fetch_customer_stats(
+                conn, from_view=SERVE_FROM_VIEWS if from_view is None else from_view
+            )
     except HTTPException:
         raise
     except Exception as e:
@@ -568,3 +819,13 @@ def get_customer_statistics():
         logger = logging.getLogger(__name__)
         logger.error(f"Error in customer-stats: {str(e)}\n{traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Error fetching customer statistics: {str(e)}")
+
+
+@router.get("/serving-views")
+def get_serving_views():
+    """Gold serving materialized views with their last refresh and staleness."""
+    try:
+        with get_db_connection() as conn:
+            return _fetch_serving_views(conn)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching serving views: {str(e)}")
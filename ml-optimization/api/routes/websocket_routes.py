@@ -10,9 +10,12 @@ import json
 import logging
 from datetime import datetime, timezone
 import os
+import select
+import threading
 import time
+import psycopg2
 from psycopg2.extras import RealDictCursor
-from ml_optimization.utils.db_utils import get_db_connection
+from ml_optimization.utils.db_utils import get_db_connection, get_db_connection_string
 from concurrent.futures import ThreadPoolExecutor
 
 router = APIRouter()
@@ -302,6 +305,117 @@ async def websocket_optimization_stream(websocket: WebSocket):
             pass
         optimization_manager.disconnect(websocket)
 
+# LISTEN channel the ETL's buffered progress reporter publishes on
+# (ml_optimization/utils/progress_reporter.py PROGRESS_CHANNEL)
+ETL_PROGRESS_CHANNEL = "etl_progress"
+
+# Runs with no progress message for this long are dropped from the live view: a killed ETL
+# process never publishes its terminal state (see progress_reporter.py, "Durability")
+ETL_PROGRESS_STALE_SEC = float(os.getenv("ETL_PROGRESS_STALE_SEC", "600"))
+
+
+class LiveProgressListener:
+    """Keep the latest progress of running ETL runs in memory from NOTIFY messages."""
+
+    def __init__(self, channel: str = ETL_PROGRESS_CHANNEL, stale_after: float = ETL_PROGRESS_STALE_SEC):
+        self.channel = channel
+        self.stale_after = stale_after
+        self.runs: dict = {}
+        # run_id -> time.monotonic() of its last message (the publisher's clock is not ours)
+        self.last_seen: dict = {}
+        self.version = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self) -> None:
+        """Start the listener thread once (lazily, on the first progress subscriber)."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._listen_forever, name="etl-progress-listen", daemon=True)
+                self._thread.start()
+
+    def snapshot(self) -> tuple:
+        with self._lock:
+            self._evict_stale()
+            return self.version, {k: dict(v) for k, v in self.runs.items()}
+
+    def _evict_stale(self) -> None:
+        """Drop runs that stopped publishing; called with the lock held."""
+        cutoff = time.monotonic() - self.stale_after
+        stale = [run_id for run_id, seen in self.last_seen.items() if seen < cutoff]
+        for run_id in stale:
+            self.runs.pop(run_id, None)
+            del self.last_seen[run_id]
+        if stale:
+            self.version += 1
+
+    def _apply(self, payload: str) -> None:
+        try:
+            state = json.loads(payload)
+        except ValueError:
+            return
+        run_id = state.get("run_id")
+        if not run_id:
+            return
+        with self._lock:
+            if state.get("status", "running") == "running":
+                self.runs.setdefault(run_id, {}).update(state)
+                self.last_seen[run_id] = time.monotonic()
+            else:
+                self.runs.pop(run_id, None)
+                self.last_seen.pop(run_id, None)
+            self.version += 1
+
+    def _listen_forever(self) -> None:
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(get_db_connection_string())
+                conn.autocommit = True
+                conn.cursor().execute(f"LISTEN {self.channel}")
+                while True:
+                    if select.select([conn], [], [], 30) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._apply(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning(f"ETL progress listener disconnected: {e}; retrying in 5s")
+                time.sleep(5)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+live_progress = LiveProgressListener()
+
+
+@router.websocket("/ws/etl-progress")
+async def websocket_etl_progress(websocket: WebSocket):
+    """Push live ETL run progress as it is published, without querying monitoring.job_runs."""
+    await websocket.accept()
+    live_progress.start()
+    sent_version = -1
+    try:
+        while True:
+            version, runs = live_progress.snapshot()
+            if version != sent_version:
+                await websocket.send_json({
+                    "type": "etl_progress",
+                    "runs": list(runs.values()),
+                    "timestamp": datetime.now().isoformat(),
+                })
+                sent_version = version
+            await asyncio.sleep(0.5)
+    except WebSocketDisconnect:
+        logger.info("ETL progress WebSocket client disconnected")
+    except Exception as e:
+        logger.error(f"ETL progress WebSocket error: {e}", exc_info=True)
+
+
 async def send_etl_jobs_update(websocket: WebSocket):
     """Send current ETL jobs status."""
     import asyncio
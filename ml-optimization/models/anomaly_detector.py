@@ -13,6 +13,7 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ml_optimization.config.model_config import AnomalyDetectorConfig
+from models.fast_inference import CompiledModel, compile_model
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,8 @@ class QueryAnomalyDetector:
         self.model = None
         self.scaler = StandardScaler()
         self.baseline_stats = {}
+        # NumPy-only copy of model + scaler for serving (see load_compiled)
+        self.compiled: Optional[CompiledModel] = None
     
     def train(self, historical_metrics: pd.DataFrame):
         """
@@ -94,6 +97,15 @@ class QueryAnomalyDetector:
         
         return features
     
+    @staticmethod
+    def _feature_vector(metrics: Dict, feature_cols: List[str]) -> np.ndarray:
+        """One metrics dict as a (1, n) row in training column order, like _extract_features."""
+        row = np.array([[float(metrics.get(col) or 0) for col in feature_cols]])
+        if 'mean_exec_time_ms' in feature_cols:
+            i = feature_cols.index('mean_exec_time_ms')
+            row[:, i] = np.log1p(row[:, i])
+        return row
+    
     def detect_anomaly(self, query_metrics: Dict) -> Tuple[bool, float, str]:
         """
         Detect if query metrics indicate an anomaly.
@@ -104,9 +116,15 @@ class QueryAnomalyDetector:
         Returns:
             Tuple of (is_anomaly, anomaly_score, reason)
         """
-        if self.model is None:
+        if self.model is None and self.compiled is None:
             return False, 0.0, "Model not trained"
         
+        if self.compiled is not None and self.compiled.feature_names:
+            features = self._feature_vector(query_metrics, self.compiled.feature_names)
+            anomaly_score = self.compiled.score_samples(features)[0]
+            is_anomaly = anomaly_score - self.compiled.offset < 0
+            return bool(is_anomaly), float(anomaly_score), self._classify_anomaly_type(query_metrics)
+        
         # Extract features
         features_df = pd.DataFrame([query_metrics])
         features = self._extract_features(features_df)
@@ -128,6 +146,69 @@ class QueryAnomalyDetector:
         
         return is_anomaly, float(anomaly_score), reason
     
+    def detect_anomalies_batch(self, query_metrics: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Detect anomalies for many query metrics rows in one call.
+
+        Args:
+            query_metrics: DataFrame with one row per query (same columns as detect_anomaly's dict)
+
+        Returns:
+            Tuple of arrays (is_anomaly, anomaly_score, reason), one entry per row
+        """
+        n = len(query_metrics)
+        if self.model is None and self.compiled is None:
+            return np.zeros(n, dtype=bool), np.zeros(n), np.full(n, "Model not trained", dtype=object)
+
+        if self.compiled is not None and self.compiled.feature_names:
+            feature_cols = list(self.compiled.feature_names)
+        else:
+            feature_cols = list(getattr(self.scaler, 'feature_names_in_', []))
+        if not feature_cols or n == 0:
+            return np.zeros(n, dtype=bool), np.zeros(n), np.full(n, "No features available", dtype=object)
+
+        # Columns in training order; missing columns and NULLs read as 0 like in detect_anomaly
+        features = np.column_stack([
+            self._metric_column(query_metrics, col) for col in feature_cols
+        ])
+        if 'mean_exec_time_ms' in feature_cols:
+            i = feature_cols.index('mean_exec_time_ms')
+            features[:, i] = np.log1p(features[:, i])
+
+        # Compiled model for small batches; the estimator is faster for large ones
+        if self.compiled is not None and self.compiled.feature_names and (
+                self.model is None or self.compiled.serves(n)):
+            anomaly_scores = self.compiled.score_samples(features)
+            offset = self.compiled.offset
+        else:
+            features_scaled = self.scaler.transform(pd.DataFrame(features, columns=feature_cols))
+            anomaly_scores = self.model.score_samples(features_scaled)
+            offset = self.model.offset_
+        # IsolationForest.predict flags rows whose decision_function (score - offset_) is negative
+        is_anomaly = anomaly_scores - offset < 0
+
+        reasons = self._classify_anomaly_types(
+            self._metric_column(query_metrics, 'mean_exec_time_ms'),
+            self._metric_column(query_metrics, 'calls'),
+        )
+        return is_anomaly, anomaly_scores, reasons
+
+    @staticmethod
+    def _metric_column(metrics: pd.DataFrame, col: str) -> np.ndarray:
+        if col not in metrics.columns:
+            return np.zeros(len(metrics))
+        # PostgreSQL NUMERIC comes as Decimal, NULL as None
+        return metrics[col].astype(float).fillna(0).to_numpy()
+
+    @staticmethod
+    def _classify_anomaly_types(exec_time: np.ndarray, calls: np.ndarray) -> np.ndarray:
+        """_classify_anomaly_type over arrays of execution times and call counts."""
+        return np.select(
+            [exec_time > 5000, (exec_time < 1) & (calls > 1000)],
+            ["Execution time spike", "Unusual query pattern"],
+            default="Performance anomaly",
+        ).astype(object)
+
     def _classify_anomaly_type(self, metrics: Dict) -> str:
         """Classify the type of anomaly."""
         exec_time = metrics.get('mean_exec_time_ms', 0)
@@ -160,9 +241,21 @@ class QueryAnomalyDetector:
         joblib.dump(model_data, filepath)
         logger.info(f"Saved anomaly detector to {filepath}")
     
+    def export_compiled(self, filepath: str):
+        """Save model + scaler as a NumPy-only inference artifact (models.fast_inference)."""
+        if self.model is None:
+            raise ValueError("Model must be trained before export")
+        compile_model(self.model, self.scaler).save(filepath)
+    
+    def load_compiled(self, filepath: str):
+        """Score with an artifact written by export_compiled instead of sklearn."""
+        self.compiled = CompiledModel.load(filepath)
+        logger.info(f"Loaded compiled anomaly detector from {filepath}")
+    
     def load_model(self, filepath: str):
         """Load trained model from file."""
         model_data = joblib.load(filepath)
+        self.compiled = None
         self.model = model_data['model']
         self.scaler = model_data['scaler']
         self.baseline_stats = model_data.get('baseline_stats', {})
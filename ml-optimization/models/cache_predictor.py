@@ -16,6 +16,7 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
 
 from ml_optimization.config.model_config import CachePredictorConfig
+from models.fast_inference import CompiledModel, compile_model
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,8 @@ class CachePredictor:
         ]
         self.training_stats: Dict[str, Any] = {}
         self.access_patterns: Dict[str, Dict[str, Any]] = {}
+        # NumPy-only copy of model + scaler for serving (see load_compiled)
+        self.compiled: Optional[CompiledModel] = None
 
     def _aggregate_groups(self, df: pd.DataFrame) -> pd.DataFrame:
         """One row per distinct query_text with telemetry aggregates."""
@@ -193,8 +196,11 @@ class CachePredictor:
         if not self.is_trained or agg is None or len(agg) == 0:
             return np.array([])
         rows = np.vstack([self._features_from_agg_row(row)[0] for _, row in agg.iterrows()])
-        Xs = self.scaler.transform(rows)
-        proba = self.model.predict_proba(Xs)
+        # Compiled model for small batches; the estimator is faster for large ones
+        if self.compiled is not None and (self.model is None or self.compiled.serves(len(rows))):
+            proba = self.compiled.predict_proba(rows)
+        else:
+            proba = self.model.predict_proba(self.scaler.transform(rows))
         # class 1 = cache candidate
         if proba.shape[1] < 2:
             return proba[:, 0]
@@ -315,8 +321,19 @@ class CachePredictor:
         joblib.dump(payload, filepath)
         logger.info("CachePredictor saved to %s", filepath)
 
+    def export_compiled(self, filepath: str) -> None:
+        """Save model + scaler as a NumPy-only inference artifact (models.fast_inference)."""
+        if not self.is_trained:
+            raise ValueError("CachePredictor must be trained before export")
+        compile_model(self.model, self.scaler, self.feature_names).save(filepath)
+
+    def load_compiled(self, filepath: str) -> None:
+        self.compiled = CompiledModel.load(filepath)
+        logger.info("CachePredictor compiled model loaded from %s", filepath)
+
     def load_model(self, filepath: str) -> None:
         data = joblib.load(filepath)
+        self.compiled = None
         self.model = data["model"]
         self.scaler = data["scaler"]
         self.config = data.get("config", CachePredictorConfig())
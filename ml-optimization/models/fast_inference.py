@@ -0,0 +1,406 @@
+"""
+Fast Inference
+NumPy-only evaluation of the trained tree models, for serving without sklearn / XGBoost.
+
+compile_model() flattens a fitted tree ensemble (XGBoost regressor, random forest,
+gradient boosting or isolation forest) and its StandardScaler into plain arrays: one row
+per node across all trees with the split feature, threshold, children and leaf value.
+A CompiledModel evaluates a float32 batch by walking every (row, tree) pair down one level
+per step until all of them sit on a leaf, so a batch costs depth-many vectorized gathers
+and a single row skips the pandas / sklearn input validation around each estimator call.
+That wins for single rows and small batches only: the estimators walk their trees in
+compiled code, so past COMPILED_MAX_ROWS rows the models go back to them (see
+CompiledModel.serves).
+
+Artifacts are saved as .npz files holding only arrays and a JSON header, and are loaded
+with allow_pickle=False. They are an optional sidecar: the joblib bundles stay the source
+of truth and the API falls back to them when no artifact is present.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = 1
+
+# Largest batch served from the compiled model, per kind; bigger batches are faster through the
+# fitted estimator. Crossovers measured with benchmarks/scripts/benchmark_model_inference.py at
+# the model_config defaults (XGBoost regressor ~130 rows, random forest ~1k, isolation forest ~3k).
+COMPILED_MAX_ROWS: Dict[str, int] = {
+    'regressor': 128,
+    'classifier': 1000,
+    'isolation_forest': 2000,
+}
+# Overrides every kind when set (e.g. 0 to always use the estimators)
+COMPILED_MAX_ROWS_OVERRIDE = os.getenv("COMPILED_MODEL_MAX_ROWS")
+
+
+class TreeEnsemble:
+    """
+    Trees of an ensemble stored as flat node arrays, siblings next to each other.
+
+    From node ``i`` a row moves to ``left[i]`` when ``x[feature[i]] <= threshold[i]`` (or x is
+    NaN and ``missing_left[i]``) and to ``left[i] + 1`` otherwise. Leaves point to themselves
+    with an infinite threshold, so walking past a leaf is a no-op and every tree can be walked
+    for ``max_depth`` steps.
+    """
+
+    # Rows walked together; keeps the (trees x rows) index blocks in cache
+    BLOCK_ROWS = 512
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray,
+                 missing_left: np.ndarray, value: np.ndarray, roots: np.ndarray, max_depth: int):
+        self.feature = feature.astype(np.intp)
+        self.threshold = threshold
+        self.left = left.astype(np.intp)
+        self.missing_left = missing_left
+        # (n_nodes, n_outputs) leaf values
+        self.value = value
+        self.roots = roots.astype(np.intp)
+        self.max_depth = max_depth
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @classmethod
+    def from_trees(cls, trees: Sequence[Dict[str, np.ndarray]]) -> "TreeEnsemble":
+        """Build from per-tree node arrays (children as tree-local indices, -1 on leaves)."""
+        parts: Dict[str, List[np.ndarray]] = {k: [] for k in ('feature', 'threshold', 'left',
+                                                             'missing_left', 'value')}
+        roots = []
+        offset = 0
+        max_depth = 0
+        for tree in trees:
+            left, right = np.asarray(tree['left']), np.asarray(tree['right'])
+            # Breadth-first order puts each node's two children in consecutive slots
+            order = [0]
+            for node in order:
+                if left[node] >= 0:
+                    order += [left[node], right[node]]
+            order = np.asarray(order)
+            position = np.empty(len(left), dtype=np.int64)
+            position[order] = np.arange(len(order))
+            leaf = left[order] < 0
+            parts['feature'].append(np.where(leaf, 0, np.asarray(tree['feature'])[order]))
+            parts['threshold'].append(np.where(leaf, np.inf, np.asarray(tree['threshold'], dtype=np.float64)[order]))
+            parts['left'].append(np.where(leaf, np.arange(len(order)), position[left[order]]) + offset)
+            parts['missing_left'].append(np.where(leaf, True, np.asarray(tree['missing_left'], dtype=bool)[order]))
+            parts['value'].append(np.asarray(tree['value'], dtype=np.float64).reshape(len(left), -1)[order])
+            roots.append(offset)
+            offset += len(order)
+            max_depth = max(max_depth, _tree_depth(left, right))
+        return cls(
+            **{k: np.concatenate(v) for k, v in parts.items()},
+            roots=np.asarray(roots),
+            max_depth=max_depth,
+        )
+
+    def leaves(self, X: np.ndarray) -> np.ndarray:
+        """Leaf node index reached by each row in each tree, shape (n_rows, n_trees)."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_rows, n_features = X.shape
+        out = np.empty((n_rows, self.n_trees), dtype=np.intp)
+        has_nan = bool(np.isnan(X).any())
+        for start in range(0, n_rows, self.BLOCK_ROWS):
+            block = X[start:start + self.BLOCK_ROWS]
+            flat = block.ravel()
+            row_base = np.arange(len(block)) * n_features
+            node = np.repeat(self.roots[:, None], len(block), axis=1)
+            for depth in range(self.max_depth):
+                column = self.feature.take(node)
+                column += row_base
+                x = flat.take(column)
+                go_right = x > self.threshold.take(node)
+                if has_nan:
+                    go_right |= np.isnan(x) & ~self.missing_left.take(node)
+                step = self.left.take(node)
+                step += go_right
+                # Deep, unbalanced forests: stop once every row has reached its leaves
+                if depth % 4 == 3 and np.array_equal(step, node):
+                    break
+                node = step
+            out[start:start + len(block)] = node.T
+        return out
+
+
+class CompiledModel:
+    """A StandardScaler plus tree ensemble evaluated with NumPy only."""
+
+    def __init__(self, kind: str, trees: TreeEnsemble, mean: np.ndarray, scale: np.ndarray,
+                 feature_names: Optional[List[str]] = None, base: float = 0.0, tree_weight: float = 1.0,
+                 classes: Optional[np.ndarray] = None, offset: float = 0.0, path_norm: float = 1.0):
+        """
+        Args:
+            kind: 'regressor', 'classifier' or 'isolation_forest'
+            trees: Compiled ensemble
+            mean, scale: StandardScaler parameters (zeros / ones when the scaler skips them)
+            feature_names: Input column order
+            base: Regressor output before any tree (XGBoost base_score, gradient boosting init)
+            tree_weight: Factor applied to the summed tree outputs (learning rate, 1 / n_trees)
+            classes: Classifier labels, in predict_proba column order
+            offset: IsolationForest offset_ (decision_function = score_samples - offset)
+            path_norm: IsolationForest n_trees * average path length of max_samples
+        """
+        self.kind = kind
+        self.trees = trees
+        self.mean = mean
+        self.scale = scale
+        self.feature_names = feature_names or []
+        self.base = base
+        self.tree_weight = tree_weight
+        self.classes = classes
+        self.offset = offset
+        self.path_norm = path_norm
+
+    def serves(self, rows: int) -> bool:
+        """True when a batch of ``rows`` is faster here than through the fitted estimator."""
+        if COMPILED_MAX_ROWS_OVERRIDE is not None:
+            return rows <= int(COMPILED_MAX_ROWS_OVERRIDE)
+        return rows <= COMPILED_MAX_ROWS.get(self.kind, 0)
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Scale like StandardScaler.transform (in the input's float dtype), as float32."""
+        X = np.asarray(X)
+        if X.dtype not in (np.float32, np.float64):
+            X = X.astype(np.float64)
+        X = np.array(X, ndmin=2, copy=True)
+        X -= self.mean.astype(X.dtype)
+        X /= self.scale.astype(X.dtype)
+        return X.astype(np.float32, copy=False)
+
+    def _tree_sum(self, X: np.ndarray) -> np.ndarray:
+        leaves = self.trees.leaves(self.transform(X))
+        return self.trees.value[leaves].sum(axis=1)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        if self.kind == 'regressor':
+            return self.base + self.tree_weight * self._tree_sum(X)[:, 0]
+        if self.kind == 'classifier':
+            return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+        if self.kind == 'isolation_forest':
+            return np.where(self.decision_function(X) >= 0, 1, -1)
+        raise ValueError(f"Unsupported compiled model kind: {self.kind}")
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        if self.kind != 'classifier':
+            raise ValueError("predict_proba needs a compiled classifier")
+        return self._tree_sum(X) * self.tree_weight
+
+    def score_samples(self, X: np.ndarray) -> np.ndarray:
+        """IsolationForest.score_samples: the opposite of the anomaly score."""
+        if self.kind != 'isolation_forest':
+            raise ValueError("score_samples needs a compiled isolation forest")
+        depths = self._tree_sum(X)[:, 0]
+        if self.path_norm == 0:
+            return -np.ones_like(depths)
+        return -(2.0 ** (-depths / self.path_norm))
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        return self.score_samples(X) - self.offset
+
+    def save(self, filepath: str) -> None:
+        header = {
+            'version': ARTIFACT_VERSION,
+            'kind': self.kind,
+            'feature_names': list(self.feature_names),
+            'base': float(self.base),
+            'tree_weight': float(self.tree_weight),
+            'offset': float(self.offset),
+            'path_norm': float(self.path_norm),
+            'max_depth': int(self.trees.max_depth),
+        }
+        arrays = {name: getattr(self.trees, name) for name in
+                  ('feature', 'threshold', 'left', 'missing_left', 'value', 'roots')}
+        if self.classes is not None:
+            arrays['classes'] = np.asarray(self.classes)
+        with open(filepath, 'wb') as fh:
+            np.savez(fh, header=np.array(json.dumps(header)), mean=self.mean, scale=self.scale, **arrays)
+        logger.info("Saved compiled %s (%s trees) to %s", self.kind, self.trees.n_trees, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "CompiledModel":
+        with np.load(filepath, allow_pickle=False) as data:
+            header = json.loads(str(data['header']))
+            if header.get('version') != ARTIFACT_VERSION:
+                raise ValueError(f"Unsupported compiled model version in {filepath}: {header.get('version')}")
+            trees = TreeEnsemble(
+                data['feature'], data['threshold'], data['left'],
+                data['missing_left'], data['value'], data['roots'], header['max_depth'],
+            )
+            return cls(
+                header['kind'], trees, data['mean'], data['scale'],
+                feature_names=header['feature_names'],
+                base=header['base'],
+                tree_weight=header['tree_weight'],
+                classes=data['classes'] if 'classes' in data else None,
+                offset=header['offset'],
+                path_norm=header['path_norm'],
+            )
+
+
+def compiled_path(filepath: str) -> Path:
+    """Artifact path next to a joblib bundle (``model.pkl`` -> ``model.npz``)."""
+    return Path(filepath).with_suffix('.npz')
+
+
+def attach_compiled(model: Any, bundle_path: Path) -> bool:
+    """
+    Point a loaded model at the artifact next to its joblib bundle (model.load_compiled),
+    unless there is none or it is older than the bundle. Failures are logged, not raised.
+    """
+    artifact = compiled_path(str(bundle_path))
+    if not artifact.exists():
+        return False
+    if bundle_path.exists() and artifact.stat().st_mtime < bundle_path.stat().st_mtime:
+        logger.warning("Ignoring %s: older than %s (re-run train_model.py --export-compiled)", artifact, bundle_path)
+        return False
+    try:
+        model.load_compiled(str(artifact))
+    except Exception as e:
+        logger.warning("Failed to load compiled model %s: %s", artifact, e)
+        return False
+    return True
+
+
+def compile_model(model: Any, scaler: Any = None, feature_names: Optional[Sequence[str]] = None) -> CompiledModel:
+    """
+    Compile a fitted estimator and the StandardScaler in front of it.
+
+    Supported: xgboost.XGBRegressor (reg:squarederror), RandomForestRegressor,
+    GradientBoostingRegressor (default init), RandomForestClassifier and IsolationForest.
+    """
+    name = type(model).__name__
+    if name == 'XGBRegressor':
+        compiled = _compile_xgboost(model)
+    elif name == 'RandomForestRegressor':
+        compiled = CompiledModel('regressor', _sklearn_ensemble(model.estimators_), None, None,
+                                 tree_weight=1.0 / len(model.estimators_))
+    elif name == 'GradientBoostingRegressor':
+        compiled = _compile_gradient_boosting(model)
+    elif name == 'RandomForestClassifier':
+        compiled = CompiledModel('classifier', _sklearn_ensemble(model.estimators_, normalize=True), None, None,
+                                 tree_weight=1.0 / len(model.estimators_), classes=np.asarray(model.classes_))
+    elif name == 'IsolationForest':
+        compiled = _compile_isolation_forest(model)
+    else:
+        raise ValueError(f"Cannot compile model of type {name}")
+
+    n_features = int(getattr(model, 'n_features_in_', 0) or (scaler.n_features_in_ if scaler is not None else 0))
+    compiled.mean = np.zeros(n_features)
+    compiled.scale = np.ones(n_features)
+    if scaler is not None:
+        if getattr(scaler, 'mean_', None) is not None:
+            compiled.mean = np.asarray(scaler.mean_, dtype=np.float64)
+        if getattr(scaler, 'scale_', None) is not None:
+            compiled.scale = np.asarray(scaler.scale_, dtype=np.float64)
+    if feature_names is None and scaler is not None and hasattr(scaler, 'feature_names_in_'):
+        feature_names = scaler.feature_names_in_
+    compiled.feature_names = [str(f) for f in feature_names] if feature_names is not None else []
+    return compiled
+
+
+def _node_depths(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    depth = np.zeros(len(left), dtype=np.int64)
+    # Children always come after their parent in sklearn and XGBoost node order
+    for node in range(len(left)):
+        if left[node] >= 0:
+            depth[left[node]] = depth[right[node]] = depth[node] + 1
+    return depth
+
+
+def _tree_depth(left: np.ndarray, right: np.ndarray) -> int:
+    return int(_node_depths(left, right).max()) if len(left) else 0
+
+
+def _sklearn_tree(estimator, normalize: bool = False, feature_map: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    tree = estimator.tree_
+    value = tree.value[:, 0, :] if tree.value.ndim == 3 else tree.value
+    if normalize:
+        totals = value.sum(axis=1, keepdims=True)
+        value = np.divide(value, totals, out=np.zeros_like(value), where=totals > 0)
+    feature = tree.feature
+    if feature_map is not None:
+        feature = np.where(feature >= 0, feature_map[np.maximum(feature, 0)], feature)
+    missing_left = getattr(tree, 'missing_go_to_left', None)
+    return {
+        'feature': feature,
+        'threshold': tree.threshold,
+        'left': tree.children_left,
+        'right': tree.children_right,
+        'missing_left': missing_left if missing_left is not None else np.zeros(tree.node_count, dtype=bool),
+        'value': value,
+    }
+
+
+def _sklearn_ensemble(estimators, normalize: bool = False) -> TreeEnsemble:
+    return TreeEnsemble.from_trees([_sklearn_tree(e, normalize) for e in estimators])
+
+
+def _compile_gradient_boosting(model) -> CompiledModel:
+    init = model.init_
+    if init == 'zero':
+        base = 0.0
+    elif type(init).__name__ == 'DummyRegressor':
+        base = float(np.ravel(init.predict(np.zeros((1, model.n_features_in_))))[0])
+    else:
+        raise ValueError(f"Cannot compile GradientBoostingRegressor with init {type(init).__name__}")
+    trees = _sklearn_ensemble(model.estimators_[:, 0])
+    return CompiledModel('regressor', trees, None, None, base=base, tree_weight=float(model.learning_rate))
+
+
+def _average_path_length(n_samples: np.ndarray) -> np.ndarray:
+    n = np.asarray(n_samples, dtype=np.float64)
+    out = np.zeros_like(n)
+    out[n == 2] = 1.0
+    many = n > 2
+    out[many] = 2.0 * (np.log(n[many] - 1.0) + np.euler_gamma) - 2.0 * (n[many] - 1.0) / n[many]
+    return out
+
+
+def _compile_isolation_forest(model) -> CompiledModel:
+    trees = []
+    n_features = model.n_features_in_
+    for estimator, features in zip(model.estimators_, model.estimators_features_):
+        # Trees see a feature subset only when features were subsampled (see BaseBagging)
+        subset = model.bootstrap_features or len(features) != n_features
+        tree = _sklearn_tree(estimator, feature_map=np.asarray(features) if subset else None)
+        # Leaf value: decision path length plus the expected depth of the rest of the leaf
+        depth = _node_depths(tree['left'], tree['right'])
+        tree['value'] = depth + _average_path_length(estimator.tree_.n_node_samples)
+        trees.append(tree)
+    path_norm = len(model.estimators_) * float(_average_path_length(np.array([model._max_samples]))[0])
+    return CompiledModel('isolation_forest', TreeEnsemble.from_trees(trees), None, None,
+                         offset=float(model.offset_), path_norm=path_norm)
+
+
+def _compile_xgboost(model) -> CompiledModel:
+    booster = model.get_booster()
+    learner = json.loads(booster.save_raw(raw_format='json'))['learner']
+    objective = learner['objective']['name']
+    if objective != 'reg:squarederror':
+        raise ValueError(f"Cannot compile XGBoost objective {objective}")
+    base_score = float(str(learner['learner_model_param']['base_score']).strip('[]'))
+
+    trees = []
+    for tree in learner['gradient_booster']['model']['trees']:
+        left = np.asarray(tree['left_children'], dtype=np.int64)
+        conditions = np.asarray(tree['split_conditions'], dtype=np.float32)
+        # XGBoost goes left when x < condition; on float32 x that is x <= the next float32 below
+        threshold = np.nextafter(conditions, np.float32(-np.inf)).astype(np.float64)
+        trees.append({
+            'feature': np.asarray(tree['split_indices'], dtype=np.int64),
+            'threshold': threshold,
+            'left': left,
+            'right': np.asarray(tree['right_children'], dtype=np.int64),
+            'missing_left': np.asarray(tree['default_left'], dtype=bool),
+            # Leaves keep their value in split_conditions
+            'value': np.where(left < 0, conditions, 0.0).astype(np.float64),
+        })
+    return CompiledModel('regressor', TreeEnsemble.from_trees(trees), None, None, base=base_score)
@@ -16,14 +16,59 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
 import xgboost as xgb
 import joblib
+import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from ml_optimization.config.model_config import QueryTimePredictorConfig
+from models.fast_inference import CompiledModel, compile_model
 
 logger = logging.getLogger(__name__)
 
+# Keys of query_logs.extracted_features used as-is (a missing key reads as 0)
+COUNT_FEATURES = [
+    'table_count', 'join_count', 'has_aggregation',
+    'has_window_function', 'has_subquery', 'has_cte',
+    'filter_predicate_count', 'order_by_count', 'group_by_count',
+]
+# Plan estimates, NULL until a plan is captured; NULL and missing read as 0
+PLAN_FEATURES = ['estimated_rows', 'estimated_cost', 'plan_depth']
+FEATURE_NAMES = COUNT_FEATURES + [
+    'estimated_rows_log', 'estimated_cost_log', 'plan_depth',
+    'calls',
+]
+
+
+def _plan_feature_rows(extracted: List[Any]) -> np.ndarray:
+    """Raw count and plan features for decoded extracted_features dicts (None reads as {})."""
+    rows = [
+        [e.get(k, 0) for k in COUNT_FEATURES] + [e.get(k, 0) or 0 for k in PLAN_FEATURES]
+        if isinstance(e, dict) else [0] * (len(COUNT_FEATURES) + len(PLAN_FEATURES))
+        for e in extracted
+    ]
+    # dtype=float turns a JSON null in a count key into NaN
+    return np.array(rows, dtype=np.float64).reshape(len(rows), len(COUNT_FEATURES) + len(PLAN_FEATURES))
+
+
+def _extracted_feature_matrix(column: pd.Series) -> np.ndarray:
+    """
+    Count and plan feature columns for an extracted_features column.
+    
+    Values are dicts (psycopg2 decodes JSONB) or JSON text. Query logs repeat the same
+    features for every snapshot of a statement, so JSON text is factorized and each distinct
+    value is decoded once, then gathered back to the rows.
+    """
+    values = column.to_numpy(dtype=object)
+    is_text = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    matrix = np.empty((len(values), len(COUNT_FEATURES) + len(PLAN_FEATURES)), dtype=np.float64)
+    if is_text.any():
+        codes, uniques = pd.factorize(values[is_text])
+        matrix[is_text] = _plan_feature_rows([json.loads(u) for u in uniques])[codes]
+    if not is_text.all():
+        matrix[~is_text] = _plan_feature_rows(values[~is_text].tolist())
+    return matrix
+
 
 class QueryTimePredictor:
     """Predicts query execution time based on query features."""
@@ -41,6 +86,8 @@ class QueryTimePredictor:
         self.feature_names = []
         self.feature_importance_ = None
         self.training_metrics: Optional[Dict[str, Any]] = None
+        # NumPy-only copy of model + scaler for serving (see load_compiled)
+        self.compiled: Optional[CompiledModel] = None
     
     def _create_model(self):
         """Create model based on configuration."""
@@ -73,56 +120,48 @@ class QueryTimePredictor:
         else:
             raise ValueError(f"Unsupported model type: {self.config.model_type}")
     
-    def extract_features(self, query_logs: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    def feature_matrix(self, query_logs: pd.DataFrame) -> np.ndarray:
         """
-        Extract features and target from query logs.
+        Feature matrix for query logs, one row per log and one column per FEATURE_NAMES entry.
         
         Args:
             query_logs: DataFrame with query log data
             
         Returns:
-            Tuple of (features DataFrame, target Series)
+            float32 array of shape (len(query_logs), len(FEATURE_NAMES))
         """
-        features = []
-        targets = []
-        
-        for _, row in query_logs.iterrows():
-            # Extract features from extracted_features JSONB
-            extracted = row.get('extracted_features', {})
-            if isinstance(extracted, str):
-                import json
-                extracted = json.loads(extracted)
-            
-            feature_vector = [
-                extracted.get('table_count', 0),
-                extracted.get('join_count', 0),
-                extracted.get('has_aggregation', 0),
-                extracted.get('has_window_function', 0),
-                extracted.get('has_subquery', 0),
-                extracted.get('has_cte', 0),
-                extracted.get('filter_predicate_count', 0),
-                extracted.get('order_by_count', 0),
-                extracted.get('group_by_count', 0),
-                np.log1p(extracted.get('estimated_rows', 0) or 0),
-                np.log1p(extracted.get('estimated_cost', 0) or 0),
-                extracted.get('plan_depth', 0) or 0,
-                row.get('calls', 0),
-            ]
-            
-            features.append(feature_vector)
-            targets.append(row.get('mean_exec_time_ms', 0))
+        n = len(query_logs)
+        if 'extracted_features' in query_logs.columns:
+            extracted = _extracted_feature_matrix(query_logs['extracted_features'])
+        else:
+            extracted = np.zeros((n, len(COUNT_FEATURES) + len(PLAN_FEATURES)))
         
-        feature_names = [
-            'table_count', 'join_count', 'has_aggregation',
-            'has_window_function', 'has_subquery', 'has_cte',
-            'filter_predicate_count', 'order_by_count', 'group_by_count',
-            'estimated_rows_log', 'estimated_cost_log', 'plan_depth',
-            'calls',
-        ]
+        matrix = np.empty((n, len(FEATURE_NAMES)), dtype=np.float32)
+        matrix[:, :len(COUNT_FEATURES) + len(PLAN_FEATURES)] = extracted
+        plan = len(COUNT_FEATURES)
+        matrix[:, plan:plan + 2] = np.log1p(extracted[:, plan:plan + 2])
+        if 'calls' in query_logs.columns:
+            matrix[:, -1] = pd.to_numeric(query_logs['calls'], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            matrix[:, -1] = 0
+        return matrix
+    
+    def extract_features(self, query_logs: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        Extract features and target from query logs.
         
-        self.feature_names = feature_names
-        features_df = pd.DataFrame(features, columns=feature_names)
-        targets_series = pd.Series(targets)
+        Args:
+            query_logs: DataFrame with query log data
+            
+        Returns:
+            Tuple of (features DataFrame over the float32 feature_matrix(), target Series)
+        """
+        self.feature_names = list(FEATURE_NAMES)
+        features_df = pd.DataFrame(self.feature_matrix(query_logs), columns=self.feature_names, copy=False)
+        if 'mean_exec_time_ms' in query_logs.columns:
+            targets_series = pd.Series(query_logs['mean_exec_time_ms'].to_numpy())
+        else:
+            targets_series = pd.Series(np.zeros(len(query_logs)))
         
         return features_df, targets_series
     
@@ -205,6 +244,8 @@ class QueryTimePredictor:
         
         # Select and order features
         X = query_features[self.feature_names]
+        if self._use_compiled(len(X)):
+            return self.compiled.predict(X.to_numpy())
         
         # Scale features
         X_scaled = self.scaler.transform(X)
@@ -214,6 +255,22 @@ class QueryTimePredictor:
         
         return predictions
     
+    def predict_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict execution time for a feature matrix in FEATURE_NAMES order (see feature_matrix).
+        
+        Uses the compiled model when one is loaded and serves this many rows, without going
+        through pandas.
+        """
+        if self.compiled is not None and self.compiled.feature_names == FEATURE_NAMES \
+                and self._use_compiled(len(X)):
+            return self.compiled.predict(X)
+        return self.predict(pd.DataFrame(X, columns=FEATURE_NAMES, copy=False))
+    
+    def _use_compiled(self, rows: int) -> bool:
+        """Compiled model for small batches; the estimator is faster for large ones."""
+        return self.compiled is not None and (self.model is None or self.compiled.serves(rows))
+    
     def explain_prediction(self, query_features: pd.DataFrame) -> Dict:
         """
         Explain prediction using feature importance.
@@ -274,6 +331,20 @@ class QueryTimePredictor:
         joblib.dump(model_data, filepath)
         logger.info("Saved model to %s", filepath)
 
+    def export_compiled(self, filepath: str) -> None:
+        """Save model + scaler as a NumPy-only inference artifact (models.fast_inference)."""
+        if self.model is None:
+            raise ValueError("Model must be trained before export")
+        compile_model(self.model, self.scaler, self.feature_names).save(filepath)
+
+    def load_compiled(self, filepath: str) -> None:
+        """Serve predictions from an artifact written by export_compiled."""
+        compiled = CompiledModel.load(filepath)
+        if self.feature_names and compiled.feature_names != list(self.feature_names):
+            raise ValueError(f"Compiled model features do not match in {filepath}")
+        self.compiled = compiled
+        logger.info("Loaded compiled query time predictor from %s", filepath)
+
     def _slim_xgboost_joblib_bundle(self, filepath: str, model_data: dict) -> None:
         """Drop pickled estimator from joblib; native JSON holds the tree ensemble."""
         try:
@@ -294,6 +365,7 @@ class QueryTimePredictor:
             )
             model_data = joblib.load(filepath)
 
+        self.compiled = None
         self.scaler = model_data['scaler']
         self.config = model_data.get('config', QueryTimePredictorConfig())
         self.feature_names = model_data.get('feature_names', [])
@@ -345,21 +417,7 @@ class QueryTimePredictor:
         self.config = QueryTimePredictorConfig(model_type="xgboost")
         self._create_model()
         self.model.load_model(str(path))
-        self.feature_names = [
-            "table_count",
-            "join_count",
-            "has_aggregation",
-            "has_window_function",
-            "has_subquery",
-            "has_cte",
-            "filter_predicate_count",
-            "order_by_count",
-            "group_by_count",
-            "estimated_rows_log",
-            "estimated_cost_log",
-            "plan_depth",
-            "calls",
-        ]
+        self.feature_names = list(FEATURE_NAMES)
         n = len(self.feature_names)
         rng = np.random.default_rng(42)
         self.scaler = StandardScaler()
@@ -12,6 +12,7 @@ import logging
 from psycopg2.extras import Json
 
 from ml_optimization.utils.db_utils import get_db_connection
+from ml_optimization.utils.progress_reporter import BufferedProgressReporter, shared_reporter
 
 logger = logging.getLogger(__name__)
 
@@ -19,15 +20,46 @@ logger = logging.getLogger(__name__)
 class ETLJobTracker:
     """Track ETL job execution and progress."""
     
-    def __init__(self, connection=None):
+    def __init__(self, connection=None, progress_flush_interval: Optional[float] = None):
         """
         Initialize ETL job tracker.
         
         Args:
             connection: Optional database connection. If None, creates new connection.
+            progress_flush_interval: Seconds between background writes of buffered progress.
+                None uses the process's shared reporter (ETL_PROGRESS_FLUSH_INTERVAL_SEC or 1s),
+                a positive value a reporter of this tracker's own, 0 writes every update directly.
         """
         self.connection = connection
         self._own_connection = connection is None
+        self._own_progress = False
+        if progress_flush_interval is None:
+            self.progress = shared_reporter()
+        elif progress_flush_interval > 0:
+            self.progress = BufferedProgressReporter(progress_flush_interval)
+            self._own_progress = True
+        else:
+            self.progress = None
+    
+    def close(self):
+        """
+        Write buffered progress; stops the reporter (thread and connection) if this tracker owns it.
+        
+        The shared reporter keeps running for the other trackers of the process.
+        """
+        if not self.progress:
+            return
+        if self._own_progress:
+            self.progress.close()
+        else:
+            self.flush_progress()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
         
     def _get_connection(self):
         """Get database connection."""
@@ -239,7 +271,9 @@ class ETLJobTracker:
 
             conn.commit()
             logger.info(f"Started ETL job run: {run_id} for job {job_name}")
-            return run_id
+        if self.progress:
+            self.progress.set_state(run_id, "running", progress=0, records_processed=0)
+        return run_id
     
     def update_progress(
         self,
@@ -254,8 +288,14 @@ class ETLJobTracker:
             job_id: Run identifier (as returned by start_job)
             progress: Progress percentage (0-100)
             records_processed: Number of records processed so far
+
+        With buffering the update is coalesced per run and written by the reporter's
+        background flush (see progress_reporter.py).
         """
         progress = max(0, min(100, progress))
+        if self.progress:
+            self.progress.update(job_id, progress, records_processed)
+            return
         now = datetime.now()
         
         with self._get_connection() as conn:
@@ -282,7 +322,199 @@ class ETLJobTracker:
                     (progress, now, job_id),
                 )
             conn.commit()
-    
+
+    def record_step_metrics(
+        self,
+        job_id: str,
+        step_name: str,
+        metrics: Dict[str, Any]
+    ):
+        """
+        Merge per-step metrics into the run's metadata under ``steps.<step_name>``.
+
+        Written synchronously; the run's buffered progress and pending counts are flushed
+        right after, so a step's final state is durable once it has been recorded.
+
+        Args:
+            job_id: Run identifier (as returned by start_job)
+            step_name: Pipeline step (e.g. 'orders', 'order_items')
+            metrics: JSON-serializable metrics, e.g. rows, seconds, rows_per_sec, status
+        """
+        now = datetime.now()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE monitoring.job_runs
+                SET metadata = COALESCE(metadata, '{}'::jsonb) || jsonb_build_object(
+                        'steps',
+                        COALESCE(metadata->'steps', '{}'::jsonb) || jsonb_build_object(%s::text, %s::jsonb)
+                    ),
+                    updated_at = %s
+                WHERE run_id = %s
+                """,
+                (step_name, Json(metrics), now, job_id),
+            )
+            conn.commit()
+        self.flush_progress(job_id)
+
+    def record_backfill_state(
+        self,
+        job_id: str,
+        step_name: str,
+        state: Dict[str, Any]
+    ):
+        """
+        Store a backfill's progress in the run's metadata under ``backfill.<step_name>``.
+
+        Args:
+            job_id: Run identifier (as returned by start_job)
+            step_name: Backfilled step (e.g. 'order_items')
+            state: JSON-serializable progress (completed key ranges, rows, finished flag)
+        """
+        now = datetime.now()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE monitoring.job_runs
+                SET metadata = COALESCE(metadata, '{}'::jsonb) || jsonb_build_object(
+                        'backfill',
+                        COALESCE(metadata->'backfill', '{}'::jsonb) || jsonb_build_object(%s::text, %s::jsonb)
+                    ),
+                    updated_at = %s
+                WHERE run_id = %s
+                """,
+                (step_name, Json(state), now, job_id),
+            )
+            conn.commit()
+
+    def record_profile(
+        self,
+        job_id: str,
+        summary: Dict[str, Any]
+    ):
+        """
+        Store a profiled run's summary in its metadata under ``profile``.
+
+        Args:
+            job_id: Run identifier (as returned by start_job)
+            summary: JSON-serializable profile summary (see etl.utils.profiling.Profiler.summary)
+        """
+        now = datetime.now()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE monitoring.job_runs
+                SET metadata = COALESCE(metadata, '{}'::jsonb) || jsonb_build_object('profile', %s::jsonb),
+                    updated_at = %s
+                WHERE run_id = %s
+                """,
+                (Json(summary), now, job_id),
+            )
+            conn.commit()
+
+    def record_pending(
+        self,
+        job_id: str,
+        pending: Dict[str, Any]
+    ):
+        """
+        Store per-step pending-row counts in the run's metadata under ``pending``.
+
+        Args:
+            job_id: Run identifier (as returned by start_job)
+            pending: Step name -> {rows, remaining, exact, since}; replaces the previous value
+        """
+        if self.progress:
+            self.progress.update_metadata(job_id, "pending", pending)
+            return
+        now = datetime.now()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE monitoring.job_runs
+                SET metadata = COALESCE(metadata, '{}'::jsonb) || jsonb_build_object('pending', %s::jsonb),
+                    updated_at = %s
+                WHERE run_id = %s
+                """,
+                (Json(pending), now, job_id),
+            )
+            conn.commit()
+
+    def latest_backfill_state(
+        self,
+        job_name: str,
+        job_type: str,
+        step_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the most recent backfill progress recorded for a step by any run of a job.
+
+        Args:
+            job_name: Name of the logical job
+            job_type: Type of job
+            step_name: Backfilled step
+
+        Returns:
+            The stored state dict, or None if the step was never backfilled.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT r.metadata->'backfill'->%s
+                FROM monitoring.job_runs r
+                JOIN monitoring.etl_jobs j ON j.job_id = r.job_id
+                WHERE j.job_name = %s
+                  AND j.job_type = %s
+                  AND r.metadata->'backfill' ? %s
+                ORDER BY r.started_at DESC
+                LIMIT 1
+                """,
+                (step_name, job_name, job_type, step_name),
+            )
+            row = cursor.fetchone()
+            conn.commit()
+            return row[0] if row else None
+
+    def flush_progress(self, job_id: Optional[str] = None):
+        """
+        Write buffered progress now (one run, or all).
+
+        A failed flush is logged and left queued for the background writer.
+        """
+        if not self.progress:
+            return
+        try:
+            self.progress.flush(job_id)
+        except Exception as e:
+            logger.warning(f"Could not flush buffered progress for {job_id or 'all runs'}: {e}")
+
+    def live_progress(self, job_id: Optional[str] = None):
+        """
+        In-memory progress of this process's running runs, without querying job_runs.
+
+        Args:
+            job_id: Run identifier, or None for every running run (run_id -> dict)
+        """
+        if not self.progress:
+            return None if job_id else {}
+        return self.progress.live(job_id)
+
+    def _take_pending(self, job_id: str) -> Dict[str, Any]:
+        """A run's still-buffered progress, removed from the reporter for its terminal UPDATE."""
+        if not self.progress:
+            return {"meta": {}}
+        return self.progress.take(job_id)
+
+    def _restore_pending(self, job_id: str, pending: Dict[str, Any]):
+        """Hand buffered progress back to the reporter when the terminal UPDATE failed."""
+        if self.progress:
+            self.progress.restore(job_id, pending)
+
     def complete_job(
         self,
         job_id: str,
@@ -292,54 +524,44 @@ class ETLJobTracker:
         """
         Mark job run as completed.
         
+        Written synchronously, together with any progress / metadata still buffered for the run.
+        
         Args:
             job_id: Run identifier (as returned by start_job)
             records_processed: Final number of records processed
             metadata: Additional metadata to update
         """
+        pending = self._take_pending(job_id)
+        if records_processed is None:
+            records_processed = pending.get("records_processed")
+        meta = {**pending["meta"], **(metadata or {})}
         now = datetime.now()
+        try:
+            self._write_completed(job_id, records_processed, meta, now)
+        except Exception:
+            self._restore_pending(job_id, pending)
+            raise
+        if self.progress:
+            self.progress.set_state(job_id, "completed", progress=100, records_processed=records_processed)
+
+    def _write_completed(self, job_id: str, records_processed: Optional[int], meta: Dict[str, Any], now):
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            if records_processed is not None and metadata is not None:
-                meta_param = Json(metadata)
-                cursor.execute(
-                    """
-                    UPDATE monitoring.job_runs
-                    SET status = 'completed',
-                        progress = 100,
-                        records_processed = %s,
-                        completed_at = %s,
-                        metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb,
-                        updated_at = %s
-                    WHERE run_id = %s
-                    """,
-                    (records_processed, now, meta_param, now, job_id),
-                )
-            elif records_processed is not None:
-                cursor.execute(
-                    """
-                    UPDATE monitoring.job_runs
-                    SET status = 'completed',
-                        progress = 100,
-                        records_processed = %s,
-                        completed_at = %s,
-                        updated_at = %s
-                    WHERE run_id = %s
-                    """,
-                    (records_processed, now, now, job_id),
-                )
-            else:
-                cursor.execute(
-                    """
-                    UPDATE monitoring.job_runs
-                    SET status = 'completed',
-                        progress = 100,
-                        completed_at = %s,
-                        updated_at = %s
-                    WHERE run_id = %s
-                    """,
-                    (now, now, job_id),
-                )
+            cursor.execute(
+                """
+                UPDATE monitoring.job_runs
+                SET status = 'completed',
+                    progress = 100,
+                    records_processed = COALESCE(%s, records_processed),
+                    completed_at = %s,
+                    metadata = CASE WHEN %s::jsonb IS NULL THEN metadata
+                                    ELSE COALESCE(metadata, '{}'::jsonb) || %s::jsonb END,
+                    updated_at = %s
+                WHERE run_id = %s
+                """,
+                (records_processed, now, Json(meta) if meta else None, Json(meta) if meta else None,
+                 now, job_id),
+            )
             conn.commit()
             logger.info(f"Completed ETL job run: {job_id}")
     
@@ -354,41 +576,44 @@ class ETLJobTracker:
 
         Always opens a new connection so a closed or broken ETL session connection
         cannot block updating monitoring.job_runs (avoids stuck status='running').
+        Written synchronously, together with any progress / metadata still buffered for the run.
         
         Args:
             job_id: Run identifier (as returned by start_job)
             error_message: Error message
             metadata: Additional metadata
         """
+        pending = self._take_pending(job_id)
+        meta = {**pending["meta"], **(metadata or {})}
         now = datetime.now()
+        try:
+            self._write_failed(job_id, error_message, pending, meta, now)
+        except Exception:
+            self._restore_pending(job_id, pending)
+            raise
+        if self.progress:
+            self.progress.set_state(job_id, "failed")
+
+    def _write_failed(self, job_id: str, error_message: str, pending: Dict[str, Any],
+                      meta: Dict[str, Any], now):
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            if metadata:
-                meta_param = Json(metadata)
-                cursor.execute(
-                    """
-                    UPDATE monitoring.job_runs
-                    SET status = 'failed',
-                        error_message = %s,
-                        completed_at = %s,
-                        metadata = COALESCE(metadata, '{}'::jsonb) || %s::jsonb,
-                        updated_at = %s
-                    WHERE run_id = %s
-                    """,
-                    (error_message, now, meta_param, now, job_id),
-                )
-            else:
-                cursor.execute(
-                    """
-                    UPDATE monitoring.job_runs
-                    SET status = 'failed',
-                        error_message = %s,
-                        completed_at = %s,
-                        updated_at = %s
-                    WHERE run_id = %s
-                    """,
-                    (error_message, now, now, job_id),
-                )
+            cursor.execute(
+                """
+                UPDATE monitoring.job_runs
+                SET status = 'failed',
+                    error_message = %s,
+                    progress = COALESCE(%s, progress),
+                    records_processed = COALESCE(%s, records_processed),
+                    completed_at = %s,
+                    metadata = CASE WHEN %s::jsonb IS NULL THEN metadata
+                                    ELSE COALESCE(metadata, '{}'::jsonb) || %s::jsonb END,
+                    updated_at = %s
+                WHERE run_id = %s
+                """,
+                (error_message, pending.get("progress"), pending.get("records_processed"), now,
+                 Json(meta) if meta else None, Json(meta) if meta else None, now, job_id),
+            )
             logger.error(f"Failed ETL job run: {job_id} - {error_message}")
     
     @contextmanager
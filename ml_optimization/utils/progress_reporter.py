@@ -0,0 +1,272 @@
+"""
+Buffered Progress Reporter
+Coalesces ETL run progress in memory and writes it to monitoring.job_runs in the background.
+
+Transforms report progress after every batch. Instead of an UPDATE + commit per call, the
+latest progress / records_processed / metadata keys per run_id are kept in memory and flushed
+every ``flush_interval`` seconds by a daemon thread, in one statement for all changed runs,
+on a dedicated connection (never the ETL session's). Each flush also publishes the runs'
+progress with pg_notify on PROGRESS_CHANNEL so listeners (the API's WebSocket feed) get live
+progress without polling job_runs.
+
+Durability: only intermediate progress goes through the buffer. ETLJobTracker writes these
+synchronously, each committed before the call returns:
+- a run's start;
+- its terminal state (completed / failed), in an UPDATE that takes over the run's queued
+  progress and metadata (take()), so the final row never depends on a pending flush;
+- each step's final metrics (completed or failed), followed by a flush of the run.
+A failed flush keeps its updates queued for the next attempt, and a normal interpreter exit
+flushes whatever is queued. A process that is killed (SIGKILL, OOM, power loss) or exits
+without running atexit handlers loses the progress and pending counts reported since the last
+flush or finished step. Its row also stays status='running' with the last written progress,
+because no terminal state is ever written; readers must treat a running row whose updated_at
+stops advancing as dead (the API's live view drops such runs after a timeout).
+
+shared_reporter() returns one reporter per process, so trackers created per job (the
+scheduler daemon makes one per dispatch) share a single flush thread and connection.
+``live()`` is the in-memory read path for the reporting process.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import psycopg2
+from psycopg2.extras import Json, execute_values
+
+from ml_optimization.utils.db_utils import get_db_connection_string
+
+logger = logging.getLogger(__name__)
+
+# LISTEN/NOTIFY channel carrying live run progress
+PROGRESS_CHANNEL = "etl_progress"
+
+DEFAULT_FLUSH_INTERVAL = float(os.getenv("ETL_PROGRESS_FLUSH_INTERVAL_SEC", "1.0"))
+
+_FLUSH_SQL = """
+    UPDATE monitoring.job_runs r
+    SET progress = COALESCE(v.progress, r.progress),
+        records_processed = COALESCE(v.records_processed, r.records_processed),
+        metadata = CASE WHEN v.meta IS NULL THEN r.metadata
+                        ELSE COALESCE(r.metadata, '{}'::jsonb) || v.meta END,
+        updated_at = v.updated_at
+    FROM (VALUES %s) AS v(run_id, progress, records_processed, meta, updated_at)
+    WHERE r.run_id = v.run_id
+      AND r.status = 'running'
+"""
+_FLUSH_TEMPLATE = "(%s, %s::int, %s::bigint, %s::jsonb, %s::timestamp)"
+
+
+class BufferedProgressReporter:
+    """Coalesce per-run progress updates and flush them on a background thread."""
+
+    def __init__(self, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 connection_string: Optional[str] = None, channel: str = PROGRESS_CHANNEL):
+        """
+        Args:
+            flush_interval: Seconds between background flushes.
+            connection_string: DSN of the dedicated flush connection (default from env).
+            channel: NOTIFY channel for live progress; None disables notifications.
+        """
+        self.flush_interval = flush_interval
+        self.connection_string = connection_string
+        self.channel = channel
+        self._lock = threading.Lock()
+        # Serializes flushes so the dedicated connection is used by one thread at a time
+        self._flush_lock = threading.Lock()
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._live: Dict[str, Dict[str, Any]] = {}
+        self._connection = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    # -- buffering -------------------------------------------------------------------------
+
+    def update(self, run_id: str, progress: int, records_processed: Optional[int] = None) -> None:
+        """Record a run's latest progress; written by the next flush."""
+        now = datetime.now()
+        with self._lock:
+            entry = self._dirty.setdefault(run_id, {"meta": {}})
+            entry["progress"] = progress
+            if records_processed is not None:
+                entry["records_processed"] = records_processed
+            entry["updated_at"] = now
+            live = self._live.setdefault(run_id, {"run_id": run_id, "status": "running"})
+            live.update(progress=progress, updated_at=now.isoformat())
+            if records_processed is not None:
+                live["records_processed"] = records_processed
+        self._ensure_thread()
+
+    def update_metadata(self, run_id: str, key: str, value: Any) -> None:
+        """Replace top-level ``metadata.<key>`` of a run at the next flush."""
+        with self._lock:
+            entry = self._dirty.setdefault(run_id, {"meta": {}})
+            entry["meta"][key] = value
+            entry.setdefault("updated_at", datetime.now())
+        self._ensure_thread()
+
+    def set_state(self, run_id: str, status: str, progress: Optional[int] = None,
+                  records_processed: Optional[int] = None) -> None:
+        """Record a state change in the live view (the tracker writes the row itself)."""
+        with self._lock:
+            live = self._live.setdefault(run_id, {"run_id": run_id})
+            live.update(status=status, updated_at=datetime.now().isoformat())
+            if progress is not None:
+                live["progress"] = progress
+            if records_processed is not None:
+                live["records_processed"] = records_processed
+            if status != "running":
+                # Finished runs drop out of the live view after the final notification
+                self._live.pop(run_id, None)
+        self._notify_now(run_id, live)
+
+    def take(self, run_id: str) -> Dict[str, Any]:
+        """Remove and return a run's queued update (progress, records_processed, meta), if any.
+
+        For callers that write the run's row themselves, e.g. its terminal state.
+        """
+        with self._lock:
+            return self._dirty.pop(run_id, None) or {"meta": {}}
+
+    def restore(self, run_id: str, entry: Dict[str, Any]) -> None:
+        """Queue an update returned by take() again (its writer failed); newer values win."""
+        if entry.get("updated_at") is not None:
+            self._requeue({run_id: entry})
+
+    def live(self, run_id: Optional[str] = None):
+        """In-memory progress of running runs (one run's dict, or run_id -> dict)."""
+        with self._lock:
+            if run_id is not None:
+                entry = self._live.get(run_id)
+                return dict(entry) if entry else None
+            return {k: dict(v) for k, v in self._live.items()}
+
+    # -- flushing --------------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None or self._stop.is_set():
+            return
+        with self._lock:
+            if self._thread is not None or self._stop.is_set():
+                return
+            self._thread = threading.Thread(target=self._run, name="etl-progress-flush", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning("Progress flush failed (will retry): %s", e)
+
+    def _connect(self):
+        if self._connection is None or self._connection.closed:
+            self._connection = psycopg2.connect(self.connection_string or get_db_connection_string())
+        return self._connection
+
+    def flush(self, run_id: Optional[str] = None) -> int:
+        """Write queued updates (all runs, or one) in one statement; returns runs written.
+
+        On error the updates are put back (newer values reported meanwhile win) and the
+        exception is raised.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if run_id is None:
+                    batch, self._dirty = self._dirty, {}
+                else:
+                    entry = self._dirty.pop(run_id, None)
+                    batch = {run_id: entry} if entry else {}
+                live = {k: dict(self._live[k]) for k in batch if k in self._live}
+            if not batch:
+                return 0
+            rows = [
+                (rid, e.get("progress"), e.get("records_processed"),
+                 Json(e["meta"]) if e["meta"] else None, e["updated_at"])
+                for rid, e in batch.items()
+            ]
+            try:
+                conn = self._connect()
+                cursor = conn.cursor()
+                execute_values(cursor, _FLUSH_SQL, rows, template=_FLUSH_TEMPLATE)
+                if self.channel:
+                    for rid, payload in live.items():
+                        cursor.execute("SELECT pg_notify(%s, %s)",
+                                       (self.channel, json.dumps(payload, default=str)))
+                conn.commit()
+                cursor.close()
+            except Exception:
+                self._requeue(batch)
+                self._reset_connection()
+                raise
+            return len(batch)
+
+    def _reset_connection(self) -> None:
+        try:
+            if self._connection is not None:
+                self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+    def _requeue(self, batch: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            for rid, old in batch.items():
+                newer = self._dirty.get(rid)
+                if newer is None:
+                    self._dirty[rid] = old
+                    continue
+                merged = dict(old, **{k: v for k, v in newer.items() if k != "meta"})
+                merged["meta"] = {**old["meta"], **newer["meta"]}
+                self._dirty[rid] = merged
+
+    def _notify_now(self, run_id: str, payload: Dict[str, Any]) -> None:
+        if not self.channel:
+            return
+        try:
+            with self._flush_lock:
+                conn = self._connect()
+                cursor = conn.cursor()
+                cursor.execute("SELECT pg_notify(%s, %s)", (self.channel, json.dumps(payload, default=str)))
+                conn.commit()
+                cursor.close()
+        except Exception as e:
+            self._reset_connection()
+            logger.debug("Could not publish state of run %s: %s", run_id, e)
+
+    def close(self) -> None:
+        """Stop the flush thread, write everything still queued and close the connection.
+
+        Updates reported after close() are still buffered and can be written with flush().
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=max(5.0, self.flush_interval * 2))
+        atexit.unregister(self.close)
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("Final progress flush failed: %s", e)
+        self._reset_connection()
+
+
+_shared: Optional[BufferedProgressReporter] = None
+_shared_lock = threading.Lock()
+
+
+def shared_reporter() -> BufferedProgressReporter:
+    """The process-wide reporter with the default flush interval, created on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = BufferedProgressReporter()
+        return _shared
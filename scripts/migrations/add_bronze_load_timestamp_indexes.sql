@@ -0,0 +1,32 @@
+-- Migration: Add _load_timestamp indexes to Bronze tables
+-- Lets Bronze -> Silver steps read their high-water mark with an index lookup and extract
+-- only rows newer than their watermark (monitoring.etl_watermarks) instead of scanning
+-- the full bronze history on every run.
+-- CONCURRENTLY avoids blocking bronze loaders; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_country_load_ts ON bronze.country(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_location_load_ts ON bronze.location(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_warehouse_load_ts ON bronze.warehouse(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_product_load_ts ON bronze.product(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_inventory_load_ts ON bronze.inventory(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_person_load_ts ON bronze.person(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_restricted_info_load_ts ON bronze.restricted_info(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_person_location_load_ts ON bronze.person_location(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_phone_number_load_ts ON bronze.phone_number(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_customer_company_load_ts ON bronze.customer_company(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_customer_employee_load_ts ON bronze.customer_employee(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_customer_load_ts ON bronze.customer(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_employment_jobs_load_ts ON bronze.employment_jobs(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_employment_load_ts ON bronze.employment(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_orders_load_ts ON bronze.orders(_load_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_order_item_load_ts ON bronze.order_item(_load_timestamp);
+
+-- Watermark state (also created on demand by WatermarkStore.ensure_table_exists)
+CREATE SCHEMA IF NOT EXISTS monitoring;
+CREATE TABLE IF NOT EXISTS monitoring.etl_watermarks (
+    step_name           VARCHAR(100) PRIMARY KEY,
+    bronze_table        VARCHAR(100) NOT NULL,
+    last_load_timestamp TIMESTAMP,
+    last_full_reconcile TIMESTAMP,
+    updated_at          TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
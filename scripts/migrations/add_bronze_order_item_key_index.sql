@@ -0,0 +1,8 @@
+-- Migration: Add (order_item_id, _load_timestamp) index to bronze.order_item
+-- Keyset-range backfill (run_etl.py --backfill order_items) loads order_item_id BETWEEN a AND b
+-- per range; the index keeps each range an index range scan that already yields the latest
+-- row per id for DISTINCT ON.
+-- CONCURRENTLY avoids blocking bronze loaders; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bronze_order_item_id_load_ts
+    ON bronze.order_item(order_item_id, _load_timestamp DESC);
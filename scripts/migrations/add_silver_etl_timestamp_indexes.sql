@@ -0,0 +1,8 @@
+-- Migration: Add _etl_timestamp indexes to Silver tables feeding delta-maintained gold aggregates
+-- agg_customer_lifetime and agg_monthly_product_sales only recompute customers / months with
+-- silver rows newer than their watermark (monitoring.etl_watermarks, step gold.<table>).
+-- CONCURRENTLY avoids blocking the Bronze -> Silver loaders; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_silver_customer_etl_ts ON silver.customer(_etl_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_silver_orders_etl_ts ON silver.orders(_etl_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_silver_orderitem_etl_ts ON silver.order_item(_etl_timestamp);
@@ -0,0 +1,8 @@
+-- Migration: Add _etl_timestamp indexes for change-tracked inventory snapshots
+-- populate_fact_inventory_snapshot only rebuilds (product, warehouse) keys whose silver.inventory
+-- or silver.product rows are newer than its watermark (monitoring.etl_watermarks, step
+-- gold.fact_inventory_snapshot); these indexes keep that lookup off a full table scan.
+-- CONCURRENTLY avoids blocking the Bronze -> Silver loaders; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_silver_inventory_etl_ts ON silver.inventory(_etl_timestamp);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_silver_product_etl_ts ON silver.product(_etl_timestamp);
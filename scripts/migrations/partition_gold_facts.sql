@@ -0,0 +1,174 @@
+-- Migration: Convert gold fact tables to monthly range partitions on their date key
+-- gold.fact_sales / gold.fact_orders (order_date_key) and gold.fact_inventory_snapshot
+-- (snapshot_date_key) become PARTITION BY RANGE tables with one <table>_pYYYYMM partition per
+-- month of existing data (plus three months ahead) and a <table>_default partition. The ETL
+-- (etl/aggregators/partitions.py) creates later months before each load.
+--
+-- Each table is copied into the new layout inside one transaction; the row counts are
+-- compared before the old heap table is dropped. Surrogate-key sequences are kept, so
+-- sales_key / order_fact_key / inventory_snapshot_key values are preserved.
+-- Unique keys must include the partition key: gold.fact_orders UNIQUE (order_id) becomes
+-- UNIQUE (order_id, order_date_key) and primary keys gain the date key.
+-- Takes an ACCESS EXCLUSIVE lock per table; run while the ETL is stopped.
+-- The gold serving materialized views depend on the old tables and are dropped; the next
+-- ETL run recreates and refreshes them (etl/aggregators/serving_views.py).
+
+DROP MATERIALIZED VIEW IF EXISTS gold.mv_daily_sales_by_category;
+DROP MATERIALIZED VIEW IF EXISTS gold.mv_top_products;
+DROP MATERIALIZED VIEW IF EXISTS gold.mv_customer_tiers;
+
+CREATE OR REPLACE FUNCTION pg_temp.create_month_partitions(tbl TEXT, key_col TEXT)
+RETURNS VOID AS $$
+DECLARE
+    lo DATE;
+    hi DATE;
+    m DATE;
+BEGIN
+    EXECUTE format(
+        'SELECT to_date(MIN(%1$I)::text, ''YYYYMMDD''), to_date(MAX(%1$I)::text, ''YYYYMMDD'') FROM gold.%2$I',
+        key_col, tbl || '_unpartitioned'
+    ) INTO lo, hi;
+    IF lo IS NULL THEN
+        lo := CURRENT_DATE;
+        hi := CURRENT_DATE;
+    END IF;
+    hi := GREATEST(hi, CURRENT_DATE);
+    FOR m IN SELECT generate_series(date_trunc('month', lo), date_trunc('month', hi) + INTERVAL '3 months', INTERVAL '1 month')::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS gold.%I PARTITION OF gold.%I FOR VALUES FROM (%s) TO (%s)',
+            tbl || '_p' || to_char(m, 'YYYYMM'), tbl,
+            to_char(m, 'YYYYMMDD'), to_char(m + INTERVAL '1 month', 'YYYYMMDD')
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION pg_temp.check_copied(tbl TEXT)
+RETURNS VOID AS $$
+DECLARE
+    old_rows BIGINT;
+    new_rows BIGINT;
+BEGIN
+    EXECUTE format('SELECT COUNT(*) FROM gold.%I', tbl || '_unpartitioned') INTO old_rows;
+    EXECUTE format('SELECT COUNT(*) FROM gold.%I', tbl) INTO new_rows;
+    IF old_rows <> new_rows THEN
+        RAISE EXCEPTION 'gold.%: copied % of % rows', tbl, new_rows, old_rows;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ----------------------------------------------------------------------------
+-- gold.fact_sales
+-- ----------------------------------------------------------------------------
+BEGIN;
+
+ALTER TABLE gold.fact_sales RENAME TO fact_sales_unpartitioned;
+ALTER INDEX IF EXISTS gold.fact_sales_pkey RENAME TO fact_sales_unpartitioned_pkey;
+DROP INDEX IF EXISTS gold.idx_fact_sales_date;
+DROP INDEX IF EXISTS gold.idx_fact_sales_customer;
+DROP INDEX IF EXISTS gold.idx_fact_sales_product;
+DROP INDEX IF EXISTS gold.idx_fact_sales_employee;
+DROP INDEX IF EXISTS gold.idx_fact_sales_order;
+ALTER SEQUENCE gold.fact_sales_sales_key_seq OWNED BY NONE;
+
+CREATE TABLE gold.fact_sales (
+    LIKE gold.fact_sales_unpartitioned INCLUDING DEFAULTS,
+    CONSTRAINT fk_fact_sales_date FOREIGN KEY (order_date_key) REFERENCES gold.dim_date(date_key),
+    CONSTRAINT fk_fact_sales_customer FOREIGN KEY (customer_key) REFERENCES gold.dim_customer(customer_key),
+    CONSTRAINT fk_fact_sales_product FOREIGN KEY (product_key) REFERENCES gold.dim_product(product_key),
+    CONSTRAINT fk_fact_sales_employee FOREIGN KEY (employee_key) REFERENCES gold.dim_employee(employee_key),
+    CONSTRAINT fk_fact_sales_promotion FOREIGN KEY (promotion_key) REFERENCES gold.dim_promotion(promotion_key),
+    PRIMARY KEY (sales_key, order_date_key)
+) PARTITION BY RANGE (order_date_key);
+ALTER SEQUENCE gold.fact_sales_sales_key_seq OWNED BY gold.fact_sales.sales_key;
+
+CREATE TABLE gold.fact_sales_default PARTITION OF gold.fact_sales DEFAULT;
+SELECT pg_temp.create_month_partitions('fact_sales', 'order_date_key');
+
+INSERT INTO gold.fact_sales SELECT * FROM gold.fact_sales_unpartitioned;
+SELECT pg_temp.check_copied('fact_sales');
+
+CREATE INDEX idx_fact_sales_date ON gold.fact_sales(order_date_key);
+CREATE INDEX idx_fact_sales_customer ON gold.fact_sales(customer_key);
+CREATE INDEX idx_fact_sales_product ON gold.fact_sales(product_key);
+CREATE INDEX idx_fact_sales_employee ON gold.fact_sales(employee_key);
+CREATE INDEX idx_fact_sales_order ON gold.fact_sales(order_id, order_item_id);
+
+DROP TABLE gold.fact_sales_unpartitioned;
+
+COMMIT;
+
+-- ----------------------------------------------------------------------------
+-- gold.fact_orders
+-- ----------------------------------------------------------------------------
+BEGIN;
+
+ALTER TABLE gold.fact_orders RENAME TO fact_orders_unpartitioned;
+ALTER INDEX IF EXISTS gold.fact_orders_pkey RENAME TO fact_orders_unpartitioned_pkey;
+ALTER INDEX IF EXISTS gold.fact_orders_order_id_key RENAME TO fact_orders_unpartitioned_order_id_key;
+DROP INDEX IF EXISTS gold.idx_fact_orders_date;
+DROP INDEX IF EXISTS gold.idx_fact_orders_customer;
+ALTER SEQUENCE gold.fact_orders_order_fact_key_seq OWNED BY NONE;
+
+CREATE TABLE gold.fact_orders (
+    LIKE gold.fact_orders_unpartitioned INCLUDING DEFAULTS,
+    CONSTRAINT fk_fact_orders_date FOREIGN KEY (order_date_key) REFERENCES gold.dim_date(date_key),
+    CONSTRAINT fk_fact_orders_customer FOREIGN KEY (customer_key) REFERENCES gold.dim_customer(customer_key),
+    CONSTRAINT fk_fact_orders_employee FOREIGN KEY (employee_key) REFERENCES gold.dim_employee(employee_key),
+    CONSTRAINT fk_fact_orders_promotion FOREIGN KEY (promotion_key) REFERENCES gold.dim_promotion(promotion_key),
+    PRIMARY KEY (order_fact_key, order_date_key),
+    CONSTRAINT uk_fact_orders_order UNIQUE (order_id, order_date_key)
+) PARTITION BY RANGE (order_date_key);
+ALTER SEQUENCE gold.fact_orders_order_fact_key_seq OWNED BY gold.fact_orders.order_fact_key;
+
+CREATE TABLE gold.fact_orders_default PARTITION OF gold.fact_orders DEFAULT;
+SELECT pg_temp.create_month_partitions('fact_orders', 'order_date_key');
+
+INSERT INTO gold.fact_orders SELECT * FROM gold.fact_orders_unpartitioned;
+SELECT pg_temp.check_copied('fact_orders');
+
+CREATE INDEX idx_fact_orders_date ON gold.fact_orders(order_date_key);
+CREATE INDEX idx_fact_orders_customer ON gold.fact_orders(customer_key);
+
+DROP TABLE gold.fact_orders_unpartitioned;
+
+COMMIT;
+
+-- ----------------------------------------------------------------------------
+-- gold.fact_inventory_snapshot
+-- ----------------------------------------------------------------------------
+BEGIN;
+
+ALTER TABLE gold.fact_inventory_snapshot RENAME TO fact_inventory_snapshot_unpartitioned;
+ALTER INDEX IF EXISTS gold.fact_inventory_snapshot_pkey RENAME TO fact_inventory_snapshot_unpartitioned_pkey;
+DROP INDEX IF EXISTS gold.idx_fact_inv_date;
+DROP INDEX IF EXISTS gold.idx_fact_inv_product;
+ALTER SEQUENCE gold.fact_inventory_snapshot_inventory_snapshot_key_seq OWNED BY NONE;
+
+CREATE TABLE gold.fact_inventory_snapshot (
+    LIKE gold.fact_inventory_snapshot_unpartitioned INCLUDING DEFAULTS,
+    CONSTRAINT fk_fact_inv_date FOREIGN KEY (snapshot_date_key) REFERENCES gold.dim_date(date_key),
+    CONSTRAINT fk_fact_inv_product FOREIGN KEY (product_key) REFERENCES gold.dim_product(product_key),
+    CONSTRAINT fk_fact_inv_warehouse FOREIGN KEY (warehouse_key) REFERENCES gold.dim_warehouse(warehouse_key),
+    PRIMARY KEY (inventory_snapshot_key, snapshot_date_key)
+) PARTITION BY RANGE (snapshot_date_key);
+ALTER SEQUENCE gold.fact_inventory_snapshot_inventory_snapshot_key_seq
+    OWNED BY gold.fact_inventory_snapshot.inventory_snapshot_key;
+
+CREATE TABLE gold.fact_inventory_snapshot_default PARTITION OF gold.fact_inventory_snapshot DEFAULT;
+SELECT pg_temp.create_month_partitions('fact_inventory_snapshot', 'snapshot_date_key');
+
+INSERT INTO gold.fact_inventory_snapshot SELECT * FROM gold.fact_inventory_snapshot_unpartitioned;
+SELECT pg_temp.check_copied('fact_inventory_snapshot');
+
+CREATE INDEX idx_fact_inv_date ON gold.fact_inventory_snapshot(snapshot_date_key);
+CREATE INDEX idx_fact_inv_product ON gold.fact_inventory_snapshot(product_key);
+
+DROP TABLE gold.fact_inventory_snapshot_unpartitioned;
+
+COMMIT;
+
+ANALYZE gold.fact_sales;
+ANALYZE gold.fact_orders;
+ANALYZE gold.fact_inventory_snapshot;
@@ -69,6 +69,7 @@ try:
     from models.query_time_predictor import QueryTimePredictor
     from models.anomaly_detector import QueryAnomalyDetector
     from models.cache_predictor import CachePredictor
+    from models.fast_inference import compiled_path
     from ml_optimization.config.model_config import QueryTimePredictorConfig
 except ImportError as e:
     logger.error("Failed to import ML models: %s", e, exc_info=True)
@@ -141,6 +142,17 @@ def load_query_data(db_conn_str, limit: int):
     return query_data, queries, execution_times, df
 
 
+def save_compiled(model, bundle_path, export: bool) -> None:
+    """Write the NumPy-only inference artifact next to a saved bundle, or drop a stale one."""
+    artifact = compiled_path(str(bundle_path))
+    if export:
+        model.export_compiled(str(artifact))
+        logger.info("Compiled inference artifact saved to %s", artifact)
+    elif artifact.exists():
+        artifact.unlink()
+        logger.info("Removed stale compiled artifact %s", artifact)
+
+
 def train_clustering(models_dir, query_logs_df):
     """Train workload clustering model only."""
     logger.info("Training Workload Clustering Model")
@@ -159,7 +171,7 @@ def train_clustering(models_dir, query_logs_df):
     return True
 
 
-def train_cache_predictor(models_dir, query_logs_df):
+def train_cache_predictor(models_dir, query_logs_df, export_compiled=False):
     """Train cache-worthiness RandomForest on aggregated query templates."""
     logger.info("Training Cache Predictor Model")
     if len(query_logs_df) < MIN_RECORDS:
@@ -173,11 +185,12 @@ def train_cache_predictor(models_dir, query_logs_df):
         return False
     cache_path = models_dir / "cache_predictor.pkl"
     cp.save_model(str(cache_path))
+    save_compiled(cp, cache_path, export_compiled)
     logger.info("Cache predictor saved to %s", cache_path)
     return True
 
 
-def train_predictor(models_dir, query_logs_df):
+def train_predictor(models_dir, query_logs_df, export_compiled=False):
     """Train query time predictor model only. query_logs_df must have extracted_features, calls, mean_exec_time_ms."""
     logger.info("Training Query Time Predictor Model")
     if len(query_logs_df) < MIN_RECORDS:
@@ -251,11 +264,12 @@ def train_predictor(models_dir, query_logs_df):
 
     predictor_path = models_dir / "query_time_predictor.pkl"
     best_predictor.save_model(str(predictor_path))
+    save_compiled(best_predictor, predictor_path, export_compiled)
     logger.info("Query time predictor model saved to %s", predictor_path)
     return True
 
 
-def train_anomaly(models_dir, query_logs_df):
+def train_anomaly(models_dir, query_logs_df, export_compiled=False):
     """Train anomaly detector model only. query_logs_df must have mean_exec_time_ms, calls, rows_affected, shared_blks_*."""
     logger.info("Training Anomaly Detector Model")
     # Anomaly detector requires at least 100 samples internally
@@ -268,6 +282,7 @@ def train_anomaly(models_dir, query_logs_df):
         return False
     detector_path = models_dir / "anomaly_detector.pkl"
     detector.save_model(str(detector_path))
+    save_compiled(detector, detector_path, export_compiled)
     logger.info("Anomaly detector model saved to %s", detector_path)
     return True
 
@@ -286,6 +301,7 @@ Examples:
   python scripts/ml-optimization/train_model.py --model all --limit 200000
   python scripts/ml-optimization/train_model.py --model all --limit 0
   python scripts/ml-optimization/train_model.py --model predictor --limit 100000
+  python scripts/ml-optimization/train_model.py --model all --export-compiled
         """,
     )
     parser.add_argument(
@@ -307,6 +323,14 @@ Examples:
             "Use 0 for no SQL LIMIT (high RAM and train time)."
         ),
     )
+    parser.add_argument(
+        "--export-compiled",
+        action="store_true",
+        help=(
+            "Also write NumPy-only inference artifacts (.npz next to each .pkl) for the predictor, "
+            "anomaly detector and cache predictor; the API serves from them when present."
+        ),
+    )
     args = parser.parse_args()
 
     if args.limit is not None:
@@ -369,13 +393,13 @@ Examples:
                 if not train_clustering(models_dir, query_logs_df):
                     success = False
             elif model_name == "predictor":
-                if not train_predictor(models_dir, query_logs_df):
+                if not train_predictor(models_dir, query_logs_df, args.export_compiled):
                     success = False
             elif model_name == "anomaly":
-                if not train_anomaly(models_dir, query_logs_df):
+                if not train_anomaly(models_dir, query_logs_df, args.export_compiled):
                     success = False
             elif model_name == "cache":
-                if not train_cache_predictor(models_dir, query_logs_df):
+                if not train_cache_predictor(models_dir, query_logs_df, args.export_compiled):
                     success = False
         except Exception as e:
             logger.error("Error training %s: %s", model_name, e, exc_info=True)
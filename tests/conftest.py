@@ -7,10 +7,13 @@ import pytest
 import psycopg2
 import os
 from typing import Generator
+import importlib
 import sys
+import types
 
 # Add project root to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
 
 
 @pytest.fixture(scope="session")
@@ -57,3 +60,38 @@ def redis_client():
     client.close()
 
 
+@pytest.fixture(scope="module")
+def ml_models():
+    """
+    The ml-optimization model modules, as attributes (ml_models.fast_inference, ...).
+
+    The model code imports ml_optimization.config, which lives in the ml-optimization folder
+    rather than the ml_optimization package, so that name is mapped to the folder first.
+    The mapping, the sys.path entry and the imported modules are removed again after the
+    requesting test module, so other tests see the real packages.
+    """
+    ml_dir = os.path.join(PROJECT_ROOT, "ml-optimization")
+    added_path = ml_dir not in sys.path
+    if added_path:
+        sys.path.insert(0, ml_dir)
+    loaded = set(sys.modules)
+    import ml_optimization
+    had_config = hasattr(ml_optimization, "config")
+    if "ml_optimization.config" not in sys.modules:
+        config_package = types.ModuleType("ml_optimization.config")
+        config_package.__path__ = [os.path.join(ml_dir, "config")]
+        sys.modules["ml_optimization.config"] = config_package
+        ml_optimization.config = config_package
+    try:
+        yield types.SimpleNamespace(**{
+            name: importlib.import_module(f"models.{name}")
+            for name in ("anomaly_detector", "cache_predictor", "fast_inference", "query_time_predictor")
+        })
+    finally:
+        for name in set(sys.modules) - loaded:
+            if name.split(".")[0] == "models" or name.startswith("ml_optimization.config"):
+                del sys.modules[name]
+        if not had_config and hasattr(ml_optimization, "config"):
+            del ml_optimization.config
+        if added_path:
+            sys.path.remove(ml_dir)
@@ -0,0 +1,86 @@
+"""
+Duplicate Validation Integration Tests
+Checks that DuplicateValidator picks the cheapest sound check per table and finds duplicates.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from etl.utils.duplicate_checker import DuplicateValidator
+
+
+class TestDuplicateValidator:
+    """Constraint, window, sample and full duplicate checks."""
+
+    @pytest.fixture
+    def tables(self, db_connection, test_schema):
+        cursor = db_connection.cursor()
+        cursor.execute(f"""
+            CREATE TABLE {test_schema}.keyed (id INT PRIMARY KEY, _etl_timestamp TIMESTAMP);
+            CREATE TABLE {test_schema}.loose (id INT, _etl_timestamp TIMESTAMP);
+            CREATE TABLE {test_schema}.pairs (a INT, b INT);
+            INSERT INTO {test_schema}.keyed SELECT g, now() FROM generate_series(1, 10) g;
+            -- id 1 duplicated by an old row and a new one, id 2 only among old rows
+            INSERT INTO {test_schema}.loose VALUES
+                (1, now() - interval '2 days'), (1, now()), (2, now() - interval '2 days'),
+                (2, now() - interval '2 days'), (3, now());
+            INSERT INTO {test_schema}.pairs VALUES (1, 1), (1, 2), (1, 2), (2, 1);
+        """)
+        cursor.close()
+        return test_schema
+
+    def _run(self, connection, schema, since=None, **kwargs):
+        validator = DuplicateValidator(connection, run_id="test-run", since=since, **kwargs)
+        results = validator.validate({schema: {
+            'keyed': ['id'], 'loose': ['id'], 'pairs': ['a', 'b'],
+        }})
+        return {r.table: r for r in results}
+
+    def test_unique_index_is_trusted(self, db_connection, tables):
+        result = self._run(db_connection, tables)['keyed']
+        assert result.method == 'constraint'
+        assert result.duplicates == 0
+
+    def test_window_checks_only_new_keys(self, db_connection, tables):
+        since = datetime.now() - timedelta(days=1)
+        results = self._run(db_connection, tables, since=since)
+        assert results['loose'].method == 'window'
+        assert results['loose'].rows_checked == 2
+        assert results['loose'].duplicates == 1
+        # Tables without _etl_timestamp are checked whole
+        assert results['pairs'].method == 'full'
+        assert results['pairs'].duplicates == 1
+
+    def test_full_check_without_window(self, db_connection, tables):
+        results = self._run(db_connection, tables)
+        assert results['loose'].method == 'full'
+        assert results['loose'].duplicates == 2
+
+    def test_sample_estimate_over_threshold(self, db_connection, tables):
+        cursor = db_connection.cursor()
+        cursor.execute(f"ANALYZE {tables}.loose")
+        cursor.close()
+        result = self._run(db_connection, tables, sample_threshold=1, sample_rows=10**6)['loose']
+        assert result.method == 'sample'
+        assert result.is_estimate
+        assert result.duplicates == 2
+
+    def test_checks_are_recorded(self, db_connection, tables):
+        self._run(db_connection, tables)
+        cursor = db_connection.cursor()
+        cursor.execute("""
+            SELECT COUNT(*) FROM monitoring.duplicate_checks WHERE run_id = 'test-run'
+        """)
+        assert cursor.fetchone()[0] >= 3
+        cursor.execute("DELETE FROM monitoring.duplicate_checks WHERE run_id = 'test-run'")
+        cursor.close()
+
+    def test_window_start_covers_client_and_database_clocks(self, db_connection):
+        since = DuplicateValidator.window_start(db_connection)
+        cursor = db_connection.cursor()
+        cursor.execute("SELECT LOCALTIMESTAMP")
+        database_now = cursor.fetchone()[0]
+        cursor.close()
+        # Rows stamped by either clock after the run started fall inside the window
+        assert since <= datetime.now()
+        assert since <= database_now
@@ -5,7 +5,7 @@ Tests for end-to-end ETL pipeline functionality.
 
 import pytest
 import psycopg2
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import pandas as pd
 
 
@@ -209,3 +209,288 @@ class TestSilverToGoldAggregation:
         cursor.close()
 
 
+
+
+class _SavepointConnection:
+    """Connection whose commits and rollbacks stay inside the test's transaction."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._execute("SAVEPOINT aggregator")
+
+    def _execute(self, sql):
+        cursor = self._connection.cursor()
+        cursor.execute(sql)
+        cursor.close()
+
+    def cursor(self, *args, **kwargs):
+        return self._connection.cursor(*args, **kwargs)
+
+    def commit(self):
+        self._execute("RELEASE SAVEPOINT aggregator; SAVEPOINT aggregator")
+
+    def rollback(self):
+        self._execute("ROLLBACK TO SAVEPOINT aggregator")
+
+
+@pytest.fixture
+def warehouse(db_connection):
+    """Cursor in a transaction rolled back after the test, foreign keys not enforced."""
+    cursor = db_connection.cursor()
+    cursor.execute("SELECT to_regclass('gold.agg_customer_lifetime'), to_regclass('silver.orders'), "
+                   "to_regclass('gold.fact_inventory_snapshot')")
+    if None in cursor.fetchone():
+        pytest.skip("warehouse schema not loaded in the test database")
+    db_connection.autocommit = False
+    # Fixture rows skip the foreign keys to person / employee / warehouse
+    cursor.execute("SET LOCAL session_replication_role = replica")
+    yield cursor
+    db_connection.rollback()
+    db_connection.autocommit = True
+    cursor.close()
+
+
+class TestIncrementalAggregates:
+    """Delta-maintained gold aggregates match a full rebuild after silver rows change."""
+
+    CUSTOMERS = (990000001, 990000002, 990000003)
+    YEAR = 2091
+
+    def _seed(self, cursor):
+        """Three customers, two categories and four orders in test-only months."""
+        old = datetime(2000, 1, 1)
+        cursor.execute("""
+            INSERT INTO silver.product (product_id, product_name, category_name, _etl_timestamp)
+            VALUES (990000001, 'Widget', 'TestCatA', %(old)s), (990000002, 'Gadget', 'TestCatB', %(old)s)
+        """, {'old': old})
+        for customer_id in self.CUSTOMERS:
+            cursor.execute("""
+                INSERT INTO silver.customer (customer_id, person_key, _etl_timestamp)
+                VALUES (%s, 0, %s)
+            """, (customer_id, old))
+        orders = [
+            # order_id, customer, month, [(product, price, quantity)]
+            (990000001, 990000001, 1, [(990000001, 10, 2), (990000002, 5, 1)]),
+            (990000002, 990000001, 1, [(990000001, 10, 1)]),
+            (990000003, 990000002, 2, [(990000002, 7, 3)]),
+            (990000004, 990000003, 4, [(990000001, 10, 5)]),
+        ]
+        for item_id, (order_id, customer_id, month, items) in enumerate(orders):
+            cursor.execute("""
+                INSERT INTO silver.orders (order_id, customer_key, order_date, order_status, _etl_timestamp)
+                SELECT %s, customer_key, %s, 'COMPLETED', %s FROM silver.customer WHERE customer_id = %s
+            """, (order_id, date(self.YEAR, month, 10), old, customer_id))
+            for n, (product_id, price, quantity) in enumerate(items):
+                cursor.execute("""
+                    INSERT INTO silver.order_item
+                        (order_item_id, order_key, product_key, unit_price, quantity, _etl_timestamp)
+                    SELECT %s, o.order_key, p.product_key, %s, %s, %s
+                    FROM silver.orders o, silver.product p
+                    WHERE o.order_id = %s AND p.product_id = %s
+                """, (990000000 + item_id * 10 + n, price, quantity, old, order_id, product_id))
+
+    def _change(self, cursor):
+        """Re-key, re-date, invalidate and add silver rows, stamped after the watermark."""
+        now = datetime.now() + timedelta(hours=1)
+        # Order 2 moves from customer 1 to customer 2
+        cursor.execute("""
+            UPDATE silver.orders SET _etl_timestamp = %s,
+                customer_key = (SELECT customer_key FROM silver.customer WHERE customer_id = 990000002)
+            WHERE order_id = 990000002
+        """, (now,))
+        # Order 3 moves to March; February has no orders left
+        cursor.execute("UPDATE silver.orders SET order_date = %s, _etl_timestamp = %s WHERE order_id = 990000003",
+                       (date(self.YEAR, 3, 10), now))
+        # Customer 3 is no longer valid
+        cursor.execute("UPDATE silver.customer SET is_valid = FALSE, _etl_timestamp = %s WHERE customer_id = 990000003",
+                       (now,))
+        # TestCatB products are retired and January gets a new item, so it is recomputed
+        cursor.execute("UPDATE silver.product SET is_valid = FALSE WHERE product_id = 990000002")
+        cursor.execute("""
+            INSERT INTO silver.order_item (order_item_id, order_key, product_key, unit_price, quantity, _etl_timestamp)
+            SELECT 990000099, o.order_key, p.product_key, 10, 1, %s
+            FROM silver.orders o, silver.product p
+            WHERE o.order_id = 990000001 AND p.product_id = 990000001
+        """, (now,))
+
+    def _gold(self, cursor):
+        cursor.execute("""
+            SELECT c.customer_id, g.first_order_date, g.last_order_date, g.total_orders,
+                   g.total_items_purchased, g.lifetime_net_value, g.rfm_segment, g.customer_tier
+            FROM gold.agg_customer_lifetime g
+            JOIN silver.customer c ON c.customer_key = g.customer_key
+            WHERE c.customer_id = ANY(%s)
+            ORDER BY 1
+        """, (list(self.CUSTOMERS),))
+        lifetime = cursor.fetchall()
+        cursor.execute("""
+            SELECT month_number, category_name, total_quantity_sold, total_orders,
+                   net_revenue, category_rank
+            FROM gold.agg_monthly_product_sales
+            WHERE year_number = %s
+            ORDER BY 1, 2
+        """, (self.YEAR,))
+        return lifetime, cursor.fetchall()
+
+    def test_incremental_run_matches_full_rebuild(self, db_connection, warehouse):
+        from etl.aggregators.silver_to_gold import SilverToGoldAggregator
+        from etl.transformers.watermarks import WatermarkStore
+
+        self._seed(warehouse)
+        connection = _SavepointConnection(db_connection)
+        watermarks = WatermarkStore(connection)
+        watermarks.ensure_table_exists()
+        aggregator = SilverToGoldAggregator(connection, watermarks=watermarks)
+        aggregator.aggregate_customer_lifetime(full_reconcile=True)
+        aggregator.aggregate_monthly_product_sales(full_reconcile=True)
+
+        self._change(warehouse)
+        aggregator.aggregate_customer_lifetime()
+        aggregator.aggregate_monthly_product_sales()
+        incremental = self._gold(warehouse)
+
+        aggregator.aggregate_customer_lifetime(force_refresh=True)
+        aggregator.aggregate_monthly_product_sales(force_refresh=True)
+        rebuilt = self._gold(warehouse)
+
+        assert incremental == rebuilt
+        lifetime, monthly = incremental
+        assert [row[0] for row in lifetime] == [990000001, 990000002]
+        assert [row[3] for row in lifetime] == [1, 2]
+        # February emptied, TestCatB gone from January; March only has retired products
+        assert [(row[0], row[1]) for row in monthly] == [(1, 'TestCatA'), (4, 'TestCatA')]
+
+        # Moving an order away leaves no newer row for its old customer: the delta run
+        # recomputes only the new owner, the full reconcile repairs the old one
+        warehouse.execute("""
+            UPDATE silver.orders SET _etl_timestamp = %s,
+                customer_key = (SELECT customer_key FROM silver.customer WHERE customer_id = 990000001)
+            WHERE order_id = 990000002
+        """, (datetime.now() + timedelta(hours=2),))
+        aggregator.aggregate_customer_lifetime()
+        assert [row[3] for row in self._gold(warehouse)[0]] == [2, 2]
+        aggregator.aggregate_customer_lifetime(full_reconcile=True)
+        assert [row[3] for row in self._gold(warehouse)[0]] == [2, 1]
+
+
+class TestIncrementalInventorySnapshot:
+    """A change-tracked snapshot date matches a full rebuild and the set-based backfill."""
+
+    PRODUCTS = (990000101, 990000102, 990000103)
+    WAREHOUSE_KEY = 990000101
+    DAY = date(2091, 5, 1)
+
+    def _seed(self, cursor):
+        """Three products, each stocked in one test warehouse."""
+        old = datetime(2000, 1, 1)
+        for n, product_id in enumerate(self.PRODUCTS):
+            cursor.execute("""
+                INSERT INTO silver.product (product_id, product_name, list_price, _etl_timestamp)
+                VALUES (%s, 'Stock item', %s, %s)
+            """, (product_id, 10 + n, old))
+            cursor.execute("""
+                INSERT INTO silver.inventory
+                    (inventory_id, product_key, warehouse_key, quantity_on_hand, quantity_available, _etl_timestamp)
+                SELECT %s, product_key, %s, %s, %s, %s FROM silver.product WHERE product_id = %s
+            """, (product_id, self.WAREHOUSE_KEY, 100, 50 - n * 20, old, product_id))
+
+    def _change(self, cursor):
+        """New stock level, a repriced product, an invalidated row and a new stocked product."""
+        now = datetime.now() + timedelta(hours=1)
+        cursor.execute("""
+            UPDATE silver.inventory SET quantity_available = 5, _etl_timestamp = %s
+            WHERE inventory_id = %s
+        """, (now, self.PRODUCTS[0]))
+        cursor.execute("UPDATE silver.product SET list_price = 99, _etl_timestamp = %s WHERE product_id = %s",
+                       (now, self.PRODUCTS[1]))
+        cursor.execute("UPDATE silver.inventory SET is_valid = FALSE, _etl_timestamp = %s WHERE inventory_id = %s",
+                       (now, self.PRODUCTS[2]))
+        cursor.execute("""
+            INSERT INTO silver.product (product_id, product_name, list_price, _etl_timestamp)
+            VALUES (990000104, 'New stock item', 7, %s)
+        """, (now,))
+        cursor.execute("""
+            INSERT INTO silver.inventory
+                (inventory_id, product_key, warehouse_key, quantity_on_hand, quantity_available, _etl_timestamp)
+            SELECT 990000104, product_key, %s, 3, 0, %s FROM silver.product WHERE product_id = 990000104
+        """, (self.WAREHOUSE_KEY, now))
+
+    def _snapshot(self, cursor, day):
+        cursor.execute("""
+            SELECT p.product_id, f.quantity_on_hand, f.quantity_available, f.quantity_reserved,
+                   f.days_of_supply, f.stock_status, f.inventory_value
+            FROM gold.fact_inventory_snapshot f
+            JOIN silver.product p ON p.product_key = f.product_key
+            WHERE f.snapshot_date_key = %s AND f.warehouse_key = %s
+            ORDER BY 1
+        """, (int(day.strftime('%Y%m%d')), self.WAREHOUSE_KEY))
+        return cursor.fetchall()
+
+    def test_delta_snapshot_matches_full_rebuild(self, db_connection, warehouse):
+        from etl.aggregators.silver_to_gold import SilverToGoldAggregator
+        from etl.transformers.watermarks import WatermarkStore
+
+        self._seed(warehouse)
+        connection = _SavepointConnection(db_connection)
+        watermarks = WatermarkStore(connection)
+        watermarks.ensure_table_exists()
+        aggregator = SilverToGoldAggregator(connection, watermarks=watermarks)
+        aggregator.populate_fact_inventory_snapshot(self.DAY, full_reconcile=True)
+        assert [row[0] for row in self._snapshot(warehouse, self.DAY)] == list(self.PRODUCTS)
+
+        self._change(warehouse)
+        next_day = self.DAY + timedelta(days=1)
+        aggregator.populate_fact_inventory_snapshot(next_day)
+        incremental = self._snapshot(warehouse, next_day)
+
+        aggregator.populate_fact_inventory_snapshot(next_day, force_refresh=True)
+        assert self._snapshot(warehouse, next_day) == incremental
+
+        backfill_days = (next_day + timedelta(days=1), next_day + timedelta(days=2))
+        assert aggregator.backfill_inventory_snapshots(*backfill_days) >= 2 * len(incremental)
+        for day in backfill_days:
+            assert self._snapshot(warehouse, day) == incremental
+
+        # Product 3 is gone, product 4 is new; product 2 is repriced, product 1 low on stock
+        assert [row[0] for row in incremental] == [990000101, 990000102, 990000104]
+        assert [row[5] for row in incremental] == ['LOW_STOCK', 'IN_STOCK', 'OUT_OF_STOCK']
+        assert incremental[1][6] == 100 * 99
+
+
+class TestDateDimension:
+    """gold.dim_date rows generated in SQL carry the configured fiscal periods and holidays."""
+
+    def test_fiscal_and_holiday_columns_across_year_end(self, db_connection):
+        from etl.aggregators.date_dimension import CalendarConfig, DateDimension, US_FEDERAL_HOLIDAYS
+
+        cursor = db_connection.cursor()
+        cursor.execute("SELECT to_regclass('gold.dim_date')")
+        if cursor.fetchone()[0] is None:
+            pytest.skip("warehouse schema not loaded in the test database")
+        db_connection.autocommit = False
+        try:
+            connection = _SavepointConnection(db_connection)
+            start, end = date(2095, 6, 29), date(2096, 1, 2)
+            cursor.execute("DELETE FROM gold.dim_date WHERE full_date BETWEEN %s AND %s", (start, end))
+            config = CalendarConfig(fiscal_year_start_month=7, holidays=US_FEDERAL_HOLIDAYS)
+            assert DateDimension(config).ensure_range(connection, start, end) == (end - start).days + 1
+
+            cursor.execute("""
+                SELECT full_date, day_name, is_holiday, holiday_name,
+                       fiscal_year, fiscal_quarter, fiscal_month
+                FROM gold.dim_date
+                WHERE full_date IN (%s, %s, %s, %s, %s)
+                ORDER BY full_date
+            """, (date(2095, 6, 30), date(2095, 7, 1), date(2095, 7, 4),
+                  date(2095, 12, 31), date(2096, 1, 1)))
+            assert cursor.fetchall() == [
+                (date(2095, 6, 30), 'Thursday', False, '', 2095, 4, 12),
+                (date(2095, 7, 1), 'Friday', False, '', 2096, 1, 1),
+                (date(2095, 7, 4), 'Monday', True, 'Independence Day', 2096, 1, 1),
+                (date(2095, 12, 31), 'Saturday', False, '', 2096, 2, 6),
+                (date(2096, 1, 1), 'Sunday', True, "New Year's Day", 2096, 3, 7),
+            ]
+        finally:
+            db_connection.rollback()
+            db_connection.autocommit = True
+            cursor.close()
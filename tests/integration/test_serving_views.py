@@ -0,0 +1,82 @@
+"""
+Serving View Parity Integration Tests
+Checks that the warehouse API returns the same dashboard stats from the gold serving views
+(?from_view=true) as from the gold tables they are defined over.
+"""
+
+import os
+import sys
+
+import pytest
+
+from etl.aggregators.serving_views import TOP_PRODUCT_WINDOWS, ServingViewManager
+
+pytest.importorskip("fastapi")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ml-optimization"))
+from api.routes import warehouse_routes  # noqa: E402
+
+
+def _products(rows):
+    """Top-product rows without ties in revenue order affecting the comparison."""
+    return sorted(
+        (r["product"], int(r["sales_count"]), round(r["revenue"], 2), float(r["quantity"]))
+        for r in rows
+    )
+
+
+def _without_source(stats):
+    return {k: v for k, v in stats.items() if k != "source"}
+
+
+@pytest.fixture
+def gold(db_connection):
+    """Autocommit connection with the gold serving views refreshed from the current tables."""
+    cursor = db_connection.cursor()
+    cursor.execute("SELECT to_regclass('gold.fact_sales') IS NOT NULL AND to_regclass('gold.fact_orders') IS NOT NULL")
+    if not cursor.fetchone()[0]:
+        pytest.skip("gold schema is not deployed")
+    cursor.close()
+    refreshed = ServingViewManager(db_connection).refresh_all()
+    assert set(refreshed) == {"mv_daily_sales_by_category", "mv_top_products", "mv_customer_tiers"}
+    return db_connection
+
+
+class TestServingViewParity:
+    """from_view responses match the table path row for row."""
+
+    def test_windows_match_the_view_definition(self):
+        assert warehouse_routes.TOP_PRODUCT_VIEW_WINDOWS == frozenset(TOP_PRODUCT_WINDOWS)
+
+    @pytest.mark.parametrize("days", [0, 60])
+    def test_sales_stats(self, gold, days):
+        from_tables = warehouse_routes._fetch_sales_stats(gold, daily_lookback_days=days)
+        from_views = warehouse_routes._fetch_sales_stats(gold, daily_lookback_days=days, from_view=True)
+        assert from_tables["source"]["kind"] == "tables"
+        assert from_views["source"]["kind"] == "view"
+
+        totals, view_totals = from_tables["total_sales"], from_views["total_sales"]
+        assert view_totals["count"] == totals["count"]
+        assert view_totals["total_quantity"] == int(totals["total_quantity"])
+        assert view_totals["revenue"] == pytest.approx(totals["revenue"])
+        assert view_totals["avg_sale"] == pytest.approx(totals["avg_sale"])
+        assert from_views["daily_sales"] == [
+            dict(day, revenue=pytest.approx(day["revenue"])) for day in from_tables["daily_sales"]
+        ]
+        assert _products(from_views["top_products"]) == _products(from_tables["top_products"])
+
+    @pytest.mark.parametrize("window_days", sorted(TOP_PRODUCT_WINDOWS))
+    def test_top_products(self, gold, window_days):
+        # A limit past the product count, so ties at the cut-off cannot differ
+        limit = 1_000_000
+        assert _products(warehouse_routes._top_products_from_view(gold, limit, window_days)) == \
+            _products(warehouse_routes._top_products_from_tables(gold, limit, window_days))
+
+    def test_customer_stats(self, gold):
+        from_tables = warehouse_routes._fetch_customer_stats(gold)
+        from_views = warehouse_routes._fetch_customer_stats(gold, from_view=True)
+        assert from_views["source"]["kind"] == "view"
+        assert from_views["total_customers"] == from_tables["total_customers"]
+        assert from_views["orders"]["unique_customers"] == from_tables["orders"]["unique_customers"]
+        assert from_views["orders"]["total_orders"] == from_tables["orders"]["total_orders"]
+        assert from_views["orders"]["total_revenue"] == pytest.approx(from_tables["orders"]["total_revenue"])
+        assert _without_source(from_views).keys() - _without_source(from_tables).keys() == {"tiers"}
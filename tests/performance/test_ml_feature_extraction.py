@@ -0,0 +1,133 @@
+"""
+Query Time Predictor Feature Extraction Tests
+Checks the columnar extract_features against the previous row-by-row implementation,
+for identical output and for speed on 1M query log rows.
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def qtp(ml_models):
+    """models.query_time_predictor"""
+    return ml_models.query_time_predictor
+
+
+def legacy_extract_features(query_logs: pd.DataFrame, feature_names):
+    """Row-by-row extraction as QueryTimePredictor did it before the columnar pipeline."""
+    features = []
+    targets = []
+    for _, row in query_logs.iterrows():
+        extracted = row.get('extracted_features', {})
+        if isinstance(extracted, str):
+            extracted = json.loads(extracted)
+        features.append([
+            extracted.get('table_count', 0),
+            extracted.get('join_count', 0),
+            extracted.get('has_aggregation', 0),
+            extracted.get('has_window_function', 0),
+            extracted.get('has_subquery', 0),
+            extracted.get('has_cte', 0),
+            extracted.get('filter_predicate_count', 0),
+            extracted.get('order_by_count', 0),
+            extracted.get('group_by_count', 0),
+            np.log1p(extracted.get('estimated_rows', 0) or 0),
+            np.log1p(extracted.get('estimated_cost', 0) or 0),
+            extracted.get('plan_depth', 0) or 0,
+            row.get('calls', 0),
+        ])
+        targets.append(row.get('mean_exec_time_ms', 0))
+    return pd.DataFrame(features, columns=feature_names), pd.Series(targets)
+
+
+def make_query_logs(rows: int, statements: int, seed: int = 0) -> pd.DataFrame:
+    """Query log snapshots of ``statements`` distinct statements, features stored as JSON text."""
+    rng = np.random.default_rng(seed)
+    variants = []
+    for i in range(statements):
+        planned = rng.random() < 0.6
+        features = {
+            'query_type': 'SELECT',
+            'table_count': int(rng.integers(1, 8)),
+            'join_count': int(rng.integers(0, 6)),
+            'has_aggregation': bool(rng.random() < 0.5),
+            'has_window_function': bool(rng.random() < 0.1),
+            'has_subquery': int(rng.random() < 0.2),
+            'has_cte': int(rng.random() < 0.1),
+            'filter_predicate_count': int(rng.integers(0, 5)),
+            'order_by_count': int(rng.integers(0, 2)),
+            'group_by_count': int(rng.integers(0, 2)),
+            'estimated_rows': int(rng.integers(1, 10 ** 7)) if planned else None,
+            'estimated_cost': round(float(rng.random() * 10 ** 5), 2) if planned else None,
+            'plan_depth': int(rng.integers(1, 12)) if planned else None,
+        }
+        if i % 7 == 0:
+            del features['group_by_count']
+        variants.append(json.dumps(features))
+    picks = rng.integers(0, statements, size=rows)
+    return pd.DataFrame({
+        'query_text': [f'SELECT {p}' for p in picks],
+        'mean_exec_time_ms': rng.gamma(2.0, 40.0, size=rows),
+        'calls': rng.integers(1, 500, size=rows),
+        'extracted_features': np.array(variants, dtype=object)[picks],
+    })
+
+
+def assert_same_features(qtp, query_logs: pd.DataFrame):
+    X, y = qtp.QueryTimePredictor().extract_features(query_logs)
+    X_ref, y_ref = legacy_extract_features(query_logs, qtp.FEATURE_NAMES)
+    assert list(X.columns) == qtp.FEATURE_NAMES
+    assert X.dtypes.eq(np.float32).all()
+    np.testing.assert_array_equal(X.to_numpy(), X_ref.to_numpy(dtype=np.float64).astype(np.float32))
+    np.testing.assert_array_equal(y.to_numpy(dtype=np.float64), y_ref.to_numpy(dtype=np.float64))
+
+
+class TestFeatureExtraction:
+    """The columnar pipeline reproduces the row-by-row features exactly."""
+
+    def test_matches_row_by_row_on_json_text(self, qtp):
+        assert_same_features(qtp, make_query_logs(2000, 150, seed=1))
+
+    def test_matches_row_by_row_on_decoded_dicts(self, qtp):
+        logs = make_query_logs(500, 40, seed=2)
+        # psycopg2 returns JSONB as dicts; mix both forms
+        logs['extracted_features'] = [
+            json.loads(v) if i % 2 else v for i, v in enumerate(logs['extracted_features'])
+        ]
+        assert_same_features(qtp, logs)
+
+    def test_missing_columns_read_as_zero(self, qtp):
+        logs = pd.DataFrame({'extracted_features': ['{}', '{"join_count": 2}']})
+        X, y = qtp.QueryTimePredictor().extract_features(logs)
+        assert X['join_count'].tolist() == [0, 2]
+        assert X['calls'].tolist() == [0, 0]
+        assert y.tolist() == [0, 0]
+        assert qtp.QueryTimePredictor().feature_matrix(logs.iloc[:0]).shape == (0, len(qtp.FEATURE_NAMES))
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestFeatureExtractionBenchmark:
+    """Columnar extraction on 1M rows is at least 10x faster than row by row."""
+
+    def test_one_million_rows(self, qtp):
+        logs = make_query_logs(1_000_000, 20_000, seed=3)
+
+        start = time.perf_counter()
+        X, y = qtp.QueryTimePredictor().extract_features(logs)
+        columnar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        X_ref, y_ref = legacy_extract_features(logs, qtp.FEATURE_NAMES)
+        legacy_s = time.perf_counter() - start
+
+        np.testing.assert_array_equal(X.to_numpy(), X_ref.to_numpy(dtype=np.float64).astype(np.float32))
+        np.testing.assert_array_equal(y.to_numpy(), y_ref.to_numpy(dtype=np.float64))
+        print(f"\nextract_features on 1M rows: row by row {legacy_s:.1f}s, columnar {columnar_s:.2f}s "
+              f"(x{legacy_s / columnar_s:.0f})")
+        assert legacy_s / columnar_s >= 10
@@ -0,0 +1,113 @@
+"""
+DAG Executor Tests
+Checks dependency ordering, concurrent branches, failure handling, graph validation and the
+reported critical path with stub step callables.
+"""
+
+import threading
+import time
+
+import pytest
+
+from etl.utils.dag_executor import DagExecutor
+
+
+def _step(name, log, seconds=0.0, result=None):
+    """Step that records its start and end in ``log``."""
+    def run():
+        log.append(("start", name))
+        if seconds:
+            time.sleep(seconds)
+        log.append(("end", name))
+        return name if result is None else result
+    return run
+
+
+class TestDagExecutor:
+    """Steps start once their dependencies finish; failures only stop their dependents."""
+
+    def test_dependencies_finish_first(self):
+        log = []
+        result = DagExecutor(max_workers=4).run([
+            ("orders", _step("orders", log), ("customers", "products")),
+            ("customers", _step("customers", log, 0.02), ()),
+            ("products", _step("products", log), ()),
+            ("order_items", _step("order_items", log), ("orders",)),
+        ])
+        position = {event: i for i, event in enumerate(log)}
+        assert position[("end", "customers")] < position[("start", "orders")]
+        assert position[("end", "products")] < position[("start", "orders")]
+        assert position[("end", "orders")] < position[("start", "order_items")]
+        assert result.results == {name: name for name in ("orders", "customers", "products", "order_items")}
+        assert result.skipped == []
+
+    def test_independent_branches_run_concurrently(self):
+        # Each branch waits for the other to arrive; run one at a time, the barrier breaks
+        barrier = threading.Barrier(2, timeout=5)
+        result = DagExecutor(max_workers=2).run([
+            ("countries", barrier.wait, ()),
+            ("persons", barrier.wait, ()),
+        ])
+        assert result.timings["countries"]["worker"] != result.timings["persons"]["worker"]
+
+    def test_single_worker_runs_in_declaration_order(self):
+        log = []
+        DagExecutor(max_workers=1).run([
+            ("b", _step("b", log), ()),
+            ("a", _step("a", log), ()),
+            ("c", _step("c", log), ("a",)),
+        ])
+        assert [name for event, name in log if event == "start"] == ["b", "a", "c"]
+
+    def test_failure_skips_dependents_only(self):
+        log = []
+
+        def fail():
+            raise RuntimeError("locations failed")
+
+        with pytest.raises(RuntimeError, match="locations failed") as failure:
+            DagExecutor(max_workers=2).run([
+                ("countries", _step("countries", log), ()),
+                ("locations", fail, ("countries",)),
+                ("warehouses", _step("warehouses", log), ("locations",)),
+                ("inventory", _step("inventory", log), ("warehouses", "products")),
+                ("products", _step("products", log, 0.02), ()),
+                ("persons", _step("persons", log), ("products",)),
+            ])
+        result = failure.value.dag_result
+        assert result.skipped == ["warehouses", "inventory"]
+        assert set(result.results) == {"countries", "products", "persons"}
+        assert result.timings["locations"]["status"] == "failed"
+        assert ("start", "warehouses") not in log and ("start", "inventory") not in log
+        assert result.to_metrics()["skipped"] == ["warehouses", "inventory"]
+
+    @pytest.mark.parametrize("nodes, message", [
+        ([("a", None, ("b",)), ("b", None, ("a",))], "cycle"),
+        ([("a", None, ("a",))], "cycle"),
+        ([("a", None, ("missing",))], "unknown"),
+        ([("a", None, ()), ("a", None, ())], "Duplicate"),
+    ])
+    def test_invalid_graphs(self, nodes, message):
+        with pytest.raises(ValueError, match=message):
+            DagExecutor().run(nodes)
+
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            DagExecutor(max_workers=0)
+
+    def test_critical_path_follows_the_slowest_dependency(self):
+        log = []
+        result = DagExecutor(max_workers=3).run([
+            ("countries", _step("countries", log, 0.01), ()),
+            ("products", _step("products", log, 0.08), ()),
+            ("persons", _step("persons", log, 0.01), ()),
+            ("inventory", _step("inventory", log, 0.01), ("countries", "products")),
+            ("customers", _step("customers", log, 0.01), ("persons",)),
+        ])
+        assert result.critical_path == ["products", "inventory"]
+        metrics = result.to_metrics()
+        assert metrics["critical_path"] == ["products", "inventory"]
+        assert metrics["critical_path_seconds"] == pytest.approx(
+            result.timings["products"]["seconds"] + result.timings["inventory"]["seconds"], abs=1e-3
+        )
+        assert set(metrics["nodes"]) == {"countries", "products", "persons", "inventory", "customers"}
@@ -1,2 +1,295 @@
-# Data generator tests
+"""
+Data Generator Tests
+Checks the columnar generation mode against the dict API, the COPY rendering of batches
+JSONB encoding and the streaming loader's pacing and error handling.
+"""
 
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "data-generator"))
+
+from config import DataGeneratorConfig  # noqa: E402
+from generators import ClickstreamGenerator, ColumnBatch, CustomerGenerator, OrderGenerator  # noqa: E402
+from generators import ProductGenerator, SessionGenerator  # noqa: E402
+from loaders import batch_loader  # noqa: E402
+from loaders.batch_loader import JsonbAdapter, dumps_jsonb  # noqa: E402
+from loaders.stream_loader import StreamLoader, continuous_source  # noqa: E402
+
+
+class TestColumnBatch:
+    """Column batches render to COPY text and back to dict records."""
+
+    def test_copy_text_escapes_and_nulls(self):
+        batch = ColumnBatch(
+            {
+                'id': np.array([1, 2]),
+                'name': np.array(['a\tb', 'back\\slash']),
+                'note': np.array([None, 'x'], dtype=object),
+                'flag': np.array([True, False]),
+                'at': np.array(['2024-01-02T03:04:05'], dtype='datetime64[us]').repeat(2),
+            },
+            {'info': {'city': np.array(['Köln', 'Line\nTwo']), 'n': np.array([1.5, 2.0])}},
+        )
+        lines = batch.to_copy_text(['id', 'name', 'note', 'flag', 'at', 'info']).splitlines()
+        assert lines[0] == '1\ta\\tb\t\\N\tt\t2024-01-02T03:04:05.000000\t{"city": "K\\\\u00f6ln", "n": 1.5}'
+        assert lines[1].split('\t')[1] == 'back\\\\slash'
+        assert lines[1].endswith('{"city": "Line\\\\nTwo", "n": 2.0}')
+
+    def test_records_and_take(self):
+        batch = ColumnBatch({'id': np.arange(5)}, {'info': {'v': np.arange(5) * 2}})
+        part = batch.take(slice(1, 3))
+        assert len(part) == 2
+        assert part.to_records() == [{'id': 1, 'info': {'v': 2}}, {'id': 2, 'info': {'v': 4}}]
+        assert [len(c) for c in batch.chunks(2)] == [2, 2, 1]
+
+
+class TestColumnarGenerators:
+    """Columnar batches carry the dict API's fields and are reproducible per seed."""
+
+    def setup_method(self):
+        self.config = DataGeneratorConfig(days_of_data=3, sessions_per_day=20)
+
+    def test_customer_columns_match_dict_fields(self):
+        records = CustomerGenerator(self.config, seed=7).generate(3)
+        batch = CustomerGenerator(self.config, seed=7).generate_columns(300)
+        assert set(batch.names()) == set(records[0]) - {'raw_data'}
+        assert len(set(batch['customer_id'])) == 300
+        assert len(set(batch['email'])) == 300
+        assert batch.to_records()[0]['address'].keys() == records[0]['address'].keys()
+
+    def test_same_seed_reproduces_batch(self):
+        first = ProductGenerator(self.config, seed=3).generate_columns(200)
+        again = ProductGenerator(self.config, seed=3).generate_columns(200)
+        for name in ('product_name', 'description', 'price', 'supplier_id', 'sku'):
+            assert (first[name] == again[name]).all()
+        assert [r['attributes'] for r in first.to_records()] == [r['attributes'] for r in again.to_records()]
+
+    def test_order_totals_follow_items(self):
+        customers = CustomerGenerator(self.config, seed=1).generate_columns(50)
+        products = ProductGenerator(self.config, seed=1).generate_columns(40)
+        orders, items = OrderGenerator(self.config, customers, products, seed=1).generate_columns(
+            500, datetime(2024, 1, 1), datetime(2024, 2, 1)
+        )
+        assert len(orders) == 500
+        low, high = self.config.items_per_order_range
+        per_order = np.unique(items['order_id'], return_counts=True)[1]
+        assert per_order.min() >= low and per_order.max() <= high
+        assert (orders['total_amount'] >= self.config.min_order_amount).all()
+        assert set(items['product_id']) <= set(products['product_id'])
+        assert (orders['order_date'] >= np.datetime64('2024-01-01')).all()
+
+    def test_order_raw_data_matches_dict_api(self):
+        customers = CustomerGenerator(self.config, seed=4).generate(30)
+        products = ProductGenerator(self.config, seed=4).generate(20)
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+        dict_orders, _ = OrderGenerator(self.config, customers, products, seed=4).generate(50, start, end)
+        orders, items = OrderGenerator(self.config, customers, products, seed=4).generate_columns(50, start, end)
+
+        # The same fields reach bronze.raw_orders.raw_data in both modes
+        _, columns = batch_loader.COLUMNAR_TABLES['orders']
+        copied = json.loads(orders.to_copy_text(columns).splitlines()[0].split('\t')[columns.index('raw_data')])
+        expected = json.loads(dumps_jsonb(dict_orders[0]['raw_data']))
+        assert set(copied) == set(expected) - {'raw_data'}
+        assert set(copied['items'][0]) == set(expected['items'][0])
+        assert set(copied['shipping_address']) == set(expected['shipping_address'])
+
+        # raw_data agrees with the order's columns and its order_items rows
+        for order in orders.to_records():
+            raw = order['raw_data']
+            assert raw['order_id'] == order['order_id']
+            assert raw['total_amount'] == order['total_amount']
+            assert raw['payment_method'] in OrderGenerator.PAYMENT_METHODS
+            rows = items.take(items['order_id'] == order['order_id']).to_records()
+            assert [i['product_id'] for i in raw['items']] == [r['product_id'] for r in rows]
+            assert [i['total_amount'] for i in raw['items']] == [r['total_amount'] for r in rows]
+            assert raw['discount_amount'] == pytest.approx(sum(r['discount_amount'] for r in rows), abs=0.06)
+
+    def test_clickstream_from_dict_sessions(self):
+        customers = CustomerGenerator(self.config, seed=2).generate(20)
+        products = ProductGenerator(self.config, seed=2).generate(10)
+        sessions = SessionGenerator(self.config, customers, seed=2).generate(15)
+        events = ClickstreamGenerator(self.config, sessions, products, seed=2).generate_columns()
+        low, high = self.config.events_per_session_range
+        assert 15 * low <= len(events) <= 15 * high
+        by_id = {s['session_id']: s for s in sessions}
+        for event in events.to_records()[:50]:
+            session = by_id[event['session_id']]
+            assert session['start_time'] <= event['event_timestamp'] <= session['end_time']
+            assert event['device_info']['browser'] == session['browser']
+
+
+class TestJsonbEncoding:
+    """dict records are encoded for JSONB in one pass, with or without orjson."""
+
+    RECORD = {
+        'id': 1,
+        'at': datetime(2024, 5, 6, 7, 8, 9, 123),
+        'day': datetime(2024, 5, 6).date(),
+        'items': [{'sku': 'Köln', 'qty': 2}],
+        'none': None,
+    }
+
+    def _expected(self):
+        return {
+            'id': 1, 'at': '2024-05-06T07:08:09.000123', 'day': '2024-05-06',
+            'items': [{'sku': 'Köln', 'qty': 2}], 'none': None,
+        }
+
+    def test_single_pass_matches_round_trip(self, monkeypatch):
+        assert json.loads(dumps_jsonb(self.RECORD)) == self._expected()
+        monkeypatch.setattr(batch_loader, 'orjson', None)
+        assert json.loads(dumps_jsonb(self.RECORD)) == self._expected()
+
+    def test_adapter_serializes_when_quoted(self):
+        quoted = JsonbAdapter({'at': datetime(2024, 1, 2)}).getquoted()
+        assert json.loads(quoted[1:-1]) == {'at': '2024-01-02T00:00:00'}
+        with pytest.raises(TypeError):
+            dumps_jsonb({'value': object()})
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = -1
+
+    def copy_expert(self, sql, stream):
+        if self.connection.fail:
+            raise RuntimeError("copy failed")
+        time.sleep(self.connection.delay)
+        self.connection.copies.append((sql, stream.read()))
+
+    def execute(self, sql, params=None):
+        self.connection.statements.append(sql)
+        if sql.startswith('INSERT'):
+            self.rowcount = self.connection.copies[-1][1].count('\n')
+
+    def fetchone(self):
+        return (self.connection.last_id,)
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, delay=0.0, fail=False, last_id=0):
+        self.delay = delay
+        self.fail = fail
+        self.last_id = last_id
+        self.copies = []
+        self.statements = []
+        self.closed = False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class TestStreamLoader:
+    """The stream loader paces the producer, reports lag and stops on consumer errors."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.config = DataGeneratorConfig(days_of_data=3)
+        cls.customers = CustomerGenerator(cls.config, seed=5).generate_columns(50)
+        cls.products = ProductGenerator(cls.config, seed=5).generate_columns(20)
+        cls.sessions = SessionGenerator(cls.config, cls.customers, seed=5).generate_columns(10)
+
+    def _loader(self, monkeypatch, pool, **kwargs):
+        loader = StreamLoader(self.config, **kwargs)
+        connections = iter(pool)
+        monkeypatch.setattr(loader, '_connect', lambda: next(connections))
+        return loader
+
+    def test_continuous_source_loads_every_row(self, monkeypatch):
+        connections = [_FakeConnection(), _FakeConnection()]
+        loader = self._loader(monkeypatch, connections, connections=2)
+        source = continuous_source(self.config, self.customers, self.products, sessions_per_batch=20, seed=5)
+        stats = asyncio.run(loader.run(source, max_rows=1000))
+        copied = [text for conn in connections for _, text in conn.copies]
+        assert stats.rows == sum(text.count('\n') for text in copied) >= 1000
+        assert stats.batches == len(copied) == len(stats.lags_s)
+        assert set(stats.rows_by_entity) == {'sessions', 'clickstream'}
+        assert all(conn.closed for conn in connections)
+        summary = stats.summary()
+        assert summary['lag_p50_ms'] <= summary['lag_p95_ms'] <= summary['lag_max_ms']
+
+    def test_target_rate_paces_producer(self, monkeypatch):
+        batches = iter([('sessions', self.sessions)] * 6)
+        loader = self._loader(monkeypatch, [_FakeConnection()], connections=1, target_rate=200)
+        stats = asyncio.run(loader.run(batches))
+        # 60 rows at 200 rows/s take at least 0.3 s; unthrottled they would take milliseconds
+        assert stats.rows == 60
+        assert stats.elapsed_s >= 0.29
+        assert stats.rows_per_s <= 210
+
+    def test_slow_consumer_applies_backpressure(self, monkeypatch):
+        batches = iter([('sessions', self.sessions.take(slice(0, 5)))] * 8)
+        loader = self._loader(monkeypatch, [_FakeConnection(delay=0.05)], connections=1, queue_size=1)
+        stats = asyncio.run(loader.run(batches))
+        assert stats.batches == 8
+        assert stats.backpressure_s > 0.1
+
+    def test_consumer_error_stops_stream(self, monkeypatch):
+        def endless():
+            while True:
+                yield 'sessions', self.sessions
+
+        connection = _FakeConnection(fail=True)
+        loader = self._loader(monkeypatch, [connection], connections=1, queue_size=1)
+        with pytest.raises(RuntimeError, match="copy failed"):
+            asyncio.run(loader.run(endless()))
+        assert connection.closed
+
+    def test_tables_with_keys_are_staged(self, monkeypatch):
+        connection = _FakeConnection()
+        loader = self._loader(monkeypatch, [connection], connections=1)
+        asyncio.run(loader.run(iter([('sessions', self.sessions)])))
+        create, insert, truncate = connection.statements
+        assert 'CREATE TEMP TABLE IF NOT EXISTS stage_raw_sessions' in create
+        assert connection.copies[0][0].startswith('COPY stage_raw_sessions (')
+        assert insert.startswith('INSERT INTO bronze.raw_sessions (')
+        assert insert.endswith('ON CONFLICT (session_id) DO NOTHING')
+        assert truncate == 'TRUNCATE stage_raw_sessions'
+
+
+class TestStreamData:
+    """main.stream_data loads the reference data and streams on from the last loaded session."""
+
+    def test_stream_data_on_small_config(self, monkeypatch):
+        import main
+        import psycopg2
+
+        connections = []
+
+        def connect(**kwargs):
+            connections.append(_FakeConnection(last_id=41))
+            return connections[-1]
+
+        monkeypatch.setattr(psycopg2, 'connect', connect)
+        config = DataGeneratorConfig(num_customers=30, num_products=10, days_of_data=2)
+        stats = main.stream_data(config, duration=0.3, connections=1)
+
+        reference, stream = connections
+        copied = [sql.split(' (')[0] for sql, _ in reference.copies]
+        assert copied == ['COPY stage_raw_customers', 'COPY stage_raw_products']
+        assert reference.copies[0][1].count('\n') == 30
+        assert stats.rows > 0 and set(stats.rows_by_entity) == {'sessions', 'clickstream'}
+        first_sessions = next(text for sql, text in stream.copies if 'raw_sessions' in sql)
+        assert first_sessions.startswith('SESS000000000042\t')
+        assert reference.closed and stream.closed
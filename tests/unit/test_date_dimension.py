@@ -0,0 +1,169 @@
+"""
+Date Dimension Tests
+Checks holiday rules, the fiscal-period shifts passed to the dim_date SQL, year rollover and
+the date_key cache that lets repeated ranges skip the INSERT.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from etl.aggregators.date_dimension import (
+    CalendarConfig,
+    DateDimension,
+    HolidayRule,
+    US_FEDERAL_HOLIDAYS,
+    date_key,
+)
+
+
+def _fiscal_period(config, d):
+    """(fiscal_year, fiscal_quarter, fiscal_month) as _GENERATE_SQL derives them from the shifts."""
+    def plus_months(months):
+        index = d.year * 12 + d.month - 1 + months
+        return index // 12, index % 12 + 1
+
+    year, _ = plus_months(config.fiscal_year_shift)
+    _, month = plus_months(-config.fiscal_month_shift)
+    return year, (month - 1) // 3 + 1, month
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        if params is None:
+            return
+        self.connection.inserts.append(params)
+        days = (params['end'] - params['start']).days + 1
+        keys = {date_key(params['start'] + timedelta(days=i)) for i in range(days)}
+        self.rowcount = len(keys - self.connection.keys)
+        self.connection.keys |= keys
+
+    def fetchall(self):
+        return [(k,) for k in self.connection.keys]
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, keys=()):
+        self.keys = set(keys)
+        self.inserts = []
+        self.commits = 0
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class TestHolidays:
+    """Holiday rules land on the right days, including at the end of the year."""
+
+    @pytest.mark.parametrize("name, year, expected", [
+        ("New Year's Day", 2025, date(2025, 1, 1)),
+        ("Martin Luther King Jr. Day", 2024, date(2024, 1, 15)),
+        ("Memorial Day", 2024, date(2024, 5, 27)),
+        ("Memorial Day", 2021, date(2021, 5, 31)),
+        ("Labor Day", 2025, date(2025, 9, 1)),
+        ("Thanksgiving Day", 2024, date(2024, 11, 28)),
+        ("Christmas Day", 2024, date(2024, 12, 25)),
+    ])
+    def test_us_federal_rules(self, name, year, expected):
+        rule = next(r for r in US_FEDERAL_HOLIDAYS if r.name == name)
+        assert rule.on(year) == expected
+
+    def test_last_weekday_of_december(self):
+        # The month after December is January of the next year
+        assert HolidayRule("Last Friday", 12, weekday=4, nth=-1).on(2024) == date(2024, 12, 27)
+        assert HolidayRule("Last Tuesday", 12, weekday=1, nth=-1).on(2024) == date(2024, 12, 31)
+
+    def test_holidays_between_spans_years(self):
+        config = CalendarConfig(holidays=US_FEDERAL_HOLIDAYS)
+        assert config.holidays_between(date(2024, 12, 20), date(2025, 1, 20)) == [
+            (date(2024, 12, 25), "Christmas Day"),
+            (date(2025, 1, 1), "New Year's Day"),
+            (date(2025, 1, 20), "Martin Luther King Jr. Day"),
+        ]
+        assert config.holidays_between(date(2024, 12, 26), date(2024, 12, 31)) == []
+        assert CalendarConfig().holidays_between(date(2024, 1, 1), date(2024, 12, 31)) == []
+
+
+class TestFiscalPeriods:
+    """Fiscal year, quarter and month at the fiscal and calendar year boundaries."""
+
+    @pytest.mark.parametrize("start_month, by_end, day, expected", [
+        # Default: the fiscal year is the calendar year
+        (1, True, date(2024, 12, 31), (2024, 4, 12)),
+        (1, True, date(2025, 1, 1), (2025, 1, 1)),
+        # July start, named after the year it ends in: FY2026 runs Jul 2025 - Jun 2026
+        (7, True, date(2025, 6, 30), (2025, 4, 12)),
+        (7, True, date(2025, 7, 1), (2026, 1, 1)),
+        (7, True, date(2025, 12, 31), (2026, 2, 6)),
+        (7, True, date(2026, 1, 1), (2026, 3, 7)),
+        # July start, named after the year it starts in
+        (7, False, date(2025, 7, 1), (2025, 1, 1)),
+        (7, False, date(2026, 1, 1), (2025, 3, 7)),
+        (7, False, date(2026, 6, 30), (2025, 4, 12)),
+        # October start
+        (10, True, date(2024, 9, 30), (2024, 4, 12)),
+        (10, True, date(2024, 10, 1), (2025, 1, 1)),
+        (10, True, date(2025, 1, 1), (2025, 2, 4)),
+    ])
+    def test_boundaries(self, start_month, by_end, day, expected):
+        config = CalendarConfig(fiscal_year_start_month=start_month, fiscal_year_by_end=by_end)
+        assert _fiscal_period(config, day) == expected
+
+    def test_invalid_start_month(self):
+        with pytest.raises(ValueError):
+            CalendarConfig(fiscal_year_start_month=13)
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("DIM_DATE_FISCAL_START_MONTH", "7")
+        monkeypatch.setenv("DIM_DATE_FISCAL_YEAR_BY_END", "false")
+        monkeypatch.setenv("DIM_DATE_HOLIDAYS", "US")
+        config = CalendarConfig.from_env()
+        assert (config.fiscal_year_start_month, config.fiscal_year_by_end) == (7, False)
+        assert config.holidays == US_FEDERAL_HOLIDAYS
+        monkeypatch.setenv("DIM_DATE_HOLIDAYS", "uk")
+        with pytest.raises(ValueError, match="DIM_DATE_HOLIDAYS"):
+            CalendarConfig.from_env()
+
+
+class TestDateDimension:
+    """ensure_range inserts only when a key is missing and passes the calendar to the SQL."""
+
+    def test_range_across_year_end(self):
+        config = CalendarConfig(fiscal_year_start_month=7, holidays=US_FEDERAL_HOLIDAYS)
+        conn = _FakeConnection(keys={date_key(date(2024, 12, 30))})
+        dimension = DateDimension(config)
+        assert dimension.ensure_range(conn, date(2024, 12, 24), date(2025, 1, 2)) == 9
+        [params] = conn.inserts
+        assert (params['fy_year_shift'], params['fy_month_shift']) == (6, 6)
+        assert params['holiday_dates'] == [date(2024, 12, 25), date(2025, 1, 1)]
+        assert params['holiday_names'] == ["Christmas Day", "New Year's Day"]
+        assert conn.commits == 1
+
+        # Every key is cached now; sub-ranges and single dates skip the database
+        assert dimension.ensure_range(conn, date(2024, 12, 31), date(2025, 1, 1)) == 0
+        assert dimension.ensure_dates(conn, [date(2025, 1, 2), None]) == 0
+        assert len(conn.inserts) == 1
+        assert dimension.ensure_range(conn, date(2025, 1, 2), date(2025, 1, 3)) == 1
+        assert len(conn.inserts) == 2
+
+    def test_forget_range(self):
+        conn = _FakeConnection()
+        dimension = DateDimension()
+        dimension.ensure_range(conn, date(2024, 12, 31), date(2025, 1, 1))
+        dimension.forget(date(2025, 1, 1), date(2025, 1, 1))
+        dimension.ensure_range(conn, date(2024, 12, 31), date(2025, 1, 1))
+        assert len(conn.inserts) == 2
+        assert dimension.ensure_range(conn, date(2025, 1, 2), date(2025, 1, 1)) == 0
@@ -0,0 +1,211 @@
+"""
+ETL Job Tracker Tests
+Checks the buffered progress reporter (coalescing, flush, requeue, close) and that the
+tracker writes terminal run states and finished or failed steps synchronously with the run's
+buffered progress.
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from etl.transformers.bronze_to_silver import BronzeToSilverTransformer
+from ml_optimization.utils import etl_job_tracker, progress_reporter
+from ml_optimization.utils.etl_job_tracker import ETLJobTracker
+from ml_optimization.utils.progress_reporter import BufferedProgressReporter
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, sql, params=None):
+        if self.connection.fail:
+            raise RuntimeError("database down")
+        self.connection.statements.append((" ".join(sql.split()), params))
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.statements = []
+        self.commits = 0
+        self.closed = False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def flushed(monkeypatch):
+    """Rows written by the reporter's flushes; set ``flushed.fail`` to make them raise."""
+    class Recorder(list):
+        fail = False
+
+    rows = Recorder()
+
+    def execute_values(cursor, sql, batch, template=None):
+        if rows.fail:
+            raise RuntimeError("database down")
+        rows.extend(batch)
+
+    monkeypatch.setattr(progress_reporter, "execute_values", execute_values)
+    monkeypatch.setattr(progress_reporter.psycopg2, "connect", lambda dsn: _FakeConnection())
+    return rows
+
+
+class TestBufferedProgressReporter:
+    """Updates are coalesced per run, written by flush() and kept on failure."""
+
+    def test_flush_writes_latest_values_once(self, flushed):
+        reporter = BufferedProgressReporter(flush_interval=60, channel=None)
+        try:
+            reporter.update("run-1", 10, 100)
+            reporter.update("run-1", 40, 400)
+            reporter.update_metadata("run-1", "pending", {"orders": 5})
+            reporter.update("run-2", 5)
+            assert reporter.flush() == 2
+            by_run = {row[0]: row for row in flushed}
+            assert by_run["run-1"][1:3] == (40, 400)
+            assert by_run["run-1"][3].adapted == {"pending": {"orders": 5}}
+            assert by_run["run-2"][1:3] == (5, None)
+            assert reporter.flush() == 0
+        finally:
+            reporter.close()
+
+    def test_failed_flush_requeues_and_newer_values_win(self, flushed):
+        reporter = BufferedProgressReporter(flush_interval=60, channel=None)
+        try:
+            reporter.update("run-1", 10, 100)
+            flushed.fail = True
+            with pytest.raises(RuntimeError):
+                reporter.flush()
+            reporter.update("run-1", 20)
+            flushed.fail = False
+            assert reporter.flush() == 1
+            assert flushed[-1][1:3] == (20, 100)
+        finally:
+            reporter.close()
+
+    def test_close_stops_thread_and_writes_queue(self, flushed):
+        reporter = BufferedProgressReporter(flush_interval=60, channel=None)
+        reporter.update("run-1", 70, 7)
+        thread = reporter._thread
+        assert thread.is_alive()
+        reporter.close()
+        assert not thread.is_alive()
+        assert [row[:3] for row in flushed] == [("run-1", 70, 7)]
+        # No thread is restarted after close; later updates wait for an explicit flush
+        reporter.update("run-1", 80)
+        assert reporter._thread is thread
+        assert reporter.flush() == 1
+
+    def test_trackers_share_one_reporter(self, monkeypatch):
+        monkeypatch.setattr(progress_reporter, "_shared", None)
+        first, second = ETLJobTracker(_FakeConnection()), ETLJobTracker(_FakeConnection())
+        assert first.progress is second.progress
+        assert ETLJobTracker(_FakeConnection(), progress_flush_interval=0).progress is None
+        own = ETLJobTracker(_FakeConnection(), progress_flush_interval=5)
+        assert own.progress is not first.progress
+
+
+class TestTerminalStates:
+    """complete_job / fail_job and step records write synchronously."""
+
+    @pytest.fixture
+    def session(self, monkeypatch, flushed):
+        """Connections opened by get_db_connection(); set ``session.fail`` to make them raise."""
+        session = SimpleNamespace(connections=[], fail=False)
+
+        @contextmanager
+        def get_db_connection():
+            session.connections.append(_FakeConnection(fail=session.fail))
+            yield session.connections[-1]
+
+        monkeypatch.setattr(etl_job_tracker, "get_db_connection", get_db_connection)
+        return session
+
+    def _tracker(self):
+        tracker = ETLJobTracker(_FakeConnection(), progress_flush_interval=60)
+        tracker.progress.channel = None
+        return tracker
+
+    def test_complete_job_takes_buffered_progress(self, flushed):
+        with self._tracker() as tracker:
+            tracker.update_progress("run-1", 60, 600)
+            tracker.record_pending("run-1", {"orders": {"rows": 3}})
+            tracker.complete_job("run-1", metadata={"note": "ok"})
+            sql, params = tracker.connection.statements[-1]
+            assert sql.startswith("UPDATE monitoring.job_runs SET status = 'completed'")
+            assert params[0] == 600
+            assert params[2].adapted == {"pending": {"orders": {"rows": 3}}, "note": "ok"}
+            assert tracker.progress.take("run-1") == {"meta": {}}
+        # Nothing left for the background flush, which skips finished runs anyway
+        assert flushed == []
+
+    def test_fail_job_writes_buffered_progress(self, session):
+        tracker = self._tracker()
+        tracker.update_progress("run-1", 35, 350)
+        tracker.fail_job("run-1", "boom")
+        sql, params = session.connections[-1].statements[-1]
+        assert sql.startswith("UPDATE monitoring.job_runs SET status = 'failed'")
+        assert params[:3] == ("boom", 35, 350)
+        tracker.close()
+
+    def test_failed_terminal_write_keeps_progress_queued(self, session, flushed):
+        tracker = self._tracker()
+        tracker.update_progress("run-1", 35, 350)
+        session.fail = True
+        with pytest.raises(RuntimeError):
+            tracker.fail_job("run-1", "boom")
+        tracker.close()
+        assert [row[:3] for row in flushed] == [("run-1", 35, 350)]
+
+    def test_step_metrics_flush_the_run(self, flushed):
+        with self._tracker() as tracker:
+            tracker.update_progress("run-1", 20, 200)
+            tracker.record_pending("run-1", {"orders": {"rows": 0}})
+            tracker.record_step_metrics("run-1", "orders", {"status": "completed", "rows": 200})
+            sql, params = tracker.connection.statements[-1]
+            assert sql.startswith("UPDATE monitoring.job_runs SET metadata")
+            assert params[0] == "orders" and params[1].adapted["status"] == "completed"
+            # Written before close(): the finished step does not wait for the background flush
+            assert [row[:3] for row in flushed] == [("run-1", 20, 200)]
+            assert flushed[0][3].adapted == {"pending": {"orders": {"rows": 0}}}
+
+    def test_failed_step_is_recorded_after_rollback(self, flushed):
+        class Connection(_FakeConnection):
+            def rollback(self):
+                self.statements.append(("ROLLBACK", None))
+
+        conn = Connection()
+        with ETLJobTracker(conn, progress_flush_interval=60) as tracker:
+            tracker.progress.channel = None
+            transformer = BronzeToSilverTransformer(conn, tracker=tracker, run_id="run-1")
+            transformer._count_rows("orders", inserted=5, skipped=1)
+            transformer._record_step_failure("orders", RuntimeError("deadlock detected"))
+        # The failed batch is rolled back before the shared connection commits the record
+        (rollback, _), (sql, params) = conn.statements
+        assert rollback == "ROLLBACK" and sql.startswith("UPDATE monitoring.job_runs SET metadata")
+        assert params[1].adapted == {
+            "status": "failed", "error": "deadlock detected", "rows": 5, "skipped": 1, "conflicted": 0,
+        }
@@ -0,0 +1,82 @@
+"""
+Pending Estimate Tests
+Checks that steps are sized from planner statistics and exact delta counts, without counting
+their bronze or silver tables.
+"""
+
+from datetime import datetime
+
+from etl.transformers.bronze_to_silver import BronzeToSilverTransformer
+from etl.transformers.incremental_pending import PendingEstimator
+
+
+class _FakeCursor:
+    """Answers the catalog query with ``stats`` and the delta count with ``pending``."""
+
+    def __init__(self, stats, pending=0):
+        self.stats = stats
+        self.pending = pending
+        self.statements = []
+        self.result = None
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.statements.append(sql)
+        self.result = self.stats if "pg_class" in sql else (self.pending,)
+
+    def fetchone(self):
+        return self.result
+
+
+class _FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class TestPendingEstimator:
+    """Estimates come from the catalog on full scans and from a delta count with a watermark."""
+
+    def test_full_scan_uses_statistics(self):
+        cursor = _FakeCursor((1200.0, -0.5, 250.0))
+        estimate = PendingEstimator().estimate(cursor, "orders")
+        assert (estimate.rows, estimate.exact) == (350, False)
+        assert (estimate.bronze_rows, estimate.silver_rows) == (1200, 250)
+        assert len(cursor.statements) == 1
+
+    def test_watermark_delta_is_exact(self):
+        cursor = _FakeCursor((1200.0, -0.5, 250.0), pending=7)
+        estimate = PendingEstimator().estimate(cursor, "orders", since=datetime(2024, 1, 1))
+        assert (estimate.rows, estimate.exact, estimate.bronze_rows) == (7, True, 1200)
+
+    def test_unanalyzed_tables(self):
+        estimate = PendingEstimator().estimate(_FakeCursor((None, None, 0.0)), "orders")
+        assert (estimate.rows, estimate.bronze_rows, estimate.silver_rows) == (None, 0, 0)
+
+
+class TestRunStep:
+    """A step is skipped on its estimate alone and never scans its tables to log their size."""
+
+    def test_drained_step_is_skipped_without_table_counts(self):
+        cursor = _FakeCursor((1000.0, -1.0, 1000.0))
+        transformer = BronzeToSilverTransformer(_FakeConnection(cursor))
+        calls = []
+        assert transformer._run_step(1, 1, "orders", calls.append, "orders", 100) == 0
+        assert calls == []
+        assert not [sql for sql in cursor.statements if "COUNT(" in sql]
+
+    def test_unknown_estimate_runs_until_empty(self):
+        cursor = _FakeCursor((None, None, 10.0))
+        transformer = BronzeToSilverTransformer(_FakeConnection(cursor))
+        transformer.estimated_zero_batches = 2
+        batches = iter([5, 0, 0, 9])
+        assert transformer._run_step(1, 1, "orders", lambda size: next(batches), "orders", 100) == 5
+        assert not [sql for sql in cursor.statements if "COUNT(" in sql]
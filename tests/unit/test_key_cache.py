@@ -0,0 +1,77 @@
+"""
+Key Cache Tests
+Checks incremental refreshes of the id -> surrogate key maps and that lookups running while
+another thread refreshes a shared map only ever see matching ids and keys.
+"""
+
+import threading
+
+from etl.transformers.key_cache import KeyLookupCache, KeyMap
+
+
+class _FakeCursor:
+    """Serves silver rows ``(id, key)`` above the requested high-water mark."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.pending = []
+
+    def execute(self, sql, params=None):
+        self.pending = sorted(row for row in self.rows if row[1] > params[0])
+
+    def fetchmany(self, size):
+        rows, self.pending = self.pending[:size], self.pending[size:]
+        return rows
+
+
+class TestKeyMap:
+    """Refreshes append or merge new rows above the high-water mark."""
+
+    def test_refresh_appends_and_merges(self):
+        rows = [(10, 1), (20, 2)]
+        key_map = KeyMap("product", "product_id", "product_key")
+        cursor = _FakeCursor(rows)
+        assert key_map.refresh(cursor) == 2
+        rows += [(30, 3)]
+        assert key_map.refresh(cursor) == 1
+        # Lower natural ids are merged in; a re-inserted id takes its newer key
+        rows += [(5, 4), (20, 5)]
+        assert key_map.refresh(cursor) == 2
+        assert list(key_map.ids) == [5, 10, 20, 30]
+        assert list(key_map.keys) == [4, 1, 5, 3]
+        assert key_map.high_water == 5
+        assert key_map.get(20) == 5 and key_map.get(25, "none") == "none"
+        assert 5 in key_map and None not in key_map
+        assert key_map.missing([5, 25, None]) == {25}
+        assert key_map.refresh(cursor) == 0
+
+    def test_lookups_during_refresh(self):
+        def surrogate(natural_id):
+            # Later inserts (odd ids) get larger keys, as from a BIGSERIAL
+            return natural_id * 10 + 1 if natural_id % 2 == 0 else 10 ** 6 + natural_id
+
+        rows = [(i, surrogate(i)) for i in range(0, 20000, 2)]
+        cache = KeyLookupCache()
+        key_map = cache.get_map(_FakeCursor(rows), "orders", "order_id", "order_key")
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                for natural_id in range(0, 20000, 97):
+                    key = key_map.get(natural_id)
+                    if key is not None and key != surrogate(natural_id):
+                        errors.append((natural_id, key))
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            # Odd ids land between the loaded ones and go through the merge path
+            for start in range(1, 20000, 2000):
+                rows += [(i, surrogate(i)) for i in range(start, start + 2000, 2)]
+                cache.get_map(_FakeCursor(rows), "orders", "order_id", "order_key")
+        finally:
+            done.set()
+            reader.join()
+        assert errors == []
+        assert len(key_map) == 20000
@@ -1,2 +1,237 @@
-# ML models tests
+"""
+ML Models Tests
+Checks the NumPy-only compiled models against the sklearn / XGBoost estimators they were
+compiled from, the .npz round trip, the compiled serving paths of the model classes and
+batch anomaly detection.
+"""
 
+import json
+import os
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    IsolationForest,
+    RandomForestClassifier,
+    RandomForestRegressor,
+)
+from sklearn.preprocessing import StandardScaler
+
+
+def _regression_data(seed=0, rows=600, features=6):
+    rng = np.random.default_rng(seed)
+    X = rng.gamma(2.0, 3.0, size=(rows, features))
+    y = X[:, 0] * 3 + np.sin(X[:, 1]) * 10 + rng.normal(0, 0.5, rows)
+    return X, y
+
+
+def _metrics(seed=0, rows=400):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'mean_exec_time_ms': rng.lognormal(3.0, 1.5, rows),
+        'calls': rng.integers(1, 2000, rows),
+        'rows_affected': rng.integers(0, 10 ** 5, rows),
+        'shared_blks_hit': rng.integers(0, 10 ** 6, rows),
+        'shared_blks_read': rng.integers(0, 10 ** 4, rows),
+    })
+
+
+class TestCompiledModels:
+    """Compiled ensembles reproduce the estimators' outputs."""
+
+    def test_random_forest_and_gradient_boosting(self, ml_models):
+        compile_model = ml_models.fast_inference.compile_model
+        X, y = _regression_data()
+        scaler = StandardScaler().fit(X)
+        for model in (RandomForestRegressor(n_estimators=20, max_depth=12, random_state=0),
+                      GradientBoostingRegressor(n_estimators=30, max_depth=4, random_state=0)):
+            model.fit(scaler.transform(X), y)
+            compiled = compile_model(model, scaler)
+            np.testing.assert_allclose(compiled.predict(X), model.predict(scaler.transform(X)), rtol=1e-10)
+            np.testing.assert_allclose(compiled.predict(X[:1]), model.predict(scaler.transform(X[:1])), rtol=1e-10)
+
+    def test_classifier_probabilities(self, ml_models):
+        compile_model = ml_models.fast_inference.compile_model
+        X, _ = _regression_data(seed=1)
+        labels = (X[:, 0] > np.median(X[:, 0])).astype(int)
+        model = RandomForestClassifier(n_estimators=15, max_depth=8, random_state=0).fit(X, labels)
+        compiled = compile_model(model)
+        np.testing.assert_allclose(compiled.predict_proba(X), model.predict_proba(X), atol=1e-12)
+        assert (compiled.predict(X) == model.predict(X)).all()
+
+    def test_isolation_forest_scores(self, ml_models):
+        compile_model = ml_models.fast_inference.compile_model
+        features = np.log1p(_metrics().to_numpy(dtype=float))
+        scaler = StandardScaler().fit(features)
+        model = IsolationForest(n_estimators=50, max_samples=128, contamination=0.1, random_state=0)
+        model.fit(scaler.transform(features))
+        compiled = compile_model(model, scaler)
+        np.testing.assert_allclose(compiled.score_samples(features),
+                                   model.score_samples(scaler.transform(features)), atol=1e-12)
+        np.testing.assert_allclose(compiled.decision_function(features),
+                                   model.decision_function(scaler.transform(features)), atol=1e-12)
+
+    def test_xgboost_with_missing_values(self, ml_models):
+        compile_model = ml_models.fast_inference.compile_model
+        xgb = pytest.importorskip("xgboost")
+        X, y = _regression_data(seed=2)
+        X = X.astype(np.float32)
+        X[::7, 2] = np.nan
+        model = xgb.XGBRegressor(n_estimators=40, max_depth=5, learning_rate=0.1, random_state=0, n_jobs=1)
+        model.fit(X, y)
+        compiled = compile_model(model)
+        np.testing.assert_allclose(compiled.predict(X), model.predict(X), rtol=1e-5, atol=1e-4)
+
+    def test_npz_round_trip(self, ml_models, tmp_path):
+        compile_model = ml_models.fast_inference.compile_model
+        X, y = _regression_data(seed=3)
+        scaler = StandardScaler().fit(X)
+        model = RandomForestRegressor(n_estimators=10, random_state=0).fit(scaler.transform(X), y)
+        compiled = compile_model(model, scaler, feature_names=[f"f{i}" for i in range(X.shape[1])])
+        path = tmp_path / "model.npz"
+        compiled.save(str(path))
+        loaded = ml_models.fast_inference.CompiledModel.load(str(path))
+        assert loaded.feature_names == compiled.feature_names
+        np.testing.assert_array_equal(loaded.predict(X), compiled.predict(X))
+
+    def test_unsupported_model(self, ml_models):
+        with pytest.raises(ValueError, match="Cannot compile"):
+            ml_models.fast_inference.compile_model(StandardScaler())
+
+
+class TestCompiledServing:
+    """Model classes answer the same from a compiled artifact as from their joblib bundle."""
+
+    def test_anomaly_detector_fast_path(self, ml_models, tmp_path):
+        QueryAnomalyDetector = ml_models.anomaly_detector.QueryAnomalyDetector
+        attach_compiled, compiled_path = ml_models.fast_inference.attach_compiled, ml_models.fast_inference.compiled_path
+        detector = QueryAnomalyDetector()
+        detector.train(_metrics())
+        bundle = tmp_path / "anomaly_detector.pkl"
+        detector.save_model(str(bundle))
+        detector.export_compiled(str(compiled_path(str(bundle))))
+
+        served = QueryAnomalyDetector()
+        served.load_model(str(bundle))
+        assert attach_compiled(served, bundle)
+        for metrics in _metrics(seed=4, rows=25).to_dict('records'):
+            expected = detector.detect_anomaly(metrics)
+            got = served.detect_anomaly(metrics)
+            assert got[0] == expected[0] and got[2] == expected[2]
+            assert got[1] == pytest.approx(expected[1], abs=1e-12)
+
+    def test_stale_artifact_is_ignored(self, ml_models, tmp_path):
+        attach_compiled, compiled_path = ml_models.fast_inference.attach_compiled, ml_models.fast_inference.compiled_path
+        bundle = tmp_path / "anomaly_detector.pkl"
+        detector = ml_models.anomaly_detector.QueryAnomalyDetector()
+        detector.train(_metrics())
+        detector.export_compiled(str(compiled_path(str(bundle))))
+        detector.save_model(str(bundle))
+        artifact = compiled_path(str(bundle))
+        older = bundle.stat().st_mtime - 60
+        os.utime(artifact, (older, older))
+        assert not attach_compiled(detector, bundle)
+        assert detector.compiled is None
+
+    def test_query_time_predictor_predict_array(self, ml_models, tmp_path):
+        rng = np.random.default_rng(5)
+        logs = pd.DataFrame({
+            'extracted_features': [json.dumps({
+                'table_count': int(rng.integers(1, 6)),
+                'join_count': int(rng.integers(0, 5)),
+                'estimated_rows': int(rng.integers(1, 10 ** 6)),
+            }) for _ in range(300)],
+            'calls': rng.integers(1, 500, 300),
+        })
+        logs['mean_exec_time_ms'] = rng.gamma(2.0, 20.0, 300)
+        predictor = ml_models.query_time_predictor.QueryTimePredictor()
+        predictor.config.model_type = "random_forest"
+        predictor.config.n_estimators = 20
+        predictor.train(logs)
+        X = predictor.feature_matrix(logs)
+        expected = predictor.predict_array(X)
+
+        path = tmp_path / "query_time_predictor.npz"
+        predictor.export_compiled(str(path))
+        predictor.load_compiled(str(path))
+        assert predictor.compiled is not None
+        np.testing.assert_allclose(predictor.predict_array(X[:50]), expected[:50], rtol=1e-9)
+        np.testing.assert_allclose(predictor.predict_array(X), expected, rtol=1e-9)
+
+    def test_large_batches_use_the_estimator(self, ml_models, monkeypatch):
+        detector = ml_models.anomaly_detector.QueryAnomalyDetector()
+        detector.train(_metrics())
+        detector.compiled = ml_models.fast_inference.compile_model(detector.model, detector.scaler)
+        monkeypatch.setitem(ml_models.fast_inference.COMPILED_MAX_ROWS, 'isolation_forest', 10)
+        assert detector.compiled.serves(10) and not detector.compiled.serves(11)
+
+        calls = []
+
+        def score_samples(X):
+            calls.append(len(X))
+            return np.zeros(len(X))
+
+        monkeypatch.setattr(detector.compiled, 'score_samples', score_samples)
+        detector.detect_anomalies_batch(_metrics(seed=9, rows=5))
+        detector.detect_anomalies_batch(_metrics(seed=9, rows=20))
+        assert calls == [5]
+        # Without the estimator the compiled model serves every batch
+        detector.model = None
+        detector.detect_anomalies_batch(_metrics(seed=9, rows=20))
+        assert calls == [5, 20]
+
+        monkeypatch.setattr(ml_models.fast_inference, 'COMPILED_MAX_ROWS_OVERRIDE', '0')
+        assert not detector.compiled.serves(1)
+
+
+class TestBatchAnomalyDetection:
+    """detect_anomalies_batch agrees with detect_anomaly row by row."""
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def trained(cls, ml_models):
+        cls.models = ml_models
+        cls.detector = ml_models.anomaly_detector.QueryAnomalyDetector()
+        cls.detector.config.n_jobs = 1
+        cls.detector.train(_metrics(rows=600))
+
+    def _assert_matches_rows(self, detector, metrics):
+        is_anom, scores, reasons = detector.detect_anomalies_batch(metrics)
+        expected = [self.detector.detect_anomaly(m) for m in metrics.to_dict('records')]
+        assert is_anom.tolist() == [bool(e[0]) for e in expected]
+        np.testing.assert_allclose(scores, [e[1] for e in expected], atol=1e-12)
+        assert reasons.tolist() == [e[2] for e in expected]
+
+    def test_matches_row_by_row(self):
+        metrics = _metrics(seed=6, rows=200)
+        metrics.loc[:4, 'mean_exec_time_ms'] = [9000.0, 0.5, 0.5, 20.0, 7000.0]
+        metrics.loc[:4, 'calls'] = [10, 5000, 10, 5000, 1]
+        self._assert_matches_rows(self.detector, metrics)
+        assert self.detector.detect_anomalies_batch(metrics)[2][:3].tolist() == [
+            "Execution time spike", "Unusual query pattern", "Performance anomaly",
+        ]
+
+    def test_compiled_matches_row_by_row(self):
+        served = self.models.anomaly_detector.QueryAnomalyDetector()
+        served.compiled = self.models.fast_inference.compile_model(self.detector.model, self.detector.scaler)
+        self._assert_matches_rows(served, _metrics(seed=7, rows=200))
+
+    def test_database_values_and_missing_columns(self):
+        rows = pd.DataFrame({
+            'mean_exec_time_ms': [Decimal('12.5'), None],
+            'calls': [Decimal('3'), 7],
+            'rows_affected': [None, 4],
+        })
+        _, scores, _ = self.detector.detect_anomalies_batch(rows)
+        filled = rows.astype(float).fillna(0).assign(shared_blks_hit=0.0, shared_blks_read=0.0)
+        expected = [self.detector.detect_anomaly(m) for m in filled.to_dict('records')]
+        np.testing.assert_allclose(scores, [e[1] for e in expected], atol=1e-12)
+        assert len(self.detector.detect_anomalies_batch(rows.iloc[:0])[0]) == 0
+
+    def test_untrained(self):
+        is_anom, scores, reasons = self.models.anomaly_detector.QueryAnomalyDetector().detect_anomalies_batch(_metrics(rows=3))
+        assert not is_anom.any()
+        assert reasons.tolist() == ["Model not trained"] * 3
@@ -0,0 +1,107 @@
+"""
+Fact Partition Tests
+Checks the month arithmetic and naming behind the gold fact partitions and the months
+ensure_months creates.
+"""
+
+from datetime import date
+
+import pytest
+
+from etl.aggregators.partitions import (
+    FactPartitionManager,
+    add_months,
+    month_bounds,
+    month_start,
+    partition_name,
+)
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.result = None
+
+    def execute(self, sql, params=None):
+        if "relkind" in sql:
+            self.result = [(self.connection.partitioned,)]
+        elif "pg_inherits" in sql:
+            self.result = [(name,) for name in self.connection.existing]
+        else:
+            raise AssertionError(f"unexpected SQL: {sql}")
+
+    def fetchone(self):
+        return self.result[0]
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, partitioned=True, existing=()):
+        self.partitioned = partitioned
+        self.existing = list(existing)
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+
+class TestMonthHelpers:
+    """Month starts, offsets and partition bounds, including across year ends."""
+
+    @pytest.mark.parametrize("day, months, expected", [
+        (date(2024, 1, 31), 1, date(2024, 2, 1)),
+        (date(2024, 12, 15), 1, date(2025, 1, 1)),
+        (date(2024, 11, 1), 3, date(2025, 2, 1)),
+        (date(2024, 1, 1), -1, date(2023, 12, 1)),
+        (date(2024, 3, 31), -14, date(2023, 1, 1)),
+        (date(2024, 6, 30), 0, date(2024, 6, 1)),
+        (date(2024, 1, 1), 24, date(2026, 1, 1)),
+    ])
+    def test_add_months(self, day, months, expected):
+        assert add_months(day, months) == expected
+
+    def test_month_bounds(self):
+        assert month_bounds(date(2024, 2, 29)) == (20240201, 20240301)
+        assert month_bounds(date(2024, 12, 31)) == (20241201, 20250101)
+        assert month_start(date(2024, 12, 31)) == date(2024, 12, 1)
+
+    def test_partition_name(self):
+        assert partition_name("fact_sales", date(2024, 1, 15)) == "fact_sales_p202401"
+        assert partition_name("fact_orders", date(987, 11, 1)) == "fact_orders_p098711"
+
+
+class TestEnsureMonths:
+    """ensure_months creates each missing month from first through last + months_ahead."""
+
+    @pytest.fixture
+    def created(self, monkeypatch):
+        months = []
+        monkeypatch.setattr(FactPartitionManager, "_create",
+                            lambda self, table, month: months.append(month))
+        return months
+
+    def test_range_across_year_end(self, created):
+        manager = FactPartitionManager(_FakeConnection(existing=[
+            "fact_sales_p202411", "fact_sales_p202501", "fact_sales_default",
+        ]), months_ahead=2)
+        names = manager.ensure_months("fact_sales", date(2024, 11, 20), date(2025, 1, 5))
+        assert created == [date(2024, 12, 1), date(2025, 2, 1), date(2025, 3, 1)]
+        assert names == ["fact_sales_p202412", "fact_sales_p202502", "fact_sales_p202503"]
+
+    def test_heap_table_is_left_alone(self, created):
+        manager = FactPartitionManager(_FakeConnection(partitioned=False))
+        assert manager.ensure_months("fact_orders", date(2024, 1, 1), date(2024, 6, 1)) == []
+        assert manager.target("fact_orders", date(2024, 1, 1)) == "gold.fact_orders"
+        assert created == []
+
+    def test_target_and_partitions(self):
+        manager = FactPartitionManager(_FakeConnection(existing=["fact_sales_p202401", "fact_sales_default"]))
+        assert manager.target("fact_sales", date(2024, 1, 9)) == "gold.fact_sales_p202401"
+        assert manager.target("fact_sales") == "gold.fact_sales"
+        assert manager.partitions("fact_sales") == {
+            "fact_sales_p202401": date(2024, 1, 1), "fact_sales_default": None,
+        }
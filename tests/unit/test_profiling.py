@@ -0,0 +1,62 @@
+"""
+Pipeline Profiler Tests
+Checks statement fingerprints, span self time and the exported Chrome trace.
+"""
+
+import json
+import time
+
+from etl.utils import profiling
+from etl.utils.profiling import Profiler, fingerprint
+
+
+class TestFingerprint:
+    """Statements are grouped by shape, not by their literals."""
+
+    def test_literals_are_replaced(self):
+        assert fingerprint("SELECT * FROM t WHERE id = 42 AND name = 'o''brien'") == \
+            "SELECT * FROM t WHERE id = ? AND name = ?"
+
+    def test_value_lists_collapse(self):
+        query = b"INSERT INTO silver.x (a, b) VALUES (1, 'a'),(2, 'b'),(3, 'c') ON CONFLICT DO NOTHING"
+        assert fingerprint(query) == \
+            "INSERT INTO silver.x (a, b) VALUES (?, ?), ... ON CONFLICT DO NOTHING"
+
+
+class TestProfiler:
+    """Span nesting, summaries and trace export."""
+
+    def test_span_is_noop_when_inactive(self):
+        assert profiling.active() is None
+        with profiling.span("anything"):
+            pass
+
+    def test_self_time_excludes_children(self):
+        profiler = Profiler().activate()
+        try:
+            with profiling.span("step", "step"):
+                time.sleep(0.02)
+                with profiling.span("SELECT ?", "sql"):
+                    time.sleep(0.05)
+        finally:
+            profiler.deactivate()
+        categories = profiler.summary()["self_seconds_by_category"]
+        assert categories["sql"]["seconds"] >= 0.05
+        assert 0.02 <= categories["step"]["seconds"] < 0.05
+
+    def test_trace_and_statement_totals(self, tmp_path):
+        profiler = Profiler(max_spans=1)
+        for _ in range(3):
+            with profiler.span("SELECT ?", "sql"):
+                pass
+            profiler.record_statement("SELECT ?", 0.5, 10)
+        summary = profiler.summary()
+        assert summary["top_statements"][0] == {
+            "statement": "SELECT ?", "calls": 3, "seconds": 1.5, "max_ms": 500.0, "rows": 30,
+        }
+        assert summary["dropped_spans"] == 2
+        path = profiler.write_trace(str(tmp_path / "trace.json"))
+        with open(path) as f:
+            trace = json.load(f)
+        spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert len(spans) == 1 and spans[0]["cat"] == "sql"
@@ -0,0 +1,49 @@
+"""
+Cron Expression Tests
+Checks the scheduler's cron parser and next-fire-time computation.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from etl.scheduler.cron import CronExpression
+
+
+class TestCronExpression:
+    """Parsing and matching of five-field cron expressions."""
+
+    @pytest.mark.parametrize("expression", [
+        "*/15 * * * *",
+        "0 9-17/2 * * mon-fri",
+        "30 2 1,15 * sun",
+        "5 4 * jan-mar 7",
+        "10/20 */3 * * *",
+        "@hourly",
+    ])
+    def test_next_after_is_first_match(self, expression):
+        cron = CronExpression(expression)
+        start = datetime(2024, 2, 27, 13, 41)
+        fire = cron.next_after(start)
+        assert cron.matches(fire)
+        t = start.replace(second=0) + timedelta(minutes=1)
+        while t < fire:
+            assert not cron.matches(t)
+            t += timedelta(minutes=1)
+
+    def test_dom_and_dow_match_either_when_both_restricted(self):
+        cron = CronExpression("0 0 13 * fri")
+        assert cron.matches(datetime(2024, 3, 13))   # 13th, a Wednesday
+        assert cron.matches(datetime(2024, 3, 15))   # a Friday
+        assert not cron.matches(datetime(2024, 3, 14))
+
+    def test_leap_day(self):
+        assert CronExpression("0 0 29 2 *").next_after(datetime(2025, 1, 1)) == datetime(2028, 2, 29)
+
+    @pytest.mark.parametrize("expression", ["* * *", "61 * * * *", "* * * * 8", "5-1 * * * *", "*/0 * * * *"])
+    def test_invalid_expressions(self, expression):
+        with pytest.raises(ValueError):
+            CronExpression(expression)
+
+    def test_never_fires(self):
+        with pytest.raises(ValueError):
+            CronExpression("0 0 31 2 *").next_after(datetime(2024, 1, 1))
@@ -0,0 +1,131 @@
+"""
+Scheduler Daemon Tests
+Checks job reloads (add, change, remove, bad patterns) and dispatch of due fire times.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+from etl.scheduler.daemon import SchedulerDaemon
+
+START = datetime(2024, 3, 4, 10, 0)
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self):
+        return _FakeCursor(self.rows)
+
+
+class _RecordingExecutor:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, job):
+        self.submitted.append(job.job_id)
+
+
+@pytest.fixture
+def jobs():
+    """Rows of monitoring.etl_jobs the daemon reads; edit between reloads."""
+    return []
+
+
+@pytest.fixture
+def daemon(jobs):
+    @contextmanager
+    def connection_factory():
+        yield _FakeConnection(jobs)
+
+    scheduler = SchedulerDaemon(connection_factory=connection_factory, clock=lambda: START)
+    scheduler._executor = _RecordingExecutor()
+    return scheduler
+
+
+class TestReload:
+    """reload() adds, reschedules and drops jobs, and skips patterns that cannot fire."""
+
+    def test_add_change_remove(self, daemon, jobs):
+        jobs[:] = [("1", "Pipeline", "pipeline", "*/15 * * * *"),
+                   ("2", "Other pipeline", "pipeline", "0 * * * *")]
+        daemon.reload()
+        assert daemon.jobs["1"].next_fire == START + timedelta(minutes=15)
+        assert daemon.jobs["2"].next_fire == START + timedelta(hours=1)
+        first_version = daemon.jobs["1"].version
+
+        jobs[:] = [("1", "Pipeline", "pipeline", "5 * * * *")]
+        daemon.reload()
+        assert set(daemon.jobs) == {"1"}
+        assert daemon.jobs["1"].next_fire == START + timedelta(minutes=5)
+        assert daemon.jobs["1"].version != first_version
+        assert daemon.next_fire_time() == START + timedelta(minutes=5)
+
+    def test_unchanged_job_keeps_its_schedule(self, daemon, jobs):
+        jobs[:] = [("1", "Pipeline", "pipeline", "*/15 * * * *")]
+        daemon.reload()
+        job = daemon.jobs["1"]
+        daemon.reload(START + timedelta(minutes=7))
+        assert daemon.jobs["1"] is job
+
+    @pytest.mark.parametrize("pattern", ["not a cron", "0 0 31 2 *"])
+    def test_bad_pattern_does_not_stop_the_reload(self, daemon, jobs, pattern):
+        jobs[:] = [("1", "Pipeline", "pipeline", "*/15 * * * *")]
+        daemon.reload()
+        job = daemon.jobs["1"]
+        jobs[:] = [("1", "Pipeline", "pipeline", pattern),
+                   ("2", "Bad pipeline", "pipeline", pattern),
+                   ("3", "Other pipeline", "pipeline", "0 * * * *")]
+        daemon.reload()
+        # The broken edit keeps the job's last good schedule; a new broken job is not added
+        assert daemon.jobs["1"] is job
+        assert "2" not in daemon.jobs
+        assert daemon.jobs["3"].next_fire == START + timedelta(hours=1)
+
+    def test_unknown_job_type_is_skipped(self, daemon, jobs):
+        jobs[:] = [("1", "Mystery", "mystery", "* * * * *")]
+        daemon.reload()
+        assert daemon.jobs == {}
+
+
+class TestRunPending:
+    """Due jobs are dispatched once, with missed fire times collapsed."""
+
+    def test_missed_fire_times_collapse(self, daemon, jobs):
+        jobs[:] = [("1", "Pipeline", "pipeline", "*/15 * * * *")]
+        daemon.reload()
+        later = START + timedelta(hours=2, minutes=1)
+        assert daemon.run_pending(later) == ["1"]
+        assert daemon._executor.submitted == ["1"]
+        assert daemon.jobs["1"].next_fire == START + timedelta(hours=2, minutes=15)
+        assert daemon.run_pending(later) == []
+
+    def test_job_at_its_limit_is_skipped(self, daemon, jobs):
+        jobs[:] = [("1", "Pipeline", "pipeline", "* * * * *")]
+        daemon.reload()
+        assert daemon.run_pending(START + timedelta(minutes=1)) == ["1"]
+        assert daemon.run_pending(START + timedelta(minutes=2)) == []
+        assert daemon.jobs["1"].skipped == 1
+
+    def test_nothing_due(self, daemon, jobs):
+        jobs[:] = [("1", "Pipeline", "pipeline", "0 * * * *")]
+        daemon.reload()
+        assert daemon.run_pending(START + timedelta(minutes=30)) == []
+        assert daemon._executor.submitted == []
@@ -0,0 +1,175 @@
+"""
+Streaming Extract Tests
+Checks server-side cursor streaming, write chunking, a streamed transform step and the RSS
+readings behind step metrics.
+"""
+
+import pytest
+
+from etl.transformers import bronze_to_silver
+from etl.transformers.bronze_to_silver import BronzeToSilverTransformer
+from etl.transformers.streaming import chunked, stream_rows
+from etl.utils import memory
+
+
+class FakeNamedCursor:
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = rows
+        self.itersize = 2000
+        self.closed = False
+        self.executed = None
+
+    def execute(self, query, params=None):
+        self.executed = (query, params)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.cursors = []
+
+    def cursor(self, name=None):
+        cursor = FakeNamedCursor(name, self.rows)
+        self.cursors.append(cursor)
+        return cursor
+
+
+class FakeKeyCursor:
+    """Client-side cursor answering the silver key-map lookups."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.pending = []
+
+    def execute(self, query, params=None):
+        table = query.split("FROM silver.")[1].split()[0]
+        self.pending = sorted(self.keys.get(table, {}).items())
+
+    def fetchmany(self, size):
+        rows, self.pending = self.pending[:size], self.pending[size:]
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeTransformConnection(FakeConnection):
+    """Named cursors stream bronze rows; the plain cursor serves key maps."""
+
+    def __init__(self, rows, keys):
+        super().__init__(rows)
+        self.key_cursor = FakeKeyCursor(keys)
+        self.events = []
+
+    def cursor(self, name=None):
+        if name is None:
+            return self.key_cursor
+        return super().cursor(name)
+
+    def commit(self):
+        self.events.append(("commit", [c.closed for c in self.cursors]))
+
+    def rollback(self):
+        self.events.append(("rollback", [c.closed for c in self.cursors]))
+
+
+class TestStreaming:
+    """Rows flow lazily from a named cursor into fixed-size write chunks."""
+
+    def test_stream_rows_uses_named_cursor(self):
+        conn = FakeConnection([(1,), (2,), (3,)])
+        rows = stream_rows(conn, "SELECT 1", {"batch_size": 3}, itersize=2, name="etl_orders")
+        assert conn.cursors == []  # nothing is declared until the first row is pulled
+        assert list(rows) == [(1,), (2,), (3,)]
+        cursor = conn.cursors[0]
+        assert cursor.name.startswith("etl_orders_")
+        assert cursor.itersize == 2
+        assert cursor.executed == ("SELECT 1", {"batch_size": 3})
+        assert cursor.closed
+
+    def test_abandoned_stream_closes_cursor(self):
+        conn = FakeConnection([(1,), (2,)])
+        rows = stream_rows(conn, "SELECT 1")
+        next(rows)
+        rows.close()
+        assert conn.cursors[0].closed
+
+    def test_chunked(self):
+        assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(chunked(iter(range(5)), None)) == [[0, 1, 2, 3, 4]]
+        assert list(chunked(iter([]), None)) == []
+
+
+class TestStreamedTransform:
+    """A streamed step writes per itersize rows and closes its named cursor on every path."""
+
+    BRONZE = [(1, 10, 100, 5, 4), (2, 10, 999, 7, 7), (3, 11, 100, None, 2),
+              (4, 11, 100, 9, 9), (5, 10, 100, 1, 1)]
+    KEYS = {"product": {10: 1, 11: 2}, "warehouse": {100: 1}}
+
+    @pytest.fixture
+    def writes(self, monkeypatch):
+        """Row lists passed to execute_values; set ``writes.fail`` to make them raise."""
+        class Recorder(list):
+            fail = False
+
+        writes = Recorder()
+
+        def execute_values(cursor, sql, rows, page_size=100, fetch=False):
+            if writes.fail:
+                raise RuntimeError("insert failed")
+            writes.append(list(rows))
+            return [(1,)] * len(rows)
+
+        monkeypatch.setattr(bronze_to_silver, "execute_values", execute_values)
+        return writes
+
+    def _transformer(self):
+        conn = FakeTransformConnection(self.BRONZE, self.KEYS)
+        transformer = BronzeToSilverTransformer(conn)
+        transformer.stream_steps = {"inventory"}
+        transformer.itersize = 2
+        return conn, transformer
+
+    def test_inventory_streams_in_itersize_chunks(self, writes):
+        conn, transformer = self._transformer()
+        assert transformer.transform_inventory(batch_size=10) == 4
+        [cursor] = conn.cursors
+        assert cursor.name.startswith("etl_inventory_") and cursor.itersize == 2
+        assert cursor.executed[1] == {"since": None, "batch_size": 10}
+        # Inventory 2 has no warehouse key and is skipped
+        assert [[row[:5] for row in chunk] for chunk in writes] == [
+            [(1, 1, 1, 5, 4), (3, 2, 1, 0, 2)],
+            [(4, 2, 1, 9, 9), (5, 1, 1, 1, 1)],
+        ]
+        assert transformer.row_counts["inventory"] == {"inserted": 4, "skipped": 1, "conflicted": 0}
+        assert conn.events == [("commit", [True])]
+
+    def test_failed_write_closes_cursor(self, writes):
+        conn, transformer = self._transformer()
+        writes.fail = True
+        with pytest.raises(RuntimeError) as failure:
+            transformer.transform_inventory(batch_size=10)
+        # The traceback keeps the step's frame alive, as in a caller's except block that
+        # rolls back; the cursor must already be closed by then, not on garbage collection
+        assert failure.traceback and conn.cursors[0].closed
+
+
+class TestMemory:
+    """RSS readings are positive where the platform reports them."""
+
+    def test_rss_readings(self):
+        current = memory.current_rss_bytes()
+        peak = memory.peak_rss_bytes()
+        assert peak is None or peak > 0
+        if current is not None and peak is not None:
+            assert peak >= current or memory.reset_peak_rss()
+        assert memory.to_mb(3 * 1024 * 1024) == 3.0
+        assert memory.to_mb(None) is None
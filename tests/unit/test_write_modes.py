@@ -0,0 +1,198 @@
+"""
+Write Mode Tests
+Checks the COPY staging path (text encoding, staging table, merge and its row accounting),
+the INSERT ... RETURNING path and a streamed step writing each chunk through COPY.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from etl.transformers import bronze_to_silver
+from etl.transformers.bronze_to_silver import (
+    BronzeToSilverTransformer,
+    WRITE_MODE_COPY,
+    _copy_text_value,
+    _parse_insert_target,
+)
+from etl.transformers.streaming import stream_rows
+
+
+INSERT_COUNTRY = """
+    INSERT INTO silver.country
+    (country_id, country_name, country_code)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (country_id) DO NOTHING
+"""
+
+
+class FakeCopyCursor:
+    """Records statements and COPY payloads; the merge inserts ``merge_rowcount`` rows."""
+
+    def __init__(self, merge_rowcount=0):
+        self.merge_rowcount = merge_rowcount
+        self.statements = []
+        self.copies = []
+        self.rowcount = -1
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.statements.append(sql)
+        self.rowcount = self.merge_rowcount if sql.startswith("INSERT INTO silver.") else -1
+
+    def copy_expert(self, sql, buf):
+        self.copies.append((sql, buf.read()))
+
+
+class FakeNamedCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.itersize = None
+        self.closed = False
+
+    def execute(self, sql, params=None):
+        pass
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """Plain cursor is the recording cursor; named cursors stream ``rows``."""
+
+    def __init__(self, cursor, rows=()):
+        self._cursor = cursor
+        self.rows = list(rows)
+        self.named = []
+
+    def cursor(self, name=None):
+        if name is None:
+            return self._cursor
+        cursor = FakeNamedCursor(self.rows)
+        self.named.append(cursor)
+        return cursor
+
+
+def _copy_transformer(merge_rowcount, rows=()):
+    cursor = FakeCopyCursor(merge_rowcount)
+    transformer = BronzeToSilverTransformer(FakeConnection(cursor, rows))
+    transformer.write_modes["countries"] = WRITE_MODE_COPY
+    return cursor, transformer
+
+
+class TestCopyEncoding:
+    """Values render as COPY text fields and insert statements name their target."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, "\\N"),
+        (True, "t"),
+        (False, "f"),
+        (42, "42"),
+        (Decimal("19.90"), "19.90"),
+        (date(2024, 2, 29), "2024-02-29"),
+        (datetime(2024, 2, 29, 13, 5, 1), "2024-02-29T13:05:01"),
+        (b"\x01\xff", "\\\\x01ff"),
+        ("tab\there", "tab\\there"),
+        ("line\nbreak\r", "line\\nbreak\\r"),
+        ("C:\\path", "C:\\\\path"),
+        ("\\N", "\\\\N"),
+    ])
+    def test_copy_text_value(self, value, expected):
+        assert _copy_text_value(value) == expected
+
+    def test_parse_insert_target(self):
+        assert _parse_insert_target(INSERT_COUNTRY) == (
+            "country", ("country_id", "country_name", "country_code"), "country_id",
+        )
+        with pytest.raises(ValueError):
+            _parse_insert_target("UPDATE silver.country SET country_name = %s")
+
+
+class TestCopyMerge:
+    """COPY mode stages a batch and merges it with one INSERT ... SELECT ... ON CONFLICT."""
+
+    ROWS = [(1, "France", "FR"), (2, "Tab\tLand", None), (3, "Ísland", "IS")]
+
+    def test_stage_copy_merge(self):
+        cursor, transformer = _copy_transformer(merge_rowcount=2)
+        assert transformer._write_rows("countries", INSERT_COUNTRY, self.ROWS, skipped=4) == 2
+        create, merge, truncate = cursor.statements
+        assert create == (
+            "CREATE TEMP TABLE IF NOT EXISTS _stg_silver_country ON COMMIT DELETE ROWS AS "
+            "SELECT country_id, country_name, country_code FROM silver.country WITH NO DATA"
+        )
+        assert cursor.copies == [(
+            "COPY _stg_silver_country (country_id, country_name, country_code) FROM STDIN",
+            "1\tFrance\tFR\n2\tTab\\tLand\t\\N\n3\tÍsland\tIS\n",
+        )]
+        assert merge == (
+            "INSERT INTO silver.country (country_id, country_name, country_code) "
+            "SELECT country_id, country_name, country_code FROM _stg_silver_country "
+            "ON CONFLICT (country_id) DO NOTHING"
+        )
+        assert truncate == "TRUNCATE _stg_silver_country"
+        # The row not merged hit ON CONFLICT; the caller's skipped rows are added as given
+        assert transformer.row_counts["countries"] == {"inserted": 2, "skipped": 4, "conflicted": 1}
+
+    def test_unknown_rowcount_counts_as_nothing_inserted(self):
+        cursor, transformer = _copy_transformer(merge_rowcount=-1)
+        assert transformer._write_rows("countries", INSERT_COUNTRY, self.ROWS[:1]) == 0
+        assert transformer.row_counts["countries"]["conflicted"] == 1
+
+    def test_empty_batch_touches_nothing(self):
+        cursor, transformer = _copy_transformer(merge_rowcount=0)
+        assert transformer._write_rows("countries", INSERT_COUNTRY, [], skipped=2) == 0
+        assert cursor.statements == [] and cursor.copies == []
+        assert transformer.row_counts["countries"] == {"inserted": 0, "skipped": 2, "conflicted": 0}
+
+    def test_streamed_step_merges_each_chunk(self):
+        cursor, transformer = _copy_transformer(merge_rowcount=1, rows=self.ROWS)
+        transformer.stream_steps = {"countries"}
+        transformer.itersize = 2
+        source = stream_rows(transformer.connection, "SELECT 1", itersize=2, name="etl_countries")
+        rows = (row for row in source)
+        assert transformer._write_stream("countries", INSERT_COUNTRY, rows, source) == 2
+        assert [len(payload.splitlines()) for _, payload in cursor.copies] == [2, 1]
+        assert [s.split()[0] for s in cursor.statements] == [
+            "CREATE", "INSERT", "TRUNCATE", "CREATE", "INSERT", "TRUNCATE",
+        ]
+        [named] = transformer.connection.named
+        assert named.itersize == 2 and named.closed
+        assert transformer.row_counts["countries"] == {"inserted": 2, "skipped": 0, "conflicted": 1}
+
+
+class TestReturningInsert:
+    """Rows mode inserts with RETURNING and counts the rows that came back."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+
+        def execute_values(cursor, sql, rows, page_size=100, fetch=False):
+            calls.append({"sql": " ".join(sql.split()), "rows": list(rows),
+                          "page_size": page_size, "fetch": fetch})
+            # Every other row already exists in silver
+            return [(1,) for i, _ in enumerate(rows) if i % 2 == 0]
+
+        monkeypatch.setattr(bronze_to_silver, "execute_values", execute_values)
+        return calls
+
+    def test_inserted_and_conflicted_from_returning(self, calls):
+        transformer = BronzeToSilverTransformer(FakeConnection(FakeCopyCursor()))
+        rows = [(i, f"Country {i}", "CC") for i in range(5)]
+        assert transformer._write_rows("countries", INSERT_COUNTRY, rows, page_size=500, skipped=1) == 3
+        [call] = calls
+        assert call["sql"] == (
+            "INSERT INTO silver.country (country_id, country_name, country_code) VALUES %s "
+            "ON CONFLICT (country_id) DO NOTHING RETURNING 1"
+        )
+        assert call["rows"] == rows and call["page_size"] == 500 and call["fetch"] is True
+        assert transformer.row_counts["countries"] == {"inserted": 3, "skipped": 1, "conflicted": 2}
+
+        transformer._write_rows("countries", INSERT_COUNTRY, rows[:2])
+        assert calls[-1]["page_size"] == 100
+        assert transformer.row_counts["countries"] == {"inserted": 4, "skipped": 1, "conflicted": 3}